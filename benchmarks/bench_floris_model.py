@@ -0,0 +1,149 @@
+"""
+Benchmarks of FlorisModel construction and FlorisModel.run() across farm sizes, numbers of
+wind conditions, velocity models and grid types.
+"""
+
+import numpy as np
+
+from floris import FlorisModel
+from floris.utilities import load_yaml
+
+from .common import (
+    build_model,
+    get_layout,
+    GRID_TYPES,
+    INPUTS_DIR,
+    UNSUPPORTED_CONFIGURATIONS,
+    VELOCITY_MODELS,
+)
+
+
+class Construction:
+    """
+    Scaling of the construction of a FlorisModel from an input dictionary, with one turbine
+    type from the turbine library, and of its reload from a snapshot, with the number of
+    turbines.
+    """
+    params = [10, 100, 500, 1000]
+    param_names = ["n_turbines"]
+
+    def setup(self, n_turbines):
+        self.configuration = load_yaml(INPUTS_DIR / "gch.yaml")
+        layout_x, layout_y = get_layout(n_turbines)
+        self.configuration["farm"]["layout_x"] = layout_x.tolist()
+        self.configuration["farm"]["layout_y"] = layout_y.tolist()
+        self.snapshot = FlorisModel(self.configuration).to_snapshot()
+
+    def time_construct(self, n_turbines):
+        FlorisModel(self.configuration)
+
+    def time_from_snapshot(self, n_turbines):
+        FlorisModel.from_snapshot(self.snapshot)
+
+
+class TurbineCount:
+    """
+    Scaling of the GCH model with the number of turbines.
+    """
+    params = [10, 100, 1000]
+    param_names = ["n_turbines"]
+    timeout = 600
+
+    def setup(self, n_turbines):
+        self.fmodel = build_model("gauss", n_turbines=n_turbines, n_findex=10)
+
+    def time_run(self, n_turbines):
+        self.fmodel.run()
+
+    def peakmem_run(self, n_turbines):
+        self.fmodel.run()
+
+
+class YawedTurbineCount:
+    """
+    Scaling of the GCH model with the number of turbines when every third turbine is yawed,
+    which exercises the Gauss velocity and deflection models, secondary steering and the
+    transverse velocities on large farms.
+    """
+    params = [100, 300]
+    param_names = ["n_turbines"]
+    timeout = 600
+
+    def setup(self, n_turbines):
+        self.fmodel = build_model("gauss", n_turbines=n_turbines, n_findex=50)
+        yaw_angles = np.zeros((50, n_turbines))
+        yaw_angles[:, ::3] = 20.0
+        self.fmodel.set(yaw_angles=yaw_angles)
+
+    def time_run(self, n_turbines):
+        self.fmodel.run()
+
+    def peakmem_run(self, n_turbines):
+        self.fmodel.run()
+
+
+class FindexCount:
+    """
+    Scaling of the GCH model with the number of wind conditions.
+    """
+    params = [1, 100, 10000, 100000]
+    param_names = ["n_findex"]
+    timeout = 600
+
+    def setup(self, n_findex):
+        self.fmodel = build_model("gauss", n_turbines=10, n_findex=n_findex)
+
+    def time_run(self, n_findex):
+        self.fmodel.run()
+
+    def peakmem_run(self, n_findex):
+        self.fmodel.run()
+
+
+class VelocityModels:
+    """
+    Each velocity model, with its example settings, on each turbine grid type.
+    """
+    params = [VELOCITY_MODELS, GRID_TYPES]
+    param_names = ["velocity_model", "grid_type"]
+    timeout = 300
+
+    def setup(self, velocity_model, grid_type):
+        if (velocity_model, grid_type) in UNSUPPORTED_CONFIGURATIONS:
+            raise NotImplementedError
+        self.fmodel = build_model(velocity_model, grid_type=grid_type, n_findex=100)
+
+    def time_run(self, velocity_model, grid_type):
+        self.fmodel.run()
+
+    def peakmem_run(self, velocity_model, grid_type):
+        self.fmodel.run()
+
+    def time_run_no_wake(self, velocity_model, grid_type):
+        self.fmodel.run_no_wake()
+
+
+class SolverBackends:
+    """
+    The NumPy and numba solver backends for the velocity models that both support, on a
+    yawed farm. The numba kernels are compiled, or loaded from the cache, in the setup.
+    """
+    params = [["gauss", "jensen", "empirical_gauss"], ["numpy", "numba"]]
+    param_names = ["velocity_model", "backend"]
+    timeout = 600
+
+    def setup(self, velocity_model, backend):
+        if backend == "numba":
+            try:
+                import numba  # noqa: F401
+            except ImportError:
+                raise NotImplementedError
+        self.fmodel = build_model(velocity_model, n_turbines=100, n_findex=100)
+        self.fmodel.set_param(["solver", "backend"], backend)
+        yaw_angles = np.zeros((100, 100))
+        yaw_angles[:, ::3] = 20.0
+        self.fmodel.set(yaw_angles=yaw_angles)
+        self.fmodel.run()
+
+    def time_run(self, velocity_model, backend):
+        self.fmodel.run()
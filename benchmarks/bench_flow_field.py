@@ -0,0 +1,42 @@
+"""
+Benchmarks of the flow field outputs: cut planes and points.
+"""
+
+import numpy as np
+
+from .common import build_model
+
+
+class FlowField:
+    """
+    Planes and points in the flow around a farm of 25 turbines. The model is rebuilt for
+    every sample so that the turbine solve cached by the model is included in the timings.
+    """
+    params = [50, 200]
+    param_names = ["resolution"]
+    number = 1
+    timeout = 300
+
+    def setup(self, resolution):
+        self.fmodel = build_model(n_findex=10)
+        x, y = np.meshgrid(
+            np.linspace(-500.0, 3000.0, resolution),
+            np.linspace(-500.0, 3000.0, resolution),
+        )
+        self.points = (x.flatten(), y.flatten(), np.full(x.size, 90.0))
+
+    def time_calculate_horizontal_plane(self, resolution):
+        self.fmodel.calculate_horizontal_plane(90.0, resolution, resolution, findex_for_viz=0)
+
+    def peakmem_calculate_horizontal_plane(self, resolution):
+        self.fmodel.calculate_horizontal_plane(90.0, resolution, resolution, findex_for_viz=0)
+
+    def time_calculate_horizontal_planes(self, resolution):
+        for _ in self.fmodel.calculate_horizontal_planes(90.0, resolution, resolution):
+            pass
+
+    def time_sample_flow_at_points(self, resolution):
+        self.fmodel.sample_flow_at_points(*self.points)
+
+    def peakmem_sample_flow_at_points(self, resolution):
+        self.fmodel.sample_flow_at_points(*self.points)
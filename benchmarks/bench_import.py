@@ -0,0 +1,11 @@
+"""
+Benchmarks of importing FLORIS.
+"""
+
+
+def timeraw_import_floris():
+    """
+    Time of `import floris` in a fresh interpreter, which does not import the plotting stack
+    or the parallel backends.
+    """
+    return "import floris"
@@ -0,0 +1,110 @@
+"""
+Benchmarks of the yaw and layout optimizers.
+"""
+
+import numpy as np
+
+from floris.optimization.layout_optimization.layout_optimization_gridded import (
+    LayoutOptimizationGridded,
+)
+from floris.optimization.layout_optimization.layout_optimization_random_search import (
+    LayoutOptimizationRandomSearch,
+)
+from floris.optimization.layout_optimization.layout_optimization_scipy import (
+    LayoutOptimizationScipy,
+)
+from floris.optimization.yaw_optimization.yaw_optimizer_geometric import (
+    YawOptimizationGeometric,
+)
+from floris.optimization.yaw_optimization.yaw_optimizer_scipy import YawOptimizationScipy
+from floris.optimization.yaw_optimization.yaw_optimizer_sr import YawOptimizationSR
+
+from .common import build_model
+
+
+class YawOptimization:
+    """
+    Yaw optimization of a farm of 9 turbines for 72 wind directions at one wind speed, or
+    for 4 wind directions with the slower scipy optimizer.
+    """
+    timeout = 600
+
+    def setup(self):
+        self.fmodel = build_model(n_turbines=9, n_findex=72)
+        self.fmodel.set(
+            wind_directions=np.arange(0.0, 360.0, 5.0),
+            wind_speeds=np.full(72, 8.0),
+            turbulence_intensities=np.full(72, 0.06),
+        )
+        self.fmodel_scipy = build_model(n_turbines=9, n_findex=4)
+        self.fmodel_scipy.set(
+            wind_directions=np.arange(270.0, 290.0, 5.0),
+            wind_speeds=np.full(4, 8.0),
+            turbulence_intensities=np.full(4, 0.06),
+        )
+
+    def time_serial_refine(self):
+        YawOptimizationSR(self.fmodel).optimize(print_progress=False)
+
+    def peakmem_serial_refine(self):
+        YawOptimizationSR(self.fmodel).optimize(print_progress=False)
+
+    def time_geometric(self):
+        YawOptimizationGeometric(self.fmodel).optimize()
+
+    def time_scipy(self):
+        YawOptimizationScipy(self.fmodel_scipy, opt_options={"maxiter": 5}).optimize()
+
+
+class LayoutOptimization:
+    """
+    Layout optimization of a farm of 9 turbines within a square boundary for 12 wind
+    directions.
+    """
+    timeout = 600
+
+    def setup(self):
+        self.fmodel = build_model(n_turbines=9, n_findex=60)
+        self.boundaries = [(0.0, 0.0), (0.0, 2000.0), (2000.0, 2000.0), (2000.0, 0.0)]
+
+    def time_scipy(self):
+        LayoutOptimizationScipy(
+            self.fmodel,
+            self.boundaries,
+            optOptions={"maxiter": 5, "disp": False},
+        ).optimize()
+
+    def peakmem_scipy(self):
+        LayoutOptimizationScipy(
+            self.fmodel,
+            self.boundaries,
+            optOptions={"maxiter": 5, "disp": False},
+        ).optimize()
+
+    def time_gridded(self):
+        LayoutOptimizationGridded(
+            self.fmodel,
+            self.boundaries,
+            min_dist_D=5.0,
+            rotation_step=5.0,
+        ).optimize()
+
+    def track_random_search_seconds_per_objective_call(self):
+        # The random search runs for a fixed time, so its speed is tracked by the time
+        # taken by each evaluation of the objective.
+        layout_opt = LayoutOptimizationRandomSearch(
+            self.fmodel,
+            self.boundaries,
+            min_dist_D=5.0,
+            n_individuals=1,
+            seconds_per_iteration=2.0,
+            total_optimization_seconds=4.0,
+            interface=None,
+            relegation_number=0,
+            random_seed=0,
+        )
+        layout_opt.optimize()
+        num_objective_calls = np.sum(layout_opt.num_objective_calls_log)
+        return layout_opt.opt_time / max(num_objective_calls, 1)
+
+    track_random_search_seconds_per_objective_call.unit = "seconds"
@@ -0,0 +1,57 @@
+"""
+Benchmarks of the models that wrap FlorisModel: the uncertain and parallel models.
+"""
+
+from floris import ParFlorisModel, UncertainFlorisModel
+
+from .common import build_model
+
+
+class UncertainModel:
+    """
+    The GCH model with wind direction uncertainty, which expands each wind condition
+    into several wind directions.
+    """
+    params = [3.0, 5.0]
+    param_names = ["wd_std"]
+    timeout = 300
+
+    def setup(self, wd_std):
+        self.fmodel = build_model(
+            n_findex=100,
+            model_class=UncertainFlorisModel,
+            wd_std=wd_std,
+        )
+
+    def time_run(self, wd_std):
+        self.fmodel.run()
+
+    def peakmem_run(self, wd_std):
+        self.fmodel.run()
+
+
+class ParallelModel:
+    """
+    The GCH model run with each parallelization interface of ParFlorisModel on 2
+    workers, and in serial for comparison.
+    """
+    params = [[None, "multiprocessing", "concurrent"], [False, True]]
+    param_names = ["interface", "return_turbine_powers_only"]
+    timeout = 300
+
+    def setup(self, interface, return_turbine_powers_only):
+        if interface is None and return_turbine_powers_only:
+            raise NotImplementedError
+        self.fmodel = build_model(
+            n_findex=1000,
+            model_class=ParFlorisModel,
+            interface=interface,
+            max_workers=2,
+            return_turbine_powers_only=return_turbine_powers_only,
+        )
+
+    def time_run(self, interface, return_turbine_powers_only):
+        self.fmodel.run()
+
+    def peakmem_run(self, interface, return_turbine_powers_only):
+        self.fmodel.run()
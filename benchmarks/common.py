@@ -0,0 +1,98 @@
+"""
+Shared model construction for the benchmarks.
+"""
+
+from pathlib import Path
+
+import numpy as np
+
+from floris import FlorisModel
+
+
+INPUTS_DIR = Path(__file__).resolve().parents[1] / "examples" / "inputs"
+
+# Input file of each velocity model
+VELOCITY_MODEL_INPUTS = {
+    "jensen": "jensen.yaml",
+    "gauss": "gch.yaml",
+    "empirical_gauss": "emgauss.yaml",
+    "cc": "cc.yaml",
+    "turbopark": "turbopark.yaml",
+    "turboparkgauss": "turboparkgauss.yaml",
+}
+
+VELOCITY_MODELS = list(VELOCITY_MODEL_INPUTS)
+
+GRID_TYPES = ["turbine_grid", "turbine_cubature_grid"]
+
+# Combinations of velocity model and grid type that the solvers do not support
+UNSUPPORTED_CONFIGURATIONS = [("cc", "turbine_cubature_grid")]
+
+
+def get_layout(n_turbines: int, spacing_D: float = 5.0, D: float = 126.0):
+    """
+    Get a square-packed layout of n_turbines, filled row by row.
+    """
+    n_columns = int(np.ceil(np.sqrt(n_turbines)))
+    x, y = np.meshgrid(np.arange(n_columns), np.arange(n_columns))
+    layout_x = spacing_D * D * x.flatten()[:n_turbines]
+    layout_y = spacing_D * D * y.flatten()[:n_turbines]
+    return layout_x, layout_y
+
+
+def get_wind_conditions(n_findex: int):
+    """
+    Get n_findex wind conditions that sweep the wind directions and, for each direction,
+    a range of wind speeds, so that every findex has wakes.
+    """
+    findex = np.arange(n_findex)
+    wind_directions = np.mod(270.0 + 5.0 * (findex // 5), 360.0)
+    wind_speeds = 6.0 + 2.0 * (findex % 5)
+    turbulence_intensities = np.full(n_findex, 0.06)
+    return wind_directions, wind_speeds, turbulence_intensities
+
+
+def build_model(
+    velocity_model: str = "gauss",
+    n_turbines: int = 25,
+    n_findex: int = 100,
+    grid_type: str = "turbine_grid",
+    model_class: type = FlorisModel,
+    **model_kwargs,
+) -> FlorisModel:
+    """
+    Build a model of a square-packed farm for a sweep of wind conditions.
+
+    Args:
+        velocity_model (str, optional): The velocity model, one of VELOCITY_MODELS, with
+            the settings of its example input file. Defaults to "gauss", which is the
+            GCH model.
+        n_turbines (int, optional): The number of turbines. Defaults to 25.
+        n_findex (int, optional): The number of wind conditions. Defaults to 100.
+        grid_type (str, optional): The solver type, one of GRID_TYPES, with 3 points in
+            each direction on the rotor. Defaults to "turbine_grid".
+        model_class (type, optional): The model class, e.g. UncertainFlorisModel or
+            ParFlorisModel. Defaults to FlorisModel.
+        **model_kwargs: Additional arguments for the model class.
+
+    Returns:
+        FlorisModel: The model, which has not been run.
+    """
+    fmodel = FlorisModel(INPUTS_DIR / VELOCITY_MODEL_INPUTS[velocity_model])
+    solver_settings = {"type": grid_type, "turbine_grid_points": 3}
+    if fmodel.core.solver != solver_settings:
+        fmodel.set_param(["solver"], solver_settings)
+
+    layout_x, layout_y = get_layout(n_turbines)
+    wind_directions, wind_speeds, turbulence_intensities = get_wind_conditions(n_findex)
+    fmodel.set(
+        layout_x=layout_x,
+        layout_y=layout_y,
+        wind_directions=wind_directions,
+        wind_speeds=wind_speeds,
+        turbulence_intensities=turbulence_intensities,
+    )
+
+    if model_class is not FlorisModel:
+        fmodel = model_class(fmodel, **model_kwargs)
+    return fmodel
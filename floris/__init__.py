@@ -1,24 +1,63 @@
 
+from importlib import import_module
 from importlib.metadata import version
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 
 __version__ = version("floris")
 
 
 from .floris_model import FlorisModel
-from .flow_visualization import (
-    plot_rotor_values,
-    visualize_cut_plane,
-    visualize_quiver,
-)
-from .heterogeneous_map import HeterogeneousMap
-from .par_floris_model import ParFlorisModel
-from .parallel_floris_model import ParallelFlorisModel
-from .uncertain_floris_model import ApproxFlorisModel, UncertainFlorisModel
-from .wind_data import (
-    TimeSeries,
-    WindRose,
-    WindRoseWRG,
-    WindTIRose,
-)
+
+
+# The plotting, parallel and optional subsystems are imported on first access so that
+# `import floris` only pays for what is needed to construct and run a FlorisModel.
+_LAZY_IMPORTS = {
+    "plot_rotor_values": ".flow_visualization",
+    "visualize_cut_plane": ".flow_visualization",
+    "visualize_quiver": ".flow_visualization",
+    "FlorisService": ".floris_service",
+    "HeterogeneousMap": ".heterogeneous_map",
+    "ParFlorisModel": ".par_floris_model",
+    "ParallelFlorisModel": ".parallel_floris_model",
+    "TurbineResultStore": ".result_store",
+    "ApproxFlorisModel": ".uncertain_floris_model",
+    "UncertainFlorisModel": ".uncertain_floris_model",
+    "TimeSeries": ".wind_data",
+    "WindRose": ".wind_data",
+    "WindRoseWRG": ".wind_data",
+    "WindTIRose": ".wind_data",
+}
+
+if TYPE_CHECKING:
+    from .floris_service import FlorisService
+    from .flow_visualization import (
+        plot_rotor_values,
+        visualize_cut_plane,
+        visualize_quiver,
+    )
+    from .heterogeneous_map import HeterogeneousMap
+    from .par_floris_model import ParFlorisModel
+    from .parallel_floris_model import ParallelFlorisModel
+    from .result_store import TurbineResultStore
+    from .uncertain_floris_model import ApproxFlorisModel, UncertainFlorisModel
+    from .wind_data import (
+        TimeSeries,
+        WindRose,
+        WindRoseWRG,
+        WindTIRose,
+    )
+
+
+def __getattr__(name):
+    if name not in _LAZY_IMPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(_LAZY_IMPORTS[name], __name__), name)
+    # Cache the attribute so that later accesses skip this function
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted([*globals(), *_LAZY_IMPORTS])
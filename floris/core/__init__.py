@@ -45,6 +45,11 @@ from .grid import (
 )
 from .flow_field import FlowField
 from .wake import WakeModelManager
+from .profiler import (
+    get_active_profiler,
+    Profiler,
+    profiling,
+)
 from .solver import (
     cc_solver,
     empirical_gauss_solver,
@@ -53,6 +58,7 @@ from .solver import (
     full_flow_sequential_solver,
     full_flow_turbopark_solver,
     sequential_solver,
+    solve_turbine_grid_for_full_flow,
     turbopark_solver,
 )
 from .core import Core
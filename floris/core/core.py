@@ -1,8 +1,12 @@
 
 from __future__ import annotations
 
+import copy
+import hashlib
+from collections.abc import Callable
 from pathlib import Path
 
+import attrs
 import numpy as np
 import pandas as pd
 import yaml
@@ -21,15 +25,18 @@ from floris.core import (
     full_flow_empirical_gauss_solver,
     full_flow_sequential_solver,
     full_flow_turbopark_solver,
+    get_active_profiler,
     Grid,
     PointsGrid,
     sequential_solver,
+    solve_turbine_grid_for_full_flow,
     State,
     TurbineCubatureGrid,
     TurbineGrid,
     turbopark_solver,
     WakeModelManager,
 )
+from floris.core.profiler import profiled_phase
 from floris.type_dec import NDArrayFloat
 from floris.utilities import (
     load_yaml,
@@ -37,6 +44,60 @@ from floris.utilities import (
 )
 
 
+SOLVER_BACKENDS = ("numpy", "numba")
+
+# Attributes of the farm, flow field and grid with the findex as their first dimension once the
+# domain is initialized on a turbine grid
+FINDEX_ATTRIBUTES = {
+    "farm": (
+        "yaw_angles",
+        "yaw_angles_sorted",
+        "tilt_angles",
+        "tilt_angles_sorted",
+        "power_setpoints",
+        "power_setpoints_sorted",
+        "awc_modes",
+        "awc_modes_sorted",
+        "awc_amplitudes",
+        "awc_amplitudes_sorted",
+        "awc_frequencies",
+        "awc_frequencies_sorted",
+        "hub_heights_sorted",
+        "rotor_diameters_sorted",
+        "TSRs_sorted",
+        "ref_tilts_sorted",
+        "correct_cp_ct_for_tilt_sorted",
+        "turbine_type_map_sorted",
+    ),
+    "flow_field": (
+        "wind_directions",
+        "wind_speeds",
+        "turbulence_intensities",
+        "u_initial_sorted",
+        "v_initial_sorted",
+        "w_initial_sorted",
+        "dudz_initial_sorted",
+        "u_sorted",
+        "v_sorted",
+        "w_sorted",
+        "turbulence_intensity_field",
+        "turbulence_intensity_field_sorted",
+    ),
+    "grid": (
+        "wind_directions",
+        "x_sorted",
+        "y_sorted",
+        "z_sorted",
+        "x_sorted_inertial_frame",
+        "y_sorted_inertial_frame",
+        "z_sorted_inertial_frame",
+        "sorted_indices",
+        "sorted_coord_indices",
+        "unsorted_indices",
+    ),
+}
+
+
 @define
 class Core(BaseClass):
     """
@@ -59,6 +120,21 @@ class Core(BaseClass):
 
     grid: Grid = field(init=False)
 
+    # Turbine grid solution shared by the full flow solves and the state it was solved for
+    _turbine_grid_solution: tuple | None = field(init=False, default=None)
+    _turbine_grid_solution_key: str | None = field(init=False, default=None)
+
+    # Reasons the numba solver backend fell back to the NumPy solvers, which are warned once
+    _solver_backend_fallbacks: set = field(init=False, factory=set)
+
+    @solver.validator
+    def check_solver_backend(self, attribute: attrs.Attribute, value: dict) -> None:
+        backend = value.get("backend", "numpy")
+        if backend not in SOLVER_BACKENDS:
+            raise ValueError(
+                f"Invalid solver backend {backend}. Options are {', '.join(SOLVER_BACKENDS)}."
+            )
+
     def __attrs_post_init__(self) -> None:
 
         # Configure logging
@@ -71,63 +147,68 @@ class Core(BaseClass):
             self.logging["file"]["level"],
         )
 
+        profiler = get_active_profiler()
+
         # Initialize farm quantities that depend on other objects
-        self.farm.construct_turbine_map()
-        self.farm.construct_turbine_thrust_coefficient_functions()
-        self.farm.construct_turbine_axial_induction_functions()
-        self.farm.construct_turbine_power_functions()
-        self.farm.construct_turbine_power_thrust_tables()
-        self.farm.construct_hub_heights()
-        self.farm.construct_rotor_diameters()
-        self.farm.construct_turbine_TSRs()
-        self.farm.construct_turbine_ref_tilts()
-        self.farm.construct_turbine_tilt_interps()
-        self.farm.construct_turbine_correct_cp_ct_for_tilt()
-        self.farm.set_yaw_angles_to_ref_yaw(self.flow_field.n_findex)
-        self.farm.set_tilt_to_ref_tilt(self.flow_field.n_findex)
-        self.farm.set_power_setpoints_to_ref_power(self.flow_field.n_findex)
-        self.farm.set_awc_modes_to_ref_mode(self.flow_field.n_findex)
-        self.farm.set_awc_amplitudes_to_ref_amp(self.flow_field.n_findex)
-        self.farm.set_awc_frequencies_to_ref_freq(self.flow_field.n_findex)
-
-        if self.solver["type"] == "turbine_grid":
-            self.grid = TurbineGrid(
-                turbine_coordinates=self.farm.coordinates,
-                turbine_diameters=self.farm.rotor_diameters,
-                wind_directions=self.flow_field.wind_directions,
-                grid_resolution=self.solver["turbine_grid_points"],
-            )
-        elif self.solver["type"] == "turbine_cubature_grid":
-            self.grid = TurbineCubatureGrid(
-                turbine_coordinates=self.farm.coordinates,
-                turbine_diameters=self.farm.rotor_diameters,
-                wind_directions=self.flow_field.wind_directions,
-                grid_resolution=self.solver["turbine_grid_points"],
-            )
-        elif self.solver["type"] == "flow_field_grid":
-            self.grid = FlowFieldGrid(
-                turbine_coordinates=self.farm.coordinates,
-                turbine_diameters=self.farm.rotor_diameters,
-                wind_directions=self.flow_field.wind_directions,
-                grid_resolution=self.solver["flow_field_grid_points"],
-            )
-        elif self.solver["type"] == "flow_field_planar_grid":
-            self.grid = FlowFieldPlanarGrid(
-                turbine_coordinates=self.farm.coordinates,
-                turbine_diameters=self.farm.rotor_diameters,
-                wind_directions=self.flow_field.wind_directions,
-                normal_vector=self.solver["normal_vector"],
-                planar_coordinate=self.solver["planar_coordinate"],
-                grid_resolution=self.solver["flow_field_grid_points"],
-                x1_bounds=self.solver["flow_field_bounds"][0],
-                x2_bounds=self.solver["flow_field_bounds"][1],
-            )
-        else:
-            raise ValueError(
-                "Supported solver types are "
-                "[turbine_grid, turbine_cubature_grid, flow_field_grid, flow_field_planar_grid], "
-                f"but type given was {self.solver['type']}"
-            )
+        with profiled_phase(profiler, "construct_farm"):
+            self.farm.construct_turbine_map()
+            self.farm.construct_turbine_thrust_coefficient_functions()
+            self.farm.construct_turbine_axial_induction_functions()
+            self.farm.construct_turbine_power_functions()
+            self.farm.construct_turbine_power_thrust_tables()
+            self.farm.construct_hub_heights()
+            self.farm.construct_rotor_diameters()
+            self.farm.construct_turbine_TSRs()
+            self.farm.construct_turbine_ref_tilts()
+            self.farm.construct_turbine_tilt_interps()
+            self.farm.construct_turbine_correct_cp_ct_for_tilt()
+            self.farm.set_yaw_angles_to_ref_yaw(self.flow_field.n_findex)
+            self.farm.set_tilt_to_ref_tilt(self.flow_field.n_findex)
+            self.farm.set_power_setpoints_to_ref_power(self.flow_field.n_findex)
+            self.farm.set_awc_modes_to_ref_mode(self.flow_field.n_findex)
+            self.farm.set_awc_amplitudes_to_ref_amp(self.flow_field.n_findex)
+            self.farm.set_awc_frequencies_to_ref_freq(self.flow_field.n_findex)
+
+        with profiled_phase(profiler, "construct_grid"):
+            if self.solver["type"] == "turbine_grid":
+                self.grid = TurbineGrid(
+                    turbine_coordinates=self.farm.coordinates,
+                    turbine_diameters=self.farm.rotor_diameters,
+                    wind_directions=self.flow_field.wind_directions,
+                    grid_resolution=self.solver["turbine_grid_points"],
+                )
+            elif self.solver["type"] == "turbine_cubature_grid":
+                self.grid = TurbineCubatureGrid(
+                    turbine_coordinates=self.farm.coordinates,
+                    turbine_diameters=self.farm.rotor_diameters,
+                    wind_directions=self.flow_field.wind_directions,
+                    grid_resolution=self.solver["turbine_grid_points"],
+                )
+            elif self.solver["type"] == "flow_field_grid":
+                self.grid = FlowFieldGrid(
+                    turbine_coordinates=self.farm.coordinates,
+                    turbine_diameters=self.farm.rotor_diameters,
+                    wind_directions=self.flow_field.wind_directions,
+                    grid_resolution=self.solver["flow_field_grid_points"],
+                )
+            elif self.solver["type"] == "flow_field_planar_grid":
+                self.grid = FlowFieldPlanarGrid(
+                    turbine_coordinates=self.farm.coordinates,
+                    turbine_diameters=self.farm.rotor_diameters,
+                    wind_directions=self.flow_field.wind_directions,
+                    normal_vector=self.solver["normal_vector"],
+                    planar_coordinate=self.solver["planar_coordinate"],
+                    grid_resolution=self.solver["flow_field_grid_points"],
+                    x1_bounds=self.solver["flow_field_bounds"][0],
+                    x2_bounds=self.solver["flow_field_bounds"][1],
+                )
+            else:
+                raise ValueError(
+                    "Supported solver types are "
+                    "[turbine_grid, turbine_cubature_grid, flow_field_grid, "
+                    "flow_field_planar_grid], "
+                    f"but type given was {self.solver['type']}"
+                )
 
         if isinstance(self.grid, (TurbineGrid, TurbineCubatureGrid)):
             self.farm.expand_farm_properties(
@@ -135,16 +216,65 @@ class Core(BaseClass):
                 self.grid.sorted_coord_indices
             )
 
+    def set_findex_layouts(self, layout_x: NDArrayFloat, layout_y: NDArrayFloat) -> None:
+        """
+        Assign a separate turbine layout to each findex. This allows many candidate layouts
+        with the same turbines to be solved in a single vectorized calculation by stacking
+        them along the findex dimension. The layout stored on the farm is not changed, so
+        this setting is lost when the Core is reconstructed from its dictionary.
+
+        Args:
+            layout_x (NDArrayFloat): x-coordinates of the turbines with shape
+                (n_findex, n_turbines).
+            layout_y (NDArrayFloat): y-coordinates of the turbines with shape
+                (n_findex, n_turbines).
+        """
+        if not isinstance(self.grid, (TurbineGrid, TurbineCubatureGrid)):
+            raise ValueError(
+                "Layouts specific to each findex are only supported with the turbine_grid "
+                "and turbine_cubature_grid solver types."
+            )
+
+        layout_x = np.array(layout_x, dtype=float)
+        layout_y = np.array(layout_y, dtype=float)
+        expected_shape = (self.flow_field.n_findex, self.farm.n_turbines)
+        if layout_x.shape != expected_shape or layout_y.shape != expected_shape:
+            raise ValueError(
+                f"layout_x and layout_y must have shape (n_findex, n_turbines) = {expected_shape}."
+            )
+
+        # Hub heights and rotor diameters are expanded per findex after a solve
+        hub_heights = self.farm.coordinates[:, 2]
+        rotor_diameters = np.reshape(self.farm.rotor_diameters, (-1, self.farm.n_turbines))[0]
+        turbine_coordinates = np.stack(
+            [layout_x, layout_y, np.broadcast_to(hub_heights, expected_shape)],
+            axis=-1,
+        )
+        self.grid = type(self.grid)(
+            turbine_coordinates=turbine_coordinates,
+            turbine_diameters=rotor_diameters,
+            wind_directions=self.flow_field.wind_directions,
+            grid_resolution=self.grid.grid_resolution,
+        )
+        self.farm.expand_farm_properties(
+            self.flow_field.n_findex,
+            self.grid.sorted_coord_indices
+        )
+        self.state = State.UNINITIALIZED
+
     def initialize_domain(self):
         """Initialize solution space prior to wake calculations"""
 
         # Initialize field quantities; doing this immediately prior to doing
         # the calculation step allows for manipulating inputs in a script
         # without changing the data structures
-        self.flow_field.initialize_velocity_field(self.grid)
+        profiler = get_active_profiler()
+        with profiled_phase(profiler, "initialize_velocity_field"):
+            self.flow_field.initialize_velocity_field(self.grid)
 
         # Initialize farm quantities
-        self.farm.initialize(self.grid.sorted_indices)
+        with profiled_phase(profiler, "initialize_farm"):
+            self.farm.initialize(self.grid.sorted_indices)
 
         self.state.INITIALIZED
 
@@ -152,6 +282,30 @@ class Core(BaseClass):
         """Perform the steady-state wind farm wake calculations. Note that
         initialize_domain() is required to be called before this function."""
 
+        solver = self.select_solver()
+
+        profiler = get_active_profiler()
+        with profiled_phase(profiler, solver.__name__):
+            solver(
+                self.farm,
+                self.flow_field,
+                self.grid,
+                self.wake,
+                profiler=profiler,
+            )
+
+        with profiled_phase(profiler, "finalize"):
+            self.finalize()
+
+    def select_solver(self) -> Callable:
+        """
+        Get the solver for the velocity model and solver backend, and warn about the effects
+        of the turbines that the velocity model does not capture.
+
+        Returns:
+            Callable: The solver, which is called with the farm, flow field, grid and wake
+            models.
+        """
         vel_model = self.wake.model_strings["velocity_model"]
 
         if vel_model not in ["empirical_gauss"] and \
@@ -174,66 +328,241 @@ class Core(BaseClass):
             )
 
         if vel_model=="cc":
-            cc_solver(
-                self.farm,
-                self.flow_field,
-                self.grid,
-                self.wake
-            )
+            solver = cc_solver
         elif vel_model=="turbopark":
             self.logger.warning(
                 "The turbopark model has been superseded by the turboparkgauss model. We " +
                 "recommend using `velocity_model: turboparkgauss` instead."
             )
-            turbopark_solver(
-                self.farm,
-                self.flow_field,
-                self.grid,
-                self.wake
-            )
+            solver = turbopark_solver
         elif vel_model=="empirical_gauss":
-            empirical_gauss_solver(
-                self.farm,
-                self.flow_field,
-                self.grid,
-                self.wake
-            )
+            solver = empirical_gauss_solver
         else:
-            sequential_solver(
+            solver = sequential_solver
+        return self.select_solver_backend(solver, self.grid)
+
+    def findex_slab(self, findices: slice) -> tuple[Farm, FlowField, Grid]:
+        """
+        Get views of the farm, flow field and grid for a range of consecutive findices, once
+        the domain is initialized. The views share the arrays of this Core rather than copying
+        them, so a solver can be run on each of several slabs of findices, e.g. from separate
+        threads. The outputs of the solver are set on the flow field view, although a solver
+        may also update the shared arrays of its slab in place.
+
+        Args:
+            findices (slice): The findices of the slab.
+
+        Returns:
+            tuple[Farm, FlowField, Grid]: The views of the farm, flow field and grid.
+        """
+        views = []
+        objects = {"farm": self.farm, "flow_field": self.flow_field, "grid": self.grid}
+        for name, obj in objects.items():
+            view = copy.copy(obj)
+            # The slabs are set without the validators, which compare the lengths of the
+            # findex attributes while they are only partly replaced
+            for attribute in FINDEX_ATTRIBUTES[name]:
+                value = getattr(obj, attribute)
+                if value is not None:
+                    object.__setattr__(view, attribute, value[findices])
+            views.append(view)
+
+        farm, flow_field, grid = views
+        flow_field.n_findex = len(flow_field.wind_directions)
+        grid.n_findex = len(grid.wind_directions)
+        return farm, flow_field, grid
+
+    def select_solver_backend(self, solver: Callable, grid: Grid | None) -> Callable:
+        """
+        Get the implementation of a turbine-level solver for the solver backend. With the
+        "numba" backend, the compiled solver is used when it supports the wake models and
+        turbines; otherwise, the NumPy solver is used, with a warning the first time for each
+        reason.
+
+        Args:
+            solver (Callable): The NumPy solver, e.g. sequential_solver.
+            grid (Grid | None): The grid of the solve, or None for the TurbineGrid of the
+                full flow solvers.
+
+        Returns:
+            Callable: The solver to use.
+        """
+        if self.solver.get("backend", "numpy") == "numpy":
+            return solver
+
+        # Import the numba solvers, and numba, only once they are used
+        from floris.core.numba_solver import numba_solver_unsupported_reason, NUMBA_SOLVERS
+
+        reason = numba_solver_unsupported_reason(self.farm, grid, self.wake)
+        if reason is None:
+            return NUMBA_SOLVERS[solver]
+        if reason not in self._solver_backend_fallbacks:
+            self._solver_backend_fallbacks.add(reason)
+            self.logger.warning(f"{reason} Using the numpy solver backend instead.")
+        return solver
+
+    def solve_turbine_grid_for_viz(self) -> tuple:
+        """
+        Solve for the flow at the turbines on the 3x3 TurbineGrid used by the full flow
+        solvers. The solution is cached and reused by :py:meth:`solve_for_viz` and
+        :py:meth:`solve_for_points` until the wind conditions, layout or turbine operation
+        change, so that the turbine-level solve is only done once for several flow field
+        grids.
+
+        Returns:
+            tuple: The turbine grid solution; see
+                :py:func:`~floris.core.solver.solve_turbine_grid_for_full_flow`.
+        """
+        key = self.get_turbine_grid_solution_key()
+        if self._turbine_grid_solution is not None and key == self._turbine_grid_solution_key:
+            return self._turbine_grid_solution
+
+        vel_model = self.wake.model_strings["velocity_model"]
+
+        if vel_model=="cc":
+            solver = cc_solver
+        elif vel_model=="turbopark":
+            solver = turbopark_solver
+        elif vel_model=="empirical_gauss":
+            solver = empirical_gauss_solver
+        else:
+            solver = sequential_solver
+        solver = self.select_solver_backend(solver, None)
+
+        profiler = get_active_profiler()
+        with profiled_phase(profiler, "solve_turbine_grid_for_full_flow"):
+            self._turbine_grid_solution = solve_turbine_grid_for_full_flow(
                 self.farm,
                 self.flow_field,
-                self.grid,
-                self.wake
+                self.wake,
+                solver,
+                profiler=profiler,
             )
+        self._turbine_grid_solution_key = key
+        return self._turbine_grid_solution
+
+    def grid_is_outside_wakes(self, grid: Grid, wake_cone_slope: float) -> bool:
+        """
+        Check whether a grid lies outside of the wakes of every turbine for all findices, so
+        that the flow on it is the inflow. The grid is outside of a turbine's wake if it is
+        more than two rotor diameters upstream of the turbine, or outside of a cone around the
+        rotor axis that starts with a radius of one rotor diameter and widens by
+        `wake_cone_slope` per unit of downstream distance. The cone does not bound the wakes
+        exactly, so a larger slope is more conservative. The transverse velocities are not
+        bounded by the cone, so only the upstream condition is used when they are enabled.
+
+        Args:
+            grid (Grid): The grid, whose sorted coordinates are in the rotated frame of the
+                turbine grid solution from :py:meth:`solve_turbine_grid_for_viz`.
+            wake_cone_slope (float): Growth rate of the radius of the wake cone.
 
-        self.finalize()
+        Returns:
+            bool: Whether the grid is outside of all of the wakes.
+        """
+        turbine_grid_farm, _, turbine_grid, _ = self.solve_turbine_grid_for_viz()
+        x_turbines = np.mean(turbine_grid.x_sorted, axis=(2, 3))
+        y_turbines = np.mean(turbine_grid.y_sorted, axis=(2, 3))
+        z_turbines = np.mean(turbine_grid.z_sorted, axis=(2, 3))
+        rotor_diameters = turbine_grid_farm.rotor_diameters_sorted
+
+        # Distances from the rotor axes to the bounding box of the grid
+        x_max = np.max(grid.x_sorted)
+        dy = np.maximum(
+            np.maximum(np.min(grid.y_sorted) - y_turbines, y_turbines - np.max(grid.y_sorted)),
+            0.0,
+        )
+        dz = np.maximum(
+            np.maximum(np.min(grid.z_sorted) - z_turbines, z_turbines - np.max(grid.z_sorted)),
+            0.0,
+        )
+
+        upstream = x_max < x_turbines - 2 * rotor_diameters
+        if self.wake.enable_transverse_velocities:
+            return bool(np.all(upstream))
+
+        cone_radius = rotor_diameters + wake_cone_slope * np.maximum(x_max - x_turbines, 0.0)
+        outside_cone = np.hypot(dy, dz) > cone_radius
+        return bool(np.all(upstream | outside_cone))
+
+    def get_turbine_grid_solution_key(self) -> str:
+        """
+        Get a key that identifies the inputs to the turbine grid solve of
+        :py:meth:`solve_turbine_grid_for_viz`: the wind conditions, the layout and the turbine
+        operation. Other settings can only be changed by creating a new Core.
 
-    def solve_for_viz(self):
+        Returns:
+            str: A digest of the inputs.
+        """
+        flow_field = self.flow_field
+        farm = self.farm
+        key = hashlib.sha1(
+            repr((
+                self.wake.model_strings,
+                flow_field.wind_shear,
+                flow_field.wind_veer,
+                flow_field.air_density,
+                flow_field.reference_wind_height,
+            )).encode()
+        )
+        arrays = [
+            flow_field.wind_directions,
+            flow_field.wind_speeds,
+            flow_field.turbulence_intensities,
+            farm.layout_x,
+            farm.layout_y,
+            farm.yaw_angles,
+            farm.power_setpoints,
+            farm.awc_modes,
+            farm.awc_amplitudes,
+            farm.awc_frequencies,
+        ]
+        for array in arrays:
+            array = np.ascontiguousarray(array)
+            key.update(repr((array.dtype.str, array.shape)).encode())
+            key.update(array.tobytes())
+        return key.hexdigest()
+
+    def solve_for_viz(self, turbine_grid_solution: tuple | None = None):
         # Do the calculation with the TurbineGrid for a single wind speed
         # and wind direction and 1 point on the grid. Then, use the result
         # to construct the full flow field grid.
         # This function call should be for a single wind direction and wind speed
         # since the memory consumption is very large.
+        # The TurbineGrid calculation is cached by solve_turbine_grid_for_viz
+        # and reused while the inputs are unchanged.
+
+        if turbine_grid_solution is None:
+            turbine_grid_solution = self.solve_turbine_grid_for_viz()
 
         self.flow_field.initialize_velocity_field(self.grid)
 
         vel_model = self.wake.model_strings["velocity_model"]
 
         if vel_model=="cc":
-            full_flow_cc_solver(self.farm, self.flow_field, self.grid, self.wake)
+            full_flow_solver = full_flow_cc_solver
         elif vel_model=="turbopark":
-            full_flow_turbopark_solver(self.farm, self.flow_field, self.grid, self.wake)
+            full_flow_solver = full_flow_turbopark_solver
         elif vel_model=="empirical_gauss":
-            full_flow_empirical_gauss_solver(self.farm, self.flow_field, self.grid, self.wake)
+            full_flow_solver = full_flow_empirical_gauss_solver
         else:
-            full_flow_sequential_solver(self.farm, self.flow_field, self.grid, self.wake)
+            full_flow_solver = full_flow_sequential_solver
 
-    def solve_for_points(self, x, y, z):
+        with profiled_phase(get_active_profiler(), full_flow_solver.__name__):
+            full_flow_solver(
+                self.farm, self.flow_field, self.grid, self.wake, turbine_grid_solution
+            )
+
+    def solve_for_points(self, x, y, z, turbine_grid_solution: tuple | None = None):
         # Do the calculation with the TurbineGrid for a single wind speed
         # and wind direction and a 3x3 rotor grid. Then, use the result
         # to construct the full flow field grid.
         # This function call should be for a single wind direction and wind speed
         # since the memory consumption is very large.
+        # The TurbineGrid calculation is cached by solve_turbine_grid_for_viz
+        # and reused while the inputs are unchanged.
+
+        if turbine_grid_solution is None:
+            turbine_grid_solution = self.solve_turbine_grid_for_viz()
 
         # Instantiate the flow_grid
         field_grid = PointsGrid(
@@ -252,15 +581,19 @@ class Core(BaseClass):
 
         vel_model = self.wake.model_strings["velocity_model"]
 
-        if vel_model == "cc" or vel_model == "turbopark":
-            raise NotImplementedError(
-                "solve_for_points is currently only available with the "+\
-                "gauss, jensen, and empirical_gauss models."
-            )
+        if vel_model == "cc":
+            full_flow_solver = full_flow_cc_solver
+        elif vel_model == "turbopark":
+            full_flow_solver = full_flow_turbopark_solver
         elif vel_model == "empirical_gauss":
-            full_flow_empirical_gauss_solver(self.farm, self.flow_field, field_grid, self.wake)
+            full_flow_solver = full_flow_empirical_gauss_solver
         else:
-            full_flow_sequential_solver(self.farm, self.flow_field, field_grid, self.wake)
+            full_flow_solver = full_flow_sequential_solver
+
+        with profiled_phase(get_active_profiler(), full_flow_solver.__name__):
+            full_flow_solver(
+                self.farm, self.flow_field, field_grid, self.wake, turbine_grid_solution
+            )
 
         return self.flow_field.u_sorted[:,:,0,0] # Remove turbine grid dimensions
 
@@ -282,6 +615,50 @@ class Core(BaseClass):
         for more details.
         """
 
+        profile_arrays = self.solve_for_velocity_deficit_profile_arrays(
+            direction,
+            downstream_dists,
+            profile_range,
+            resolution,
+            homogeneous_wind_speed,
+            ref_rotor_diameter,
+            x_start,
+            y_start,
+            reference_height,
+        )
+
+        velocity_deficit_profiles = []
+
+        for i in range(len(downstream_dists)):
+            df = pd.DataFrame({name: values[0, i] for name, values in profile_arrays.items()})
+            velocity_deficit_profiles.append(df)
+
+        return velocity_deficit_profiles
+
+    def solve_for_velocity_deficit_profile_arrays(
+        self,
+        direction: str,
+        downstream_dists: NDArrayFloat | list,
+        profile_range: NDArrayFloat | list,
+        resolution: int,
+        homogeneous_wind_speed: float | NDArrayFloat,
+        ref_rotor_diameter: float,
+        x_start: float,
+        y_start: float,
+        reference_height: float,
+        turbine_grid_solution: tuple | None = None,
+    ) -> dict[str, NDArrayFloat]:
+        """
+        Extract velocity deficit profiles for all findices. See
+        :py:meth:`~floris.floris_model.FlorisModel.sample_batched_velocity_deficit_profiles`
+        for more details. The sample points are shared by all findices with the same wind
+        direction, so the points are solved together for each unique wind direction.
+
+        Returns:
+            dict[str, NDArrayFloat]: The coordinates and velocity deficit of the sample points,
+            each with dimensions (n_findex, n_lines, resolution).
+        """
+
         # Create a grid that contains coordinates for all the sample points in all profiles.
         # Effectively, this is a grid of parallel lines.
         n_lines = len(downstream_dists)
@@ -303,41 +680,51 @@ class Core(BaseClass):
             x3 = single_line * np.ones((n_lines, resolution))
             x2 = np.zeros((n_lines, resolution))
 
-        # Find the coordinates of the sample points in the inertial frame (x, y, z). This is done
-        # through one rotation and one translation.
-        x, y, z = reverse_rotate_coordinates_rel_west(
+        # Find the coordinates of the sample points in the inertial frame (x, y, z) for each
+        # unique wind direction. This is done through one rotation and one translation.
+        unique_wind_directions, wind_direction_indices = np.unique(
             self.flow_field.wind_directions,
+            return_inverse=True,
+        )
+        x, y, z = reverse_rotate_coordinates_rel_west(
+            unique_wind_directions,
             x1[None, :, :],
             x2[None, :, :],
             x3[None, :, :],
             x_center_of_rotation=0.0,
             y_center_of_rotation=0.0,
         )
-        x = np.squeeze(x, axis=0) + x_start
-        y = np.squeeze(y, axis=0) + y_start
-        z = np.squeeze(z, axis=0) + reference_height
+        x = x + x_start
+        y = y + y_start
+        z = z + reference_height
+
+        if turbine_grid_solution is None:
+            turbine_grid_solution = self.solve_turbine_grid_for_viz()
+
+        u = np.zeros((self.flow_field.n_findex, n_lines, resolution))
+        for i in range(len(unique_wind_directions)):
+            u_points = self.solve_for_points(
+                x[i].flatten(),
+                y[i].flatten(),
+                z[i].flatten(),
+                turbine_grid_solution,
+            )
+            findices = wind_direction_indices == i
+            u[findices] = np.reshape(u_points[findices], (-1, n_lines, resolution))
 
-        u = self.solve_for_points(x.flatten(), y.flatten(), z.flatten())
-        u = np.reshape(u[0, :], (n_lines, resolution))
+        homogeneous_wind_speed = np.reshape(homogeneous_wind_speed, (-1, 1, 1))
         velocity_deficit = (homogeneous_wind_speed - u) / homogeneous_wind_speed
 
-        velocity_deficit_profiles = []
-
-        for i in range(n_lines):
-            df = pd.DataFrame(
-                {
-                    'x': x[i],
-                    'y': y[i],
-                    'z': z[i],
-                    'x1/D': x1[i]/ref_rotor_diameter,
-                    'x2/D': x2[i]/ref_rotor_diameter,
-                    'x3/D': x3[i]/ref_rotor_diameter,
-                    'velocity_deficit': velocity_deficit[i],
-                }
-            )
-            velocity_deficit_profiles.append(df)
-
-        return velocity_deficit_profiles
+        shape = u.shape
+        return {
+            'x': x[wind_direction_indices],
+            'y': y[wind_direction_indices],
+            'z': z[wind_direction_indices],
+            'x1/D': np.broadcast_to(x1 / ref_rotor_diameter, shape),
+            'x2/D': np.broadcast_to(x2 / ref_rotor_diameter, shape),
+            'x3/D': np.broadcast_to(x3 / ref_rotor_diameter, shape),
+            'velocity_deficit': velocity_deficit,
+        }
 
     def finalize(self):
         # Once the wake calculation is finished, unsort the values to match
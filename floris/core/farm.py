@@ -35,6 +35,67 @@ from floris.utilities import load_yaml
 
 default_turbine_library_path = Path(__file__).parents[1] / "turbine_library"
 
+# Parsed turbine definition files, shared by all farms in this process. Each entry is keyed by
+# the resolved file path and holds the modification time of the file when it was parsed, so
+# that a file that is edited is parsed again.
+_turbine_file_cache: dict[Path, tuple[int, dict]] = {}
+
+
+def load_turbine_definition(path: Path) -> dict:
+    """
+    Load a turbine definition file, reusing the parsed definition if the file has not been
+    modified since it was last loaded in this process. Files included in the definition
+    with the "!include" tag are not checked for modifications.
+
+    Args:
+        path (Path): The path to the turbine definition YAML file.
+
+    Returns:
+        dict: A copy of the turbine definition, which the caller may modify.
+    """
+    path = Path(path).resolve()
+    mtime = path.stat().st_mtime_ns
+    cached = _turbine_file_cache.get(path)
+    if cached is None or cached[0] != mtime:
+        cached = (mtime, load_yaml(path))
+        _turbine_file_cache[path] = cached
+    return copy.deepcopy(cached[1])
+
+
+class ReadOnlyDict(dict):
+    """
+    A dict that raises a TypeError when it is modified, e.g. a turbine definition shared by
+    all of the turbines of a type. Copies and deep copies are regular dicts that may be
+    modified.
+    """
+
+    def _read_only(self, *args, **kwargs):
+        raise TypeError(
+            f"{type(self).__name__} cannot be modified. Copy it with copy.deepcopy() first."
+        )
+
+    __setitem__ = __delitem__ = __ior__ = _read_only
+    clear = pop = popitem = setdefault = update = _read_only
+
+    def __copy__(self) -> dict:
+        return dict(self)
+
+    def __deepcopy__(self, memo: dict) -> dict:
+        return {k: copy.deepcopy(v, memo) for k, v in self.items()}
+
+    def __reduce__(self):
+        return (type(self), (dict(self),))
+
+
+def read_only_dict(value: dict) -> ReadOnlyDict:
+    """
+    Get a read-only view of a dict and of the dicts nested in it, without copying their
+    other values.
+    """
+    return ReadOnlyDict({
+        k: read_only_dict(v) if isinstance(v, dict) else v for k, v in value.items()
+    })
+
 
 @define
 class Farm(BaseClass):
@@ -153,7 +214,8 @@ class Farm(BaseClass):
                             f"'{t['turbine_type']}'. "\
                             "Please specify a unique 'turbine_type' for each turbine definition."
                         )
-                self._turbine_definition_cache[t["turbine_type"]] = t
+                # Copy the definition so that the caller's dict is not shared by the turbines
+                self._turbine_definition_cache[t["turbine_type"]] = copy.deepcopy(t)
 
             # If a turbine type is a string, then it is expected in the internal or external
             # turbine library
@@ -185,7 +247,7 @@ class Farm(BaseClass):
                         f"The turbine type: {t} does not exist in either the internal or"
                         " external turbine library."
                     )
-                self._turbine_definition_cache[t] = load_yaml(full_path)
+                self._turbine_definition_cache[t] = load_turbine_definition(full_path)
 
         # Convert any dict entries in the turbine_type list to the type string. Since the
         # definition is saved above, we can make the whole list consistent now to use it
@@ -209,10 +271,12 @@ class Farm(BaseClass):
         for _, v in self._turbine_definition_cache.items():
             check_turbine_definition_for_v3_keys(v)
 
-        # Map each turbine definition to its index in this list
-        self.turbine_definitions = [
-            copy.deepcopy(self._turbine_definition_cache[t]) for t in self._turbine_types
-        ]
+        # Map each turbine definition to its index in this list. Turbines of the same type share
+        # a read-only definition, which must be copied with copy.deepcopy() to modify it.
+        read_only_definitions = {
+            k: read_only_dict(v) for k, v in self._turbine_definition_cache.items()
+        }
+        self.turbine_definitions = [read_only_definitions[t] for t in self._turbine_types]
 
     @layout_x.validator
     def check_x(self, attribute: attrs.Attribute, value: Any) -> None:
@@ -2,12 +2,10 @@
 from __future__ import annotations
 
 import attrs
-import matplotlib.path as mpltPath
 import numpy as np
 from attrs import define, field
 from scipy.interpolate import LinearNDInterpolator
 from scipy.spatial import ConvexHull
-from shapely.geometry import Polygon
 
 from floris.core import (
     BaseClass,
@@ -163,6 +161,11 @@ class FlowField(BaseClass):
         # If heterogeneous flow data is given, the speed ups at the defined
         # grid locations are determined in either 2 or 3 dimensions.
         else:
+            # Only needed for heterogeneous inflow, so imported here to keep them out of
+            # the import of floris
+            import matplotlib.path as mpltPath
+            from shapely.geometry import Polygon
+
             bounds = np.array(list(zip(
                 self.heterogeneous_inflow_config['x'],
                 self.heterogeneous_inflow_config['y']
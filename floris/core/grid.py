@@ -42,7 +42,8 @@ class Grid(ABC, BaseClass):
 
     Args:
         turbine_coordinates (:py:obj:`NDArrayFloat`): The arrays of turbine coordinates as Numpy
-            arrays with shape (N coordinates, 3).
+            arrays with shape (N coordinates, 3). The turbine grids also accept coordinates
+            specific to each findex with shape (n_findex, N coordinates, 3).
         turbine_diameters (:py:obj:`NDArrayFloat`): The rotor diameters of each turbine.
         wind_directions (:py:obj:`NDArrayFloat`): Wind directions supplied by the user.
         grid_resolution (:py:obj:`int` | :py:obj:`Iterable(int,)`): Grid resolution with values
@@ -76,7 +77,7 @@ class Grid(ABC, BaseClass):
                 "with three components of type `float`."
             )
 
-        self.n_turbines = len(value)
+        self.n_turbines = value.shape[-2] if value.ndim > 1 else len(value)
 
     @wind_directions.validator
     def wind_directions_validator(self, instance: attrs.Attribute, value: NDArrayFloat) -> None:
@@ -609,13 +610,15 @@ class FlowFieldPlanarGrid(Grid):
             self.y_sorted = y_points[None, :, :, :]
             self.z_sorted = z_points[None, :, :, :]
 
-        # Now calculate grid coordinates in original frame (from 270 deg perspective)
+        # Now calculate grid coordinates in original frame (from 270 deg perspective).
+        # The rotated grid is shared by all findex, but the inertial frame grid is not.
+        findex_shape = (len(self.wind_directions),) + self.x_sorted.shape[1:]
         self.x_sorted_inertial_frame, self.y_sorted_inertial_frame, self.z_sorted_inertial_frame = \
             reverse_rotate_coordinates_rel_west(
                 wind_directions=self.wind_directions,
-                grid_x=self.x_sorted,
-                grid_y=self.y_sorted,
-                grid_z=self.z_sorted,
+                grid_x=np.broadcast_to(self.x_sorted, findex_shape),
+                grid_y=np.broadcast_to(self.y_sorted, findex_shape),
+                grid_z=np.broadcast_to(self.z_sorted, findex_shape),
                 x_center_of_rotation=self.x_center_of_rotation,
                 y_center_of_rotation=self.y_center_of_rotation,
             )
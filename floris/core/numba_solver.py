@@ -0,0 +1,1285 @@
+
+from __future__ import annotations
+
+import importlib.util
+import math
+import os
+import threading
+
+import numpy as np
+
+from floris.core import (
+    Farm,
+    FlowField,
+    Grid,
+    TurbineCubatureGrid,
+    TurbineGrid,
+)
+from floris.core.profiler import profiled, Profiler
+from floris.core.solver import empirical_gauss_solver, sequential_solver
+from floris.core.turbine.operation_models import CosineLossTurbine, SimpleTurbine
+from floris.core.wake import WakeModelManager
+from floris.core.wake_velocity.empirical_gauss import awc_added_wake_mixing
+from floris.core.wake_velocity.gauss import EXP_ARGUMENT_MIN
+
+
+# This module, and numba, are only imported by Core the first time a model with the numba
+# solver backend is solved, so that importing FLORIS does not import numba.
+# The kernels run on numba's workqueue threading layer unless another layer is chosen, e.g.
+# with the NUMBA_THREADING_LAYER environment variable. The TBB and OpenMP layers can hang or
+# abort processes that fork once they are running, as the multiprocessing interfaces do. The
+# layer is chosen when the first parallel kernel of the process runs, so it cannot be changed
+# once another parallel numba function has run.
+if importlib.util.find_spec("numba") is not None:
+    import numba
+    if "NUMBA_THREADING_LAYER" not in os.environ and numba.config.THREADING_LAYER == "default":
+        numba.config.THREADING_LAYER = "workqueue"
+else:
+    numba = None
+
+
+# The compiled solvers reproduce sequential_solver and empirical_gauss_solver for the most
+# common models. Each findex is solved independently, so the findices are split across threads,
+# and the loop over turbines runs in compiled code for each findex, evaluating the models point
+# by point without allocating arrays over the whole grid. NumPy semantics are kept for
+# floating point errors, so the results match the NumPy solvers to rounding.
+if numba is not None:
+    _jit = numba.njit(cache=True, error_model="numpy")
+    _jit_parallel = numba.njit(cache=True, error_model="numpy", parallel=True)
+    _prange = numba.prange
+else:
+    def _jit(function):
+        return function
+    _jit_parallel = _jit
+    _prange = range
+
+NUM_EPS = 0.001
+
+# Integer codes for the models and operation models supported by the compiled solvers
+VELOCITY_MODELS = {"gauss": 0, "jensen": 1, "empirical_gauss": 2}
+DEFLECTION_MODELS = {"none": 0, "gauss": 1, "jimenez": 2, "empirical_gauss": 3}
+COMBINATION_MODELS = {"fls": 0, "max": 1, "sosfs": 2}
+OPERATION_MODELS = {
+    CosineLossTurbine.thrust_coefficient: 0,
+    SimpleTurbine.thrust_coefficient: 1,
+}
+
+# The denominator of the exponent of the Gaussian wake profiles, 2 * sigma ** 2 with
+# sigma = sqrt(0.5), as computed by gaussian_function
+_GAUSS_DENOMINATOR = 2 * np.sqrt(0.5) ** 2
+
+# Value of negative infinity after np.nan_to_num
+_FLOAT_MAX = np.finfo(np.float64).max
+
+_kernel_lock = threading.Lock()
+
+
+def numba_solver_unsupported_reason(
+    farm: Farm,
+    grid: Grid | None,
+    model_manager: WakeModelManager,
+) -> str | None:
+    """
+    Check whether the numba solver backend can solve a farm with the given grid and wake
+    models.
+
+    Args:
+        farm (Farm): The farm, initialized for the solve.
+        grid (Grid | None): The grid of the solve, or None for the 3x3 TurbineGrid used by
+            the full flow solvers.
+        model_manager (WakeModelManager): The wake models.
+
+    Returns:
+        str | None: Why the numba backend cannot be used, or None if it can.
+    """
+    if numba is None:
+        return "The numba solver backend requires numba, which is not installed."
+
+    model_strings = {k: v.lower() for k, v in model_manager.model_strings.items()}
+    velocity_model = model_strings["velocity_model"]
+    if velocity_model not in VELOCITY_MODELS:
+        return f"The numba solver backend does not support the {velocity_model} velocity model."
+
+    if velocity_model == "empirical_gauss":
+        supported_models = {
+            "deflection_model": ["empirical_gauss"],
+            "turbulence_model": ["wake_induced_mixing"],
+            "combination_model": list(COMBINATION_MODELS),
+        }
+        if model_manager.enable_secondary_steering or model_manager.enable_transverse_velocities:
+            return (
+                "The numba solver backend does not support secondary steering or transverse "
+                "velocities with the empirical_gauss velocity model."
+            )
+    else:
+        supported_models = {
+            "deflection_model": ["none", "gauss", "jimenez"],
+            "turbulence_model": ["crespo_hernandez"],
+            "combination_model": list(COMBINATION_MODELS),
+        }
+    for model_type, models in supported_models.items():
+        if model_strings[model_type] not in models:
+            return (
+                f"The numba solver backend does not support the {model_strings[model_type]} "
+                f"{model_type.replace('_', ' ')} with the {velocity_model} velocity model."
+            )
+
+    if grid is not None and not isinstance(grid, (TurbineGrid, TurbineCubatureGrid)):
+        return "The numba solver backend only solves on turbine grids."
+
+    for turbine in farm.turbine_map:
+        if OPERATION_MODELS.get(turbine.thrust_coefficient_function) is None:
+            return (
+                "The numba solver backend does not support the "
+                f"{turbine.operation_model} operation model."
+            )
+        if "thrust_coefficient" not in turbine.power_thrust_table:
+            return "The numba solver backend does not support multidimensional turbines."
+        if turbine.correct_cp_ct_for_tilt or (
+            velocity_model == "empirical_gauss" and turbine.tilt_interp is not None
+        ):
+            return "The numba solver backend does not support floating turbines."
+
+    return None
+
+
+def _turbine_tables(farm: Farm) -> tuple:
+    # Thrust coefficient tables of each turbine type, padded to the same length, and the index
+    # of the type of each turbine
+    turbine_types = list(farm.turbine_power_thrust_tables)
+    n_points = np.array([
+        len(farm.turbine_power_thrust_tables[t]["wind_speed"]) for t in turbine_types
+    ])
+    wind_speeds = np.zeros((len(turbine_types), n_points.max()))
+    thrust_coefficients = np.zeros_like(wind_speeds)
+    for k, turbine_type in enumerate(turbine_types):
+        table = farm.turbine_power_thrust_tables[turbine_type]
+        order = np.argsort(table["wind_speed"])
+        wind_speeds[k, :n_points[k]] = np.asarray(table["wind_speed"], dtype=float)[order]
+        thrust_coefficients[k, :n_points[k]] = (
+            np.asarray(table["thrust_coefficient"], dtype=float)[order]
+        )
+    operation_models = np.array([
+        OPERATION_MODELS[farm.turbine_thrust_coefficient_functions[t]] for t in turbine_types
+    ])
+    ref_tilts = np.array(
+        [farm.turbine_power_thrust_tables[t]["ref_tilt"] for t in turbine_types], dtype=float
+    )
+    type_indices = {turbine_type: k for k, turbine_type in enumerate(turbine_types)}
+    turbine_type_indices = np.vectorize(type_indices.__getitem__, otypes=[np.int64])(
+        farm.turbine_type_map_sorted
+    )
+    return (
+        turbine_type_indices,
+        wind_speeds,
+        thrust_coefficients,
+        n_points,
+        operation_models,
+        ref_tilts,
+    )
+
+
+def _rotor_average_arguments(grid: Grid) -> tuple:
+    # Weights of the points along the first grid axis for the rotor-average velocity, and
+    # whether it is a cubic average
+    n_points = grid.x_sorted.shape[2]
+    if grid.cubature_weights is None:
+        weights = np.ones(n_points)
+    else:
+        weights = grid.cubature_weights.flatten()
+        weights = weights * len(weights) / np.sum(weights)
+    return weights, grid.average_method in ("cubic-mean", "cubic-cubature")
+
+
+def _float_array(array) -> np.ndarray:
+    return np.ascontiguousarray(array, dtype=float)
+
+
+def _run_kernel(kernel, *args) -> None:
+    # The workqueue threading layer cannot run kernels from several threads at once. Each
+    # kernel is already parallel, so launches are serialized.
+    with _kernel_lock:
+        kernel(*args)
+
+
+def numba_sequential_solver(
+    farm: Farm,
+    flow_field: FlowField,
+    grid: TurbineGrid,
+    model_manager: WakeModelManager,
+    profiler: Profiler | None = None,
+) -> None:
+    """
+    Compiled equivalent of :py:func:`~floris.core.solver.sequential_solver` for the gauss
+    and jensen velocity models with the none, gauss or jimenez deflection models, the
+    crespo_hernandez turbulence model and any combination model. See
+    :py:func:`numba_solver_unsupported_reason` for the supported turbines.
+
+    Args:
+        farm (Farm)
+        flow_field (FlowField)
+        grid (TurbineGrid)
+        model_manager (WakeModelManager)
+        profiler (Profiler, optional): Profiler to time the solve with.
+    """
+    velocity_model = model_manager.velocity_model
+    deflection_model = model_manager.deflection_model
+    turbulence_model = model_manager.turbulence_model
+    velocity_model_string = model_manager.model_strings["velocity_model"].lower()
+    deflection_model_string = model_manager.model_strings["deflection_model"].lower()
+
+    if velocity_model_string == "gauss":
+        velocity_parameters = [
+            velocity_model.alpha, velocity_model.beta, velocity_model.ka, velocity_model.kb
+        ]
+    else:
+        velocity_parameters = [velocity_model.we]
+    if deflection_model_string == "gauss":
+        deflection_parameters = [
+            deflection_model.ad,
+            deflection_model.bd,
+            deflection_model.alpha,
+            deflection_model.beta,
+            deflection_model.ka,
+            deflection_model.kb,
+            deflection_model.dm,
+        ]
+    elif deflection_model_string == "jimenez":
+        deflection_parameters = [deflection_model.kd, deflection_model.ad, deflection_model.bd]
+    else:
+        deflection_parameters = []
+    turbulence_parameters = [
+        turbulence_model.initial,
+        turbulence_model.constant,
+        turbulence_model.ai,
+        turbulence_model.downstream,
+    ]
+
+    u = _float_array(flow_field.u_sorted).copy()
+    v = _float_array(flow_field.v_sorted).copy()
+    w = _float_array(flow_field.w_sorted).copy()
+    turbulence_intensity_field = np.empty_like(u)
+    weights, cubic_average = _rotor_average_arguments(grid)
+
+    _run_kernel(
+        profiled(profiler, _sequential_kernel, "sequential_kernel"),
+        _float_array(grid.x_sorted),
+        _float_array(grid.y_sorted),
+        _float_array(grid.z_sorted),
+        _float_array(flow_field.u_initial_sorted),
+        _float_array(flow_field.dudz_initial_sorted),
+        u,
+        v,
+        w,
+        turbulence_intensity_field,
+        _float_array(flow_field.turbulence_intensities),
+        _float_array(farm.yaw_angles_sorted),
+        _float_array(farm.tilt_angles_sorted),
+        _float_array(farm.hub_heights_sorted),
+        _float_array(farm.rotor_diameters_sorted),
+        _float_array(farm.TSRs_sorted),
+        *_turbine_tables(farm),
+        weights,
+        cubic_average,
+        float(grid.grid_resolution),
+        float(flow_field.wind_shear),
+        float(flow_field.wind_veer),
+        VELOCITY_MODELS[velocity_model_string],
+        np.array(velocity_parameters, dtype=float),
+        DEFLECTION_MODELS[deflection_model_string],
+        np.array(deflection_parameters, dtype=float),
+        np.array(turbulence_parameters, dtype=float),
+        COMBINATION_MODELS[model_manager.model_strings["combination_model"].lower()],
+        bool(model_manager.enable_secondary_steering),
+        bool(model_manager.enable_transverse_velocities),
+        bool(model_manager.enable_yaw_added_recovery),
+    )
+
+    flow_field.u_sorted = u
+    flow_field.v_sorted = v
+    flow_field.w_sorted = w
+    flow_field.turbulence_intensity_field_sorted = turbulence_intensity_field
+    flow_field.turbulence_intensity_field_sorted_avg = np.mean(
+        turbulence_intensity_field,
+        axis=(2,3)
+    )[:, :, None, None]
+
+
+def numba_empirical_gauss_solver(
+    farm: Farm,
+    flow_field: FlowField,
+    grid: TurbineGrid,
+    model_manager: WakeModelManager,
+    profiler: Profiler | None = None,
+) -> np.ndarray:
+    """
+    Compiled equivalent of :py:func:`~floris.core.solver.empirical_gauss_solver` for the
+    empirical_gauss velocity and deflection models with the wake_induced_mixing turbulence
+    model and any combination model. See :py:func:`numba_solver_unsupported_reason` for the
+    supported turbines.
+
+    Args:
+        farm (Farm)
+        flow_field (FlowField)
+        grid (TurbineGrid)
+        model_manager (WakeModelManager)
+        profiler (Profiler, optional): Profiler to time the solve with.
+
+    Returns:
+        NDArrayFloat: wake induced mixing field primarily for use in the full-flow EmGauss solver
+    """
+    velocity_model = model_manager.velocity_model
+    deflection_model = model_manager.deflection_model
+    if len(velocity_model.wake_expansion_rates) != len(velocity_model.breakpoints_D) + 1:
+        raise ValueError("Invalid combination of wake_expansion_rates and breakpoints.")
+
+    velocity_parameters = [
+        velocity_model.sigma_0_D,
+        velocity_model.smoothing_length_D,
+        velocity_model.mixing_gain_velocity,
+    ]
+    deflection_parameters = [
+        deflection_model.horizontal_deflection_gain_D,
+        deflection_model.vertical_deflection_gain_D,
+        deflection_model.deflection_rate,
+        deflection_model.mixing_gain_deflection,
+        deflection_model.yaw_added_mixing_gain,
+    ]
+
+    # Active wake control only depends on the setpoints, so its mixing is computed up front
+    awc_mixing = np.zeros(farm.yaw_angles_sorted.shape)
+    if model_manager.enable_active_wake_mixing:
+        for i in range(grid.n_turbines):
+            awc_mixing[:, i:i+1] = awc_added_wake_mixing(
+                farm.awc_modes_sorted[:, i:i+1, None, None],
+                farm.awc_amplitudes_sorted[:, i:i+1, None, None],
+                farm.awc_frequencies_sorted[:, i:i+1, None, None],
+                velocity_model.awc_wake_exp,
+                velocity_model.awc_wake_denominator,
+            )
+
+    # Initialize the mixing factor model using TI if specified
+    mixing_factor = np.repeat(
+        np.eye(grid.n_turbines)[None, :, :] * model_manager.turbulence_model.atmospheric_ti_gain,
+        flow_field.n_findex,
+        axis=0,
+    )
+    mixing_factor = mixing_factor * flow_field.turbulence_intensities[:, None, None]
+
+    u = _float_array(flow_field.u_sorted).copy()
+    weights, cubic_average = _rotor_average_arguments(grid)
+
+    _run_kernel(
+        profiled(profiler, _empirical_gauss_kernel, "empirical_gauss_kernel"),
+        _float_array(grid.x_sorted),
+        _float_array(grid.y_sorted),
+        _float_array(grid.z_sorted),
+        _float_array(flow_field.u_initial_sorted),
+        u,
+        mixing_factor,
+        _float_array(farm.yaw_angles_sorted),
+        _float_array(farm.tilt_angles_sorted),
+        _float_array(farm.hub_heights_sorted),
+        _float_array(farm.rotor_diameters_sorted),
+        awc_mixing,
+        *_turbine_tables(farm),
+        weights,
+        cubic_average,
+        float(grid.grid_resolution),
+        float(flow_field.wind_veer),
+        np.array(velocity_parameters, dtype=float),
+        _float_array(velocity_model.wake_expansion_rates),
+        _float_array(velocity_model.breakpoints_D),
+        np.array(deflection_parameters, dtype=float),
+        COMBINATION_MODELS[model_manager.model_strings["combination_model"].lower()],
+        bool(model_manager.enable_yaw_added_recovery),
+    )
+
+    flow_field.u_sorted = u
+    return mixing_factor
+
+
+NUMBA_SOLVERS = {
+    sequential_solver: numba_sequential_solver,
+    empirical_gauss_solver: numba_empirical_gauss_solver,
+}
+
+
+## Turbine quantities
+
+@_jit
+def _cosd(angle):
+    return math.cos(math.radians(angle))
+
+
+@_jit
+def _sind(angle):
+    return math.sin(math.radians(angle))
+
+
+@_jit
+def _block_sum(values, start, n):
+    # One block of NumPy's pairwise summation, which sums up to 128 values with eight
+    # accumulators
+    if n < 8:
+        total = -0.0
+        for k in range(start, start + n):
+            total += values[k]
+        return total
+    r0 = values[start]
+    r1 = values[start + 1]
+    r2 = values[start + 2]
+    r3 = values[start + 3]
+    r4 = values[start + 4]
+    r5 = values[start + 5]
+    r6 = values[start + 6]
+    r7 = values[start + 7]
+    k = 8
+    while k < n - n % 8:
+        r0 += values[start + k]
+        r1 += values[start + k + 1]
+        r2 += values[start + k + 2]
+        r3 += values[start + k + 3]
+        r4 += values[start + k + 4]
+        r5 += values[start + k + 5]
+        r6 += values[start + k + 6]
+        r7 += values[start + k + 7]
+        k += 8
+    total = ((r0 + r1) + (r2 + r3)) + ((r4 + r5) + (r6 + r7))
+    for k in range(start + k, start + n):
+        total += values[k]
+    return total
+
+
+@_jit
+def _pairwise_sum(values, start, n):
+    # Sum of values[start:start + n] in the same order as NumPy: pairwise summation within
+    # each buffer of 8192 values, and the buffers added in turn. The means of the rotor points
+    # must match NumPy exactly, since the turbine locations are compared with the locations of
+    # the points.
+    if n <= 8192:
+        return _buffer_sum(values, start, n)
+    total = -0.0
+    for buffer_start in range(start, start + n, 8192):
+        total += _buffer_sum(values, buffer_start, min(8192, start + n - buffer_start))
+    return total
+
+
+@_jit
+def _buffer_sum(values, start, n):
+    if n <= 128:
+        return _block_sum(values, start, n)
+
+    # Larger sums are split in halves, as in NumPy, using explicit stacks since recursion is
+    # not supported in the parallel kernels
+    starts = np.empty(128, dtype=np.int64)
+    sizes = np.empty(128, dtype=np.int64)
+    split = np.zeros(128, dtype=np.bool_)
+    sums = np.empty(128)
+    n_nodes = 1
+    n_sums = 0
+    starts[0] = start
+    sizes[0] = n
+    while n_nodes > 0:
+        n_nodes -= 1
+        node_start = starts[n_nodes]
+        node_size = sizes[n_nodes]
+        if split[n_nodes]:
+            # Both halves have been summed
+            split[n_nodes] = False
+            n_sums -= 1
+            sums[n_sums - 1] += sums[n_sums]
+        elif node_size <= 128:
+            sums[n_sums] = _block_sum(values, node_start, node_size)
+            n_sums += 1
+        else:
+            n2 = node_size // 2
+            n2 -= n2 % 8
+            split[n_nodes] = True
+            n_nodes += 1
+            starts[n_nodes] = node_start + n2
+            sizes[n_nodes] = node_size - n2
+            split[n_nodes] = False
+            starts[n_nodes + 1] = node_start
+            sizes[n_nodes + 1] = n2
+            split[n_nodes + 1] = False
+            n_nodes += 2
+    return sums[0]
+
+
+@_jit
+def _mean(values):
+    return _pairwise_sum(values.ravel(), 0, values.size) / values.size
+
+
+@_jit
+def _cubic_mean(values):
+    return np.cbrt(_mean(values ** 3.0))
+
+
+@_jit
+def _rotor_average_velocity(velocities, weights, cubic_average):
+    n1, n2 = velocities.shape
+    values = np.empty(n1 * n2)
+    for p in range(n1):
+        for q in range(n2):
+            if cubic_average:
+                values[p * n2 + q] = velocities[p, q] ** 3.0 * weights[p]
+            else:
+                values[p * n2 + q] = velocities[p, q] * weights[p]
+    average = _pairwise_sum(values, 0, values.size) / values.size
+    return np.cbrt(average) if cubic_average else average
+
+
+@_jit
+def _thrust_coefficient_axial_induction(
+    rotor_average_velocity,
+    yaw_angle,
+    tilt_angle,
+    wind_speeds,
+    thrust_coefficients,
+    n_points,
+    operation_model,
+    ref_tilt,
+):
+    # Linear interpolation of the thrust coefficient table as by scipy's interp1d, which is
+    # 0.0001 outside of the table
+    if (
+        rotor_average_velocity < wind_speeds[0]
+        or rotor_average_velocity > wind_speeds[n_points - 1]
+    ):
+        ct = 0.0001
+    else:
+        k = np.searchsorted(wind_speeds[:n_points], rotor_average_velocity)
+        k = min(max(k, 1), n_points - 1)
+        slope = (
+            (thrust_coefficients[k] - thrust_coefficients[k - 1])
+            / (wind_speeds[k] - wind_speeds[k - 1])
+        )
+        ct = slope * (rotor_average_velocity - wind_speeds[k - 1]) + thrust_coefficients[k - 1]
+    ct = min(max(ct, 0.0001), 0.9999)
+
+    if operation_model == 0:
+        # Cosine loss
+        misalignment_loss = _cosd(yaw_angle) * _cosd(tilt_angle - ref_tilt)
+        ct = ct * _cosd(yaw_angle) * _cosd(tilt_angle - ref_tilt)
+        axial_induction = (
+            0.5 / misalignment_loss * (1 - math.sqrt(1 - ct * misalignment_loss))
+        )
+    else:
+        axial_induction = (1 - math.sqrt(1 - ct)) / 2
+    return ct, axial_induction
+
+
+## Wake models, evaluated at one point
+
+@_jit
+def _gaussian(C, r):
+    exponent = r / _GAUSS_DENOMINATOR
+    if not exponent < -EXP_ARGUMENT_MIN:
+        exponent = -EXP_ARGUMENT_MIN
+    return C * math.exp(-1 * exponent)
+
+
+@_jit
+def _combine(combination_model, wake, deficit):
+    if combination_model == 0:
+        return wake + deficit
+    elif combination_model == 1:
+        return max(wake, deficit)
+    return math.hypot(wake, deficit)
+
+
+@_jit
+def _vortex_profile(Gamma, y, z, z_vortex, eps, decay):
+    r2 = y ** 2 + (z - z_vortex + NUM_EPS) ** 2
+    exponent = r2 / (eps ** 2)
+    if not exponent < -EXP_ARGUMENT_MIN:
+        exponent = -EXP_ARGUMENT_MIN
+    return Gamma / (2 * np.pi * r2) * (1 - math.exp(-1 * exponent)) * decay
+
+
+@_jit
+def _gauss_deflection(
+    x, freestream_velocity, x_i, yaw, turbulence_intensity, ct, D, cos_veer, parameters
+):
+    ad = parameters[0]
+    bd = parameters[1]
+    alpha = parameters[2]
+    beta = parameters[3]
+    ka = parameters[4]
+    kb = parameters[5]
+    dm = parameters[6]
+
+    # Opposite sign convention in this model
+    yaw = -1 * yaw
+    cos_yaw = _cosd(yaw)
+    ct_cos = ct * _cosd(0.0) * cos_yaw
+
+    x0 = (
+        D
+        * (cos_yaw * (1 + math.sqrt(1 - ct * cos_yaw)))
+        / (np.sqrt(2) * (4 * alpha * turbulence_intensity + 2 * beta * (1 - math.sqrt(1 - ct))))
+        + x_i
+    )
+    theta_c0 = dm * (0.3 * math.radians(yaw) / cos_yaw)
+    theta_c0 *= (1 - math.sqrt(1 - ct * cos_yaw))
+    delta0 = math.tan(theta_c0) * (x0 - x_i)
+
+    if x >= x_i and x <= x0:
+        return ((x - x_i) / (x0 - x_i)) * delta0 + (ad + bd * (x - x_i))
+    elif x > x0:
+        sigma_z0 = D * 0.5 * math.sqrt(
+            (freestream_velocity * ct_cos / (2.0 * (1 - math.sqrt(1 - ct_cos))))
+            / (freestream_velocity + freestream_velocity * math.sqrt(1 - ct))
+        )
+        sigma_y0 = sigma_z0 * cos_yaw * cos_veer
+        ky = ka * turbulence_intensity + kb
+        kz = ka * turbulence_intensity + kb
+        C0 = 1 - freestream_velocity * math.sqrt(1 - ct) / freestream_velocity
+        M0 = C0 * (2 - C0)
+        E0 = C0 ** 2 - 3 * np.exp(1.0 / 12.0) * C0 + 3 * np.exp(1.0 / 3.0)
+        expansion = math.sqrt(
+            (ky * (x - x0) + sigma_y0) * (kz * (x - x0) + sigma_z0) / (sigma_y0 * sigma_z0)
+        )
+        return (
+            delta0
+            + theta_c0 * E0 / 5.2 * math.sqrt(sigma_y0 * sigma_z0 / (ky * kz * M0))
+            * math.log(
+                ((1.6 + math.sqrt(M0)) * (1.6 * expansion - math.sqrt(M0)))
+                / ((1.6 - math.sqrt(M0)) * (1.6 * expansion + math.sqrt(M0)))
+            )
+            + (ad + bd * (x - x_i))
+        )
+    return 0.0
+
+
+@_jit
+def _jimenez_deflection(x, x_i, yaw, ct, D, parameters):
+    kd = parameters[0]
+    ad = parameters[1]
+    bd = parameters[2]
+    xi_init = _cosd(yaw) * _sind(yaw) * ct / 2.0
+    delta_x = x - x_i
+    A = 15 * (2 * kd * delta_x / D + 1) ** 4.0 + xi_init ** 2.0
+    B = (30 * kd / D) * (2 * kd * delta_x / D + 1) ** 5.0
+    C = xi_init * D * (15 + xi_init ** 2.0)
+    yYaw_init = (xi_init * A / B) - (C / (30 * kd))
+    return yYaw_init + ad + bd * delta_x
+
+
+@_jit
+def _gauss_rC(sigma_y, sigma_z, delta_y, delta_z, wind_veer, ct_D2):
+    if wind_veer == 0.0:
+        r = delta_y ** 2 / (2 * sigma_y ** 2) + delta_z ** 2 / (2 * sigma_z ** 2)
+    else:
+        cos_veer_2 = math.cos(wind_veer) ** 2
+        sin_veer_2 = math.sin(wind_veer) ** 2
+        sin_2veer = math.sin(2 * wind_veer)
+        r = (
+            (cos_veer_2 / (2 * sigma_y ** 2) + sin_veer_2 / (2 * sigma_z ** 2))
+            * (delta_y ** 2)
+            - 2 * (-sin_2veer / (4 * sigma_y ** 2) + sin_2veer / (4 * sigma_z ** 2))
+            * delta_y * delta_z
+            + (sin_veer_2 / (2 * sigma_y ** 2) + cos_veer_2 / (2 * sigma_z ** 2))
+            * (delta_z ** 2)
+        )
+    d = 1 - ct_D2 / (8.0 * sigma_y * sigma_z)
+    C = 1 - math.sqrt(min(max(d, 0.0), 1.0))
+    return r, C
+
+
+@_jit
+def _gauss_velocity_deficit(
+    x,
+    y,
+    z,
+    u_initial,
+    x_i,
+    y_i,
+    deflection,
+    yaw,
+    turbulence_intensity,
+    ct,
+    hub_height,
+    D,
+    wind_veer,
+    cos_veer,
+    parameters,
+):
+    alpha = parameters[0]
+    beta = parameters[1]
+    ka = parameters[2]
+    kb = parameters[3]
+
+    # Opposite sign convention in this model
+    yaw = -1 * yaw
+    cos_yaw = _cosd(yaw)
+    sqrt_1_ct = math.sqrt(1 - ct)
+    x0 = D * cos_yaw * (1 + sqrt_1_ct) / (
+        np.sqrt(2) * (4 * alpha * turbulence_intensity + 2 * beta * (1 - sqrt_1_ct))
+    ) + x_i
+
+    near_wake = x > x_i + 0.1 and x < x0
+    far_wake = x >= x0
+    if not (near_wake or far_wake):
+        return 0.0
+
+    sigma_z0 = D * 0.5 * math.sqrt(
+        (u_initial * ct / (2.0 * (1 - sqrt_1_ct))) / (u_initial + u_initial * sqrt_1_ct)
+    )
+    sigma_y0 = sigma_z0 * cos_yaw * cos_veer
+
+    if near_wake:
+        sigma_near_wake_start = 0.501 * D * math.sqrt(ct / 2.0)
+        sigma_y = ((x0 - x) * sigma_near_wake_start + (x - x_i) * sigma_y0) / (x0 - x_i)
+        sigma_z = ((x0 - x) * sigma_near_wake_start + (x - x_i) * sigma_z0) / (x0 - x_i)
+    else:
+        sigma_y = (ka * turbulence_intensity + kb) * (x - x0) + sigma_y0
+        sigma_z = (ka * turbulence_intensity + kb) * (x - x0) + sigma_z0
+
+    r, C = _gauss_rC(
+        sigma_y, sigma_z, y - y_i - deflection, z - hub_height, wind_veer, ct * cos_yaw * (D * D)
+    )
+    return _gaussian(C, r)
+
+
+@_jit
+def _jensen_velocity_deficit(x, y, z, x_i, y_i, z_i, deflection, axial_induction, D, we):
+    rotor_radius = D / 2.0
+    dx = x - x_i
+    dy = y - y_i - deflection
+    dz = z - z_i
+    if dx > 0 + NUM_EPS and math.sqrt(dy ** 2 + dz ** 2) < we * dx + rotor_radius:
+        return 2 * axial_induction * (rotor_radius / (rotor_radius + we * dx + NUM_EPS)) ** 2
+    return 0.0
+
+
+@_jit
+def _crespo_hernandez(ambient_ti, x, x_i, D, axial_induction, parameters):
+    initial = parameters[0]
+    constant = parameters[1]
+    ai = parameters[2]
+    downstream = parameters[3]
+    delta_x = x - x_i
+    if not delta_x > -0.1:
+        return 0.0
+    if delta_x <= 0.1:
+        delta_x += 1.0
+    ti = (
+        constant
+        * axial_induction ** ai
+        * ambient_ti ** initial
+        * (delta_x / D) ** downstream
+    )
+    if math.isnan(ti) or ti == np.inf:
+        return 0.0
+    if ti == -np.inf:
+        return -_FLOAT_MAX
+    return ti
+
+
+@_jit
+def _sigmoid_integral(x, center, width):
+    x = x - center
+    if x > width / 2:
+        return x
+    elif x >= -width / 2 and x <= width / 2:
+        z = x / width + 0.5
+        return width * (z ** 6 - 3 * z ** 5 + 5 / 2 * z ** 4)
+    return 0.0
+
+
+@_jit
+def _empirical_gauss_wake_width(
+    x, wake_expansion_rates, breakpoints, D, sigma_0, smoothing_length, mixing_final
+):
+    sigma = (wake_expansion_rates[0] + mixing_final) * x + sigma_0
+    for ib in range(len(breakpoints)):
+        sigma += (wake_expansion_rates[ib + 1] - wake_expansion_rates[ib]) * \
+            _sigmoid_integral(x, breakpoints[ib] * D, smoothing_length)
+    return sigma
+
+
+@_jit
+def _empirical_gauss_r(sigma_y, sigma_z, delta_y, delta_z, wind_veer):
+    a = (
+        math.cos(wind_veer) ** 2 / (2 * sigma_y ** 2)
+        + math.sin(wind_veer) ** 2 / (2 * sigma_z ** 2)
+    )
+    b = (
+        -math.sin(2 * wind_veer) / (4 * sigma_y ** 2)
+        + math.sin(2 * wind_veer) / (4 * sigma_z ** 2)
+    )
+    c = (
+        math.sin(wind_veer) ** 2 / (2 * sigma_y ** 2)
+        + math.cos(wind_veer) ** 2 / (2 * sigma_z ** 2)
+    )
+    return a * (delta_y ** 2) - 2 * b * delta_y * delta_z + c * (delta_z ** 2)
+
+
+@_jit
+def _empirical_gauss_velocity_deficit(
+    x,
+    y,
+    z,
+    x_i,
+    y_i,
+    deflection_y,
+    deflection_z,
+    yaw,
+    tilt,
+    mixing,
+    ct,
+    hub_height,
+    D,
+    wind_veer,
+    parameters,
+    wake_expansion_rates,
+    breakpoints,
+):
+    sigma_0_D = parameters[0]
+    smoothing_length_D = parameters[1]
+    mixing_gain_velocity = parameters[2]
+
+    # Only symmetric terms using yaw, but keep for consistency
+    yaw = -1 * yaw
+    sigma_y0 = sigma_0_D * D * _cosd(yaw)
+    sigma_z0 = sigma_0_D * D * _cosd(tilt)
+
+    if x < x_i - 0.1:
+        sigma_y = sigma_y0
+        sigma_z = sigma_z0
+    else:
+        sigma_y = _empirical_gauss_wake_width(
+            x - x_i,
+            wake_expansion_rates,
+            breakpoints,
+            D,
+            sigma_y0,
+            smoothing_length_D * D,
+            mixing_gain_velocity * mixing,
+        )
+        sigma_z = _empirical_gauss_wake_width(
+            x - x_i,
+            wake_expansion_rates,
+            breakpoints,
+            D,
+            sigma_z0,
+            smoothing_length_D * D,
+            mixing_gain_velocity * mixing,
+        )
+
+    d = 1 - ct * (sigma_y0 * sigma_z0) / (sigma_y * sigma_z) * _cosd(yaw) * _cosd(tilt)
+    C = (1 - np.sqrt(d)) / (8 * sigma_0_D ** 2)
+
+    # Wake and its mirror about the ground, combined by sum of squares
+    delta_y = y - y_i - deflection_y
+    r = _empirical_gauss_r(sigma_y, sigma_z, delta_y, z - hub_height - deflection_z, wind_veer)
+    r_mirror = _empirical_gauss_r(
+        sigma_y, sigma_z, delta_y, z + hub_height - deflection_z, wind_veer
+    )
+    wake_deficit = np.sqrt(_gaussian(C, r) ** 2 + _gaussian(C, r_mirror) ** 2)
+    return wake_deficit * (x > x_i + 0.1)
+
+
+## Solvers
+
+@_jit_parallel
+def _sequential_kernel(
+    x,
+    y,
+    z,
+    u_initial,
+    dudz_initial,
+    u,
+    v,
+    w,
+    turbulence_intensity_field,
+    turbulence_intensities,
+    yaw_angles,
+    tilt_angles,
+    hub_heights,
+    rotor_diameters,
+    TSRs,
+    turbine_type_indices,
+    table_wind_speeds,
+    table_thrust_coefficients,
+    table_n_points,
+    operation_models,
+    ref_tilts,
+    weights,
+    cubic_average,
+    grid_resolution,
+    wind_shear,
+    wind_veer,
+    velocity_model,
+    velocity_parameters,
+    deflection_model,
+    deflection_parameters,
+    turbulence_parameters,
+    combination_model,
+    enable_secondary_steering,
+    enable_transverse_velocities,
+    enable_yaw_added_recovery,
+):
+    n_findex, n_turbines, n1, n2 = x.shape
+    wind_veer_radians = math.radians(wind_veer)
+    cos_veer = _cosd(wind_veer)
+    gch_gain = 2
+
+    for f in _prange(n_findex):
+        ambient_ti = turbulence_intensities[f]
+        freestream_velocity = _mean(u_initial[f])
+        wake_field = np.zeros((n_turbines, n1, n2))
+        v_wake = np.zeros((n_turbines, n1, n2))
+        w_wake = np.zeros((n_turbines, n1, n2))
+        ti = turbulence_intensity_field[f]
+        ti[:] = ambient_ti
+        # Turbulence intensities at the rotor points of the current turbine, before and after
+        # the yaw added mixing, which are applied to the points of every turbine
+        ti_deflection = np.empty((n1, n2))
+        ti_velocity = np.empty((n1, n2))
+
+        # Calculate the velocity deficit sequentially from upstream to downstream turbines
+        for i in range(n_turbines):
+            x_i = _mean(x[f, i])
+            y_i = _mean(y[f, i])
+            z_i = _mean(z[f, i])
+            yaw_i = yaw_angles[f, i]
+            hub_height_i = hub_heights[f, i]
+            D = rotor_diameters[f, i]
+            k = turbine_type_indices[f, i]
+            ct_i, axial_induction_i = _thrust_coefficient_axial_induction(
+                _rotor_average_velocity(u[f, i], weights, cubic_average),
+                yaw_i,
+                tilt_angles[f, i],
+                table_wind_speeds[k],
+                table_thrust_coefficients[k],
+                table_n_points[k],
+                operation_models[k],
+                ref_tilts[k],
+            )
+            ti_deflection[:] = ti[i]
+
+            # Vortices of the curled wake
+            eps = 0.2 * D
+            z_top = hub_height_i + D / 2
+            z_bottom = hub_height_i - D / 2
+            Gamma_top = 1.0 * (np.pi / 8) * D * ((z_top / hub_height_i) ** wind_shear) \
+                * freestream_velocity * ct_i
+            Gamma_bottom = -1 * (1.0 * (np.pi / 8) * D * ((z_bottom / hub_height_i) ** wind_shear)
+                * freestream_velocity * ct_i)
+            turbine_average_velocity = _cubic_mean(u[f, i])
+            Gamma_wake_rotation = 0.25 * 2 * np.pi * D \
+                * (axial_induction_i - axial_induction_i ** 2) * turbine_average_velocity \
+                / TSRs[f, i]
+
+            effective_yaw_i = yaw_i
+            if enable_secondary_steering:
+                v_top = np.empty((n1, n2))
+                v_bottom = np.empty((n1, n2))
+                v_core = np.empty((n1, n2))
+                for p in range(n1):
+                    for q in range(n2):
+                        y_loc = y[f, i, p, q] - y_i + NUM_EPS
+                        z_loc = z[f, i, p, q]
+                        v_top[p, q] = _vortex_profile(
+                            Gamma_top, y_loc, z_loc, z_top, eps, 1.0
+                        ) * (z_loc - z_top + NUM_EPS)
+                        v_bottom[p, q] = _vortex_profile(
+                            Gamma_bottom, y_loc, z_loc, z_bottom, eps, 1.0
+                        ) * (z_loc - z_bottom + NUM_EPS)
+                        v_core[p, q] = _vortex_profile(
+                            Gamma_wake_rotation, y_loc, z_loc, hub_height_i, eps, 1.0
+                        ) * (z_loc - hub_height_i + NUM_EPS)
+                val = 2 * (_mean(v[f, i]) - _mean(v_core)) / (_mean(v_top) + _mean(v_bottom))
+                val = min(max(val, -1.0), 1.0)
+                effective_yaw_i += math.degrees(0.5 * math.asin(val))
+
+            if enable_transverse_velocities:
+                sin_cos_yaw = _sind(yaw_i) * _cosd(yaw_i)
+                lmda = D / 8
+                kappa = 0.41
+                for j in range(n_turbines):
+                    for p in range(n1):
+                        for q in range(n2):
+                            delta_x = x[f, j, p, q] - x_i
+                            z_loc = z[f, j, p, q]
+                            y_loc = y[f, j, p, q] - y_i + NUM_EPS
+                            decay = eps ** 2 / (
+                                4 * (kappa * z_loc / (1 + kappa * z_loc / lmda)) ** 2
+                                * abs(dudz_initial[f, j, p, q]) * delta_x / freestream_velocity
+                                + eps ** 2
+                            )
+                            profile_top = _vortex_profile(
+                                sin_cos_yaw * Gamma_top, y_loc, z_loc, z_top, eps, decay
+                            )
+                            profile_bottom = _vortex_profile(
+                                sin_cos_yaw * Gamma_bottom, y_loc, z_loc, z_bottom, eps, decay
+                            )
+                            profile_core = _vortex_profile(
+                                Gamma_wake_rotation, y_loc, z_loc, hub_height_i, eps, decay
+                            )
+                            profile_top_ground = _vortex_profile(
+                                sin_cos_yaw * Gamma_top, y_loc, z_loc, -z_top, eps, decay
+                            )
+                            profile_bottom_ground = _vortex_profile(
+                                sin_cos_yaw * Gamma_bottom, y_loc, z_loc, -z_bottom, eps, decay
+                            )
+                            profile_core_ground = _vortex_profile(
+                                Gamma_wake_rotation, y_loc, z_loc, -hub_height_i, eps, decay
+                            )
+                            if delta_x >= 0.0:
+                                v_wake[j, p, q] = (
+                                    profile_top * (z_loc - z_top + NUM_EPS)
+                                    + profile_bottom * (z_loc - z_bottom + NUM_EPS)
+                                    - profile_top_ground * (z_loc + z_top + NUM_EPS)
+                                    - profile_bottom_ground * (z_loc + z_bottom + NUM_EPS)
+                                    + profile_core * (z_loc - hub_height_i + NUM_EPS)
+                                    - profile_core_ground * (z_loc + hub_height_i + NUM_EPS)
+                                )
+                            else:
+                                v_wake[j, p, q] = 0.0
+                            W = -1 * y_loc * (
+                                profile_top + profile_bottom - profile_top_ground
+                                - profile_bottom_ground + profile_core - profile_core_ground
+                            )
+                            w_wake[j, p, q] = W if delta_x >= 0.0 and W >= 0 else 0.0
+
+            if enable_yaw_added_recovery:
+                I_i = ti_deflection[0, 0]
+                average_u_i = turbine_average_velocity
+                tke = (average_u_i * I_i) ** 2 / (2 / 3)
+                u_term = math.sqrt(2 * tke)
+                v_term = _mean(v[f, i] + v_wake[i])
+                w_term = _mean(w[f, i] + w_wake[i])
+                tke_total = 0.5 * (u_term ** 2 + v_term ** 2 + w_term ** 2)
+                I_mixing = math.sqrt((2 / 3) * tke_total) / average_u_i - I_i
+                ti[i] = ti_deflection + gch_gain * I_mixing
+            ti_velocity[:] = ti[i]
+
+            for j in range(n_turbines):
+                n_overlap = 0
+                for p in range(n1):
+                    for q in range(n2):
+                        x_point = x[f, j, p, q]
+                        if deflection_model == 1:
+                            deflection = _gauss_deflection(
+                                x_point,
+                                u_initial[f, j, p, q],
+                                x_i,
+                                effective_yaw_i,
+                                ti_deflection[p, q],
+                                ct_i,
+                                D,
+                                cos_veer,
+                                deflection_parameters,
+                            )
+                        elif deflection_model == 2:
+                            deflection = _jimenez_deflection(
+                                x_point, x_i, effective_yaw_i, ct_i, D, deflection_parameters
+                            )
+                        else:
+                            deflection = 0.0
+
+                        if velocity_model == 0:
+                            velocity_deficit = _gauss_velocity_deficit(
+                                x_point,
+                                y[f, j, p, q],
+                                z[f, j, p, q],
+                                u_initial[f, j, p, q],
+                                x_i,
+                                y_i,
+                                deflection,
+                                yaw_i,
+                                ti_velocity[p, q],
+                                ct_i,
+                                hub_height_i,
+                                D,
+                                wind_veer_radians,
+                                cos_veer,
+                                velocity_parameters,
+                            )
+                        else:
+                            velocity_deficit = _jensen_velocity_deficit(
+                                x_point,
+                                y[f, j, p, q],
+                                z[f, j, p, q],
+                                x_i,
+                                y_i,
+                                z_i,
+                                deflection,
+                                axial_induction_i,
+                                D,
+                                velocity_parameters[0],
+                            )
+
+                        velocity_deficit *= u_initial[f, j, p, q]
+                        wake_field[j, p, q] = _combine(
+                            combination_model, wake_field[j, p, q], velocity_deficit
+                        )
+                        if velocity_deficit > 0.05:
+                            n_overlap += 1
+
+                # Wake-added turbulence, modified by the wake area overlap
+                area_overlap = n_overlap / (grid_resolution * grid_resolution)
+                for p in range(n1):
+                    for q in range(n2):
+                        x_point = x[f, j, p, q]
+                        ti_added = 0.0
+                        if (
+                            x_point > x_i
+                            and abs(y_i - y[f, j, p, q]) < 2 * D
+                            and x_point <= 15 * D + x_i
+                        ):
+                            ti_added = area_overlap * _crespo_hernandez(
+                                ambient_ti,
+                                x_point,
+                                x_i,
+                                D,
+                                axial_induction_i,
+                                turbulence_parameters,
+                            )
+                        ti[j, p, q] = max(
+                            math.sqrt(ti_added ** 2 + ambient_ti ** 2), ti[j, p, q]
+                        )
+                        u[f, j, p, q] = u_initial[f, j, p, q] - wake_field[j, p, q]
+                        v[f, j, p, q] += v_wake[j, p, q]
+                        w[f, j, p, q] += w_wake[j, p, q]
+
+
+@_jit_parallel
+def _empirical_gauss_kernel(
+    x,
+    y,
+    z,
+    u_initial,
+    u,
+    mixing_factor,
+    yaw_angles,
+    tilt_angles,
+    hub_heights,
+    rotor_diameters,
+    awc_mixing,
+    turbine_type_indices,
+    table_wind_speeds,
+    table_thrust_coefficients,
+    table_n_points,
+    operation_models,
+    ref_tilts,
+    weights,
+    cubic_average,
+    grid_resolution,
+    wind_veer,
+    velocity_parameters,
+    wake_expansion_rates,
+    breakpoints_D,
+    deflection_parameters,
+    combination_model,
+    enable_yaw_added_recovery,
+):
+    n_findex, n_turbines, n1, n2 = x.shape
+    wind_veer_radians = math.radians(wind_veer)
+    horizontal_deflection_gain_D = deflection_parameters[0]
+    vertical_deflection_gain_D = deflection_parameters[1]
+    deflection_rate = deflection_parameters[2]
+    mixing_gain_deflection = deflection_parameters[3]
+    yaw_added_mixing_gain = deflection_parameters[4]
+
+    for f in _prange(n_findex):
+        wake_field = np.zeros((n_turbines, n1, n2))
+        mixing = mixing_factor[f]
+        x_locations = np.empty(n_turbines)
+        for j in range(n_turbines):
+            x_locations[j] = _mean(x[f, j])
+
+        # Calculate the velocity deficit sequentially from upstream to downstream turbines
+        for i in range(n_turbines):
+            x_i = x_locations[i]
+            y_i = _mean(y[f, i])
+            yaw_i = yaw_angles[f, i]
+            tilt_i = tilt_angles[f, i]
+            hub_height_i = hub_heights[f, i]
+            D = rotor_diameters[f, i]
+            k = turbine_type_indices[f, i]
+            ct_i, axial_induction_i = _thrust_coefficient_axial_induction(
+                _rotor_average_velocity(u[f, i], weights, cubic_average),
+                yaw_i,
+                tilt_i,
+                table_wind_speeds[k],
+                table_thrust_coefficients[k],
+                table_n_points[k],
+                operation_models[k],
+                ref_tilts[k],
+            )
+
+            # Influence of yawing and active wake control on the turbine's own wake
+            yaw_added_mixing = 0.0
+            if enable_yaw_added_recovery:
+                yaw_added_mixing = axial_induction_i * yaw_added_mixing_gain \
+                    * (1 - _cosd(yaw_i))
+                mixing[i, i] += yaw_added_mixing / 1 ** 2
+            mixing[i, i] += awc_mixing[f, i]
+
+            # Total wake induced mixing for turbine i
+            mixing_i = math.sqrt(_pairwise_sum(mixing[i] * mixing[i], 0, n_turbines))
+
+            # Deflection gains, with CW yaw for consistency with other models
+            deflection_gain_y = horizontal_deflection_gain_D * D
+            if vertical_deflection_gain_D == -1:
+                deflection_gain_z = deflection_gain_y
+            else:
+                deflection_gain_z = vertical_deflection_gain_D * D
+            A_y = (deflection_gain_y * ct_i * (np.pi / 180 * -yaw_i)) \
+                / (1 + mixing_gain_deflection * mixing_i)
+            A_z = (deflection_gain_z * ct_i * (np.pi / 180 * tilt_i)) \
+                / (1 + mixing_gain_deflection * mixing_i)
+
+            for j in range(n_turbines):
+                n_overlap = 0
+                for p in range(n1):
+                    for q in range(n2):
+                        x_point = x[f, j, p, q]
+                        x_normalized = (x_point - x_i) * (x_point > x_i + 0.1) / D
+                        log_term = math.log(
+                            (x_normalized - deflection_rate) / (x_normalized + deflection_rate)
+                            + 2
+                        )
+                        velocity_deficit = _empirical_gauss_velocity_deficit(
+                            x_point,
+                            y[f, j, p, q],
+                            z[f, j, p, q],
+                            x_i,
+                            y_i,
+                            A_y * log_term,
+                            A_z * log_term,
+                            yaw_i,
+                            tilt_i,
+                            mixing_i,
+                            ct_i,
+                            hub_height_i,
+                            D,
+                            wind_veer_radians,
+                            velocity_parameters,
+                            wake_expansion_rates,
+                            breakpoints_D,
+                        ) * u_initial[f, j, p, q]
+                        wake_field[j, p, q] = _combine(
+                            combination_model, wake_field[j, p, q], velocity_deficit
+                        )
+                        if velocity_deficit > 0.05:
+                            n_overlap += 1
+
+                # Wake induced mixing of the downstream turbines
+                area_overlap = n_overlap / (grid_resolution * grid_resolution)
+                downstream_distance_D = max((x_locations[j] - x_i) / rotor_diameters[f, j], 0.1)
+                mixing[j, i] += area_overlap * (axial_induction_i / downstream_distance_D ** 2)
+                if enable_yaw_added_recovery:
+                    mixing[j, i] += area_overlap * (
+                        yaw_added_mixing / downstream_distance_D ** 2
+                    )
+
+                for p in range(n1):
+                    for q in range(n2):
+                        u[f, j, p, q] = u_initial[f, j, p, q] - wake_field[j, p, q]
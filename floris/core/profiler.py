@@ -0,0 +1,181 @@
+
+from __future__ import annotations
+
+from contextlib import contextmanager, nullcontext
+from contextvars import ContextVar
+from time import perf_counter
+from typing import (
+    Any,
+    Callable,
+    Iterator,
+)
+
+import numpy as np
+import pandas as pd
+from attrs import define, field
+
+
+# Profiler that records the calculations of the current context, if any
+_active_profiler: ContextVar[Profiler | None] = ContextVar("active_profiler", default=None)
+
+
+@define
+class PhaseTiming:
+    """
+    Wall time, number of calls and size of the largest array returned by one phase of the
+    calculations.
+    """
+    time: float = field(default=0.0)
+    calls: int = field(default=0)
+    max_array_bytes: int = field(default=0)
+
+    def add(self, elapsed: float, out: Any = None) -> None:
+        self.time += elapsed
+        self.calls += 1
+        arrays = out if isinstance(out, tuple) else (out,)
+        for array in arrays:
+            if isinstance(array, np.ndarray):
+                self.max_array_bytes = max(self.max_array_bytes, array.nbytes)
+
+
+class Profiler:
+    """
+    Records the time spent in each phase of the FLORIS calculations while it is active; see
+    :py:func:`profiling`. Phases are named by their path, e.g.
+    ``"sequential_solver/velocity_model (gauss)"`` for the velocity model calls within the
+    sequential solver, so the time of a phase includes the time of its subphases.
+    """
+
+    def __init__(self):
+        self.phases: dict[str, PhaseTiming] = {}
+        self._stack: list[str] = []
+
+    def _get_phase(self, name: str) -> PhaseTiming:
+        path = "/".join([*self._stack, name])
+        if path not in self.phases:
+            self.phases[path] = PhaseTiming()
+        return self.phases[path]
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[PhaseTiming]:
+        """
+        Time a phase of the calculations. Phases and functions entered within it are
+        recorded as its subphases.
+
+        Args:
+            name (str): The name of the phase.
+        """
+        timing = self._get_phase(name)
+        self._stack.append(name)
+        start = perf_counter()
+        try:
+            yield timing
+        finally:
+            timing.add(perf_counter() - start)
+            self._stack.pop()
+
+    def wrap(self, function: Callable, name: str) -> Callable:
+        """
+        Wrap a function so that each call is recorded as a phase, together with the size of
+        the arrays it returns. The phase is a subphase of the phases entered when the
+        function is wrapped rather than when it is called.
+
+        Args:
+            function (Callable): The function to time.
+            name (str): The name of the phase.
+
+        Returns:
+            Callable: The wrapped function.
+        """
+        timing = self._get_phase(name)
+
+        def timed_function(*args, **kwargs):
+            start = perf_counter()
+            out = function(*args, **kwargs)
+            timing.add(perf_counter() - start, out)
+            return out
+
+        return timed_function
+
+    @property
+    def total_time(self) -> float:
+        """
+        The time spent in the top-level phases.
+        """
+        return sum(timing.time for path, timing in self.phases.items() if "/" not in path)
+
+    def to_dataframe(self) -> pd.DataFrame:
+        """
+        Get the report as a DataFrame indexed by the phase paths, in the order that the
+        phases were first entered, with the columns time (s), calls and max_array_bytes.
+        """
+        return pd.DataFrame(
+            {
+                "time": [timing.time for timing in self.phases.values()],
+                "calls": [timing.calls for timing in self.phases.values()],
+                "max_array_bytes": [timing.max_array_bytes for timing in self.phases.values()],
+            },
+            index=pd.Index(list(self.phases), name="phase"),
+        )
+
+    def __str__(self) -> str:
+        return (
+            f"{self.to_dataframe().to_string()}\n"
+            f"Total time in top-level phases: {self.total_time:.3f} s"
+        )
+
+
+@contextmanager
+def profiling(profiler: Profiler | None = None) -> Iterator[Profiler]:
+    """
+    Record the FLORIS calculations made within this context, e.g. by
+    :py:meth:`~floris.floris_model.FlorisModel.set` and
+    :py:meth:`~floris.floris_model.FlorisModel.run`. Profiling adds no overhead to the
+    calculations outside of this context.
+
+    Args:
+        profiler (Profiler, optional): The profiler to record into. Defaults to None,
+            which creates a new one.
+
+    Yields:
+        Profiler: The profiler, which holds the report.
+    """
+    profiler = Profiler() if profiler is None else profiler
+    token = _active_profiler.set(profiler)
+    try:
+        yield profiler
+    finally:
+        _active_profiler.reset(token)
+
+
+def get_active_profiler() -> Profiler | None:
+    """
+    Get the profiler of the current context, or None if profiling is not active.
+    """
+    return _active_profiler.get()
+
+
+def profiled_phase(profiler: Profiler | None, name: str):
+    """
+    Time a phase with the profiler, if any. Returns a context manager.
+    """
+    return nullcontext() if profiler is None else profiler.phase(name)
+
+
+def profiled(profiler: Profiler | None, function: Callable, name: str) -> Callable:
+    """
+    Get a function wrapped to be timed by the profiler, or the function itself if there is
+    no profiler, so that it can be called in loops without any overhead when not profiling.
+    """
+    return function if profiler is None else profiler.wrap(function, name)
+
+
+def profiled_model(profiler: Profiler | None, model_manager, model_type: str) -> Callable:
+    """
+    Get the function of a wake model of a
+    :py:class:`~floris.core.wake.WakeModelManager`, e.g. "velocity_model", wrapped to be
+    timed by the profiler as a phase named by the model type and model.
+    """
+    function = getattr(model_manager, model_type).function
+    name = f"{model_type} ({model_manager.model_strings[model_type]})"
+    return profiled(profiler, function, name)
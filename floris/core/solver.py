@@ -15,6 +15,11 @@ from floris.core import (
     thrust_coefficient,
     TurbineGrid,
 )
+from floris.core.profiler import (
+    profiled,
+    profiled_model,
+    Profiler,
+)
 from floris.core.rotor_velocity import average_velocity
 from floris.core.wake import WakeModelManager
 from floris.core.wake_deflection.empirical_gauss import yaw_added_wake_mixing
@@ -44,12 +49,12 @@ def calculate_area_overlap(wake_velocities, freestream_velocities, y_ngrid, z_ng
     return np.sum(freestream_velocities - wake_velocities > 0.05, axis=(3, 4)) / (y_ngrid * z_ngrid)
 
 
-# @profile
 def sequential_solver(
     farm: Farm,
     flow_field: FlowField,
     grid: TurbineGrid,
-    model_manager: WakeModelManager
+    model_manager: WakeModelManager,
+    profiler: Profiler | None = None,
 ) -> None:
     # Algorithm
     # For each turbine, calculate its effect on every downstream turbine.
@@ -61,6 +66,21 @@ def sequential_solver(
     deflection_model_args = model_manager.deflection_model.prepare_function(grid, flow_field)
     deficit_model_args = model_manager.velocity_model.prepare_function(grid, flow_field)
 
+    # Functions called for each turbine, which are timed when profiling
+    thrust_coefficient_ = profiled(profiler, thrust_coefficient, "thrust_coefficient")
+    axial_induction_ = profiled(profiler, axial_induction, "axial_induction")
+    wake_added_yaw_ = profiled(profiler, wake_added_yaw, "wake_added_yaw")
+    calculate_transverse_velocity_ = profiled(
+        profiler, calculate_transverse_velocity, "calculate_transverse_velocity"
+    )
+    yaw_added_turbulence_mixing_ = profiled(
+        profiler, yaw_added_turbulence_mixing, "yaw_added_turbulence_mixing"
+    )
+    deflection_function = profiled_model(profiler, model_manager, "deflection_model")
+    velocity_function = profiled_model(profiler, model_manager, "velocity_model")
+    combination_function = profiled_model(profiler, model_manager, "combination_model")
+    turbulence_function = profiled_model(profiler, model_manager, "turbulence_model")
+
     # This is u_wake
     wake_field = np.zeros_like(flow_field.u_initial_sorted)
     v_wake = np.zeros_like(flow_field.v_initial_sorted)
@@ -89,7 +109,7 @@ def sequential_solver(
         u_i = flow_field.u_sorted[:, i:i+1]
         v_i = flow_field.v_sorted[:, i:i+1]
 
-        ct_i = thrust_coefficient(
+        ct_i = thrust_coefficient_(
             velocities=flow_field.u_sorted,
             turbulence_intensities=flow_field.turbulence_intensity_field_sorted,
             air_density=flow_field.air_density,
@@ -111,7 +131,7 @@ def sequential_solver(
         # Since we are filtering for the i'th turbine in the thrust coefficient function,
         # get the first index here (0:1)
         ct_i = ct_i[:, 0:1, None, None]
-        axial_induction_i = axial_induction(
+        axial_induction_i = axial_induction_(
             velocities=flow_field.u_sorted,
             turbulence_intensities=flow_field.turbulence_intensity_field_sorted,
             air_density=flow_field.air_density,
@@ -143,7 +163,7 @@ def sequential_solver(
         effective_yaw_i += yaw_angle_i
 
         if model_manager.enable_secondary_steering:
-            added_yaw = wake_added_yaw(
+            added_yaw = wake_added_yaw_(
                 u_i,
                 v_i,
                 flow_field.u_initial_sorted,
@@ -160,7 +180,7 @@ def sequential_solver(
 
         # Model calculations
         # NOTE: exponential
-        deflection_field = model_manager.deflection_model.function(
+        deflection_field = deflection_function(
             x_i,
             y_i,
             effective_yaw_i,
@@ -171,7 +191,7 @@ def sequential_solver(
         )
 
         if model_manager.enable_transverse_velocities:
-            v_wake, w_wake = calculate_transverse_velocity(
+            v_wake, w_wake = calculate_transverse_velocity_(
                 u_i,
                 flow_field.u_initial_sorted,
                 flow_field.dudz_initial_sorted,
@@ -188,7 +208,7 @@ def sequential_solver(
             )
 
         if model_manager.enable_yaw_added_recovery:
-            I_mixing = yaw_added_turbulence_mixing(
+            I_mixing = yaw_added_turbulence_mixing_(
                 u_i,
                 turbulence_intensity_i,
                 v_i,
@@ -200,7 +220,7 @@ def sequential_solver(
             turbine_turbulence_intensity[:, i:i+1] = turbulence_intensity_i + gch_gain * I_mixing
 
         # NOTE: exponential
-        velocity_deficit = model_manager.velocity_model.function(
+        velocity_deficit = velocity_function(
             x_i,
             y_i,
             z_i,
@@ -214,12 +234,12 @@ def sequential_solver(
             **deficit_model_args,
         )
 
-        wake_field = model_manager.combination_model.function(
+        wake_field = combination_function(
             wake_field,
             velocity_deficit * flow_field.u_initial_sorted
         )
 
-        wake_added_turbulence_intensity = model_manager.turbulence_model.function(
+        wake_added_turbulence_intensity = turbulence_function(
             ambient_turbulence_intensities,
             grid.x_sorted,
             x_i,
@@ -260,26 +280,40 @@ def sequential_solver(
     )[:, :, None, None]
 
 
-def full_flow_sequential_solver(
+def solve_turbine_grid_for_full_flow(
     farm: Farm,
     flow_field: FlowField,
-    flow_field_grid: FlowFieldGrid | FlowFieldPlanarGrid | PointsGrid,
-    model_manager: WakeModelManager
-) -> None:
+    model_manager: WakeModelManager,
+    solver,
+    profiler: Profiler | None = None,
+) -> tuple:
+    """
+    Solve for the flow at the turbines on a 3x3 TurbineGrid without modifying the given farm
+    and flow field. The full_flow solvers use the result to compute the wakes on another grid,
+    and it can be passed to several of them to avoid repeating the turbine-level solve.
 
-    # Get the flow quantities and turbine performance
-    turbine_grid_farm = copy.deepcopy(farm)
-    turbine_grid_flow_field = copy.deepcopy(flow_field)
+    Args:
+        farm (Farm): The farm, in the same state as for the full_flow solver.
+        flow_field (FlowField): The flow field, in the same state as for the full_flow solver.
+        model_manager (WakeModelManager): The wake models.
+        solver (Callable): The turbine-level solver matching the velocity model, e.g.
+            sequential_solver.
+        profiler (Profiler, optional): Profiler to time the solver with.
+
+    Returns:
+        tuple: The solved farm, flow field and TurbineGrid, and the value returned by the
+            solver.
+    """
+    # Get the flow quantities and turbine performance. The solver only assigns new arrays to
+    # the farm and flow field, so shallow copies leave the given objects unchanged while
+    # sharing the turbine models and their functions.
+    turbine_grid_farm = copy.copy(farm)
+    turbine_grid_flow_field = copy.copy(flow_field)
 
-    turbine_grid_farm.construct_turbine_map()
-    turbine_grid_farm.construct_turbine_thrust_coefficient_functions()
-    turbine_grid_farm.construct_turbine_axial_induction_functions()
-    turbine_grid_farm.construct_turbine_power_functions()
     turbine_grid_farm.construct_hub_heights()
     turbine_grid_farm.construct_rotor_diameters()
     turbine_grid_farm.construct_turbine_TSRs()
     turbine_grid_farm.construct_turbine_ref_tilts()
-    turbine_grid_farm.construct_turbine_tilt_interps()
     turbine_grid_farm.construct_turbine_correct_cp_ct_for_tilt()
     turbine_grid_farm.set_tilt_to_ref_tilt(flow_field.n_findex)
 
@@ -295,7 +329,34 @@ def full_flow_sequential_solver(
     )
     turbine_grid_flow_field.initialize_velocity_field(turbine_grid)
     turbine_grid_farm.initialize(turbine_grid.sorted_indices)
-    sequential_solver(turbine_grid_farm, turbine_grid_flow_field, turbine_grid, model_manager)
+    solver_output = solver(
+        turbine_grid_farm,
+        turbine_grid_flow_field,
+        turbine_grid,
+        model_manager,
+        profiler=profiler,
+    )
+
+    return turbine_grid_farm, turbine_grid_flow_field, turbine_grid, solver_output
+
+
+def full_flow_sequential_solver(
+    farm: Farm,
+    flow_field: FlowField,
+    flow_field_grid: FlowFieldGrid | FlowFieldPlanarGrid | PointsGrid,
+    model_manager: WakeModelManager,
+    turbine_grid_solution: tuple | None = None,
+) -> None:
+
+    # Get the flow quantities and turbine performance
+    if turbine_grid_solution is None:
+        turbine_grid_solution = solve_turbine_grid_for_full_flow(
+            farm,
+            flow_field,
+            model_manager,
+            sequential_solver,
+        )
+    turbine_grid_farm, turbine_grid_flow_field, turbine_grid, _ = turbine_grid_solution
 
     ### Referring to the quantities from above, calculate the wake in the full grid
 
@@ -455,12 +516,27 @@ def cc_solver(
     farm: Farm,
     flow_field: FlowField,
     grid: TurbineGrid,
-    model_manager: WakeModelManager
+    model_manager: WakeModelManager,
+    profiler: Profiler | None = None,
 ) -> None:
     # <<interface>>
     deflection_model_args = model_manager.deflection_model.prepare_function(grid, flow_field)
     deficit_model_args = model_manager.velocity_model.prepare_function(grid, flow_field)
 
+    # Functions called for each turbine, which are timed when profiling
+    thrust_coefficient_ = profiled(profiler, thrust_coefficient, "thrust_coefficient")
+    axial_induction_ = profiled(profiler, axial_induction, "axial_induction")
+    wake_added_yaw_ = profiled(profiler, wake_added_yaw, "wake_added_yaw")
+    calculate_transverse_velocity_ = profiled(
+        profiler, calculate_transverse_velocity, "calculate_transverse_velocity"
+    )
+    yaw_added_turbulence_mixing_ = profiled(
+        profiler, yaw_added_turbulence_mixing, "yaw_added_turbulence_mixing"
+    )
+    deflection_function = profiled_model(profiler, model_manager, "deflection_model")
+    velocity_function = profiled_model(profiler, model_manager, "velocity_model")
+    turbulence_function = profiled_model(profiler, model_manager, "turbulence_model")
+
     # This is u_wake
     v_wake = np.zeros_like(flow_field.v_initial_sorted)
     w_wake = np.zeros_like(flow_field.w_initial_sorted)
@@ -508,7 +584,7 @@ def cc_solver(
         )
 
         turb_avg_vels = average_velocity(turb_inflow_field)
-        turb_Cts = thrust_coefficient(
+        turb_Cts = thrust_coefficient_(
             turb_avg_vels,
             flow_field.turbulence_intensity_field_sorted,
             flow_field.air_density,
@@ -527,7 +603,7 @@ def cc_solver(
             multidim_condition=flow_field.multidim_conditions,
         )
         turb_Cts = turb_Cts[:, :, None, None]
-        turb_aIs = axial_induction(
+        turb_aIs = axial_induction_(
             turb_avg_vels,
             flow_field.turbulence_intensity_field_sorted,
             flow_field.air_density,
@@ -551,7 +627,7 @@ def cc_solver(
         u_i = turb_inflow_field[:, i:i+1]
         v_i = flow_field.v_sorted[:, i:i+1]
 
-        axial_induction_i = axial_induction(
+        axial_induction_i = axial_induction_(
             velocities=flow_field.u_sorted,
             turbulence_intensities=flow_field.turbulence_intensity_field_sorted,
             air_density=flow_field.air_density,
@@ -582,7 +658,7 @@ def cc_solver(
         effective_yaw_i += yaw_angle_i
 
         if model_manager.enable_secondary_steering:
-            added_yaw = wake_added_yaw(
+            added_yaw = wake_added_yaw_(
                 u_i,
                 v_i,
                 flow_field.u_initial_sorted,
@@ -600,7 +676,7 @@ def cc_solver(
 
         # Model calculations
         # NOTE: exponential
-        deflection_field = model_manager.deflection_model.function(
+        deflection_field = deflection_function(
             x_i,
             y_i,
             effective_yaw_i,
@@ -611,7 +687,7 @@ def cc_solver(
         )
 
         if model_manager.enable_transverse_velocities:
-            v_wake, w_wake = calculate_transverse_velocity(
+            v_wake, w_wake = calculate_transverse_velocity_(
                 u_i,
                 flow_field.u_initial_sorted,
                 flow_field.dudz_initial_sorted,
@@ -629,7 +705,7 @@ def cc_solver(
             )
 
         if model_manager.enable_yaw_added_recovery:
-            I_mixing = yaw_added_turbulence_mixing(
+            I_mixing = yaw_added_turbulence_mixing_(
                 u_i,
                 turbulence_intensity_i,
                 v_i,
@@ -640,7 +716,7 @@ def cc_solver(
             gch_gain = 1.0
             turbine_turbulence_intensity[:, i:i+1] = turbulence_intensity_i + gch_gain * I_mixing
 
-        turb_u_wake, Ctmp = model_manager.velocity_model.function(
+        turb_u_wake, Ctmp = velocity_function(
             i,
             x_i,
             y_i,
@@ -656,7 +732,7 @@ def cc_solver(
             **deficit_model_args,
         )
 
-        wake_added_turbulence_intensity = model_manager.turbulence_model.function(
+        wake_added_turbulence_intensity = turbulence_function(
             ambient_turbulence_intensities,
             grid.x_sorted,
             x_i,
@@ -702,36 +778,17 @@ def full_flow_cc_solver(
     flow_field: FlowField,
     flow_field_grid: FlowFieldGrid | FlowFieldPlanarGrid | PointsGrid,
     model_manager: WakeModelManager,
+    turbine_grid_solution: tuple | None = None,
 ) -> None:
     # Get the flow quantities and turbine performance
-    turbine_grid_farm = copy.deepcopy(farm)
-    turbine_grid_flow_field = copy.deepcopy(flow_field)
-
-    turbine_grid_farm.construct_turbine_map()
-    turbine_grid_farm.construct_turbine_thrust_coefficient_functions()
-    turbine_grid_farm.construct_turbine_axial_induction_functions()
-    turbine_grid_farm.construct_turbine_power_functions()
-    turbine_grid_farm.construct_hub_heights()
-    turbine_grid_farm.construct_rotor_diameters()
-    turbine_grid_farm.construct_turbine_TSRs()
-    turbine_grid_farm.construct_turbine_ref_tilts()
-    turbine_grid_farm.construct_turbine_tilt_interps()
-    turbine_grid_farm.construct_turbine_correct_cp_ct_for_tilt()
-    turbine_grid_farm.set_tilt_to_ref_tilt(flow_field.n_findex)
-
-    turbine_grid = TurbineGrid(
-        turbine_coordinates=turbine_grid_farm.coordinates,
-        turbine_diameters=turbine_grid_farm.rotor_diameters,
-        wind_directions=turbine_grid_flow_field.wind_directions,
-        grid_resolution=3,
-    )
-    turbine_grid_farm.expand_farm_properties(
-        turbine_grid_flow_field.n_findex,
-        turbine_grid.sorted_coord_indices,
-    )
-    turbine_grid_flow_field.initialize_velocity_field(turbine_grid)
-    turbine_grid_farm.initialize(turbine_grid.sorted_indices)
-    cc_solver(turbine_grid_farm, turbine_grid_flow_field, turbine_grid, model_manager)
+    if turbine_grid_solution is None:
+        turbine_grid_solution = solve_turbine_grid_for_full_flow(
+            farm,
+            flow_field,
+            model_manager,
+            cc_solver,
+        )
+    turbine_grid_farm, turbine_grid_flow_field, turbine_grid, _ = turbine_grid_solution
 
     ### Referring to the quantities from above, calculate the wake in the full grid
 
@@ -752,6 +809,11 @@ def full_flow_cc_solver(
     shape = (farm.n_turbines,) + np.shape(flow_field.u_initial_sorted)
     Ctmp = np.zeros((shape))
 
+    # The turbine-averaged turbulence intensities from cc_solver, expanded to 4D
+    turbine_turbulence_intensity = (
+        turbine_grid_flow_field.turbulence_intensity_field_sorted_avg[:, :, None, None]
+    )
+
     # Calculate the velocity deficit sequentially from upstream to downstream turbines
     for i in range(flow_field_grid.n_turbines):
 
@@ -808,8 +870,7 @@ def full_flow_cc_solver(
         )
         axial_induction_i = axial_induction_i[:, :, None, None]
 
-        turbulence_intensity_i = \
-            turbine_grid_flow_field.turbulence_intensity_field_sorted_avg[:, i:i+1]
+        turbulence_intensity_i = turbine_turbulence_intensity[:, i:i+1]
         yaw_angle_i = turbine_grid_farm.yaw_angles_sorted[:, i:i+1, None, None]
         hub_height_i = turbine_grid_farm.hub_heights_sorted[:, i:i+1, None, None]
         rotor_diameter_i = turbine_grid_farm.rotor_diameters_sorted[:, i:i+1, None, None]
@@ -874,7 +935,7 @@ def full_flow_cc_solver(
             u_i,
             deflection_field,
             yaw_angle_i,
-            turbine_grid_flow_field.turbulence_intensity_field_sorted_avg,
+            turbine_turbulence_intensity,
             turb_Cts,
             turbine_grid_farm.rotor_diameters_sorted[:, :, None, None],
             turb_u_wake,
@@ -891,7 +952,8 @@ def turbopark_solver(
     farm: Farm,
     flow_field: FlowField,
     grid: TurbineGrid,
-    model_manager: WakeModelManager
+    model_manager: WakeModelManager,
+    profiler: Profiler | None = None,
 ) -> None:
     # Algorithm
     # For each turbine, calculate its effect on every downstream turbine.
@@ -903,6 +965,14 @@ def turbopark_solver(
     deflection_model_args = model_manager.deflection_model.prepare_function(grid, flow_field)
     deficit_model_args = model_manager.velocity_model.prepare_function(grid, flow_field)
 
+    # Functions called for each turbine, which are timed when profiling
+    thrust_coefficient_ = profiled(profiler, thrust_coefficient, "thrust_coefficient")
+    axial_induction_ = profiled(profiler, axial_induction, "axial_induction")
+    deflection_function = profiled_model(profiler, model_manager, "deflection_model")
+    velocity_function = profiled_model(profiler, model_manager, "velocity_model")
+    combination_function = profiled_model(profiler, model_manager, "combination_model")
+    turbulence_function = profiled_model(profiler, model_manager, "turbulence_model")
+
     # This is u_wake
     wake_field = np.zeros_like(flow_field.u_initial_sorted)
     v_wake = np.zeros_like(flow_field.v_initial_sorted)
@@ -930,7 +1000,7 @@ def turbopark_solver(
         z_i = np.mean(grid.z_sorted[:, i:i+1], axis=(2, 3))
         z_i = z_i[:, :, None, None]
 
-        Cts = thrust_coefficient(
+        Cts = thrust_coefficient_(
             velocities=flow_field.u_sorted,
             turbulence_intensities=flow_field.turbulence_intensity_field_sorted,
             air_density=flow_field.air_density,
@@ -949,7 +1019,7 @@ def turbopark_solver(
             multidim_condition=flow_field.multidim_conditions,
         )
 
-        ct_i = thrust_coefficient(
+        ct_i = thrust_coefficient_(
             velocities=flow_field.u_sorted,
             turbulence_intensities=flow_field.turbulence_intensity_field_sorted,
             air_density=flow_field.air_density,
@@ -971,7 +1041,7 @@ def turbopark_solver(
         # Since we are filtering for the i'th turbine in the thrust coefficient function,
         # get the first index here (0:1)
         ct_i = ct_i[:, 0:1, None, None]
-        axial_induction_i = axial_induction(
+        axial_induction_i = axial_induction_(
             velocities=flow_field.u_sorted,
             turbulence_intensities=flow_field.turbulence_intensity_field_sorted,
             air_density=flow_field.air_density,
@@ -1020,7 +1090,7 @@ def turbopark_solver(
 
                 yaw_ii = farm.yaw_angles_sorted[:, ii:ii+1, None, None]
                 turbulence_intensity_ii = turbine_turbulence_intensity[:, ii:ii+1]
-                ct_ii = thrust_coefficient(
+                ct_ii = thrust_coefficient_(
                     velocities=flow_field.u_sorted,
                     turbulence_intensities=flow_field.turbulence_intensity_field_sorted,
                     air_density=flow_field.air_density,
@@ -1042,7 +1112,7 @@ def turbopark_solver(
                 ct_ii = ct_ii[:, 0:1, None, None]
                 rotor_diameter_ii = farm.rotor_diameters_sorted[:, ii:ii+1, None, None]
 
-                deflection_field_ii = model_manager.deflection_model.function(
+                deflection_field_ii = deflection_function(
                     x_ii,
                     y_ii,
                     yaw_ii,
@@ -1063,7 +1133,7 @@ def turbopark_solver(
                 "Yaw added recovery not used in this model.")
 
         # NOTE: exponential
-        velocity_deficit = model_manager.velocity_model.function(
+        velocity_deficit = velocity_function(
             x_i,
             y_i,
             z_i,
@@ -1076,12 +1146,12 @@ def turbopark_solver(
             **deficit_model_args,
         )
 
-        wake_field = model_manager.combination_model.function(
+        wake_field = combination_function(
             wake_field,
             velocity_deficit * flow_field.u_initial_sorted
         )
 
-        wake_added_turbulence_intensity = model_manager.turbulence_model.function(
+        wake_added_turbulence_intensity = turbulence_function(
             ambient_turbulence_intensities,
             grid.x_sorted,
             x_i,
@@ -1129,16 +1199,120 @@ def full_flow_turbopark_solver(
     farm: Farm,
     flow_field: FlowField,
     flow_field_grid: FlowFieldGrid,
-    model_manager: WakeModelManager
+    model_manager: WakeModelManager,
+    turbine_grid_solution: tuple | None = None,
 ) -> None:
-    raise NotImplementedError("Plotting for the TurbOPark model is not currently implemented.")
+
+    # Get the flow quantities and turbine performance
+    if turbine_grid_solution is None:
+        turbine_grid_solution = solve_turbine_grid_for_full_flow(
+            farm,
+            flow_field,
+            model_manager,
+            turbopark_solver,
+        )
+    turbine_grid_farm, turbine_grid_flow_field, turbine_grid, _ = turbine_grid_solution
+
+    ### Referring to the quantities from above, calculate the wake in the full grid
+
+    # Use full flow_field here to use the full grid in the wake models
+    deflection_model_args = model_manager.deflection_model.prepare_function(
+        flow_field_grid,
+        flow_field
+    )
+    deficit_model_args = model_manager.velocity_model.prepare_function(
+        flow_field_grid,
+        flow_field
+    )
+
+    if model_manager.enable_secondary_steering:
+        raise NotImplementedError(
+            "Secondary steering not available for this model.")
+
+    if model_manager.enable_transverse_velocities:
+        raise NotImplementedError(
+            "Transverse velocities not used in this model.")
+
+    if model_manager.enable_yaw_added_recovery:
+        raise NotImplementedError(
+            "Yaw added recovery not used in this model.")
+
+    deficit_squared = np.zeros_like(flow_field.u_initial_sorted)
+    deflection_field = np.zeros_like(flow_field.u_initial_sorted)
+
+    turb_Cts = thrust_coefficient(
+        velocities=turbine_grid_flow_field.u_sorted,
+        turbulence_intensities=turbine_grid_flow_field.turbulence_intensity_field_sorted,
+        air_density=turbine_grid_flow_field.air_density,
+        yaw_angles=turbine_grid_farm.yaw_angles_sorted,
+        tilt_angles=turbine_grid_farm.tilt_angles_sorted,
+        power_setpoints=turbine_grid_farm.power_setpoints_sorted,
+        awc_modes=turbine_grid_farm.awc_modes,
+        awc_amplitudes=turbine_grid_farm.awc_amplitudes_sorted,
+        thrust_coefficient_functions=turbine_grid_farm.turbine_thrust_coefficient_functions,
+        tilt_interps=turbine_grid_farm.turbine_tilt_interps,
+        correct_cp_ct_for_tilt=turbine_grid_farm.correct_cp_ct_for_tilt_sorted,
+        turbine_type_map=turbine_grid_farm.turbine_type_map_sorted,
+        turbine_power_thrust_tables=turbine_grid_farm.turbine_power_thrust_tables,
+        average_method=turbine_grid.average_method,
+        cubature_weights=turbine_grid.cubature_weights,
+        multidim_condition=turbine_grid_flow_field.multidim_conditions,
+    )
+    turb_Cts = turb_Cts[:, :, None, None]
+
+    # The rotor-averaged turbulence intensities from turbopark_solver, expanded to 4D
+    turbine_turbulence_intensity = (
+        turbine_grid_flow_field.turbulence_intensity_field_sorted_avg[:, :, None, None]
+    )
+
+    # Add the wake of each turbine to the grid points
+    for i in range(flow_field_grid.n_turbines):
+
+        # Get the current turbine quantities
+        x_i = np.mean(turbine_grid.x_sorted[:, i:i+1], axis=(2, 3))
+        x_i = x_i[:, :, None, None]
+        y_i = np.mean(turbine_grid.y_sorted[:, i:i+1], axis=(2, 3))
+        y_i = y_i[:, :, None, None]
+        z_i = np.mean(turbine_grid.z_sorted[:, i:i+1], axis=(2, 3))
+        z_i = z_i[:, :, None, None]
+
+        turbulence_intensity_i = turbine_turbulence_intensity[:, i:i+1]
+        yaw_angle_i = turbine_grid_farm.yaw_angles_sorted[:, i:i+1, None, None]
+        rotor_diameter_i = turbine_grid_farm.rotor_diameters_sorted[:, i:i+1, None, None]
+
+        # Model calculations
+        # NOTE: exponential
+        if np.any(turbine_grid_farm.yaw_angles_sorted):
+            deflection_field = model_manager.deflection_model.function(
+                x_i,
+                y_i,
+                yaw_angle_i,
+                turbulence_intensity_i,
+                turb_Cts[:, i:i+1],
+                rotor_diameter_i,
+                **deflection_model_args,
+            )
+
+        deficit_squared += model_manager.velocity_model.point_deficit_squared(
+            x_i,
+            y_i,
+            z_i,
+            turbulence_intensity_i,
+            turb_Cts[:, i:i+1],
+            rotor_diameter_i,
+            deflection_field,
+            **deficit_model_args,
+        )
+
+    flow_field.u_sorted = flow_field.u_initial_sorted * (1 - np.sqrt(deficit_squared))
 
 
 def empirical_gauss_solver(
     farm: Farm,
     flow_field: FlowField,
     grid: TurbineGrid,
-    model_manager: WakeModelManager
+    model_manager: WakeModelManager,
+    profiler: Profiler | None = None,
 ) -> NDArrayFloat:
     """
     Algorithm:
@@ -1152,6 +1326,7 @@ def empirical_gauss_solver(
         flow_field (FlowField)
         grid (TurbineGrid)
         model_manager (WakeModelManager)
+        profiler (Profiler, optional): Profiler to time the calculations with.
 
     Raises:
         NotImplementedError: Raised if secondary steering is enabled with the EmGauss model.
@@ -1166,6 +1341,16 @@ def empirical_gauss_solver(
     deflection_model_args = model_manager.deflection_model.prepare_function(grid, flow_field)
     deficit_model_args = model_manager.velocity_model.prepare_function(grid, flow_field)
 
+    # Functions called for each turbine, which are timed when profiling
+    thrust_coefficient_ = profiled(profiler, thrust_coefficient, "thrust_coefficient")
+    axial_induction_ = profiled(profiler, axial_induction, "axial_induction")
+    yaw_added_wake_mixing_ = profiled(profiler, yaw_added_wake_mixing, "yaw_added_wake_mixing")
+    awc_added_wake_mixing_ = profiled(profiler, awc_added_wake_mixing, "awc_added_wake_mixing")
+    deflection_function = profiled_model(profiler, model_manager, "deflection_model")
+    velocity_function = profiled_model(profiler, model_manager, "velocity_model")
+    combination_function = profiled_model(profiler, model_manager, "combination_model")
+    turbulence_function = profiled_model(profiler, model_manager, "turbulence_model")
+
     # This is u_wake
     wake_field = np.zeros_like(flow_field.u_initial_sorted)
     v_wake = np.zeros_like(flow_field.v_initial_sorted)
@@ -1198,7 +1383,7 @@ def empirical_gauss_solver(
         z_i = np.mean(grid.z_sorted[:, i:i+1], axis=(2, 3))
         z_i = z_i[:, :, None, None]
 
-        ct_i = thrust_coefficient(
+        ct_i = thrust_coefficient_(
             velocities=flow_field.u_sorted,
             turbulence_intensities=flow_field.turbulence_intensity_field_sorted,
             air_density=flow_field.air_density,
@@ -1220,7 +1405,7 @@ def empirical_gauss_solver(
         # Since we are filtering for the i'th turbine in the thrust coefficient function,
         # get the first index here (0:1)
         ct_i = ct_i[:, 0:1, None, None]
-        axial_induction_i = axial_induction(
+        axial_induction_i = axial_induction_(
             velocities=flow_field.u_sorted,
             turbulence_intensities=flow_field.turbulence_intensity_field_sorted,
             air_density=flow_field.air_density,
@@ -1272,7 +1457,7 @@ def empirical_gauss_solver(
         if model_manager.enable_yaw_added_recovery:
             # Influence of yawing on turbine's own wake
             mixing_factor[:, i:i+1, i] += \
-                yaw_added_wake_mixing(
+                yaw_added_wake_mixing_(
                     axial_induction_i,
                     yaw_angle_i,
                     1,
@@ -1282,7 +1467,7 @@ def empirical_gauss_solver(
         if model_manager.enable_active_wake_mixing:
             # Influence of awc on turbine's own wake
             mixing_factor[:, i:i+1, i] += \
-                awc_added_wake_mixing(
+                awc_added_wake_mixing_(
                     awc_mode_i,
                     awc_amplitude_i,
                     awc_frequency_i,
@@ -1298,7 +1483,7 @@ def empirical_gauss_solver(
 
         # Model calculations
         # NOTE: exponential
-        deflection_field_y, deflection_field_z = model_manager.deflection_model.function(
+        deflection_field_y, deflection_field_z = deflection_function(
             x_i,
             y_i,
             yaw_angle_i,
@@ -1310,7 +1495,7 @@ def empirical_gauss_solver(
         )
 
         # NOTE: exponential
-        velocity_deficit = model_manager.velocity_model.function(
+        velocity_deficit = velocity_function(
             x_i,
             y_i,
             z_i,
@@ -1326,7 +1511,7 @@ def empirical_gauss_solver(
             **deficit_model_args
         )
 
-        wake_field = model_manager.combination_model.function(
+        wake_field = combination_function(
             wake_field,
             velocity_deficit * flow_field.u_initial_sorted
         )
@@ -1337,12 +1522,12 @@ def empirical_gauss_solver(
 
         # Compute wake induced mixing factor
         mixing_factor[:,:,i] += \
-            area_overlap * model_manager.turbulence_model.function(
+            area_overlap * turbulence_function(
                 axial_induction_i, downstream_distance_D[:,:,i]
             )
         if model_manager.enable_yaw_added_recovery:
             mixing_factor[:,:,i] += \
-                area_overlap * yaw_added_wake_mixing(
+                area_overlap * yaw_added_wake_mixing_(
                 axial_induction_i,
                 yaw_angle_i,
                 downstream_distance_D[:,:,i],
@@ -1360,43 +1545,19 @@ def full_flow_empirical_gauss_solver(
     farm: Farm,
     flow_field: FlowField,
     flow_field_grid: FlowFieldGrid,
-    model_manager: WakeModelManager
+    model_manager: WakeModelManager,
+    turbine_grid_solution: tuple | None = None,
 ) -> None:
 
     # Get the flow quantities and turbine performance
-    turbine_grid_farm = copy.deepcopy(farm)
-    turbine_grid_flow_field = copy.deepcopy(flow_field)
-
-    turbine_grid_farm.construct_turbine_map()
-    turbine_grid_farm.construct_turbine_thrust_coefficient_functions()
-    turbine_grid_farm.construct_turbine_axial_induction_functions()
-    turbine_grid_farm.construct_turbine_power_functions()
-    turbine_grid_farm.construct_hub_heights()
-    turbine_grid_farm.construct_rotor_diameters()
-    turbine_grid_farm.construct_turbine_TSRs()
-    turbine_grid_farm.construct_turbine_ref_tilts()
-    turbine_grid_farm.construct_turbine_tilt_interps()
-    turbine_grid_farm.construct_turbine_correct_cp_ct_for_tilt()
-    turbine_grid_farm.set_tilt_to_ref_tilt(flow_field.n_findex)
-
-    turbine_grid = TurbineGrid(
-        turbine_coordinates=turbine_grid_farm.coordinates,
-        turbine_diameters=turbine_grid_farm.rotor_diameters,
-        wind_directions=turbine_grid_flow_field.wind_directions,
-        grid_resolution=3,
-    )
-    turbine_grid_farm.expand_farm_properties(
-        turbine_grid_flow_field.n_findex,
-        turbine_grid.sorted_coord_indices
-    )
-    turbine_grid_flow_field.initialize_velocity_field(turbine_grid)
-    turbine_grid_farm.initialize(turbine_grid.sorted_indices)
-    wim_field = empirical_gauss_solver(
-        turbine_grid_farm,
-        turbine_grid_flow_field,
-        turbine_grid,
-        model_manager
-    )
+    if turbine_grid_solution is None:
+        turbine_grid_solution = solve_turbine_grid_for_full_flow(
+            farm,
+            flow_field,
+            model_manager,
+            empirical_gauss_solver,
+        )
+    turbine_grid_farm, turbine_grid_flow_field, turbine_grid, wim_field = turbine_grid_solution
 
     ### Referring to the quantities from above, calculate the wake in the full grid
 
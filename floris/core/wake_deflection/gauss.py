@@ -19,6 +19,7 @@ from floris.core import (
     Grid,
     Turbine,
 )
+from floris.core.wake_velocity.gauss import EXP_ARGUMENT_MIN
 from floris.utilities import cosd, sind
 
 
@@ -137,20 +138,25 @@ class GaussVelocityDeflection(BaseModel):
         # TODO: connect support for tilt
         tilt = 0.0  # turbine.tilt_angle
 
-        # initial velocity deficits
-        uR = (
-            freestream_velocity
-            * ct_i
-            * cosd(tilt)
-            * cosd(yaw_i)
-            / (2.0 * (1 - np.sqrt(1 - (ct_i * cosd(tilt) * cosd(yaw_i)))))
+        # The expressions over the whole grid are each evaluated in a single numexpr pass to
+        # limit the temporary arrays allocated for each turbine
+        cos_yaw = cosd(yaw_i)
+        ct_cos = ct_i * cosd(tilt) * cos_yaw
+
+        # initial Gaussian wake expansion, from the initial velocity deficits
+        sigma_z0 = ne.evaluate(
+            "rotor_diameter_i * 0.5 * sqrt("
+            "(freestream_velocity * ct_cos / (2.0 * (1 - sqrt(1 - ct_cos))))"
+            " / (freestream_velocity + freestream_velocity * sqrt(1 - ct_i))"
+            ")"
         )
-        u0 = freestream_velocity * np.sqrt(1 - ct_i)
+        cos_veer = cosd(wind_veer)
+        sigma_y0 = ne.evaluate("sigma_z0 * cos_yaw * cos_veer")
 
         # length of near wake
         x0 = (
             rotor_diameter_i
-            * (cosd(yaw_i) * (1 + np.sqrt(1 - ct_i * cosd(yaw_i))))
+            * (cos_yaw * (1 + np.sqrt(1 - ct_i * cos_yaw)))
             / (np.sqrt(2) * (
                 4 * self.alpha * turbulence_intensity_i + 2 * self.beta * (1 - np.sqrt(1 - ct_i))
             )) + x_i
@@ -160,55 +166,81 @@ class GaussVelocityDeflection(BaseModel):
         ky = self.ka * turbulence_intensity_i + self.kb
         kz = self.ka * turbulence_intensity_i + self.kb
 
-        C0 = 1 - u0 / freestream_velocity
+        C0 = 1 - np.sqrt(1 - ct_i)
         M0 = C0 * (2 - C0)
-        E0 = ne.evaluate("C0 ** 2 - 3 * exp(1.0 / 12.0) * C0 + 3 * exp(1.0 / 3.0)")
-
-        # initial Gaussian wake expansion
-        sigma_z0 = ne.evaluate("rotor_diameter_i * 0.5 * sqrt(uR / (freestream_velocity + u0))")
-        sigma_y0 = sigma_z0 * cosd(yaw_i) * cosd(wind_veer)
+        E0 = C0 ** 2 - 3 * np.exp(1.0 / 12.0) * C0 + 3 * np.exp(1.0 / 3.0)
 
         # yR = y - y_i
         xR = x_i # yR * tand(yaw) + x_i
 
         # yaw parameters (skew angle and distance from centerline)
         # skew angle in radians
-        theta_c0 = self.dm * (0.3 * np.radians(yaw_i) / cosd(yaw_i))
-        theta_c0 *= (1 - np.sqrt(1 - ct_i * cosd(yaw_i)))
+        theta_c0 = self.dm * (0.3 * np.radians(yaw_i) / cos_yaw)
+        theta_c0 *= (1 - np.sqrt(1 - ct_i * cos_yaw))
         delta0 = np.tan(theta_c0) * (x0 - x_i)  # initial wake deflection;
         # NOTE: use np.tan here since theta_c0 is radians
 
-        # deflection in the near wake
-        delta_near_wake = ((x - xR) / (x0 - xR)) * delta0 + (self.ad + self.bd * (x - x_i))
-        delta_near_wake *= (x >= xR) & (x <= x0)
-
-        # deflection in the far wake
-        sigma_y = ky * (x - x0) + sigma_y0
-        sigma_z = kz * (x - x0) + sigma_z0
-        sigma_y = sigma_y * (x >= x0) + sigma_y0 * (x < x0)
-        sigma_z = sigma_z * (x >= x0) + sigma_z0 * (x < x0)
-
-        M0_sqrt = np.sqrt(M0)
-        middle_term = np.sqrt(sigma_y * sigma_z / (sigma_y0 * sigma_z0))
-        ln_deltaNum = (1.6 + M0_sqrt) * (1.6 * middle_term - M0_sqrt)
-        ln_deltaDen = (1.6 - M0_sqrt) * (1.6 * middle_term + M0_sqrt)
-
-        middle_term = ne.evaluate(
-            "theta_c0"
-            " * E0"
-            " / 5.2"
-            " * sqrt(sigma_y0 * sigma_z0 / (ky * kz * M0))"
-            " * log(ln_deltaNum / ln_deltaDen)"
+        ad = self.ad
+        bd = self.bd
+
+        # deflection in the near wake, and in the far wake where the wake expands linearly
+        # from its initial width
+        deflection = ne.evaluate(
+            "where("
+            "(x >= xR) & (x <= x0),"
+            " ((x - xR) / (x0 - xR)) * delta0 + (ad + bd * (x - x_i)),"
+            " 0.0"
+            ")"
+            " + where("
+            "x > x0,"
+            " delta0"
+            " + theta_c0 * E0 / 5.2 * sqrt(sigma_y0 * sigma_z0 / (ky * kz * M0))"
+            " * log("
+            "((1.6 + sqrt(M0)) * (1.6 * sqrt("
+            "(ky * (x - x0) + sigma_y0) * (kz * (x - x0) + sigma_z0) / (sigma_y0 * sigma_z0)"
+            ") - sqrt(M0)))"
+            " / ((1.6 - sqrt(M0)) * (1.6 * sqrt("
+            "(ky * (x - x0) + sigma_y0) * (kz * (x - x0) + sigma_z0) / (sigma_y0 * sigma_z0)"
+            ") + sqrt(M0)))"
+            ")"
+            " + (ad + bd * (x - x_i)),"
+            " 0.0"
+            ")"
         )
-        delta_far_wake = delta0 + middle_term + (self.ad + self.bd * (x - x_i))
-
-        delta_far_wake = delta_far_wake * (x > x0)
-        deflection = delta_near_wake + delta_far_wake
 
         return deflection
 
 ## GCH components
 
+def vortex_profile(Gamma, y, z, z_vortex, eps, decay=1.0):
+    """
+    Profile of the velocities induced by a vortex with a Gaussian core, centered at the
+    height z_vortex. The spanwise velocity is the profile times the vertical distance from the
+    vortex, and the vertical velocity is the profile times the negative spanwise distance.
+    The profile is evaluated in a single numexpr pass, without temporary arrays.
+
+    Args:
+        Gamma (np.array): Circulation strength of the vortex.
+        y (np.array): Spanwise distance from the vortex.
+        z (np.array): Heights of the points.
+        z_vortex (np.array): Height of the vortex; negative for mirror vortices.
+        eps (float): Radius of the vortex core.
+        decay (np.array, optional): Decay of the vortex downstream. Defaults to 1.0.
+
+    Returns:
+        np.array: The profile.
+    """
+    return ne.evaluate(
+        "Gamma / (2 * pi * (y ** 2 + (z - z_vortex + NUM_EPS) ** 2))"
+        " * (1 - exp(-1 * where("
+        "(y ** 2 + (z - z_vortex + NUM_EPS) ** 2) / (eps ** 2) < -EXP_ARGUMENT_MIN,"
+        " (y ** 2 + (z - z_vortex + NUM_EPS) ** 2) / (eps ** 2),"
+        " -EXP_ARGUMENT_MIN"
+        ")))"
+        " * decay"
+    )
+
+
 def gamma(
     D,
     velocity,
@@ -299,28 +331,22 @@ def wake_added_yaw(
 
     # top vortex
     # NOTE: this is the top of the grid, not the top of the rotor
-    zT = z_i - (HH + D / 2) + NUM_EPS  # distance from the top of the grid
-    rT = ne.evaluate("yLocs ** 2 + zT ** 2")  # TODO: This is (-) in the paper
-    # This looks like spanwise decay;
-    # it defines the vortex profile in the spanwise directions
-    core_shape = ne.evaluate("1 - exp(-rT / (eps ** 2))")
-    v_top = ne.evaluate("(Gamma_top * zT) / (2 * pi * rT) * core_shape")
+    z_top = HH + D / 2
+    zT = z_i - z_top + NUM_EPS  # distance from the top of the grid
+    v_top = vortex_profile(Gamma_top, yLocs, z_i, z_top, eps) * zT
     v_top = np.mean( v_top, axis=(2,3) )
     # w_top = (-1 * Gamma_top * yLocs) / (2 * pi * rT) * core_shape * decay
 
     # bottom vortex
-    zB = z_i - (HH - D / 2) + NUM_EPS
-    rB = ne.evaluate("yLocs ** 2 + zB ** 2")
-    core_shape = ne.evaluate("1 - exp(-rB / (eps ** 2))")
-    v_bottom = ne.evaluate("(Gamma_bottom * zB) / (2 * pi * rB) * core_shape")
+    z_bottom = HH - D / 2
+    zB = z_i - z_bottom + NUM_EPS
+    v_bottom = vortex_profile(Gamma_bottom, yLocs, z_i, z_bottom, eps) * zB
     v_bottom = np.mean( v_bottom, axis=(2,3) )
     # w_bottom = (-1 * Gamma_bottom * yLocs) / (2 * pi * rB) * core_shape * decay
 
     # wake rotation vortex
     zC = z_i - HH + NUM_EPS
-    rC = ne.evaluate("yLocs ** 2 + zC ** 2")
-    core_shape = ne.evaluate("1 - exp(-rC / (eps ** 2))")
-    v_core = ne.evaluate("(Gamma_wake_rotation * zC) / (2 * pi * rC) * core_shape")
+    v_core = vortex_profile(Gamma_wake_rotation, yLocs, z_i, HH, eps) * zC
     v_core = np.mean( v_core, axis=(2,3) )
     # w_core = (-1 * Gamma_wake_rotation * yLocs) / (2 * pi * rC) * core_shape * decay
 
@@ -392,65 +418,27 @@ def calculate_transverse_velocity(
     # decay the vortices as they move downstream - using mixing length
     lmda = D / 8
     kappa = 0.41
-    lm = kappa * z / (1 + kappa * z / lmda)
-    nu = lm ** 2 * np.abs(dudz_initial)
 
     # This is the decay downstream
-    decay = ne.evaluate("eps ** 2 / (4 * nu * delta_x / Uinf + eps ** 2)")
+    decay = ne.evaluate(
+        "eps ** 2"
+        " / (4 * (kappa * z / (1 + kappa * z / lmda)) ** 2 * abs(dudz_initial) * delta_x / Uinf"
+        " + eps ** 2)"
+    )
     yLocs = delta_y + NUM_EPS
 
-    # top vortex
-    zT = z - (HH + D / 2) + NUM_EPS
-    rT = ne.evaluate("yLocs ** 2 + zT ** 2")  # TODO: This is - in the paper
-    # This looks like spanwise decay;
-    # it defines the vortex profile in the spanwise directions
-    core_shape = ne.evaluate("1 - exp(-rT / (eps ** 2))")
-    V1 = ne.evaluate("(Gamma_top * zT) / (2 * pi * rT) * core_shape * decay")
-    W1 = ne.evaluate("(-1 * Gamma_top * yLocs) / (2 * pi * rT) * core_shape * decay")
-
-    # bottom vortex
-    zB = z - (HH - D / 2) + NUM_EPS
-    rB = ne.evaluate("yLocs ** 2 + zB ** 2")
-    core_shape = ne.evaluate("1 - exp(-rB / (eps ** 2))")
-    V2 = ne.evaluate("(Gamma_bottom * zB) / (2 * pi * rB) * core_shape * decay")
-    W2 = ne.evaluate("(-1 * Gamma_bottom * yLocs) / (2 * pi * rB) * core_shape * decay")
-
-    # wake rotation vortex
-    zC = z - HH + NUM_EPS
-    rC = ne.evaluate("yLocs ** 2 + zC ** 2")
-    core_shape = ne.evaluate("1 - exp(-rC / (eps ** 2))")
-    V5 = ne.evaluate("(Gamma_wake_rotation * zC) / (2 * pi * rC) * core_shape * decay")
-    W5 = ne.evaluate("(-1 * Gamma_wake_rotation * yLocs) / (2 * pi * rC) * core_shape * decay")
-
-    ### Boundary condition - ground mirror vortex
-
-    # top vortex - ground
-    zTb = z + (HH + D / 2) + NUM_EPS
-    rTb = ne.evaluate("yLocs ** 2 + zTb ** 2")
-    # This looks like spanwise decay;
-    # it defines the vortex profile in the spanwise directions
-    core_shape = ne.evaluate("1 - exp(-rTb / (eps ** 2))")
-    V3 = ne.evaluate("(-1 * Gamma_top * zTb) / (2 * pi * rTb) * core_shape * decay")
-    W3 = ne.evaluate("(Gamma_top * yLocs) / (2 * pi * rTb) * core_shape * decay")
-
-    # bottom vortex - ground
-    zBb = z + (HH - D / 2) + NUM_EPS
-    rBb = ne.evaluate("yLocs ** 2 + zBb ** 2")
-    core_shape = ne.evaluate("1 - exp(-rBb / (eps ** 2))")
-    V4 = ne.evaluate("(-1 * Gamma_bottom * zBb) / (2 * pi * rBb) * core_shape * decay")
-    W4 = ne.evaluate("(Gamma_bottom * yLocs) / (2 * pi * rBb) * core_shape * decay")
-
-    # wake rotation vortex - ground effect
-    zCb = z + HH + NUM_EPS
-    rCb = ne.evaluate("yLocs ** 2 + zCb ** 2")
-    core_shape = ne.evaluate("1 - exp(-rCb / (eps ** 2))")
-    V6 = ne.evaluate("(-1 * Gamma_wake_rotation * zCb) / (2 * pi * rCb) * core_shape * decay")
-    W6 = ne.evaluate("(Gamma_wake_rotation * yLocs) / (2 * pi * rCb) * core_shape * decay")
+    # Velocity profile of each vortex, and of its mirror vortex below the ground as the
+    # boundary condition. The profiles of the mirror vortices have the opposite sign.
+    z_top = HH + D / 2
+    z_bottom = HH - D / 2
+    profile_top = vortex_profile(Gamma_top, yLocs, z, z_top, eps, decay)
+    profile_bottom = vortex_profile(Gamma_bottom, yLocs, z, z_bottom, eps, decay)
+    profile_core = vortex_profile(Gamma_wake_rotation, yLocs, z, HH, eps, decay)
+    profile_top_ground = vortex_profile(Gamma_top, yLocs, z, -z_top, eps, decay)
+    profile_bottom_ground = vortex_profile(Gamma_bottom, yLocs, z, -z_bottom, eps, decay)
+    profile_core_ground = vortex_profile(Gamma_wake_rotation, yLocs, z, -HH, eps, decay)
 
     # total spanwise velocity
-    V = V1 + V2 + V3 + V4 + V5 + V6
-    W = W1 + W2 + W3 + W4 + W5 + W6
-
     # No spanwise and vertical velocity upstream of the turbine
     ### Original v3 implementation
     # V[delta_x < -1] = 0.0  # Subtract by 1 to avoid numerical issues on rotation
@@ -460,11 +448,27 @@ def calculate_transverse_velocity(
     # V[delta_x < 0.0] = 0.0  # Subtract by 1 to avoid numerical issues on rotation
     # W[delta_x < 0.0] = 0.0  # Subtract by 1 to avoid numerical issues on rotation
     ### Currently, here
-    V = np.where(delta_x >= 0.0, V, 0.0)
-    W = np.where(delta_x >= 0.0, W, 0.0)
+    V = ne.evaluate(
+        "where("
+        "delta_x >= 0.0,"
+        " profile_top * (z - z_top + NUM_EPS)"
+        " + profile_bottom * (z - z_bottom + NUM_EPS)"
+        " - profile_top_ground * (z + z_top + NUM_EPS)"
+        " - profile_bottom_ground * (z + z_bottom + NUM_EPS)"
+        " + profile_core * (z - HH + NUM_EPS)"
+        " - profile_core_ground * (z + HH + NUM_EPS),"
+        " 0.0"
+        ")"
+    )
+    W = ne.evaluate(
+        "-1 * yLocs * ("
+        "profile_top + profile_bottom - profile_top_ground - profile_bottom_ground"
+        " + profile_core - profile_core_ground"
+        ")"
+    )
 
     # TODO: Why would the say W cannot be negative?
-    W = np.where(W >= 0, W, 0.0)
+    W = ne.evaluate("where((delta_x >= 0.0) & (W >= 0), W, 0.0)")
 
     return V, W
 
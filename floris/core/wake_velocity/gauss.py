@@ -19,6 +19,13 @@ from floris.utilities import (
 )
 
 
+# Lower bound of the exponents of the Gaussian wake and vortex profiles. Far from the wake
+# center the exponents reach large negative values, whose exponentials underflow to subnormal
+# numbers that are much slower to compute. exp(EXP_ARGUMENT_MIN) is about 1e-304, so the
+# clamped profiles differ from the exact ones by a negligible amount.
+EXP_ARGUMENT_MIN = -700.0
+
+
 @define
 class GaussVelocityDeficit(BaseModel):
 
@@ -72,13 +79,19 @@ class GaussVelocityDeficit(BaseModel):
         # Opposite sign convention in this model
         yaw_angle = -1 * yaw_angle_i
 
-        # Initialize the velocity deficit
-        uR = u_initial * ct_i / (2.0 * (1 - np.sqrt(1 - ct_i)))
-        u0 = u_initial * np.sqrt(1 - ct_i)
+        # The expressions over the whole grid are each evaluated in a single numexpr pass to
+        # limit the temporary arrays allocated for each turbine
 
-        # Initial lateral bounds
-        sigma_z0 = rotor_diameter_i * 0.5 * np.sqrt(uR / (u_initial + u0))
-        sigma_y0 = sigma_z0 * cosd(yaw_angle) * cosd(wind_veer)
+        # Initial lateral bounds, from the initial velocity deficit
+        sigma_z0 = ne.evaluate(
+            "rotor_diameter_i * 0.5 * sqrt("
+            "(u_initial * ct_i / (2.0 * (1 - sqrt(1 - ct_i))))"
+            " / (u_initial + u_initial * sqrt(1 - ct_i))"
+            ")"
+        )
+        cos_yaw = cosd(yaw_angle)
+        cos_veer = cosd(wind_veer)
+        sigma_y0 = ne.evaluate("sigma_z0 * cos_yaw * cos_veer")
 
         # Compute the bounds of the near and far wake regions and a mask
 
@@ -86,15 +99,11 @@ class GaussVelocityDeficit(BaseModel):
         xR = x_i
 
         # Start of the far wake
-        x0 = np.ones_like(u_initial)
-        x0 *= rotor_diameter_i * cosd(yaw_angle) * (1 + np.sqrt(1 - ct_i) )
-        x0 /= np.sqrt(2) * (
-            4 * self.alpha * turbulence_intensity_i + 2 * self.beta * (1 - np.sqrt(1 - ct_i) )
-        )
-        x0 += x_i
-
-        # Initialize the velocity deficit array
-        velocity_deficit = np.zeros_like(u_initial)
+        x0 = rotor_diameter_i * cos_yaw * (1 + np.sqrt(1 - ct_i) ) / (
+            np.sqrt(2) * (
+                4 * self.alpha * turbulence_intensity_i + 2 * self.beta * (1 - np.sqrt(1 - ct_i) )
+            )
+        ) + x_i
 
         # Masks
         # When we have only an inequality, the current turbine may be applied its own
@@ -103,34 +112,39 @@ class GaussVelocityDeficit(BaseModel):
         # zero value.
 
         # This mask defines the near wake; keeps the areas downstream of xR and upstream of x0
-        near_wake_mask = (x > xR + 0.1) * (x < x0)
-        far_wake_mask = (x >= x0)
+        near_wake_mask = ne.evaluate("(x > xR + 0.1) & (x < x0)")
+        far_wake_mask = ne.evaluate("x >= x0")
+
+        # Initialize the velocity deficit array
+        velocity_deficit = None
 
         # Compute the velocity deficit in the NEAR WAKE region
         # ONLY If there are points within the near wake boundary
         # TODO: for the TurbineGrid, do we need to do this near wake calculation at all?
         #       same question for any grid with a resolution larger than the near wake region
-        if np.sum(near_wake_mask):
+        if near_wake_mask.any():
 
             # Calculate the wake expansion
 
-            # This is a linear ramp from 0 to 1 from the start of the near wake to the start
-            # of the far wake.
-            near_wake_ramp_up = (x - xR) / (x0 - xR)
-            # Another linear ramp, but positive upstream of the far wake and negative in the
-            # far wake; 0 at the start of the far wake
-            near_wake_ramp_down = (x0 - x) / (x0 - xR)
-            # near_wake_ramp_down = -1 * (near_wake_ramp_up - 1)  # : this is equivalent, right?
-
-            sigma_y = near_wake_ramp_down * 0.501 * rotor_diameter_i * np.sqrt(ct_i / 2.0)
-            sigma_y += near_wake_ramp_up * sigma_y0
-            sigma_y *= (x >= xR)
-            sigma_y += np.ones_like(sigma_y) * (x < xR) * 0.5 * rotor_diameter_i
-
-            sigma_z = near_wake_ramp_down * 0.501 * rotor_diameter_i * np.sqrt(ct_i / 2.0)
-            sigma_z += near_wake_ramp_up * sigma_z0
-            sigma_z *= (x >= xR)
-            sigma_z += np.ones_like(sigma_z) * (x < xR) * 0.5 * rotor_diameter_i
+            # Upstream of the far wake, the expansion is a blend of two linear ramps: one from
+            # 0 to 1 from the start of the near wake to the start of the far wake, and another
+            # that is positive upstream of the far wake and 0 at the start of the far wake
+            sigma_near_wake_start = 0.501 * rotor_diameter_i * np.sqrt(ct_i / 2.0)
+            near_wake_sigma_expression = (
+                "where("
+                "x >= xR,"
+                " ((x0 - x) * sigma_near_wake_start + (x - xR) * sigma_0) / (x0 - xR),"
+                " 0.5 * rotor_diameter_i"
+                ")"
+            )
+            sigma_y = ne.evaluate(near_wake_sigma_expression, local_dict={
+                "x": x, "xR": xR, "x0": x0, "rotor_diameter_i": rotor_diameter_i,
+                "sigma_near_wake_start": sigma_near_wake_start, "sigma_0": sigma_y0,
+            })
+            sigma_z = ne.evaluate(near_wake_sigma_expression, local_dict={
+                "x": x, "xR": xR, "x0": x0, "rotor_diameter_i": rotor_diameter_i,
+                "sigma_near_wake_start": sigma_near_wake_start, "sigma_0": sigma_z0,
+            })
 
             r, C = rC(
                 wind_veer,
@@ -146,19 +160,17 @@ class GaussVelocityDeficit(BaseModel):
                 rotor_diameter_i,
             )
 
-            near_wake_deficit = gaussian_function(C, r, 1, np.sqrt(0.5))
-            near_wake_deficit *= near_wake_mask
-
-            velocity_deficit += near_wake_deficit
+            velocity_deficit = gaussian_function(C, r, 1, np.sqrt(0.5))
+            velocity_deficit *= near_wake_mask
 
         # Compute the velocity deficit in the FAR WAKE region
-        if np.sum(far_wake_mask):
+        if far_wake_mask.any():
 
             # Wake expansion in the lateral (y) and the vertical (z)
             ky = self.ka * turbulence_intensity_i + self.kb  # wake expansion parameters
             kz = self.ka * turbulence_intensity_i + self.kb  # wake expansion parameters
-            sigma_y = (ky * (x - x0) + sigma_y0) * far_wake_mask + sigma_y0 * (x < x0)
-            sigma_z = (kz * (x - x0) + sigma_z0) * far_wake_mask + sigma_z0 * (x < x0)
+            sigma_y = ne.evaluate("where(x >= x0, ky * (x - x0) + sigma_y0, sigma_y0)")
+            sigma_z = ne.evaluate("where(x >= x0, kz * (x - x0) + sigma_z0, sigma_z0)")
 
             r, C = rC(
                 wind_veer,
@@ -177,7 +189,13 @@ class GaussVelocityDeficit(BaseModel):
             far_wake_deficit = gaussian_function(C, r, 1, np.sqrt(0.5))
             far_wake_deficit *= far_wake_mask
 
-            velocity_deficit += far_wake_deficit
+            if velocity_deficit is None:
+                velocity_deficit = far_wake_deficit
+            else:
+                velocity_deficit += far_wake_deficit
+
+        if velocity_deficit is None:
+            velocity_deficit = np.zeros_like(u_initial)
 
         return velocity_deficit
 
@@ -208,21 +226,29 @@ def rC(wind_veer, sigma_y, sigma_z, y, y_i, delta, z, HH, Ct, yaw, D):
     # C = 1 - np.sqrt(np.clip(1 - (Ct * cosd(yaw) / (8.0 * sigma_y * sigma_z / (D * D))), 0.0, 1.0))
 
     ## Numexpr
+    # The coefficients of the quadratic form depend only on the wind veer and the wake widths,
+    # so they are inlined to evaluate r in a single pass
     wind_veer = np.deg2rad(wind_veer)
-    a = ne.evaluate(
-        "cos(wind_veer) ** 2 / (2 * sigma_y ** 2) + sin(wind_veer) ** 2 / (2 * sigma_z ** 2)"
-    )
-    b = ne.evaluate(
-        "-sin(2 * wind_veer) / (4 * sigma_y ** 2) + sin(2 * wind_veer) / (4 * sigma_z ** 2)"
-    )
-    c = ne.evaluate(
-        "sin(wind_veer) ** 2 / (2 * sigma_y ** 2) + cos(wind_veer) ** 2 / (2 * sigma_z ** 2)"
-    )
-    r = ne.evaluate(
-        "a * ((y - y_i - delta) ** 2) - 2 * b * (y - y_i - delta) * (z - HH) + c * ((z - HH) ** 2)"
-    )
-    d = np.clip(1 - (Ct * cosd(yaw) / ( 8.0 * sigma_y * sigma_z / (D * D) )), 0.0, 1.0)
-    C = ne.evaluate("1 - sqrt(d)")
+    if wind_veer == 0.0:
+        # Without veer, the axes of the wake are aligned with y and z
+        r = ne.evaluate(
+            "(y - y_i - delta) ** 2 / (2 * sigma_y ** 2) + (z - HH) ** 2 / (2 * sigma_z ** 2)"
+        )
+    else:
+        cos_veer_2 = np.cos(wind_veer) ** 2
+        sin_veer_2 = np.sin(wind_veer) ** 2
+        sin_2veer = np.sin(2 * wind_veer)
+        r = ne.evaluate(
+            "(cos_veer_2 / (2 * sigma_y ** 2) + sin_veer_2 / (2 * sigma_z ** 2))"
+            " * ((y - y_i - delta) ** 2)"
+            " - 2 * (-sin_2veer / (4 * sigma_y ** 2) + sin_2veer / (4 * sigma_z ** 2))"
+            " * (y - y_i - delta) * (z - HH)"
+            " + (sin_veer_2 / (2 * sigma_y ** 2) + cos_veer_2 / (2 * sigma_z ** 2))"
+            " * ((z - HH) ** 2)"
+        )
+    ct_D2 = Ct * cosd(yaw) * (D * D)
+    d = ne.evaluate("1 - ct_D2 / (8.0 * sigma_y * sigma_z)")
+    C = ne.evaluate("1 - sqrt(where(d < 0.0, 0.0, where(d > 1.0, 1.0, d)))")
     return r, C
 
 
@@ -233,5 +259,13 @@ def mask_upstream_wake(mesh_y_rotated, x_coord_rotated, y_coord_rotated, turbine
 
 
 def gaussian_function(C, r, n, sigma):
-    result = ne.evaluate("C * exp(-1 * r ** n / (2 * sigma ** 2))")
+    # The integer exponent n is written into the expression so that numexpr expands the power
+    # into multiplications. Exponents below EXP_ARGUMENT_MIN are clamped to it.
+    result = ne.evaluate(
+        f"C * exp(-1 * where("
+        f"r ** {n} / (2 * sigma ** 2) < -EXP_ARGUMENT_MIN,"
+        f" r ** {n} / (2 * sigma ** 2),"
+        f" -EXP_ARGUMENT_MIN"
+        f"))"
+    )
     return result
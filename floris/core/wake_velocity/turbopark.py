@@ -134,6 +134,70 @@ class TurbOParkVelocityDeficit(BaseModel):
         return delta_total
 
 
+    def point_deficit_squared(
+        self,
+        x_j: np.ndarray,
+        y_j: np.ndarray,
+        z_j: np.ndarray,
+        ambient_turbulence_intensity_j: np.ndarray,
+        Ct_j: np.ndarray,
+        rotor_diameter_j: np.ndarray,
+        deflection_field: np.ndarray,
+        *,
+        x: np.ndarray,
+        y: np.ndarray,
+        z: np.ndarray,
+        u_initial: np.ndarray,
+    ) -> np.ndarray:
+        """
+        Squared normalized velocity deficit of the wake of turbine j, and of its image below
+        the ground, at the grid points. This evaluates the same wake as :py:meth:`function`,
+        but at points rather than averaged over the rotor of a downstream turbine. The
+        deficits of all turbines are combined by the square root of the sum of these values.
+        """
+        downstream_mask = (x - x_j >= self.NUM_EPS)
+        x_dist = (x - x_j) * downstream_mask / rotor_diameter_j
+
+        r_dist = np.sqrt((y - (y_j + deflection_field)) ** 2 + (z - z_j) ** 2)
+        r_dist_image = np.sqrt((y - (y_j + deflection_field)) ** 2 + (z - (-z_j)) ** 2)
+
+        dw = characteristic_wake_width(x_dist, ambient_turbulence_intensity_j, Ct_j, self.A)
+        epsilon = 0.25 * np.sqrt(0.5 * (1 + np.sqrt(1 - Ct_j)) / np.sqrt(1 - Ct_j))
+        sigma = rotor_diameter_j * (epsilon + dw)
+
+        val = 1 - Ct_j / (8 * (sigma / rotor_diameter_j) ** 2)
+        C = 1 - np.sqrt(val)
+
+        # The points have no extent, so the overlap is evaluated with a radius of zero
+        in_wake = (x_dist > 0) * ((self.sigma_max_rel * sigma) / 2 > r_dist)
+        delta_real = C * in_wake * self.point_overlap(r_dist / sigma)
+        delta_image = C * in_wake * self.point_overlap(r_dist_image / sigma)
+
+        return delta_real ** 2 + delta_image ** 2
+
+    def point_overlap(self, dist: np.ndarray) -> np.ndarray:
+        """
+        Overlap of the Gaussian wake profile with a point, i.e. a disc of zero radius, at
+        distances from the wake center normalized by the wake width. Beyond the largest
+        distance of the lookup table, the wake has fully decayed and the overlap is zero.
+        """
+        dist_table, radius_table = self.overlap_gauss_interp.grid
+        if not radius_table[0] <= 0.0 <= radius_table[-1]:
+            raise ValueError(
+                "The TurbOPark overlap lookup table does not include a radius of zero, so "
+                "the wake cannot be evaluated at points."
+            )
+        if np.any(dist < dist_table[0]):
+            raise ValueError(
+                "The normalized distances to the wake center are outside of the TurbOPark "
+                "overlap lookup table."
+            )
+        overlap = self.overlap_gauss_interp(
+            (np.minimum(dist, dist_table[-1]), np.zeros_like(dist))
+        )
+        return np.where(dist > dist_table[-1], 0.0, overlap)
+
+
 def precalculate_overlap():
     # TODO: first implementation to generate wake overlap lookup table
     # (currently supplied by turbopark_lookup_table.mat.)
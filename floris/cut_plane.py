@@ -1,10 +1,8 @@
+from __future__ import annotations
 
-import copy
-
-import matplotlib.pyplot as plt
 import numpy as np
 import pandas as pd
-from scipy.interpolate import griddata
+from scipy.interpolate import CloughTocher2DInterpolator, RectBivariateSpline
 
 
 def nudge_outward(x):
@@ -89,6 +87,10 @@ class CutPlane:
     """
     A CutPlane object represents a 2D slice through the flow of a
     FLORIS simulation, or other such as SOWFA result.
+
+    The data can be stored either as a DataFrame or, for planes on a structured
+    grid, as 2D arrays with shape (x2_resolution, x1_resolution). In the latter
+    case, the DataFrame is only built when :py:attr:`df` is accessed.
     """
 
     def __init__(self, df, x1_resolution, x2_resolution, normal_vector):
@@ -99,10 +101,89 @@ class CutPlane:
             df (pandas.DataFrame): Pandas DataFrame of data with
                 columns x1, x2, u, v, w.
         """
-        self.df: pd.DataFrame = df
+        self._df: pd.DataFrame | None = df
+        self._arrays: dict | None = None
         self.normal_vector: str = normal_vector
         self.resolution = (x1_resolution, x2_resolution)
-        self.df.set_index(["x1", "x2"])
+
+    @classmethod
+    def from_arrays(cls, x1, x2, x3, u, v, w, normal_vector):
+        """
+        Initialize a CutPlane object from 2D arrays of a structured grid of points,
+        each with shape (x2_resolution, x1_resolution) so that x1 varies along the
+        rows.
+
+        Args:
+            x1 (np.array): x1-coordinates of the points.
+            x2 (np.array): x2-coordinates of the points.
+            x3 (np.array): x3-coordinates of the points.
+            u (np.array): Streamwise velocity at the points.
+            v (np.array): Spanwise velocity at the points.
+            w (np.array): Vertical velocity at the points.
+            normal_vector (str): Vector normal to the plane.
+
+        Returns:
+            :py:class:`~.tools.cut_plane.CutPlane`: The plane of data.
+        """
+        cut_plane = cls(None, np.shape(x1)[1], np.shape(x1)[0], normal_vector)
+        cut_plane._set_arrays(x1=x1, x2=x2, x3=x3, u=u, v=v, w=w)
+        return cut_plane
+
+    def _set_arrays(self, **arrays):
+        self._arrays = {
+            name: np.asarray(arrays[name], dtype=float)
+            for name in ["x1", "x2", "x3", "u", "v", "w"]
+        }
+        self._df = None
+
+    @property
+    def df(self) -> pd.DataFrame:
+        """
+        The data as a DataFrame with columns x1, x2, x3, u, v, w, sorted by x2 and then x1
+        for planes on a structured grid. Once the DataFrame is accessed, it is the data
+        of the plane so that changes to it are reflected in the other accessors.
+        """
+        if self._df is None:
+            self._df = pd.DataFrame(
+                {name: values.flatten() for name, values in self._arrays.items()}
+            )
+            self._arrays = None
+        return self._df
+
+    @df.setter
+    def df(self, df: pd.DataFrame):
+        self._df = df
+        self._arrays = None
+
+    def get_values(self, name: str) -> np.ndarray:
+        """
+        Get the values of one of x1, x2, x3, u, v or w as a 1D array in the same order
+        as the rows of :py:attr:`df`, without building the DataFrame.
+
+        Args:
+            name (str): The name of the coordinate or velocity component.
+
+        Returns:
+            np.array: The values at each point.
+        """
+        if self._arrays is not None:
+            return self._arrays[name].ravel()
+        return self._df[name].values
+
+    def get_mesh(self, name: str) -> np.ndarray:
+        """
+        Get the values of one of x1, x2, x3, u, v or w as a 2D array with shape
+        (x2_resolution, x1_resolution). The plane must be on a structured grid.
+
+        Args:
+            name (str): The name of the coordinate or velocity component.
+
+        Returns:
+            np.array: The values at each point.
+        """
+        if self._arrays is not None:
+            return self._arrays[name]
+        return self._df[name].values.reshape(self.resolution[1], self.resolution[0])
 
     def __sub__(self, other):
 
@@ -113,12 +194,22 @@ class CutPlane:
         # DF must be of the same size
         # resolution must be of the same size
 
+        if self._arrays is not None and other._arrays is not None:
+            return CutPlane.from_arrays(
+                self._arrays["x1"],
+                self._arrays["x2"],
+                self._arrays["x3"],
+                self._arrays["u"] - other._arrays["u"],
+                self._arrays["v"] - other._arrays["v"],
+                self._arrays["w"] - other._arrays["w"],
+                self.normal_vector,
+            )
+
         df: pd.DataFrame = self.df.copy()
-        other_df: pd.DataFrame = other.df.copy()
 
-        df['u'] = self.df['u'] - other_df['u']
-        df['v'] = self.df['v'] - other_df['v']
-        df['w'] = self.df['w'] - other_df['w']
+        df['u'] = self.get_values('u') - other.get_values('u')
+        df['v'] = self.get_values('v') - other.get_values('v')
+        df['w'] = self.get_values('w') - other.get_values('w')
 
         return CutPlane(
             df,
@@ -128,6 +219,86 @@ class CutPlane:
         )
 
 
+def _get_grid_axes(cut_plane):
+    """
+    Get the x1 and x2 axes of a CutPlane on a rectilinear grid, i.e. where x1 only
+    varies along the rows of the meshes and x2 only along the columns, and both
+    increase.
+
+    Args:
+        cut_plane (:py:class:`~.tools.cut_plane.CutPlane`):
+            Plane of data.
+
+    Returns:
+        tuple | None: The x1 and x2 axes, or None if the plane is not on such a grid.
+    """
+    x1 = cut_plane.get_values("x1")
+    x2 = cut_plane.get_values("x2")
+    n_x1, n_x2 = cut_plane.resolution
+    if n_x1 < 2 or n_x2 < 2 or x1.size != n_x1 * n_x2:
+        return None
+
+    x1_mesh = x1.reshape(n_x2, n_x1)
+    x2_mesh = x2.reshape(n_x2, n_x1)
+    x1_axis = x1_mesh[0, :]
+    x2_axis = x2_mesh[:, 0]
+    if not (np.all(x1_mesh == x1_axis[None, :]) and np.all(x2_mesh == x2_axis[:, None])):
+        return None
+    if np.any(np.diff(x1_axis) <= 0) or np.any(np.diff(x2_axis) <= 0):
+        return None
+
+    return x1_axis, x2_axis
+
+
+def _interpolate_velocities(cut_plane, x1_mesh, x2_mesh):
+    """
+    Interpolate u, v and w of a CutPlane onto new points. Planes on a rectilinear grid
+    use cubic splines along each axis. Otherwise, the scattered points are triangulated
+    once for all three components. Points outside of the data are set to NaN.
+
+    Args:
+        cut_plane (:py:class:`~.tools.cut_plane.CutPlane`):
+            Plane of data.
+        x1_mesh (np.array): x1-coordinates of the new points.
+        x2_mesh (np.array): x2-coordinates of the new points.
+
+    Returns:
+        tuple: Arrays of u, v and w with the shape of x1_mesh.
+    """
+    grid_axes = _get_grid_axes(cut_plane)
+
+    if grid_axes is None:
+        points = np.column_stack(
+            [nudge_outward(cut_plane.get_values("x1")), nudge_outward(cut_plane.get_values("x2"))]
+        )
+        values = np.column_stack([cut_plane.get_values(c) for c in ["u", "v", "w"]])
+        uvw = CloughTocher2DInterpolator(points, values)(x1_mesh, x2_mesh)
+        return uvw[..., 0], uvw[..., 1], uvw[..., 2]
+
+    x1_axis, x2_axis = grid_axes
+    outside = (
+        (x1_mesh < x1_axis[0])
+        | (x1_mesh > x1_axis[-1])
+        | (x2_mesh < x2_axis[0])
+        | (x2_mesh > x2_axis[-1])
+    )
+    kx = min(3, len(x2_axis) - 1)
+    ky = min(3, len(x1_axis) - 1)
+    uvw = []
+    for component in ["u", "v", "w"]:
+        spline = RectBivariateSpline(
+            x2_axis,
+            x1_axis,
+            cut_plane.get_mesh(component),
+            kx=kx,
+            ky=ky,
+        )
+        values = spline.ev(x2_mesh, x1_mesh)
+        values[outside] = np.nan
+        uvw.append(values)
+    return tuple(uvw)
+
+
 # Modification functions
 def set_origin(cut_plane, center_x1=0.0, center_x2=0.0):
     """
@@ -146,8 +317,12 @@ def set_origin(cut_plane, center_x1=0.0, center_x2=0.0):
             Updated plane of data.
     """
     # Store the un-interpolated input arrays at this slice
-    cut_plane.df.x1 = cut_plane.df.x1 - center_x1
-    cut_plane.df.x2 = cut_plane.df.x2 - center_x2
+    if cut_plane._arrays is not None:
+        cut_plane._arrays["x1"] = cut_plane._arrays["x1"] - center_x1
+        cut_plane._arrays["x2"] = cut_plane._arrays["x2"] - center_x2
+    else:
+        cut_plane.df.x1 = cut_plane.df.x1 - center_x1
+        cut_plane.df.x2 = cut_plane.df.x2 - center_x2
 
     return cut_plane
 
@@ -167,53 +342,22 @@ def change_resolution(cut_plane, resolution=(100, 100)):
             Updated plane of data.
     """
 
+    x1 = cut_plane.get_values("x1")
+    x2 = cut_plane.get_values("x2")
+
     # Linearize the data
-    x1_lin = np.linspace(min(cut_plane.df.x1), max(cut_plane.df.x1), resolution[0])
-    x2_lin = np.linspace(min(cut_plane.df.x2), max(cut_plane.df.x2), resolution[1])
-    # x3 = np.ones_like(x1) * cut_plane.df.x3[0]
+    x1_lin = np.linspace(np.min(x1), np.max(x1), resolution[0])
+    x2_lin = np.linspace(np.min(x2), np.max(x2), resolution[1])
 
     # Mesh the data
     x1_mesh, x2_mesh = np.meshgrid(x1_lin, x2_lin)
-    x3_mesh = np.ones_like(x1_mesh) * cut_plane.df.x3[0]
+    x3_mesh = np.full_like(x1_mesh, cut_plane.get_values("x3")[0])
 
     # Interpolate u,v,w
-    u_mesh = griddata(
-        np.column_stack(
-            [nudge_outward(cut_plane.df.x1), nudge_outward(cut_plane.df.x2)]
-        ),
-        cut_plane.df.u.values,
-        (x1_mesh.flatten(), x2_mesh.flatten()),
-        method="cubic",
-    )
-    v_mesh = griddata(
-        np.column_stack(
-            [nudge_outward(cut_plane.df.x1), nudge_outward(cut_plane.df.x2)]
-        ),
-        cut_plane.df.v.values,
-        (x1_mesh.flatten(), x2_mesh.flatten()),
-        method="cubic",
-    )
+    u_mesh, v_mesh, w_mesh = _interpolate_velocities(cut_plane, x1_mesh, x2_mesh)
 
-    w_mesh = griddata(
-        np.column_stack(
-            [nudge_outward(cut_plane.df.x1), nudge_outward(cut_plane.df.x2)]
-        ),
-        cut_plane.df.w.values,
-        (x1_mesh.flatten(), x2_mesh.flatten()),
-        method="cubic",
-    )
-
-    # Assign back to df
-    cut_plane.df = pd.DataFrame(
-        {
-            "x1": x1_mesh.flatten(),
-            "x2": x2_mesh.flatten(),
-            "x3": x3_mesh.flatten(),
-            "u": u_mesh.flatten(),
-            "v": v_mesh.flatten(),
-            "w": w_mesh.flatten(),
-        }
-    )
+    # Assign back to the cut plane
+    cut_plane._set_arrays(x1=x1_mesh, x2=x2_mesh, x3=x3_mesh, u=u_mesh, v=v_mesh, w=w_mesh)
 
     # Save the resolution
     cut_plane.resolution = resolution
@@ -236,56 +380,20 @@ def interpolate_onto_array(cut_plane_in, x1_array, x2_array):
         cut_plane (:py:class:`~.tools.cut_plane.CutPlane`):
             Updated plane of data.
     """
-    cut_plane = copy.deepcopy(cut_plane_in)
-
     # Linearize the data
     x1_lin = x1_array
     x2_lin = x2_array
 
-    # Save the new resolution
-    cut_plane.resolution = (len(np.unique(x1_lin)), len(np.unique(x2_lin)))
-
     # Mesh the data
     x1_mesh, x2_mesh = np.meshgrid(x1_lin, x2_lin)
-    x3_mesh = np.ones_like(x1_mesh) * cut_plane.df.x3.iloc[0]
+    x3_mesh = np.full_like(x1_mesh, cut_plane_in.get_values("x3")[0])
 
     # Interpolate u,v,w
-    u_mesh = griddata(
-        np.column_stack(
-            [nudge_outward(cut_plane.df.x1), nudge_outward(cut_plane.df.x2)]
-        ),
-        cut_plane.df.u.values,
-        (x1_mesh.flatten(), x2_mesh.flatten()),
-        method="cubic",
-    )
-    v_mesh = griddata(
-        np.column_stack(
-            [nudge_outward(cut_plane.df.x1), nudge_outward(cut_plane.df.x2)]
-        ),
-        cut_plane.df.v.values,
-        (x1_mesh.flatten(), x2_mesh.flatten()),
-        method="cubic",
-    )
-
-    w_mesh = griddata(
-        np.column_stack(
-            [nudge_outward(cut_plane.df.x1), nudge_outward(cut_plane.df.x2)]
-        ),
-        cut_plane.df.w.values,
-        (x1_mesh.flatten(), x2_mesh.flatten()),
-        method="cubic",
-    )
+    u_mesh, v_mesh, w_mesh = _interpolate_velocities(cut_plane_in, x1_mesh, x2_mesh)
 
-    # Assign back to df
-    cut_plane.df = pd.DataFrame(
-        {
-            "x1": x1_mesh.flatten(),
-            "x2": x2_mesh.flatten(),
-            "x3": x3_mesh.flatten(),
-            "u": u_mesh.flatten(),
-            "v": v_mesh.flatten(),
-            "w": w_mesh.flatten(),
-        }
+    # Store the result in a new cut plane
+    cut_plane = CutPlane.from_arrays(
+        x1_mesh, x2_mesh, x3_mesh, u_mesh, v_mesh, w_mesh, cut_plane_in.normal_vector
     )
 
     # Return the cutplane
@@ -307,8 +415,12 @@ def rescale_axis(cut_plane, x1_factor=1.0, x2_factor=1.0):
             Updated plane of data.
     """
     # Store the un-interpolated input arrays at this slice
-    cut_plane.df.x1 = cut_plane.df.x1 / x1_factor
-    cut_plane.df.x2 = cut_plane.df.x2 / x2_factor
+    if cut_plane._arrays is not None:
+        cut_plane._arrays["x1"] = cut_plane._arrays["x1"] / x1_factor
+        cut_plane._arrays["x2"] = cut_plane._arrays["x2"] / x2_factor
+    else:
+        cut_plane.df.x1 = cut_plane.df.x1 / x1_factor
+        cut_plane.df.x2 = cut_plane.df.x2 / x2_factor
 
     return cut_plane
 
@@ -329,7 +441,9 @@ def project_onto(cut_plane_a, cut_plane_b):
     """
 
     return interpolate_onto_array(
-        cut_plane_a, cut_plane_b.df.x1.unique(), cut_plane_b.df.x2.unique()
+        cut_plane_a,
+        pd.unique(cut_plane_b.get_values("x1")),
+        pd.unique(cut_plane_b.get_values("x2")),
     )
 
 
@@ -348,22 +462,21 @@ def calculate_wind_speed(cross_plane, x1_loc, x2_loc, R):
         (float): effective wind speed
     """
 
-    # Temp local copy
-    df = cross_plane.df.copy()
-
-    # Make a distance column
-    df["distance"] = np.sqrt((df.x1 - x1_loc) ** 2 + (df.x2 - x2_loc) ** 2)
+    # Distance of each point from the point of interest
+    distance = np.sqrt(
+        (cross_plane.get_values("x1") - x1_loc) ** 2
+        + (cross_plane.get_values("x2") - x2_loc) ** 2
+    )
 
     # Return the cube-mean wind speed
-    return np.cbrt(np.mean(df[df.distance < R].u ** 3))
+    return np.cbrt(np.mean(cross_plane.get_values("u")[distance < R] ** 3))
 
 
 def wind_speed_profile(cross_plane, R, x2_loc, resolution=100, x1_locs=None):
 
     if x1_locs is None:
-        x1_locs = np.linspace(
-            min(cross_plane.df.x1), max(cross_plane.df.x1), resolution
-        )
+        x1 = cross_plane.get_values("x1")
+        x1_locs = np.linspace(np.min(x1), np.max(x1), resolution)
     v_array = np.array(
         [calculate_wind_speed(cross_plane, x1_loc, x2_loc, R) for x1_loc in x1_locs]
     )
@@ -411,9 +524,8 @@ def get_power_profile(
 ):
 
     if x1_locs is None:
-        x1_locs = np.linspace(
-            min(cross_plane.df.x1), max(cross_plane.df.x1), resolution
-        )
+        x1 = cross_plane.get_values("x1")
+        x1_locs = np.linspace(np.min(x1), np.max(x1), resolution)
     p_array = np.array(
         [
             calculate_power(
@@ -6,6 +6,7 @@ import inspect
 from pathlib import Path
 from typing import (
     Any,
+    Iterator,
     List,
     Optional,
 )
@@ -13,7 +14,13 @@ from typing import (
 import numpy as np
 import pandas as pd
 
-from floris.core import Core, State
+from floris.core import (
+    Core,
+    FlowFieldPlanarGrid,
+    Profiler,
+    profiling,
+    State,
+)
 from floris.core.rotor_velocity import average_velocity
 from floris.core.turbine.operation_models import (
     POWER_SETPOINT_DEFAULT,
@@ -26,10 +33,13 @@ from floris.core.turbine.turbine import (
 )
 from floris.cut_plane import CutPlane
 from floris.logging_manager import LoggingManager
+from floris.result_store import TurbineResultStore
+from floris.snapshot import read_snapshot, write_snapshot
 from floris.type_dec import (
     floris_array_converter,
     NDArrayBool,
     NDArrayFloat,
+    NDArrayInt,
     NDArrayStr,
 )
 from floris.utilities import (
@@ -37,6 +47,7 @@ from floris.utilities import (
     nested_set,
     print_nested_dict,
 )
+from floris.velocity_deficit_profiles import VelocityDeficitProfiles
 from floris.wind_data import (
     TimeSeries,
     WindDataBase,
@@ -46,6 +57,20 @@ from floris.wind_data import (
 )
 
 
+# Target number of flow field points, summed over findices, in each solve when calculating
+# cut planes or sampling points. Larger solves are limited by memory bandwidth rather than
+# overhead, and bounding them also bounds the memory used.
+FLOW_FIELD_POINTS_PER_SOLVE = 100000
+
+# Number of findices solved at a time by run_to_store. This bounds the memory used by the solve,
+# while keeping each solve large enough that its overhead is small.
+FINDEX_PER_STORE_CHUNK = 1000
+
+# Growth rate of the radius of the cone around each wake, per unit of downstream distance,
+# outside of which the tiles of tiled cut planes are set to the inflow without solving the wakes.
+TILE_WAKE_CONE_SLOPE = 0.3
+
+
 class FlorisModel(LoggingManager):
     """
     FlorisModel provides a high-level user interface to many of the
@@ -115,6 +140,9 @@ class FlorisModel(LoggingManager):
         # Initialize stored wind_data object to None
         self._wind_data = None
 
+        # Core for a subset of the findices that is reused by the flow field calculations
+        self._findex_core = None
+
     ### Methods for setting and running the FlorisModel
 
     def _reinitialize(
@@ -478,10 +506,25 @@ class FlorisModel(LoggingManager):
         """
         self._reinitialize()
 
-    def run(self) -> None:
+    def run(self, profile: bool = False) -> Profiler | None:
         """
         Run the FLORIS solve to compute the velocity field and wake effects.
+
+        Args:
+            profile (bool, optional): Record the time spent in each phase of the solve,
+                such as the initialization, the solver and each wake model, with a
+                :py:class:`~floris.core.profiler.Profiler`. To also include other calls,
+                such as set(), use the :py:func:`~floris.core.profiler.profiling` context
+                manager instead. Defaults to False.
+
+        Returns:
+            Profiler | None: The profiler, whose report can be printed or converted with
+            to_dataframe(), if profile is True.
         """
+        if profile:
+            with profiling() as profiler:
+                self.run()
+            return profiler
 
         # Initialize solution space
         self.core.initialize_domain()
@@ -489,6 +532,44 @@ class FlorisModel(LoggingManager):
         # Perform the wake calculations
         self.core.steady_state_atmospheric_condition()
 
+    def run_to_store(
+        self,
+        store: str | Path | TurbineResultStore,
+        n_findex_per_chunk: int = FINDEX_PER_STORE_CHUNK,
+        outputs: list[str] | None = None,
+    ) -> TurbineResultStore:
+        """
+        Run the FLORIS solve in chunks of findices and append the turbine outputs of each chunk,
+        with its wind conditions and setpoints, to a
+        :py:class:`~floris.result_store.TurbineResultStore` as soon as the chunk finishes. The
+        memory used grows with the chunk size rather than the number of findices, so long time
+        series can be run without holding all of their flow fields or outputs in memory. The
+        rows of the store are in findex order; for wind roses, these are the findices with
+        nonzero frequency. The FlorisModel itself is not modified and is not run.
+
+        Args:
+            store (str | Path | TurbineResultStore): The store to append to, or the directory
+                of a new store to create, replacing any existing store there.
+            n_findex_per_chunk (int, optional): The number of findices to solve at a time.
+                Defaults to FINDEX_PER_STORE_CHUNK.
+            outputs (list[str] | None, optional): The turbine outputs to store if a new store
+                is created. Defaults to None, which stores all of the outputs supported by
+                TurbineResultStore.
+
+        Returns:
+            TurbineResultStore: The store.
+        """
+        if not isinstance(store, TurbineResultStore):
+            store = TurbineResultStore(store, mode="w", outputs=outputs)
+
+        for start in range(0, self.n_findex, n_findex_per_chunk):
+            findices = np.arange(start, min(start + n_findex_per_chunk, self.n_findex))
+            chunk_fmodel = FlorisModel._from_core(self._build_core_for_findices(findices))
+            chunk_fmodel.run()
+            store.append(chunk_fmodel)
+
+        return store
+
     def run_no_wake(self) -> None:
         """
         This function is similar to `run()` except that it does not apply a wake model. That is,
@@ -577,6 +658,151 @@ class FlorisModel(LoggingManager):
 
         return turbine_powers
 
+    def get_turbine_powers_for_layouts(
+        self,
+        layout_x: NDArrayFloat,
+        layout_y: NDArrayFloat,
+        yaw_angles: NDArrayFloat | None = None,
+        n_layouts_per_solve: int | None = None,
+    ) -> NDArrayFloat:
+        """
+        Compute the turbine powers for many candidate layouts of the current turbines under
+        the current atmospheric conditions. Rather than calling `set()` and `run()` once per
+        layout, the layouts are stacked along the findex dimension and solved together in a
+        single vectorized calculation. The FlorisModel itself is not modified.
+
+        Args:
+            layout_x (NDArrayFloat): x-coordinates of the turbines for each layout with shape
+                (n_layouts, n_turbines).
+            layout_y (NDArrayFloat): y-coordinates of the turbines for each layout with shape
+                (n_layouts, n_turbines).
+            yaw_angles (NDArrayFloat | None, optional): Yaw angles for each layout with shape
+                (n_layouts, n_findex, n_turbines). If None, the current yaw angles are used
+                for all layouts. Defaults to None.
+            n_layouts_per_solve (int | None, optional): Maximum number of layouts combined
+                into a single solve, which bounds the memory used. If None, all layouts are
+                solved together. Defaults to None.
+
+        Returns:
+            NDArrayFloat: Powers at each turbine with shape (n_layouts, n_findex, n_turbines).
+        """
+        layout_x = np.atleast_2d(np.array(layout_x, dtype=float))
+        layout_y = np.atleast_2d(np.array(layout_y, dtype=float))
+        if layout_x.shape != layout_y.shape or layout_x.shape[1] != self.core.farm.n_turbines:
+            raise ValueError(
+                "layout_x and layout_y must both have shape (n_layouts, n_turbines) with "
+                f"n_turbines={self.core.farm.n_turbines}."
+            )
+        n_layouts = layout_x.shape[0]
+        n_findex = self.core.flow_field.n_findex
+        n_turbines = self.core.farm.n_turbines
+
+        if yaw_angles is None:
+            yaw_angles = np.broadcast_to(
+                self.core.farm.yaw_angles,
+                (n_layouts, n_findex, n_turbines)
+            )
+        elif np.shape(yaw_angles) != (n_layouts, n_findex, n_turbines):
+            raise ValueError(
+                "yaw_angles must have shape (n_layouts, n_findex, n_turbines) = "
+                f"{(n_layouts, n_findex, n_turbines)}."
+            )
+
+        if n_layouts_per_solve is None:
+            n_layouts_per_solve = n_layouts
+
+        floris_dict = self.core.as_dict()
+        turbine_powers = np.zeros((n_layouts, n_findex, n_turbines))
+        for start in range(0, n_layouts, n_layouts_per_solve):
+            stop = min(start + n_layouts_per_solve, n_layouts)
+            k = stop - start
+            core = self._run_layouts(
+                layout_x[start:stop],
+                layout_y[start:stop],
+                yaw_angles[start:stop],
+                floris_dict=floris_dict,
+            )
+
+            chunk_powers = power(
+                velocities=core.flow_field.u,
+                turbulence_intensities=core.flow_field.turbulence_intensity_field[:,:,None,None],
+                air_density=core.flow_field.air_density,
+                power_functions=core.farm.turbine_power_functions,
+                yaw_angles=core.farm.yaw_angles,
+                tilt_angles=core.farm.tilt_angles,
+                power_setpoints=core.farm.power_setpoints,
+                awc_modes=core.farm.awc_modes,
+                awc_amplitudes=core.farm.awc_amplitudes,
+                tilt_interps=core.farm.turbine_tilt_interps,
+                turbine_type_map=core.farm.turbine_type_map,
+                turbine_power_thrust_tables=core.farm.turbine_power_thrust_tables,
+                correct_cp_ct_for_tilt=core.farm.correct_cp_ct_for_tilt,
+                multidim_condition=core.flow_field.multidim_conditions,
+            )
+            turbine_powers[start:stop] = chunk_powers.reshape(k, n_findex, n_turbines)
+
+        return turbine_powers
+
+    def _run_layouts(
+        self,
+        layout_x: NDArrayFloat,
+        layout_y: NDArrayFloat,
+        yaw_angles: NDArrayFloat,
+        floris_dict: dict | None = None,
+    ) -> Core:
+        """
+        Solve several layouts of the current turbines together by repeating the current
+        atmospheric conditions and operation settings once per layout along the findex
+        dimension. The FlorisModel itself is not modified.
+
+        Args:
+            layout_x (NDArrayFloat): x-coordinates with shape (n_layouts, n_turbines).
+            layout_y (NDArrayFloat): y-coordinates with shape (n_layouts, n_turbines).
+            yaw_angles (NDArrayFloat): Yaw angles with shape
+                (n_layouts, n_findex, n_turbines).
+            floris_dict (dict | None, optional): The result of `self.core.as_dict()`, if
+                already available. Defaults to None.
+
+        Returns:
+            Core: The solved Core, whose findex dimension has length n_layouts * n_findex
+                and is ordered by layout first.
+        """
+        if floris_dict is None:
+            floris_dict = self.core.as_dict()
+        k = layout_x.shape[0]
+        n_findex = self.core.flow_field.n_findex
+        n_turbines = self.core.farm.n_turbines
+
+        # Repeat the atmospheric conditions once for each layout
+        flow_field_dict = floris_dict["flow_field"]
+        layouts_dict = copy.deepcopy(floris_dict)
+        layouts_flow_field_dict = layouts_dict["flow_field"]
+        for key in ["wind_directions", "wind_speeds", "turbulence_intensities"]:
+            layouts_flow_field_dict[key] = np.tile(flow_field_dict[key], k)
+        het_config = flow_field_dict.get("heterogeneous_inflow_config")
+        if het_config is not None and het_config.get("speed_multipliers") is not None:
+            layouts_flow_field_dict["heterogeneous_inflow_config"]["speed_multipliers"] = (
+                np.tile(het_config["speed_multipliers"], (k, 1))
+            )
+        core = Core.from_dict(layouts_dict)
+
+        # Repeat the operation settings and assign the yaw angles for each layout
+        core.farm.set_yaw_angles(np.reshape(yaw_angles, (k * n_findex, n_turbines)))
+        core.farm.set_power_setpoints(np.tile(self.core.farm.power_setpoints, (k, 1)))
+        if self.core.farm.awc_modes is not None:
+            core.farm.set_awc_modes(np.tile(self.core.farm.awc_modes, (k, 1)))
+        core.farm.set_awc_amplitudes(np.tile(self.core.farm.awc_amplitudes, (k, 1)))
+        core.farm.set_awc_frequencies(np.tile(self.core.farm.awc_frequencies, (k, 1)))
+
+        core.set_findex_layouts(
+            np.repeat(layout_x, n_findex, axis=0),
+            np.repeat(layout_y, n_findex, axis=0),
+        )
+        core.initialize_domain()
+        core.steady_state_atmospheric_condition()
+
+        return core
+
     def get_expected_turbine_powers(self, freq=None):
         """
         Compute the expected (mean) power of each turbine.
@@ -1077,6 +1303,7 @@ class FlorisModel(LoggingManager):
         y_bounds=None,
         z_bounds=None,
         findex_for_viz=None,
+        tile_resolution=None,
     ):
         """
         Shortcut method to instantiate a :py:class:`~.tools.cut_plane.CutPlane`
@@ -1094,6 +1321,10 @@ class FlorisModel(LoggingManager):
             z_bounds (tuple, optional): Limits of output array (in m).
                 Defaults to None.
             finder_for_viz (int, optional): Index of the condition to visualize.
+            tile_resolution (int, optional): Number of points along each side of the
+                square tiles in which the plane is solved. Defaults to None, which
+                solves the whole plane at once. See
+                :py:meth:`calculate_horizontal_planes`.
         Returns:
             :py:class:`~.tools.cut_plane.CutPlane`: containing values
             of x, y, u, v, w
@@ -1105,33 +1336,19 @@ class FlorisModel(LoggingManager):
         if findex_for_viz is None:
             findex_for_viz = 0
 
-        # Store the current state for reinitialization
-        fmodel_viz = copy.deepcopy(self)
-
-        # Set the solver to a flow field planar grid
-        solver_settings = {
-            "type": "flow_field_planar_grid",
-            "normal_vector": "x",
-            "planar_coordinate": downstream_dist,
-            "flow_field_grid_points": [y_resolution, z_resolution],
-            "flow_field_bounds": [y_bounds, z_bounds],
-        }
-        fmodel_viz.set_for_viz(findex_for_viz, solver_settings)
-
-        # Calculate wake
-        fmodel_viz.core.solve_for_viz()
-
-        # Get the points of data in a dataframe
-        # TODO this just seems to be flattening and storing the data in a df; is this necessary?
-        # It seems the biggest dependency is on CutPlane and the subsequent visualization tools.
-        df = fmodel_viz.get_plane_of_points(
-            normal_vector="x",
-            planar_coordinate=downstream_dist,
+        cross_plane = next(
+            self._calculate_planes(
+                "x",
+                downstream_dist,
+                (y_resolution, z_resolution),
+                y_bounds,
+                z_bounds,
+                findex_for_viz,
+                n_findex_per_solve=1,
+                tile_resolution=tile_resolution,
+            )
         )
 
-        # Compute the cutplane
-        cross_plane = CutPlane(df, y_resolution, z_resolution, "x")
-
         return cross_plane
 
     def calculate_horizontal_plane(
@@ -1142,6 +1359,7 @@ class FlorisModel(LoggingManager):
         x_bounds=None,
         y_bounds=None,
         findex_for_viz=None,
+        tile_resolution=None,
     ):
         """
         Shortcut method to instantiate a :py:class:`~.tools.cut_plane.CutPlane`
@@ -1160,6 +1378,10 @@ class FlorisModel(LoggingManager):
                 Defaults to None.
             finder_for_viz (int, optional): Index of the condition to visualize.
 
+            tile_resolution (int, optional): Number of points along each side of the
+                square tiles in which the plane is solved. Defaults to None, which
+                solves the whole plane at once. See
+                :py:meth:`calculate_horizontal_planes`.
         Returns:
             :py:class:`~.tools.cut_plane.CutPlane`: containing values
             of x, y, u, v, w
@@ -1171,36 +1393,17 @@ class FlorisModel(LoggingManager):
         if findex_for_viz is None:
             findex_for_viz = 0
 
-        # Store the current state for reinitialization
-        fmodel_viz = copy.deepcopy(self)
-
-        # Set the solver to a flow field planar grid
-        solver_settings = {
-            "type": "flow_field_planar_grid",
-            "normal_vector": "z",
-            "planar_coordinate": height,
-            "flow_field_grid_points": [x_resolution, y_resolution],
-            "flow_field_bounds": [x_bounds, y_bounds],
-        }
-        fmodel_viz.set_for_viz(findex_for_viz, solver_settings)
-
-        # Calculate wake
-        fmodel_viz.core.solve_for_viz()
-
-        # Get the points of data in a dataframe
-        # TODO this just seems to be flattening and storing the data in a df; is this necessary?
-        # It seems the biggest depenedcy is on CutPlane and the subsequent visualization tools.
-        df = fmodel_viz.get_plane_of_points(
-            normal_vector="z",
-            planar_coordinate=height,
-        )
-
-        # Compute the cutplane
-        horizontal_plane = CutPlane(
-            df,
-            fmodel_viz.core.grid.grid_resolution[0],
-            fmodel_viz.core.grid.grid_resolution[1],
-            "z",
+        horizontal_plane = next(
+            self._calculate_planes(
+                "z",
+                height,
+                (x_resolution, y_resolution),
+                x_bounds,
+                y_bounds,
+                findex_for_viz,
+                n_findex_per_solve=1,
+                tile_resolution=tile_resolution,
+            )
         )
 
         return horizontal_plane
@@ -1213,6 +1416,7 @@ class FlorisModel(LoggingManager):
         x_bounds=None,
         z_bounds=None,
         findex_for_viz=None,
+        tile_resolution=None,
     ):
         """
         Shortcut method to instantiate a :py:class:`~.tools.cut_plane.CutPlane`
@@ -1232,6 +1436,10 @@ class FlorisModel(LoggingManager):
             findex_for_viz (int, optional): Index of the condition to visualize.
                 Defaults to 0.
 
+            tile_resolution (int, optional): Number of points along each side of the
+                square tiles in which the plane is solved. Defaults to None, which
+                solves the whole plane at once. See
+                :py:meth:`calculate_horizontal_planes`.
         Returns:
             :py:class:`~.tools.cut_plane.CutPlane`: containing values
             of x, y, u, v, w
@@ -1243,34 +1451,494 @@ class FlorisModel(LoggingManager):
         if findex_for_viz is None:
             findex_for_viz = 0
 
-        # Store the current state for reinitialization
-        fmodel_viz = copy.deepcopy(self)
+        y_plane = next(
+            self._calculate_planes(
+                "y",
+                crossstream_dist,
+                (x_resolution, z_resolution),
+                x_bounds,
+                z_bounds,
+                findex_for_viz,
+                n_findex_per_solve=1,
+                tile_resolution=tile_resolution,
+            )
+        )
+
+        return y_plane
+
+    def _get_core_for_findices(
+        self,
+        findices: NDArrayInt,
+        flow_field_settings: dict | None = None,
+    ) -> Core:
+        """
+        Get a Core with the current settings for a subset of the findices, without modifying
+        or copying the FlorisModel. The last Core is kept and returned again while the
+        FlorisModel is unchanged so that its cached turbine grid solution is reused by
+        repeated flow field requests.
+
+        Only the flow field calculations (planes, points and velocity deficit profiles) may
+        use the kept Core. They may replace its grid and solve for its flow field, but must
+        not change its settings or run its wake calculation. Other callers, e.g. to run the
+        findices, must use :py:meth:`_build_core_for_findices` instead. The kept Core is not
+        pickled or saved in snapshots.
+
+        Args:
+            findices (NDArrayInt): The findices to keep.
+            flow_field_settings (dict | None, optional): Flow field settings to use instead of
+                the current ones, e.g. {"wind_shear": 0.0}. Defaults to None.
+
+        Returns:
+            Core: The Core, whose wake calculation has not been run.
+        """
+        findices = np.atleast_1d(np.array(findices, dtype=int))
+        core_key = (
+            findices.tobytes(),
+            repr(flow_field_settings),
+            self.core.get_turbine_grid_solution_key(),
+        )
+        if self._findex_core is not None:
+            source_core, source_core_key, core = self._findex_core
+            if source_core is self.core and source_core_key == core_key:
+                return core
+
+        core = self._build_core_for_findices(findices, flow_field_settings)
+        self._findex_core = (self.core, core_key, core)
+        return core
+
+    def _build_core_for_findices(
+        self,
+        findices: NDArrayInt,
+        flow_field_settings: dict | None = None,
+    ) -> Core:
+        """
+        Build a new Core with the current settings for a subset of the findices, without
+        modifying or copying the FlorisModel.
+
+        Args:
+            findices (NDArrayInt): The findices to keep.
+            flow_field_settings (dict | None, optional): Flow field settings to use instead of
+                the current ones, e.g. {"wind_shear": 0.0}. Defaults to None.
+
+        Returns:
+            Core: The Core, whose wake calculation has not been run.
+        """
+        findices = np.atleast_1d(np.array(findices, dtype=int))
+        floris_dict = self.core.as_dict()
+        flow_field_dict = floris_dict["flow_field"]
+        flow_field_dict.update(self._get_findex_wind_conditions(findices))
+        if flow_field_settings is not None:
+            flow_field_dict.update(flow_field_settings)
+        core = Core.from_dict(floris_dict)
+
+        setpoints = self._get_findex_setpoints(findices)
+        core.farm.set_yaw_angles(setpoints["yaw_angles"])
+        core.farm.set_power_setpoints(setpoints["power_setpoints"])
+        if setpoints["awc_modes"] is not None:
+            core.farm.set_awc_modes(setpoints["awc_modes"])
+        core.farm.set_awc_amplitudes(setpoints["awc_amplitudes"])
+        core.farm.set_awc_frequencies(setpoints["awc_frequencies"])
+
+        return core
+
+    def _get_findex_wind_conditions(self, findices: NDArrayInt) -> dict:
+        """
+        Get the wind conditions of a subset of the findices, as keyword arguments to set().
+        """
+        flow_field = self.core.flow_field
+        wind_conditions = {
+            "wind_directions": flow_field.wind_directions[findices],
+            "wind_speeds": flow_field.wind_speeds[findices],
+            "turbulence_intensities": flow_field.turbulence_intensities[findices],
+        }
+        het_config = flow_field.heterogeneous_inflow_config
+        if het_config is not None and het_config.get("speed_multipliers") is not None:
+            wind_conditions["heterogeneous_inflow_config"] = {
+                **het_config,
+                "speed_multipliers": np.array(het_config["speed_multipliers"])[findices],
+            }
+        return wind_conditions
 
-        # Set the solver to a flow field planar grid
-        solver_settings = {
-            "type": "flow_field_planar_grid",
-            "normal_vector": "y",
-            "planar_coordinate": crossstream_dist,
-            "flow_field_grid_points": [x_resolution, z_resolution],
-            "flow_field_bounds": [x_bounds, z_bounds],
+    def _get_findex_setpoints(self, findices: NDArrayInt) -> dict:
+        """
+        Get the control setpoints of a subset of the findices, as keyword arguments to set().
+        """
+        farm = self.core.farm
+        return {
+            "yaw_angles": farm.yaw_angles[findices],
+            "power_setpoints": farm.power_setpoints[findices],
+            "awc_modes": None if farm.awc_modes is None else farm.awc_modes[findices],
+            "awc_amplitudes": farm.awc_amplitudes[findices],
+            "awc_frequencies": farm.awc_frequencies[findices],
         }
-        fmodel_viz.set_for_viz(findex_for_viz, solver_settings)
 
-        # Calculate wake
-        fmodel_viz.core.solve_for_viz()
+    def _calculate_planes(
+        self,
+        normal_vector: str,
+        planar_coordinates: float | list[float] | NDArrayFloat,
+        grid_resolution: tuple[int, int],
+        x1_bounds: tuple | None,
+        x2_bounds: tuple | None,
+        findices: int | list[int] | NDArrayInt | None,
+        n_findex_per_solve: int | None,
+        tile_resolution: int | None = None,
+    ) -> Iterator[CutPlane]:
+        """
+        Generate a :py:class:`~.tools.cut_plane.CutPlane` for each combination of findex and
+        planar coordinate without modifying or copying the FlorisModel. The findices are solved
+        in groups of n_findex_per_solve, and the flow at the turbines is solved once per group
+        and reused for all of the planar coordinates. The planes are generated in the order of
+        the findices, and for each findex, in the order of the planar coordinates. If a
+        tile_resolution is given, each plane is solved in tiles; see
+        :py:meth:`_calculate_tiled_planes`.
+        """
+        if tile_resolution is not None and tile_resolution < 1:
+            raise ValueError("tile_resolution must be at least 1.")
+        if tile_resolution is not None and (
+            self.core.wake.model_strings["velocity_model"] == "cc"
+            or self.core.wake.enable_transverse_velocities
+        ):
+            self.logger.warning(
+                "The cumulative curl wakes and the transverse velocities depend on the extent "
+                "of the grid, so planes solved in tiles differ slightly from planes solved at "
+                "once."
+            )
 
-        # Get the points of data in a dataframe
-        # TODO this just seems to be flattening and storing the data in a df; is this necessary?
-        # It seems the biggest depenedcy is on CutPlane and the subsequent visualization tools.
-        df = fmodel_viz.get_plane_of_points(
-            normal_vector="y",
-            planar_coordinate=crossstream_dist,
+        if n_findex_per_solve is None:
+            # The horizontal planes are computed with 3 layers in z
+            solve_resolution = np.array(grid_resolution)
+            if tile_resolution is not None:
+                solve_resolution = np.minimum(solve_resolution, tile_resolution)
+            n_points = np.prod(solve_resolution) * (3 if normal_vector == "z" else 1)
+            n_findex_per_solve = max(1, int(FLOW_FIELD_POINTS_PER_SOLVE // n_points))
+        if n_findex_per_solve < 1:
+            raise ValueError("n_findex_per_solve must be at least 1.")
+
+        planar_coordinates = np.atleast_1d(np.array(planar_coordinates, dtype=float))
+        if findices is None:
+            findices = np.arange(self.n_findex)
+        findices = np.atleast_1d(np.array(findices, dtype=int))
+
+        # Use the same bounds for all of the planes so that they can be compared directly
+        x1_bounds, x2_bounds = self._get_plane_bounds(
+            normal_vector,
+            planar_coordinates[0],
+            grid_resolution,
+            x1_bounds,
+            x2_bounds,
+            findices,
         )
 
-        # Compute the cutplane
-        y_plane = CutPlane(df, x_resolution, z_resolution, "y")
+        for i in range(0, len(findices), n_findex_per_solve):
+            findices_solve = findices[i:i + n_findex_per_solve]
+            core = self._get_core_for_findices(findices_solve)
+
+            # Solve the flow at the turbines once for all of the planes
+            turbine_grid_solution = core.solve_turbine_grid_for_viz()
+
+            cut_planes = np.empty((len(findices_solve), len(planar_coordinates)), dtype=object)
+            for j, planar_coordinate in enumerate(planar_coordinates):
+                if tile_resolution is not None:
+                    tiled_planes = self._calculate_tiled_planes(
+                        core,
+                        turbine_grid_solution,
+                        normal_vector,
+                        planar_coordinate,
+                        grid_resolution,
+                        x1_bounds,
+                        x2_bounds,
+                        tile_resolution,
+                    )
+                    for k, cut_plane in enumerate(tiled_planes):
+                        cut_planes[k, j] = cut_plane
+                    continue
+
+                core.grid = FlowFieldPlanarGrid(
+                    turbine_coordinates=core.farm.coordinates,
+                    turbine_diameters=core.farm.rotor_diameters,
+                    wind_directions=core.flow_field.wind_directions,
+                    normal_vector=normal_vector,
+                    planar_coordinate=planar_coordinate,
+                    grid_resolution=grid_resolution,
+                    x1_bounds=x1_bounds,
+                    x2_bounds=x2_bounds,
+                )
+                core.solve_for_viz(turbine_grid_solution)
 
-        return y_plane
+                for k in range(len(findices_solve)):
+                    cut_planes[k, j] = self._get_cut_plane(core, normal_vector, k)
+
+            yield from cut_planes.flatten()
+
+    def _get_plane_bounds(
+        self,
+        normal_vector: str,
+        planar_coordinate: float,
+        grid_resolution: tuple[int, int],
+        x1_bounds: tuple | None,
+        x2_bounds: tuple | None,
+        findices: NDArrayInt,
+    ) -> tuple[tuple, tuple]:
+        """
+        Get the bounds of planes shared by several findices. Unspecified bounds are chosen
+        to fit the rotated layout for all of the findices, as
+        :py:class:`~floris.core.grid.FlowFieldPlanarGrid` does for a single findex.
+        """
+        if x1_bounds is None or x2_bounds is None:
+            bounds_grid = FlowFieldPlanarGrid(
+                turbine_coordinates=self.core.farm.coordinates,
+                turbine_diameters=self.core.farm.rotor_diameters,
+                wind_directions=self.core.flow_field.wind_directions[findices],
+                normal_vector=normal_vector,
+                planar_coordinate=planar_coordinate,
+                grid_resolution=grid_resolution,
+                x1_bounds=x1_bounds,
+                x2_bounds=x2_bounds,
+            )
+            x1_bounds, x2_bounds = bounds_grid.x1_bounds, bounds_grid.x2_bounds
+        return x1_bounds, x2_bounds
+
+    def _calculate_tiled_planes(
+        self,
+        core: Core,
+        turbine_grid_solution: tuple,
+        normal_vector: str,
+        planar_coordinate: float,
+        grid_resolution: tuple[int, int],
+        x1_bounds: tuple,
+        x2_bounds: tuple,
+        tile_resolution: int,
+    ) -> list[CutPlane]:
+        """
+        Solve a plane for each findex of a Core in square tiles of the planar grid, writing
+        each tile into preallocated arrays for the planes. Tiles outside of the wakes of every
+        turbine, according to :py:meth:`~floris.core.core.Core.grid_is_outside_wakes` with
+        TILE_WAKE_CONE_SLOPE, are set to the inflow without solving the wakes.
+        """
+        x1_points = np.linspace(x1_bounds[0], x1_bounds[1], int(grid_resolution[0]))
+        x2_points = np.linspace(x2_bounds[0], x2_bounds[1], int(grid_resolution[1]))
+        names = ["x1", "x2", "x3", "u", "v", "w"]
+        plane_arrays = np.zeros(
+            (core.flow_field.n_findex, len(names), len(x2_points), len(x1_points))
+        )
+
+        for i in range(0, len(x1_points), tile_resolution):
+            tile_x1 = x1_points[i:i + tile_resolution]
+            for j in range(0, len(x2_points), tile_resolution):
+                tile_x2 = x2_points[j:j + tile_resolution]
+                core.grid = FlowFieldPlanarGrid(
+                    turbine_coordinates=core.farm.coordinates,
+                    turbine_diameters=core.farm.rotor_diameters,
+                    wind_directions=core.flow_field.wind_directions,
+                    normal_vector=normal_vector,
+                    planar_coordinate=planar_coordinate,
+                    grid_resolution=(len(tile_x1), len(tile_x2)),
+                    x1_bounds=(tile_x1[0], tile_x1[-1]),
+                    x2_bounds=(tile_x2[0], tile_x2[-1]),
+                )
+                if core.grid_is_outside_wakes(core.grid, TILE_WAKE_CONE_SLOPE):
+                    core.flow_field.initialize_velocity_field(core.grid)
+                else:
+                    core.solve_for_viz(turbine_grid_solution)
+
+                tile = (slice(j, j + len(tile_x2)), slice(i, i + len(tile_x1)))
+                for k in range(core.flow_field.n_findex):
+                    tile_plane = self._get_cut_plane(core, normal_vector, k)
+                    for m, name in enumerate(names):
+                        plane_arrays[k, m][tile] = tile_plane.get_mesh(name)
+
+        return [
+            CutPlane.from_arrays(*plane_arrays[k], normal_vector)
+            for k in range(core.flow_field.n_findex)
+        ]
+
+    def calculate_horizontal_planes(
+        self,
+        heights: float | list[float] | NDArrayFloat,
+        x_resolution: int = 200,
+        y_resolution: int = 200,
+        x_bounds: tuple | None = None,
+        y_bounds: tuple | None = None,
+        findices: int | list[int] | NDArrayInt | None = None,
+        n_findex_per_solve: int | None = None,
+        tile_resolution: int | None = None,
+    ) -> Iterator[CutPlane]:
+        """
+        Generate :py:class:`~.tools.cut_plane.CutPlane` objects containing the velocity field in
+        horizontal planes for several findices and heights, e.g. to animate a sweep of wind
+        directions. The planes are computed lazily, in groups of findices, and the flow at the
+        turbines is solved once per group regardless of the number of heights. Unlike calling
+        :py:meth:`calculate_horizontal_plane` for each findex, the FlorisModel is not copied.
+
+        Args:
+            heights (float | list[float] | NDArrayFloat): Heights of the cut planes.
+            x_resolution (int, optional): Output array resolution. Defaults to 200 points.
+            y_resolution (int, optional): Output array resolution. Defaults to 200 points.
+            x_bounds (tuple, optional): Limits of output array (in m). Defaults to None, which
+                fits the layout for all of the requested findices.
+            y_bounds (tuple, optional): Limits of output array (in m). Defaults to None, which
+                fits the layout for all of the requested findices.
+            findices (int | list[int] | NDArrayInt, optional): Indices of the conditions to
+                visualize. Defaults to None, which uses all findices.
+            n_findex_per_solve (int, optional): Number of findices to solve together. Defaults
+                to None, which groups the findices so that each solve has roughly
+                FLOW_FIELD_POINTS_PER_SOLVE points. Grouping mostly speeds up coarse planes.
+            tile_resolution (int, optional): Number of points along each side of the square
+                tiles in which the planes are solved. The tiles are written into the planes
+                as they are solved, so the memory used by the wake calculation is bounded by
+                the tile size rather than the plane size. Tiles that lie upstream of, or
+                outside of a cone around, the wake of every turbine are set to the inflow
+                without solving the wakes; see TILE_WAKE_CONE_SLOPE. Defaults to None, which
+                solves each plane at once.
+
+        Yields:
+            :py:class:`~.tools.cut_plane.CutPlane`: The planes for each findex, and for each
+            findex, each height.
+        """
+        yield from self._calculate_planes(
+            "z",
+            heights,
+            (x_resolution, y_resolution),
+            x_bounds,
+            y_bounds,
+            findices,
+            n_findex_per_solve,
+            tile_resolution,
+        )
+
+    def calculate_cross_planes(
+        self,
+        downstream_dists: float | list[float] | NDArrayFloat,
+        y_resolution: int = 200,
+        z_resolution: int = 200,
+        y_bounds: tuple | None = None,
+        z_bounds: tuple | None = None,
+        findices: int | list[int] | NDArrayInt | None = None,
+        n_findex_per_solve: int | None = None,
+        tile_resolution: int | None = None,
+    ) -> Iterator[CutPlane]:
+        """
+        Generate :py:class:`~.tools.cut_plane.CutPlane` objects containing the velocity field in
+        cross-stream planes for several findices and downstream distances. See
+        :py:meth:`calculate_horizontal_planes`.
+
+        Args:
+            downstream_dists (float | list[float] | NDArrayFloat): Distances downstream of
+                the turbines of the cut planes.
+            y_resolution (int, optional): Output array resolution. Defaults to 200 points.
+            z_resolution (int, optional): Output array resolution. Defaults to 200 points.
+            y_bounds (tuple, optional): Limits of output array (in m). Defaults to None, which
+                fits the layout for all of the requested findices.
+            z_bounds (tuple, optional): Limits of output array (in m). Defaults to None.
+            findices (int | list[int] | NDArrayInt, optional): Indices of the conditions to
+                visualize. Defaults to None, which uses all findices.
+            n_findex_per_solve (int, optional): Number of findices to solve together. Defaults
+                to None, which groups the findices so that each solve has roughly
+                FLOW_FIELD_POINTS_PER_SOLVE points. Grouping mostly speeds up coarse planes.
+            tile_resolution (int, optional): Number of points along each side of the square
+                tiles in which the planes are solved. Defaults to None, which solves each
+                plane at once.
+
+        Yields:
+            :py:class:`~.tools.cut_plane.CutPlane`: The planes for each findex, and for each
+            findex, each downstream distance.
+        """
+        yield from self._calculate_planes(
+            "x",
+            downstream_dists,
+            (y_resolution, z_resolution),
+            y_bounds,
+            z_bounds,
+            findices,
+            n_findex_per_solve,
+            tile_resolution,
+        )
+
+    def calculate_y_planes(
+        self,
+        crossstream_dists: float | list[float] | NDArrayFloat,
+        x_resolution: int = 200,
+        z_resolution: int = 200,
+        x_bounds: tuple | None = None,
+        z_bounds: tuple | None = None,
+        findices: int | list[int] | NDArrayInt | None = None,
+        n_findex_per_solve: int | None = None,
+        tile_resolution: int | None = None,
+    ) -> Iterator[CutPlane]:
+        """
+        Generate :py:class:`~.tools.cut_plane.CutPlane` objects containing the velocity field in
+        streamwise vertical planes for several findices and cross-stream distances. See
+        :py:meth:`calculate_horizontal_planes`.
+
+        Args:
+            crossstream_dists (float | list[float] | NDArrayFloat): Cross-stream distances of
+                the cut planes.
+            x_resolution (int, optional): Output array resolution. Defaults to 200 points.
+            z_resolution (int, optional): Output array resolution. Defaults to 200 points.
+            x_bounds (tuple, optional): Limits of output array (in m). Defaults to None, which
+                fits the layout for all of the requested findices.
+            z_bounds (tuple, optional): Limits of output array (in m). Defaults to None.
+            findices (int | list[int] | NDArrayInt, optional): Indices of the conditions to
+                visualize. Defaults to None, which uses all findices.
+            n_findex_per_solve (int, optional): Number of findices to solve together. Defaults
+                to None, which groups the findices so that each solve has roughly
+                FLOW_FIELD_POINTS_PER_SOLVE points. Grouping mostly speeds up coarse planes.
+            tile_resolution (int, optional): Number of points along each side of the square
+                tiles in which the planes are solved. Defaults to None, which solves each
+                plane at once.
+
+        Yields:
+            :py:class:`~.tools.cut_plane.CutPlane`: The planes for each findex, and for each
+            findex, each cross-stream distance.
+        """
+        yield from self._calculate_planes(
+            "y",
+            crossstream_dists,
+            (x_resolution, z_resolution),
+            x_bounds,
+            z_bounds,
+            findices,
+            n_findex_per_solve,
+            tile_resolution,
+        )
+
+    @staticmethod
+    def _get_cut_plane(core: Core, normal_vector: str, findex: int = 0) -> CutPlane:
+        """
+        Build a :py:class:`~.tools.cut_plane.CutPlane` directly from the arrays of one findex
+        of a Core solved on a :py:class:`~floris.core.grid.FlowFieldPlanarGrid`. The planar
+        grid is structured, so the points are only reordered so that x1 varies along the rows.
+        """
+        grid = core.grid
+        flow_field = core.flow_field
+
+        # Select the plane from the 3D grid arrays. The rotated frame coordinates are
+        # shared by all findex.
+        if normal_vector == "z":
+            # The horizontal plane is the middle of the 3 layers in z
+            index = (slice(None), slice(None), 1)
+            x1 = grid.x_sorted_inertial_frame[findex][index]
+            x2 = grid.y_sorted_inertial_frame[findex][index]
+            x3 = grid.z_sorted_inertial_frame[findex][index]
+        elif normal_vector == "x":
+            index = (0, slice(None), slice(None))
+            x1 = grid.y_sorted[0][index]
+            x2 = grid.z_sorted[0][index]
+            x3 = grid.x_sorted[0][index]
+        else:
+            index = (slice(None), 0, slice(None))
+            x1 = grid.x_sorted[0][index]
+            x2 = grid.z_sorted[0][index]
+            x3 = grid.y_sorted[0][index]
+        u = flow_field.u_sorted[findex][index]
+        v = flow_field.v_sorted[findex][index]
+        w = flow_field.w_sorted[findex][index]
+
+        # Copy so that the plane does not keep the arrays of the whole Core alive
+        return CutPlane.from_arrays(
+            *[np.ascontiguousarray(values.T) for values in [x1, x2, x3, u, v, w]],
+            normal_vector,
+        )
 
     def get_plane_of_points(
         self,
@@ -1291,18 +1959,33 @@ class FlorisModel(LoggingManager):
         Returns:
             :py:class:`pandas.DataFrame`: containing values of x1, x2, x3, u, v, w
         """
+        return self._get_plane_of_points(self.core, normal_vector, planar_coordinate)
+
+    @staticmethod
+    def _get_plane_of_points(
+        core: Core,
+        normal_vector: str,
+        planar_coordinate: float | None,
+        findex: int = 0,
+    ) -> pd.DataFrame:
+        """
+        Collect the velocities of one findex of a Core solved on a
+        :py:class:`~floris.core.grid.FlowFieldPlanarGrid` into a dataframe of the points in the
+        plane. See :py:meth:`get_plane_of_points`.
+        """
         # Get results vectors
+        # The planar grid coordinates in the rotated frame are shared by all findex
         if normal_vector == "z":
-            x_flat = self.core.grid.x_sorted_inertial_frame[0].flatten()
-            y_flat = self.core.grid.y_sorted_inertial_frame[0].flatten()
-            z_flat = self.core.grid.z_sorted_inertial_frame[0].flatten()
+            x_flat = core.grid.x_sorted_inertial_frame[findex].flatten()
+            y_flat = core.grid.y_sorted_inertial_frame[findex].flatten()
+            z_flat = core.grid.z_sorted_inertial_frame[findex].flatten()
         else:
-            x_flat = self.core.grid.x_sorted[0].flatten()
-            y_flat = self.core.grid.y_sorted[0].flatten()
-            z_flat = self.core.grid.z_sorted[0].flatten()
-        u_flat = self.core.flow_field.u_sorted[0].flatten()
-        v_flat = self.core.flow_field.v_sorted[0].flatten()
-        w_flat = self.core.flow_field.w_sorted[0].flatten()
+            x_flat = core.grid.x_sorted[0].flatten()
+            y_flat = core.grid.y_sorted[0].flatten()
+            z_flat = core.grid.z_sorted[0].flatten()
+        u_flat = core.flow_field.u_sorted[findex].flatten()
+        v_flat = core.flow_field.v_sorted[findex].flatten()
+        w_flat = core.flow_field.w_sorted[findex].flatten()
 
         # Create a df of these
         if normal_vector == "z":
@@ -1353,25 +2036,81 @@ class FlorisModel(LoggingManager):
 
         return df
 
-    def sample_flow_at_points(self, x: NDArrayFloat, y: NDArrayFloat, z: NDArrayFloat):
+    def sample_flow_at_points(
+        self,
+        x: NDArrayFloat,
+        y: NDArrayFloat,
+        z: NDArrayFloat,
+        n_findex_per_solve: int | None = None,
+        n_points_per_solve: int | None = None,
+        out: NDArrayFloat | None = None,
+    ) -> NDArrayFloat:
         """
         Extract the wind speed at points in the flow.
 
+        The findices and points are solved in chunks to bound the memory used, and the flow
+        at the turbines is solved once for each chunk of findices. The FlorisModel is not
+        modified.
+
         Args:
             x (1DArrayFloat | list): x-locations of points where flow is desired.
             y (1DArrayFloat | list): y-locations of points where flow is desired.
             z (1DArrayFloat | list): z-locations of points where flow is desired.
+            n_findex_per_solve (int, optional): Number of findices to solve together.
+                Defaults to None, which chooses the number so that each solve has roughly
+                FLOW_FIELD_POINTS_PER_SOLVE points.
+            n_points_per_solve (int, optional): Number of points to solve together. Defaults
+                to None, which uses at most FLOW_FIELD_POINTS_PER_SOLVE points.
+            out (NDArrayFloat, optional): Array with shape (n_findex, n_points) to store the
+                wind speeds in, e.g. a numpy.memmap for results that do not fit in memory.
+                Defaults to None, which creates a new array.
 
         Returns:
-            3DArrayFloat containing wind speed with dimensions
+            2DArrayFloat containing wind speed with dimensions
             (# of findex, # of sample points)
         """
 
         # Check that x, y, z are all the same length
         if not len(x) == len(y) == len(z):
             raise ValueError("x, y, and z must be the same size")
+        x = np.asarray(x, dtype=float)
+        y = np.asarray(y, dtype=float)
+        z = np.asarray(z, dtype=float)
+        n_points = len(x)
+
+        if out is None:
+            out = np.zeros((self.n_findex, n_points))
+        elif np.shape(out) != (self.n_findex, n_points):
+            raise ValueError(
+                f"out has a shape of {np.shape(out)}, but must have a shape of "
+                f"(n_findex, n_points)=({self.n_findex}, {n_points})."
+            )
+
+        if n_points_per_solve is None:
+            n_points_per_solve = min(n_points, FLOW_FIELD_POINTS_PER_SOLVE)
+        if n_findex_per_solve is None:
+            n_findex_per_solve = FLOW_FIELD_POINTS_PER_SOLVE // max(n_points_per_solve, 1)
+        n_points_per_solve = max(n_points_per_solve, 1)
+        n_findex_per_solve = max(n_findex_per_solve, 1)
+
+        for findex_start in range(0, self.n_findex, n_findex_per_solve):
+            findex_end = min(findex_start + n_findex_per_solve, self.n_findex)
+            findices = np.arange(findex_start, findex_end)
+            core = self._get_core_for_findices(findices)
+
+            # Solve the flow at the turbines once for all of the points
+            turbine_grid_solution = core.solve_turbine_grid_for_viz()
+
+            for point_start in range(0, n_points, n_points_per_solve):
+                points = slice(point_start, point_start + n_points_per_solve)
+                out[findex_start:findex_end, points] = core.solve_for_points(
+                    x[points],
+                    y[points],
+                    z[points],
+                    turbine_grid_solution,
+                )
 
-        return self.core.solve_for_points(x, y, z)
+        return out
 
     def sample_velocity_deficit_profiles(
         self,
@@ -1497,6 +2236,107 @@ class FlorisModel(LoggingManager):
 
         return velocity_deficit_profiles
 
+    def sample_batched_velocity_deficit_profiles(
+        self,
+        direction: str = "cross-stream",
+        downstream_dists: NDArrayFloat | list = None,
+        profile_range: NDArrayFloat | list = None,
+        resolution: int = 100,
+        ref_rotor_diameter: float = None,
+        x_start: float = 0.0,
+        y_start: float = 0.0,
+        reference_height: float = None,
+        findices: int | list[int] | NDArrayInt | None = None,
+    ) -> VelocityDeficitProfiles:
+        """
+        Extract velocity deficit profiles for several findices at once. The profiles are
+        sampled as in :py:meth:`sample_velocity_deficit_profiles`, but with the current wind
+        conditions of each findex rather than a single wind direction and wind speed. For each
+        findex, the velocity deficit is defined relative to the wind speed of that findex and
+        `wind_shear` is set to 0.0. The FlorisModel is not modified.
+
+        All profiles of the findices with the same wind direction are solved together, and
+        pandas DataFrames are only built on request through the returned
+        :py:class:`~floris.velocity_deficit_profiles.VelocityDeficitProfiles`.
+
+        Args:
+            direction: At each downstream location, this is the direction in which to sample the
+                profile. Either `cross-stream` or `vertical`.
+            downstream_dists: A list/array of streamwise locations for where to sample the profiles.
+                Default starting point is (0.0, 0.0, reference_height).
+            profile_range: Determines the extent of the line along which the profiles are sampled.
+                The range is defined about a point which lies some distance directly downstream of
+                the starting point.
+            resolution: Number of sample points in each profile.
+            ref_rotor_diameter: A reference rotor diameter which is used to normalize the
+                coordinates.
+            x_start: x-coordinate of starting point.
+            y_start: y-coordinate of starting point.
+            reference_height: If `direction` is cross-stream, then `reference_height` defines the
+                height of the horizontal plane in which the velocity profiles are sampled.
+                If `direction` is vertical, then the velocity is sampled along the vertical
+                direction with the `profile_range` being relative to the `reference_height`.
+            findices: The findices for which to sample the profiles. Defaults to None, which
+                samples the profiles for all findices.
+
+        Returns:
+            VelocityDeficitProfiles: The profiles, indexed by (findex, line, sample) in the
+            order of `findices`.
+        """
+
+        if direction not in ["cross-stream", "vertical"]:
+            raise ValueError("`direction` must be either `cross-stream` or `vertical`.")
+
+        if ref_rotor_diameter is None:
+            unique_rotor_diameters = np.unique(self.core.farm.rotor_diameters)
+            if len(unique_rotor_diameters) == 1:
+                ref_rotor_diameter = unique_rotor_diameters[0]
+            else:
+                raise ValueError(
+                    "Please provide a `ref_rotor_diameter`. This is needed to normalize the "
+                    "coordinates. Could not select a value automatically since the number of "
+                    "unique rotor diameters in the turbine layout is not 1. "
+                    f"Found the following rotor diameters: {unique_rotor_diameters}."
+                )
+
+        if downstream_dists is None:
+            downstream_dists = ref_rotor_diameter * np.array([3, 5, 7, 9])
+
+        if profile_range is None:
+            profile_range = ref_rotor_diameter * np.array([-2, 2])
+
+        if reference_height is None:
+            reference_height = self.core.flow_field.reference_wind_height
+
+        if findices is None:
+            findices = np.arange(self.n_findex)
+        findices = np.atleast_1d(findices)
+
+        profile_arrays = {}
+        wind_directions = self.core.flow_field.wind_directions[findices]
+        for wind_direction in np.unique(wind_directions):
+            # The sample points are shared by all findices with the same wind direction
+            indices = np.flatnonzero(wind_directions == wind_direction)
+            core = self._get_core_for_findices(findices[indices], {"wind_shear": 0.0})
+
+            core_arrays = core.solve_for_velocity_deficit_profile_arrays(
+                direction,
+                downstream_dists,
+                profile_range,
+                resolution,
+                core.flow_field.wind_speeds,
+                ref_rotor_diameter,
+                x_start,
+                y_start,
+                reference_height,
+            )
+            for name, values in core_arrays.items():
+                if name not in profile_arrays:
+                    profile_arrays[name] = np.zeros((len(findices),) + values.shape[1:])
+                profile_arrays[name][indices] = values
+
+        return VelocityDeficitProfiles(direction, profile_arrays)
+
 
     ### Utility methods
 
@@ -1537,7 +2377,7 @@ class FlorisModel(LoggingManager):
         if isinstance(operation_model, str):
             if len(self.core.farm.turbine_type) == 1:
                 # Set a single one here, then, and return
-                turbine_type = self.core.farm.turbine_definitions[0]
+                turbine_type = copy.deepcopy(self.core.farm.turbine_definitions[0])
                 turbine_type["operation_model"] = operation_model
                 self.set(
                     turbine_type=[turbine_type],
@@ -1553,7 +2393,8 @@ class FlorisModel(LoggingManager):
                     "equal to the number of turbines."
                 )
 
-        turbine_type_list = self.core.farm.turbine_definitions
+        # Turbines of the same type share their definition, so each is copied to be modified
+        turbine_type_list = [copy.deepcopy(td) for td in self.core.farm.turbine_definitions]
 
         for tindex in range(self.core.farm.n_turbines):
             turbine_type_list[tindex]["turbine_type"] = (
@@ -1570,6 +2411,109 @@ class FlorisModel(LoggingManager):
         """Create an independent copy of the current FlorisModel object"""
         return FlorisModel(self.core.as_dict())
 
+    def __getstate__(self) -> dict:
+        """
+        Pickle the model without the Core kept for the flow field calculations, which holds
+        the turbine grid solution and flow field arrays and is rebuilt when needed.
+        """
+        state = self.__dict__.copy()
+        state["_findex_core"] = None
+        return state
+
+    def to_snapshot(self, output_file_path: str | Path | None = None) -> bytes | None:
+        """
+        Save a binary snapshot of the model, including its farm and flow field arrays, turbine
+        tables and interpolants, wake model parameters and grid. :py:meth:`from_snapshot`
+        reloads it without parsing or validating the inputs again. Snapshots can only be
+        loaded by the version of FLORIS that saved them.
+
+        Args:
+            output_file_path (str | Path | None, optional): The file to save the snapshot to.
+                Defaults to None, which returns the snapshot instead, e.g. to send it to
+                other processes.
+
+        Returns:
+            bytes | None: The snapshot, if output_file_path is None.
+        """
+        state = {
+            "configuration": self.configuration,
+            "core": self.core,
+            "wind_data": self._wind_data,
+        }
+        return write_snapshot(state, output_file_path)
+
+    @staticmethod
+    def from_snapshot(snapshot: str | Path | bytes) -> FlorisModel:
+        """
+        Load a model from a snapshot saved with :py:meth:`to_snapshot`. The arrays of a
+        snapshot file are memory mapped copy-on-write, so they are only read from the file
+        as they are used. Loading a snapshot can run arbitrary code, like unpickling, so only
+        load snapshots from trusted sources.
+
+        Args:
+            snapshot (str | Path | bytes): The snapshot file, or the snapshot itself.
+
+        Returns:
+            FlorisModel: The model.
+        """
+        state = read_snapshot(snapshot)
+        return FlorisModel._from_core(state["core"], state["configuration"], state["wind_data"])
+
+    @staticmethod
+    def _from_core(
+        core: Core,
+        configuration: dict | None = None,
+        wind_data: WindDataBase | None = None,
+    ) -> FlorisModel:
+        """
+        Wrap a Core in a FlorisModel, setting the attributes set by __init__ without
+        constructing the Core again.
+        """
+        fmodel = FlorisModel.__new__(FlorisModel)
+        fmodel.configuration = configuration
+        fmodel.core = core
+        fmodel._wind_data = wind_data
+        fmodel._findex_core = None
+        return fmodel
+
+    def _get_worker_inputs(self, findex_splits: list[NDArrayInt]) -> tuple[bytes, list[dict]]:
+        """
+        Get the inputs to rebuild the model for each split of the findices in worker processes
+        with :py:meth:`_from_worker_inputs`: a snapshot of the model for only its first findex,
+        whose size does not grow with the number of findices, and the keyword arguments to
+        set() with the wind conditions and control setpoints of each split. If there is a
+        single split, the wind data is also kept.
+
+        Args:
+            findex_splits (list[NDArrayInt]): The findices of each split.
+
+        Returns:
+            tuple[bytes, list[dict]]: The snapshot and the keyword arguments for each split.
+        """
+        floris_dict = self.core.as_dict()
+        floris_dict["flow_field"].update(self._get_findex_wind_conditions([0]))
+        snapshot = write_snapshot(
+            {"configuration": None, "core": Core.from_dict(floris_dict), "wind_data": None}
+        )
+
+        set_kwargs = []
+        for findices in findex_splits:
+            if len(findex_splits) == 1 and self.wind_data is not None:
+                wind_conditions = {"wind_data": self.wind_data}
+            else:
+                wind_conditions = self._get_findex_wind_conditions(findices)
+            set_kwargs.append({**wind_conditions, **self._get_findex_setpoints(findices)})
+        return snapshot, set_kwargs
+
+    @staticmethod
+    def _from_worker_inputs(snapshot: bytes, set_kwargs: dict) -> FlorisModel:
+        """
+        Rebuild a model in a worker process from the inputs of :py:meth:`_get_worker_inputs`.
+        """
+        fmodel = FlorisModel.from_snapshot(snapshot)
+        fmodel.set(**set_kwargs)
+        return fmodel
+
     def get_param(
         self,
         param: List[str],
@@ -0,0 +1,256 @@
+
+from __future__ import annotations
+
+import asyncio
+from concurrent.futures import (
+    Executor,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+)
+from time import monotonic
+
+import numpy as np
+
+from floris.floris_model import FlorisModel
+from floris.logging_manager import LoggingManager
+from floris.type_dec import NDArrayFloat
+
+
+# Model loaded once by the worker process of a service with the "processes" interface
+_worker_fmodel: FlorisModel | None = None
+
+
+def _load_worker_fmodel(snapshot: bytes) -> None:
+    global _worker_fmodel
+    _worker_fmodel = FlorisModel.from_snapshot(snapshot)
+
+
+def _run_batch(fmodel: FlorisModel, set_kwargs: dict) -> NDArrayFloat:
+    fmodel.set(**set_kwargs)
+    fmodel.run()
+    return fmodel._get_turbine_powers()
+
+
+def _run_batch_in_worker(set_kwargs: dict) -> NDArrayFloat:
+    return _run_batch(_worker_fmodel, set_kwargs)
+
+
+class _Request:
+    """
+    The wind conditions and yaw angles of one query, and the future of its turbine powers.
+    """
+
+    def __init__(self, set_kwargs: dict, future: asyncio.Future):
+        self.set_kwargs = set_kwargs
+        self.future = future
+        self.n_findex = len(set_kwargs["wind_directions"])
+        self.arrival_time = monotonic()
+
+
+class FlorisService(LoggingManager):
+    """
+    FlorisService answers queries for the power of a fixed farm from asyncio code, e.g. a web
+    server, at low latency. It keeps a warm model of the farm, and coalesces the queries made
+    while a solve is running, or within max_delay of each other, into a single vectorized
+    solve over all of their findices. Each query then receives its own slice of the results.
+    Solves run in a thread or a worker process so that the event loop stays responsive.
+
+    The service is started on first use and should be closed when no longer needed, e.g. by
+    using it as an async context manager:
+
+    .. code-block:: python
+
+        async with FlorisService(fmodel) as service:
+            farm_power = await service.get_farm_power(
+                wind_directions=[270.0], wind_speeds=[8.0], turbulence_intensities=[0.06]
+            )
+
+    Args:
+        fmodel (FlorisModel): The model of the farm. Its layout, turbines and wake models are
+            used for every query; its wind conditions and setpoints are not. The model itself
+            is not modified.
+        interface (str, optional): Where to run the solves: "threads" to run them in a thread,
+            or "processes" to run them in a worker process. Defaults to "threads".
+        max_delay (float, optional): The longest time, in seconds, to wait for more queries
+            to batch with a query before solving. Defaults to 0.005.
+        max_batch_findex (int, optional): The number of findices above which no more queries
+            are added to a batch. A single query larger than this is solved alone. Defaults
+            to 1000.
+    """
+
+    def __init__(
+        self,
+        fmodel: FlorisModel,
+        interface: str = "threads",
+        max_delay: float = 0.005,
+        max_batch_findex: int = 1000,
+    ):
+        # Keep only the first findex of the model, so that the warm model does not depend on
+        # the size of the model's wind data
+        snapshot, _ = fmodel._get_worker_inputs([np.array([0])])
+        if interface == "threads":
+            self._executor: Executor = ThreadPoolExecutor(max_workers=1)
+            self._fmodel = FlorisModel.from_snapshot(snapshot)
+        elif interface == "processes":
+            self._executor = ProcessPoolExecutor(
+                max_workers=1, initializer=_load_worker_fmodel, initargs=(snapshot,)
+            )
+        else:
+            raise ValueError(
+                f"Invalid interface {interface}. Options are 'threads' or 'processes'."
+            )
+        self.interface = interface
+        self.max_delay = max_delay
+        self.max_batch_findex = max_batch_findex
+        self.n_turbines = fmodel.n_turbines
+
+        self._queue: asyncio.Queue[_Request] | None = None
+        self._batcher: asyncio.Task | None = None
+        self._closed = False
+
+    async def __aenter__(self) -> FlorisService:
+        self._start()
+        return self
+
+    async def __aexit__(self, *_) -> None:
+        await self.close()
+
+    def _start(self) -> None:
+        if self._closed:
+            raise RuntimeError("The FlorisService has been closed.")
+        if self._batcher is None:
+            self._queue = asyncio.Queue()
+            self._batcher = asyncio.get_running_loop().create_task(self._run_batches())
+
+    async def close(self) -> None:
+        """
+        Stop the service. Queries that have not been answered are cancelled.
+        """
+        self._closed = True
+        if self._batcher is not None:
+            self._batcher.cancel()
+            try:
+                await self._batcher
+            except asyncio.CancelledError:
+                pass
+            while not self._queue.empty():
+                self._queue.get_nowait().future.cancel()
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    async def get_turbine_powers(
+        self,
+        wind_directions: list[float] | NDArrayFloat,
+        wind_speeds: list[float] | NDArrayFloat,
+        turbulence_intensities: list[float] | NDArrayFloat,
+        yaw_angles: list[list[float]] | NDArrayFloat | None = None,
+    ) -> NDArrayFloat:
+        """
+        Get the power of each turbine for a batch of wind conditions.
+
+        Args:
+            wind_directions (list[float] | NDArrayFloat): The wind directions.
+            wind_speeds (list[float] | NDArrayFloat): The wind speeds.
+            turbulence_intensities (list[float] | NDArrayFloat): The turbulence intensities.
+            yaw_angles (list[list[float]] | NDArrayFloat | None, optional): The yaw angles
+                of each turbine for each wind condition. Defaults to None, which sets them
+                to zero.
+
+        Returns:
+            NDArrayFloat: The turbine powers, with one row per wind condition.
+        """
+        wind_directions = np.atleast_1d(np.array(wind_directions, dtype=float))
+        n_findex = len(wind_directions)
+        set_kwargs = {
+            "wind_directions": wind_directions,
+            "wind_speeds": np.broadcast_to(np.array(wind_speeds, dtype=float), n_findex),
+            "turbulence_intensities": np.broadcast_to(
+                np.array(turbulence_intensities, dtype=float), n_findex
+            ),
+            "yaw_angles": np.broadcast_to(
+                np.array(0.0 if yaw_angles is None else yaw_angles, dtype=float),
+                (n_findex, self.n_turbines),
+            ),
+        }
+
+        self._start()
+        request = _Request(set_kwargs, asyncio.get_running_loop().create_future())
+        self._queue.put_nowait(request)
+        return await request.future
+
+    async def get_farm_power(
+        self,
+        wind_directions: list[float] | NDArrayFloat,
+        wind_speeds: list[float] | NDArrayFloat,
+        turbulence_intensities: list[float] | NDArrayFloat,
+        yaw_angles: list[list[float]] | NDArrayFloat | None = None,
+    ) -> NDArrayFloat:
+        """
+        Get the power of the farm for a batch of wind conditions. See
+        :py:meth:`get_turbine_powers` for the arguments.
+
+        Returns:
+            NDArrayFloat: The farm power for each wind condition.
+        """
+        turbine_powers = await self.get_turbine_powers(
+            wind_directions, wind_speeds, turbulence_intensities, yaw_angles
+        )
+        return np.sum(turbine_powers, axis=1)
+
+    async def _run_batches(self) -> None:
+        while True:
+            batch = [await self._queue.get()]
+            try:
+                # Collect the queries that arrive within max_delay of the first, up to the
+                # batch size. Queries that arrived during the previous solve are all ready.
+                deadline = batch[0].arrival_time + self.max_delay
+                n_findex = batch[0].n_findex
+                while n_findex < self.max_batch_findex:
+                    try:
+                        if self._queue.empty():
+                            request = await asyncio.wait_for(
+                                self._queue.get(), max(deadline - monotonic(), 0.0)
+                            )
+                        else:
+                            request = self._queue.get_nowait()
+                    except asyncio.TimeoutError:
+                        break
+                    batch.append(request)
+                    n_findex += request.n_findex
+
+                await self._solve(batch)
+            except asyncio.CancelledError:
+                for request in batch:
+                    request.future.cancel()
+                raise
+
+    async def _solve(self, batch: list[_Request]) -> None:
+        # Skip the queries whose callers stopped waiting
+        batch = [request for request in batch if not request.future.done()]
+        if not batch:
+            return
+
+        set_kwargs = {
+            key: np.concatenate([request.set_kwargs[key] for request in batch])
+            for key in batch[0].set_kwargs
+        }
+        loop = asyncio.get_running_loop()
+        try:
+            if self.interface == "threads":
+                turbine_powers = await loop.run_in_executor(
+                    self._executor, _run_batch, self._fmodel, set_kwargs
+                )
+            else:
+                turbine_powers = await loop.run_in_executor(
+                    self._executor, _run_batch_in_worker, set_kwargs
+                )
+        except Exception as e:
+            for request in batch:
+                if not request.future.done():
+                    request.future.set_exception(e)
+            return
+
+        start = 0
+        for request in batch:
+            if not request.future.done():
+                request.future.set_result(turbine_powers[start:start + request.n_findex])
+            start += request.n_findex
@@ -3,6 +3,9 @@ from __future__ import annotations
 
 import copy
 import warnings
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import cpu_count, shared_memory
+from pathlib import Path
 from typing import Union
 
 import attrs
@@ -13,6 +16,7 @@ import numpy as np
 import pandas as pd
 from attrs import define, field
 from matplotlib import rcParams
+from matplotlib.figure import Figure
 from scipy.spatial import ConvexHull
 
 from floris import FlorisModel
@@ -23,10 +27,22 @@ from floris.heterogeneous_map import HeterogeneousMap
 from floris.type_dec import (
     floris_array_converter,
     NDArrayFloat,
+    NDArrayInt,
 )
 from floris.utilities import rotate_coordinates_rel_west, wind_delta
+from floris.velocity_deficit_profiles import VelocityDeficitProfiles
 
 
+# Maximum number of turbines, summed over all test turbine locations, in each solve of
+# calculate_horizontal_plane_with_turbines
+PROBE_TURBINES_PER_SOLVE = 20000
+
+# Names of the arrays of each plane written by the workers of calculate_planes_in_parallel
+PLANE_ARRAY_NAMES = ["x1", "x2", "x3", "u", "v", "w"]
+
+# Model snapshot of each worker process of calculate_planes_in_parallel
+_worker_snapshot = None
+
 def show():
     """
     Display all open figures.  This is a wrapper for `plt.show()`.
@@ -67,9 +83,9 @@ def line_contour_cut_plane(
 
     # Plot the cut-through
     contours = ax.tricontour(
-        cut_plane.df.x1,
-        cut_plane.df.x2,
-        cut_plane.df.u,
+        cut_plane.get_values("x1"),
+        cut_plane.get_values("x2"),
+        cut_plane.get_values("u"),
         levels=levels,
         colors=colors,
         extend="both",
@@ -132,23 +148,23 @@ def visualize_cut_plane(
         fig, ax = plt.subplots()
 
     if vel_component=='u':
-        # vel_mesh = cut_plane.df.u.values.reshape(cut_plane.resolution[1], cut_plane.resolution[0])
+        # vel_mesh = cut_plane.get_mesh("u")
         if min_speed is None:
-            min_speed = cut_plane.df.u.min()
+            min_speed = cut_plane.get_values("u").min()
         if max_speed is None:
-            max_speed = cut_plane.df.u.max()
+            max_speed = cut_plane.get_values("u").max()
     elif vel_component=='v':
-        # vel_mesh = cut_plane.df.v.values.reshape(cut_plane.resolution[1], cut_plane.resolution[0])
+        # vel_mesh = cut_plane.get_mesh("v")
         if min_speed is None:
-            min_speed = cut_plane.df.v.min()
+            min_speed = cut_plane.get_values("v").min()
         if max_speed is None:
-            max_speed = cut_plane.df.v.max()
+            max_speed = cut_plane.get_values("v").max()
     elif vel_component=='w':
-        # vel_mesh = cut_plane.df.w.values.reshape(cut_plane.resolution[1], cut_plane.resolution[0])
+        # vel_mesh = cut_plane.get_mesh("w")
         if min_speed is None:
-            min_speed = cut_plane.df.w.min()
+            min_speed = cut_plane.get_values("w").min()
         if max_speed is None:
-            max_speed = cut_plane.df.w.max()
+            max_speed = cut_plane.get_values("w").max()
 
     # Allow separate number of levels for tricontourf and for line_contour
     if clevels is None:
@@ -156,9 +172,9 @@ def visualize_cut_plane(
 
     # Plot the cut-through
     im = ax.tricontourf(
-        cut_plane.df.x1,
-        cut_plane.df.x2,
-        cut_plane.df.u,
+        cut_plane.get_values("x1"),
+        cut_plane.get_values("x2"),
+        cut_plane.get_values("u"),
         vmin=min_speed,
         vmax=max_speed,
         levels=clevels,
@@ -182,7 +198,7 @@ def visualize_cut_plane(
         ax.invert_xaxis()
 
     if color_bar:
-        cbar = plt.colorbar(im, ax=ax)
+        cbar = ax.figure.colorbar(im, ax=ax)
         cbar.set_label('m/s')
 
     # Set the title
@@ -292,10 +308,10 @@ def visualize_quiver(cut_plane, ax=None, min_speed=None, max_speed=None, downSam
         fig, ax = plt.subplots()
 
     # Reshape UMesh internally
-    x1_mesh = cut_plane.df.x1.values.reshape(cut_plane.resolution[1], cut_plane.resolution[0])
-    x2_mesh = cut_plane.df.x2.values.reshape(cut_plane.resolution[1], cut_plane.resolution[0])
-    v_mesh = cut_plane.df.v.values.reshape(cut_plane.resolution[1], cut_plane.resolution[0])
-    w_mesh = cut_plane.df.w.values.reshape(cut_plane.resolution[1], cut_plane.resolution[0])
+    x1_mesh = cut_plane.get_mesh("x1")
+    x2_mesh = cut_plane.get_mesh("x2")
+    v_mesh = cut_plane.get_mesh("v")
+    w_mesh = cut_plane.get_mesh("w")
 
     # plot the stream plot
     ax.streamplot(
@@ -425,10 +441,11 @@ def calculate_horizontal_plane_with_turbines(
         a regular grid throughout the flow field. This method allows for
         visualizing wake models that do not support the FullFlowGrid and
         its associated solver. As the new turbine is moved around the flow
-        field, the velocities at its rotor are stored in local variables,
-        and the flow field is reset to its initial state for every new
-        location. Then, the local velocities are put into a DataFrame and
-        then into a CutPlane. This method is much slower than
+        field, the velocities at its rotor are stored in local variables.
+        The farm with the new turbine at each location is solved as a
+        separate findex, so that many locations are computed together in
+        a single vectorized calculation. Then, the local velocities are put
+        into a DataFrame and then into a CutPlane. This method is slower than
         `FlorisModel.calculate_horizontal_plane`, but it is helpful
         for models where the visualization capability is not yet available.
 
@@ -517,59 +534,316 @@ def calculate_horizontal_plane_with_turbines(
         y_points = np.linspace(y_bounds[0], y_bounds[1], y_resolution)
         num_points = len(x_points) * len(y_points)
 
-        # Now loop over the points
-        x_results = np.zeros(num_points)
-        y_results = np.zeros(num_points)
+        # The test turbine is placed at every point, with x varying fastest
+        x_results = np.tile(x_points, len(y_points))
+        y_results = np.repeat(y_points, len(x_points))
         z_results = np.zeros(num_points)
         u_results = np.zeros(num_points)
         v_results = np.zeros(num_points)
         w_results = np.zeros(num_points)
-        idx = 0
-        for y in y_points:
-            for x in x_points:
-
-                # Save the x and y results
-                x_results[idx] = x
-                y_results[idx] = y
-
-                # Place the test turbine at this location and calculate wake
-                layout_x_test[-1] = x
-                layout_y_test[-1] = y
-                fmodel_viz.set(
-                    layout_x=layout_x_test,
-                    layout_y=layout_y_test,
-                    yaw_angles=yaw_angles,
-                    power_setpoints=power_setpoints,
-                    awc_modes=awc_modes,
-                    awc_amplitudes=awc_amplitudes,
-                    awc_frequencies=awc_frequencies,
-                    turbine_type=turbine_types_test,
-                    reference_wind_height=fmodel_viz.reference_wind_height
-                )
-                fmodel_viz.run()
 
-                # Get the velocity of that test turbines central point
-                center_point = int(np.floor(fmodel_viz.core.flow_field.u[0,-1].shape[0] / 2.0))
-                u_results[idx] = fmodel_viz.core.flow_field.u[0,-1,center_point,center_point]
+        # Add the test turbine to the farm
+        fmodel_viz.set(
+            layout_x=layout_x_test,
+            layout_y=layout_y_test,
+            yaw_angles=yaw_angles,
+            power_setpoints=power_setpoints,
+            awc_modes=awc_modes,
+            awc_amplitudes=awc_amplitudes,
+            awc_frequencies=awc_frequencies,
+            turbine_type=turbine_types_test,
+            reference_wind_height=fmodel_viz.reference_wind_height
+        )
 
-                # Increment index
-                idx = idx + 1
+        # Rather than running the farm once per location of the test turbine, each of the
+        # resulting layouts is solved as a separate findex, in chunks to bound the memory used
+        n_turbines_test = len(layout_x_test)
+        n_points_per_solve = max(1, PROBE_TURBINES_PER_SOLVE // n_turbines_test)
+        floris_dict = fmodel_viz.core.as_dict()
+        for start in range(0, num_points, n_points_per_solve):
+            stop = min(start + n_points_per_solve, num_points)
+            layout_x_chunk = np.tile(layout_x_test, (stop - start, 1))
+            layout_y_chunk = np.tile(layout_y_test, (stop - start, 1))
+            layout_x_chunk[:, -1] = x_results[start:stop]
+            layout_y_chunk[:, -1] = y_results[start:stop]
+            core = fmodel_viz._run_layouts(
+                layout_x_chunk,
+                layout_y_chunk,
+                np.tile(yaw_angles, (stop - start, 1, 1)),
+                floris_dict=floris_dict,
+            )
 
-        # Make a dataframe
-        df = pd.DataFrame({
-            'x1':x_results,
-            'x2':y_results,
-            'x3':z_results,
-            'u':u_results,
-            'v':v_results,
-            'w':w_results,
-        })
+            # Get the velocity of the test turbine's central point
+            center_point = int(np.floor(core.flow_field.u.shape[2] / 2.0))
+            u_results[start:stop] = core.flow_field.u[:, -1, center_point, center_point]
 
         # Convert to a cut_plane
-        horizontal_plane = CutPlane(df, x_resolution, y_resolution, "z")
+        shape = (y_resolution, x_resolution)
+        horizontal_plane = CutPlane.from_arrays(
+            x_results.reshape(shape),
+            y_results.reshape(shape),
+            z_results.reshape(shape),
+            u_results.reshape(shape),
+            v_results.reshape(shape),
+            w_results.reshape(shape),
+            "z",
+        )
 
         return horizontal_plane
 
+def calculate_planes_in_parallel(
+    fmodel: FlorisModel,
+    normal_vector: str = "z",
+    planar_coordinates: float | list[float] | NDArrayFloat | None = None,
+    x1_resolution: int = 200,
+    x2_resolution: int = 200,
+    x1_bounds: tuple | None = None,
+    x2_bounds: tuple | None = None,
+    findices: int | list[int] | NDArrayInt | None = None,
+    max_workers: int = -1,
+    tile_resolution: int | None = None,
+    frames_directory: str | Path | None = None,
+    figure_kwargs: dict | None = None,
+    plot_kwargs: dict | None = None,
+    return_planes: bool = True,
+) -> list[CutPlane] | None:
+    """
+    Calculate :py:class:`~.tools.cut_plane.CutPlane` objects for several findices and planar
+    coordinates, e.g. for the frames of an animated sweep of wind directions or yaw angles,
+    with the planes split across a pool of worker processes. Each worker builds its own copy
+    of the FlorisModel once and keeps it for all of the planes it calculates, so the turbine
+    solve is shared by all of the planar coordinates of a findex as in
+    :py:meth:`~floris.floris_model.FlorisModel.calculate_horizontal_planes`. The workers
+    write the arrays of the planes into a block of shared memory rather than sending the
+    planes back to the main process.
+
+    If a frames_directory is given, each worker also renders its planes with
+    :py:func:`visualize_cut_plane` and saves them as PNG files, named plane_00000.png,
+    plane_00001.png, ... in the order of the planes. For animations, give min_speed and
+    max_speed in plot_kwargs so that all of the frames share the same color scale.
+
+    Args:
+        fmodel (:py:class:`floris.floris_model.FlorisModel`): The FlorisModel, whose
+            settings and control setpoints are used for the planes. It is not modified.
+        normal_vector (str, optional): Vector normal to the planes, "z" for horizontal
+            planes, "x" for cross planes or "y" for streamwise vertical planes.
+            Defaults to "z".
+        planar_coordinates (float | list[float] | NDArrayFloat, optional): Coordinates of
+            the planes along the normal vector: heights, downstream distances or
+            cross-stream distances. Defaults to None, which uses the reference wind height
+            for horizontal planes and is required otherwise.
+        x1_resolution (int, optional): Output array resolution along the first axis of the
+            planes. Defaults to 200 points.
+        x2_resolution (int, optional): Output array resolution along the second axis of the
+            planes. Defaults to 200 points.
+        x1_bounds (tuple, optional): Limits of the output arrays along the first axis
+            (in m). Defaults to None, which fits the layout for all of the findices.
+        x2_bounds (tuple, optional): Limits of the output arrays along the second axis
+            (in m). Defaults to None, which fits the layout for all of the findices.
+        findices (int | list[int] | NDArrayInt, optional): Indices of the conditions to
+            visualize. Defaults to None, which uses all findices.
+        max_workers (int, optional): The number of worker processes. Defaults to -1, which
+            uses the number of CPUs available. With 1, the planes are calculated in the
+            current process.
+        tile_resolution (int, optional): Number of points along each side of the square
+            tiles in which each worker solves the planes. Defaults to None, which solves
+            each plane at once. See
+            :py:meth:`~floris.floris_model.FlorisModel.calculate_horizontal_planes`.
+        frames_directory (str | Path, optional): Directory in which to save a PNG image of
+            each plane. Defaults to None, which does not render the planes.
+        figure_kwargs (dict, optional): Keyword arguments for the
+            :py:class:`matplotlib.figure.Figure` of each frame, e.g. figsize and dpi.
+            Defaults to None.
+        plot_kwargs (dict, optional): Keyword arguments for :py:func:`visualize_cut_plane`
+            for each frame. Defaults to None.
+        return_planes (bool, optional): Whether to return the planes. Set to False when
+            only the frames are needed, so that no shared memory is allocated for the
+            planes. Defaults to True.
+
+    Returns:
+        list[:py:class:`~.tools.cut_plane.CutPlane`] | None: The planes for each findex,
+        and for each findex, each planar coordinate, if return_planes is True.
+    """
+    if normal_vector not in ["x", "y", "z"]:
+        raise ValueError("normal_vector must be one of 'x', 'y' or 'z'.")
+    if planar_coordinates is None:
+        if normal_vector != "z":
+            raise ValueError(
+                "planar_coordinates must be given for cross planes and y planes."
+            )
+        planar_coordinates = fmodel.core.flow_field.reference_wind_height
+    if frames_directory is None and not return_planes:
+        raise ValueError("Either frames_directory or return_planes must be given.")
+    if max_workers == -1:
+        max_workers = cpu_count()
+
+    planar_coordinates = np.atleast_1d(np.array(planar_coordinates, dtype=float))
+    if findices is None:
+        findices = np.arange(fmodel.n_findex)
+    findices = np.atleast_1d(np.array(findices, dtype=int))
+    grid_resolution = (int(x1_resolution), int(x2_resolution))
+    x1_bounds, x2_bounds = fmodel._get_plane_bounds(
+        normal_vector,
+        planar_coordinates[0],
+        grid_resolution,
+        x1_bounds,
+        x2_bounds,
+        findices,
+    )
+    if frames_directory is not None:
+        frames_directory = Path(frames_directory)
+        frames_directory.mkdir(parents=True, exist_ok=True)
+
+    # Split the findices across the workers, keeping all of the planar coordinates of a
+    # findex together to share its turbine solve. When there are fewer findices than
+    # workers, the planar coordinates are split as well.
+    n_findex_splits = min(len(findices), max_workers)
+    n_coordinate_splits = min(
+        len(planar_coordinates),
+        int(np.ceil(max_workers / n_findex_splits)),
+    )
+    plane_indices = np.arange(len(findices) * len(planar_coordinates)).reshape(
+        len(findices), len(planar_coordinates)
+    )
+    tasks = []
+    for findex_split in np.array_split(np.arange(len(findices)), n_findex_splits):
+        for coordinate_split in np.array_split(
+            np.arange(len(planar_coordinates)), n_coordinate_splits
+        ):
+            tasks.append(
+                (
+                    findices[findex_split],
+                    planar_coordinates[coordinate_split],
+                    plane_indices[np.ix_(findex_split, coordinate_split)].flatten(),
+                )
+            )
+
+    plane_settings = {
+        "normal_vector": normal_vector,
+        "grid_resolution": grid_resolution,
+        "x1_bounds": x1_bounds,
+        "x2_bounds": x2_bounds,
+        "tile_resolution": tile_resolution,
+        "frames_directory": frames_directory,
+        "figure_kwargs": {} if figure_kwargs is None else figure_kwargs,
+        "plot_kwargs": {} if plot_kwargs is None else plot_kwargs,
+    }
+    shape = (plane_indices.size, len(PLANE_ARRAY_NAMES), grid_resolution[1], grid_resolution[0])
+
+    shm = None
+    if return_planes:
+        shm = shared_memory.SharedMemory(
+            create=True,
+            size=int(np.prod(shape)) * np.dtype(float).itemsize,
+        )
+    try:
+        multiargs = [
+            (*task, None if shm is None else shm.name, shape, plane_settings)
+            for task in tasks
+        ]
+        if max_workers == 1:
+            for args in multiargs:
+                _calculate_plane_block(fmodel, *args)
+        else:
+            # Send the workers a snapshot of the model for a single findex, and the wind
+            # conditions and setpoints of the findices of each block
+            snapshot = fmodel._get_worker_inputs([findices[:1]])[0]
+            multiargs = [
+                (
+                    {
+                        **fmodel._get_findex_wind_conditions(args[0]),
+                        **fmodel._get_findex_setpoints(args[0]),
+                    },
+                    *args,
+                )
+                for args in multiargs
+            ]
+            with ProcessPoolExecutor(
+                max_workers,
+                initializer=_initialize_plane_worker,
+                initargs=(snapshot,),
+            ) as p:
+                # Consume the results to raise any exceptions from the workers
+                list(p.map(_calculate_plane_block_in_worker, multiargs))
+
+        if shm is None:
+            return None
+
+        # Copy the planes out of the shared memory so that it can be released
+        plane_arrays = np.ndarray(shape, dtype=float, buffer=shm.buf).copy()
+    finally:
+        if shm is not None:
+            shm.close()
+            shm.unlink()
+
+    return [
+        CutPlane.from_arrays(*plane_arrays[i], normal_vector)
+        for i in range(plane_indices.size)
+    ]
+
+def _initialize_plane_worker(snapshot: bytes):
+    """
+    Keep the model snapshot of a worker process of :py:func:`calculate_planes_in_parallel`
+    for all of the planes that it calculates.
+    """
+    global _worker_snapshot
+    _worker_snapshot = snapshot
+
+def _calculate_plane_block_in_worker(args):
+    """
+    Wrapper for unpacking inputs to _calculate_plane_block() for use with map(), rebuilding
+    the model of the worker process for only the findices of the block.
+    """
+    set_kwargs, findices, *block_args = args
+    fmodel = FlorisModel._from_worker_inputs(_worker_snapshot, set_kwargs)
+    return _calculate_plane_block(fmodel, np.arange(len(findices)), *block_args)
+
+def _calculate_plane_block(
+    fmodel: FlorisModel,
+    findices: NDArrayInt,
+    planar_coordinates: NDArrayFloat,
+    plane_indices: NDArrayInt,
+    shm_name: str | None,
+    shape: tuple,
+    plane_settings: dict,
+) -> None:
+    """
+    Calculate the planes of a block of findices and planar coordinates for
+    :py:func:`calculate_planes_in_parallel`, writing their arrays into the shared memory
+    and optionally rendering them.
+    """
+    shm = None
+    if shm_name is not None:
+        shm = shared_memory.SharedMemory(name=shm_name)
+        plane_arrays = np.ndarray(shape, dtype=float, buffer=shm.buf)
+
+    try:
+        cut_planes = fmodel._calculate_planes(
+            plane_settings["normal_vector"],
+            planar_coordinates,
+            plane_settings["grid_resolution"],
+            plane_settings["x1_bounds"],
+            plane_settings["x2_bounds"],
+            findices,
+            None,
+            plane_settings["tile_resolution"],
+        )
+        for plane_index, cut_plane in zip(plane_indices, cut_planes):
+            if shm is not None:
+                for i, name in enumerate(PLANE_ARRAY_NAMES):
+                    plane_arrays[plane_index, i] = cut_plane.get_mesh(name)
+
+            if plane_settings["frames_directory"] is not None:
+                # Render without pyplot so that no figures are kept open by the worker
+                fig = Figure(**plane_settings["figure_kwargs"])
+                ax = fig.subplots()
+                visualize_cut_plane(cut_plane, ax=ax, **plane_settings["plot_kwargs"])
+                fig.savefig(plane_settings["frames_directory"] / f"plane_{plane_index:05d}.png")
+    finally:
+        if shm is not None:
+            del plane_arrays
+            shm.close()
+
 @define
 class VelocityProfilesFigure():
     """
@@ -643,18 +917,36 @@ class VelocityProfilesFigure():
 
     def add_profiles(
         self,
-        velocity_deficit_profiles: list[pd.DataFrame],
+        velocity_deficit_profiles: list[pd.DataFrame] | VelocityDeficitProfiles,
         **kwargs
     ) -> None:
         """
-        Add a list of velocity deficit profiles to the figure. Each profile is represented
-        as a pandas DataFrame. `kwargs` are passed to `ax.plot`.
+        Add velocity deficit profiles to the figure. The profiles are either a list of pandas
+        DataFrames, one per profile, or a
+        :py:class:`~floris.velocity_deficit_profiles.VelocityDeficitProfiles`, in which case
+        the profiles of every findex are plotted directly from its arrays. `kwargs` are passed
+        to `ax.plot`.
         """
-        for df in velocity_deficit_profiles:
-            ax, profile_direction = self.match_profile_to_axes(df)
-            profile_direction_D = f'{profile_direction}/D'
-            ax.plot(df['velocity_deficit'], df[profile_direction_D], **kwargs)
-            self.deficit_max = max(self.deficit_max, df['velocity_deficit'].max())
+        if isinstance(velocity_deficit_profiles, VelocityDeficitProfiles):
+            if velocity_deficit_profiles.direction == 'cross-stream':
+                profile_direction = 'x2'
+            else:
+                profile_direction = 'x3'
+            velocity_deficit = velocity_deficit_profiles.get_values('velocity_deficit')
+            profile_coordinates = velocity_deficit_profiles.get_values(f'{profile_direction}/D')
+            x1_D = velocity_deficit_profiles.get_values('x1/D')
+            for i in range(velocity_deficit_profiles.n_lines):
+                ax = self.get_axes(x1_D[0, i, 0], velocity_deficit_profiles.direction)
+                # Each column is plotted as a separate line
+                ax.plot(velocity_deficit[:, i].T, profile_coordinates[:, i].T, **kwargs)
+            if velocity_deficit.size > 0:
+                self.deficit_max = max(self.deficit_max, np.nanmax(velocity_deficit))
+        else:
+            for df in velocity_deficit_profiles:
+                ax, profile_direction = self.match_profile_to_axes(df)
+                profile_direction_D = f'{profile_direction}/D'
+                ax.plot(df['velocity_deficit'], df[profile_direction_D], **kwargs)
+                self.deficit_max = max(self.deficit_max, df['velocity_deficit'].max())
 
         margin = 0.05
         self.set_xlim([0.0 - margin, self.deficit_max + margin])
@@ -684,6 +976,13 @@ class VelocityProfilesFigure():
                 f"Velocity deficit profile at x1/D = {x1_D} is neither in the cross-stream (x2) "
                 "nor the vertical (x3) direction."
             )
+        return self.get_axes(x1_D, profile_direction_name), profile_direction
+
+    def get_axes(
+        self,
+        x1_D: float,
+        profile_direction_name: str,
+    ) -> plt.Axes:
         row = self.layout.index(profile_direction_name)
 
         col = None
@@ -698,7 +997,7 @@ class VelocityProfilesFigure():
                 "values with which this VelocityProfilesFigure object was initialized: "
                 f"{self.downstream_dists_D}."
             )
-        return self.axs[row,col], profile_direction
+        return self.axs[row,col]
 
     def set_xlim(
         self,
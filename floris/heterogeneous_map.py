@@ -1,7 +1,7 @@
 from __future__ import annotations
 
-import matplotlib.cm as cm
-import matplotlib.pyplot as plt
+from typing import TYPE_CHECKING
+
 import numpy as np
 import pandas as pd
 import scipy.spatial._qhull
@@ -13,6 +13,11 @@ from floris.logging_manager import LoggingManager
 from floris.type_dec import NDArrayFloat
 
 
+if TYPE_CHECKING:
+    import matplotlib.pyplot as plt
+    from matplotlib.colors import Colormap
+
+
 class HeterogeneousMap(LoggingManager):
     """
     Class for handling heterogeneous inflow configurations when defined by wind direction
@@ -302,6 +307,8 @@ class HeterogeneousMap(LoggingManager):
 
         # If not provided create the axis
         if ax is None:
+            import matplotlib.pyplot as plt
+
             _, ax = plt.subplots()
 
         # Get the x and y coordinates of the het map
@@ -368,7 +375,7 @@ class HeterogeneousMap(LoggingManager):
         ax: plt.Axes = None,
         vmin: float = None,
         vmax: float = None,
-        cmap: cm = cm.viridis,
+        cmap: str | Colormap = "viridis",
         show_boundary: bool = True,
         show_wind_direction: bool = True,
         show_colorbar: bool = True,
@@ -388,8 +395,8 @@ class HeterogeneousMap(LoggingManager):
                 value of the speed multipliers.
             vmax (float, optional): The maximum value for the colorbar. Default is the maximum
                 value of the speed multipliers.
-            cmap (matplotlib.colors.Colormap, optional): The colormap to use for the heatmap.
-                Default is matplotlib.cm.viridis.
+            cmap (str | matplotlib.colors.Colormap, optional): The colormap to use for the
+                heatmap. Default is "viridis".
             show_boundary (bool, optional): Whether to show the boundary of the heterogeneous
                 inflow configuration. Default is True.
             show_wind_direction (bool, optional): Whether to show the wind direction as an arrow.
@@ -437,6 +444,8 @@ class HeterogeneousMap(LoggingManager):
 
         # If not provided create the axis
         if ax is None:
+            import matplotlib.pyplot as plt
+
             fig, ax = plt.subplots()
         else:
             fig = ax.get_figure()
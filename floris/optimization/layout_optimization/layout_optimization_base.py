@@ -1,17 +1,24 @@
 
 import matplotlib.pyplot as plt
 import numpy as np
+import shapely
+from scipy.spatial import cKDTree
 from shapely.geometry import MultiPolygon, Polygon
 
 from floris import TimeSeries
 from floris.optimization.yaw_optimization.yaw_optimizer_geometric import (
     YawOptimizationGeometric,
 )
-from floris.wind_data import WindDataBase
+from floris.wind_data import WindDataBase, WindRoseWRG
 
 from ...logging_manager import LoggingManager
 
 
+# Upper bound on the number of findices combined into a single solve when many
+# candidate layouts are evaluated together; limits the memory used by the solve
+MAX_FINDEX_PER_SOLVE = 10000
+
+
 class LayoutOptimization(LoggingManager):
     """
     Base class for layout optimization. This class should not be used directly
@@ -124,6 +131,27 @@ class LayoutOptimization(LoggingManager):
 
         return self.yaw_angles
 
+    def _get_geoyaw_angles_for_layouts(self, layout_x, layout_y):
+        # Geometric yaw angles for each of several candidate layouts, with shape
+        # (n_layouts, n_findex, n_turbines). Returns None if geometric yaw is disabled.
+        if not self.enable_geometric_yaw:
+            return None
+
+        return get_geoyaw_angles_for_layouts(self.yaw_opt, layout_x, layout_y)
+
+    def _get_objectives_for_layouts(self, layout_x, layout_y, yaw_angles=None):
+        """
+        Compute the AEP (or AVP if use_value is True) of several candidate layouts.
+        See :py:func:`get_objectives_for_layouts`.
+        """
+        return get_objectives_for_layouts(
+            self.fmodel,
+            layout_x,
+            layout_y,
+            yaw_angles=yaw_angles,
+            use_value=self.use_value,
+        )
+
     # Public methods
 
     def optimize(self):
@@ -282,8 +310,209 @@ class LayoutOptimization(LoggingManager):
 
 # Helper functions
 
+def get_geoyaw_angles_for_layouts(yaw_opt, layout_x, layout_y):
+    """
+    Compute the geometric yaw angles of several candidate layouts.
+
+    Args:
+        yaw_opt (YawOptimizationGeometric): The geometric yaw optimizer of the FlorisModel.
+        layout_x (np.array): x-coordinates of the turbines for each layout with
+            shape (n_layouts, n_turbines).
+        layout_y (np.array): y-coordinates of the turbines for each layout with
+            shape (n_layouts, n_turbines).
+
+    Returns:
+        np.array: Yaw angles of each layout with shape (n_layouts, n_findex, n_turbines).
+    """
+    yaw_angles = []
+    for x, y in zip(layout_x, layout_y):
+        yaw_opt.fmodel_subset.set(layout_x=x, layout_y=y)
+        df_opt = yaw_opt.optimize()
+        yaw_angles.append(np.vstack(df_opt['yaw_angles_opt']))
+
+    return np.stack(yaw_angles)
+
+def get_objectives_for_layouts(fmodel, layout_x, layout_y, yaw_angles=None, use_value=False):
+    """
+    Compute the AEP (or AVP if use_value is True) of several candidate layouts.
+    The layouts are solved together in as few FLORIS calculations as possible
+    rather than one at a time.
+
+    Args:
+        fmodel (FlorisModel): The FlorisModel, with the wind data to evaluate the
+            layouts for.
+        layout_x (np.array): x-coordinates of the turbines for each layout with
+            shape (n_layouts, n_turbines).
+        layout_y (np.array): y-coordinates of the turbines for each layout with
+            shape (n_layouts, n_turbines).
+        yaw_angles (np.array, optional): Yaw angles for each layout with shape
+            (n_layouts, n_findex, n_turbines). If None, the current yaw angles
+            of the FlorisModel are used. Defaults to None.
+        use_value (bool, optional): If True, compute the AVP using the values of the
+            wind data instead of the AEP. Defaults to False.
+
+    Returns:
+        np.array: AEP or AVP of each layout with shape (n_layouts,).
+    """
+    layout_x = np.atleast_2d(layout_x)
+    layout_y = np.atleast_2d(layout_y)
+    wind_data = fmodel.wind_data
+
+    # Frequencies of a WindRoseWRG depend on the layout, so each layout
+    # must be evaluated separately
+    if isinstance(wind_data, WindRoseWRG):
+        fmodel_eval = fmodel.copy()
+        objectives = np.zeros(len(layout_x))
+        for i, (x, y) in enumerate(zip(layout_x, layout_y)):
+            fmodel_eval.set(layout_x=x, layout_y=y, wind_data=wind_data)
+            if yaw_angles is not None:
+                fmodel_eval.set_operation(yaw_angles=yaw_angles[i])
+            fmodel_eval.run()
+            if use_value:
+                objectives[i] = fmodel_eval.get_farm_AVP()
+            else:
+                objectives[i] = fmodel_eval.get_farm_AEP()
+        return objectives
+
+    n_findex = fmodel.n_findex
+    turbine_powers = fmodel.get_turbine_powers_for_layouts(
+        layout_x,
+        layout_y,
+        yaw_angles=yaw_angles,
+        n_layouts_per_solve=max(1, MAX_FINDEX_PER_SOLVE // n_findex),
+    )
+    farm_powers = np.sum(turbine_powers, axis=2)
+
+    if wind_data is None:
+        weights = np.full(n_findex, 1.0 / n_findex)
+    else:
+        weights = wind_data.unpack_freq()
+        if use_value:
+            weights = weights * wind_data.unpack_value()
+
+    return np.nansum(weights * farm_powers, axis=1) * 8760
+
 def list_depth(x):
     if isinstance(x, list) and len(x) > 0:
         return 1 + max(list_depth(item) for item in x)
     else:
         return 0
+
+
+# Constraint functions shared by the layout optimizers. These operate on all turbines at
+# once and optionally return analytic gradients with respect to the turbine coordinates.
+
+def distance_from_boundaries(x, y, boundary_polygon, return_gradient=False):
+    """
+    Signed distance from each point to the nearest edge of the boundary. The distance
+    is positive for points inside the boundary and negative for points outside of it.
+
+    Args:
+        x (np.array): x-coordinates of the points (m).
+        y (np.array): y-coordinates of the points (m).
+        boundary_polygon (Polygon | MultiPolygon): The boundary, possibly with holes
+            and separate regions.
+        return_gradient (bool, optional): If True, also return the derivatives of each
+            point's distance with respect to its own x- and y-coordinates. Defaults to
+            False.
+
+    Returns:
+        np.array: Signed distance of each point (m). If return_gradient is True, a tuple
+        of the distances and their derivatives with respect to x and y.
+    """
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+
+    # Gather the start and end points of every edge of every ring of the boundary
+    rings = shapely.get_rings(shapely.get_parts(boundary_polygon))
+    starts = []
+    ends = []
+    for ring in rings:
+        coords = shapely.get_coordinates(ring)
+        starts.append(coords[:-1])
+        ends.append(coords[1:])
+    starts = np.concatenate(starts)
+    edges = np.concatenate(ends) - starts
+
+    # Project each point onto each edge to find the closest point on the edge
+    dx = x[:, None] - starts[None, :, 0]
+    dy = y[:, None] - starts[None, :, 1]
+    edge_lengths_sq = np.sum(edges**2, axis=1)
+    t = (dx * edges[:, 0] + dy * edges[:, 1]) / np.where(edge_lengths_sq > 0, edge_lengths_sq, 1)
+    t = np.clip(t, 0.0, 1.0)
+    offset_x = dx - t * edges[:, 0]
+    offset_y = dy - t * edges[:, 1]
+    distances = np.hypot(offset_x, offset_y)
+
+    nearest = np.argmin(distances, axis=1)
+    arange = np.arange(len(x))
+    distance = distances[arange, nearest]
+    sign = np.where(shapely.contains_xy(boundary_polygon, x, y), 1.0, -1.0)
+
+    if not return_gradient:
+        return sign * distance
+
+    with np.errstate(invalid="ignore", divide="ignore"):
+        grad_x = np.where(distance > 0, sign * offset_x[arange, nearest] / distance, 0.0)
+        grad_y = np.where(distance > 0, sign * offset_y[arange, nearest] / distance, 0.0)
+
+    return sign * distance, grad_x, grad_y
+
+def space_constraint(x, y, min_dist, rho=500, return_gradient=False):
+    """
+    Aggregate constraint on the minimum spacing between turbines. The distance from each
+    turbine to its nearest neighbor is found with a KD-tree and the normalized violations
+    are combined with a Kreisselmeier-Steinhauser (KS) function, following the OpenMDAO
+    KSComp. The constraint is satisfied when the returned value is less than or equal
+    to zero.
+
+    Args:
+        x (np.array): x-coordinates of the turbines (m).
+        y (np.array): y-coordinates of the turbines (m).
+        min_dist (float): The minimum distance to be maintained between turbines (m).
+        rho (float, optional): KS aggregation parameter. Defaults to 500.
+        return_gradient (bool, optional): If True, also return the derivatives of the
+            constraint with respect to the turbine x- and y-coordinates. Defaults to False.
+
+    Returns:
+        tuple: The KS constraint value and the distance from each turbine to its nearest
+        neighbor (m), followed by the derivatives with respect to x and y if
+        return_gradient is True.
+    """
+    locs = np.column_stack((x, y)).astype(float)
+    n_points = len(locs)
+
+    if n_points > 1:
+        dist, idx = cKDTree(locs).query(locs, k=2)
+        dist = dist[:, 1]
+        neighbor = idx[:, 1]
+    else:
+        # A single turbine has no neighbors to be spaced from
+        dist = np.full(n_points, 1e10)
+        neighbor = np.arange(n_points)
+
+    g = 1 - dist / min_dist
+
+    # Constraint is satisfied when KS_constraint <= 0
+    g_max = np.max(g)
+    exponents = np.exp(rho * (g - g_max))
+    summation = np.sum(exponents)
+    KS_constraint = g_max + 1.0 / rho * np.log(summation)
+
+    if not return_gradient:
+        return KS_constraint, dist
+
+    # Chain rule through the KS weights and each turbine's nearest-neighbor distance
+    weights = exponents / summation
+    with np.errstate(invalid="ignore", divide="ignore"):
+        unit = np.where(
+            dist[:, None] > 0,
+            (locs - locs[neighbor]) / dist[:, None],
+            0.0,
+        )
+    dKS_ddist = -weights / min_dist
+    grad = np.zeros_like(locs)
+    np.add.at(grad, np.arange(n_points), dKS_ddist[:, None] * unit)
+    np.add.at(grad, neighbor, -dKS_ddist[:, None] * unit)
+
+    return KS_constraint, dist, grad[:, 0], grad[:, 1]
@@ -8,7 +8,7 @@ from shapely.geometry import (
     Polygon,
 )
 
-from .layout_optimization_base import LayoutOptimization
+from .layout_optimization_base import LayoutOptimization, space_constraint
 
 
 class LayoutOptimizationBoundaryGrid(LayoutOptimization):
@@ -628,21 +628,5 @@ class LayoutOptimizationBoundaryGrid(LayoutOptimization):
         plt.tick_params(which="both", labelsize=fontsize)
 
     def space_constraint(self, x, y, min_dist, rho=500):
-        # Calculate distances between turbines
-        locs = np.vstack((x, y)).T
-        distances = cdist(locs, locs)
-        arange = np.arange(distances.shape[0])
-        distances[arange, arange] = 1e10
-        dist = np.min(distances, axis=0)
-
-        g = 1 - np.array(dist) / min_dist
-
-        # Following code copied from OpenMDAO KSComp().
         # Constraint is satisfied when KS_constraint <= 0
-        g_max = np.max(np.atleast_2d(g), axis=-1)[:, np.newaxis]
-        g_diff = g - g_max
-        exponents = np.exp(rho * g_diff)
-        summation = np.sum(exponents, axis=-1)[:, np.newaxis]
-        KS_constraint = g_max + 1.0 / rho * np.log(summation)
-
-        return KS_constraint[0][0], dist
+        return space_constraint(x, y, min_dist, rho=rho)
@@ -1,11 +1,11 @@
 from __future__ import annotations
 
 import numpy as np
+import shapely
 
 from floris import FlorisModel
 
 from .layout_optimization_base import LayoutOptimization
-from .layout_optimization_random_search import test_point_in_bounds
 
 
 class LayoutOptimizationGridded(LayoutOptimization):
@@ -157,7 +157,6 @@ class LayoutOptimizationGridded(LayoutOptimization):
         # Sweep over rotations and translations to find the best layout
         n_rots = len(self.rotations)
         n_trans = len(self.translations)
-        n_tot = n_rots * n_trans**2
 
         # There are a total of n_rots x n_trans x n_trans layouts to test
         rots_rad = np.radians(self.rotations)
@@ -180,20 +179,21 @@ class LayoutOptimizationGridded(LayoutOptimization):
         # Create candidate layouts [(n_rots x n_trans x n_trans) x n_turbines x 2]
         candidate_layouts = np.einsum('ijk,lk->ilj', rotations_all, self.xy_grid) + translations_all
 
-        # For each candidate layout, check how many turbines are in bounds
-        turbines_in_bounds = np.zeros(n_tot)
-        for i in range(n_tot):
-            turbines_in_bounds[i] = np.sum(
-                [test_point_in_bounds(xy[0], xy[1], self._boundary_polygon) for
-                 xy in candidate_layouts[i, :, :]]
-            )
+        # For each candidate layout, check how many turbines are in bounds. All of the
+        # turbines of all of the candidates are tested against the prepared boundary at once.
+        shapely.prepare(self._boundary_polygon)
+        in_bounds = shapely.contains_xy(
+            self._boundary_polygon,
+            candidate_layouts[:, :, 0],
+            candidate_layouts[:, :, 1],
+        )
+        turbines_in_bounds = np.sum(in_bounds, axis=1)
         idx_max = np.argmax(turbines_in_bounds) # First maximizing index returned
 
         # Get the best layout
         x_opt_all = candidate_layouts[idx_max, :, 0]
         y_opt_all = candidate_layouts[idx_max, :, 1]
-        mask_in_bounds = [test_point_in_bounds(x, y, self._boundary_polygon) for
-                          x, y in zip(x_opt_all, y_opt_all)]
+        mask_in_bounds = in_bounds[idx_max, :]
 
         # Save best layout, along with the number of turbines in bounds, and return
         self.n_turbines_max = round(turbines_in_bounds[idx_max])
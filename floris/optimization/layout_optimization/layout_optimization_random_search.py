@@ -13,38 +13,47 @@
 # See https://floris.readthedocs.io for documentation
 
 
+import copy
 from multiprocessing import Pool
 from time import perf_counter as timerpc
 
 import matplotlib.pyplot as plt
 import numpy as np
-from scipy.spatial.distance import cdist, pdist
-from shapely.geometry import Point, Polygon
+import shapely
 
 from floris import FlorisModel
 from floris.optimization.yaw_optimization.yaw_optimizer_geometric import (
     YawOptimizationGeometric,
 )
+from floris.utilities import (
+    cosd,
+    mpi_starmap,
+    sind,
+    wind_delta,
+)
+from floris.wind_data import WindRoseWRG
 
-from .layout_optimization_base import LayoutOptimization
+from .layout_optimization_base import (
+    get_geoyaw_angles_for_layouts,
+    get_objectives_for_layouts,
+    LayoutOptimization,
+    space_constraint,
+)
 
 
 def _load_local_floris_object(
-    fmodel_dict,
-    wind_data=None,
+    fmodel_snapshot,
+    set_kwargs,
 ):
     # Load local FLORIS object
-    fmodel = FlorisModel(fmodel_dict)
-    fmodel.set(wind_data=wind_data)
-    return fmodel
+    return FlorisModel._from_worker_inputs(fmodel_snapshot, set_kwargs)
 
 def test_min_dist(layout_x, layout_y, min_dist):
-    coords = np.array([layout_x,layout_y]).T
-    dist = pdist(coords)
+    _, dist = space_constraint(layout_x, layout_y, min_dist)
     return dist.min() >= min_dist
 
 def test_point_in_bounds(test_x, test_y, poly_outer):
-    return poly_outer.contains(Point(test_x, test_y))
+    return bool(shapely.contains_xy(poly_outer, test_x, test_y))
 
 # Return in MW
 def _get_objective(
@@ -63,6 +72,234 @@ def _get_objective(
 
     return fmodel.get_farm_AVP() if use_value else fmodel.get_farm_AEP()
 
+class _IncrementalObjective:
+    """
+    Objective (AEP or AVP) of a layout that is updated incrementally as single turbines
+    are moved. Turbine powers are cached for every findex. When a turbine is moved, the
+    turbines whose powers can change are identified for each wind direction: the moved
+    turbine itself and every turbine downstream of it, through chains of wakes, at either
+    its old or its new location. Only those turbines and the turbines upstream of them are
+    solved again, and the cached powers are reused for everything else.
+
+    A turbine is considered to wake another when the other lies within a cone around its
+    wake centerline. The cone is wider than the wakes and the wake-added turbulence
+    region of the wake models, but the tails of the velocity deficits and the transverse
+    velocities reach further, so the objective differs slightly from a full evaluation
+    (typically by a relative amount of order 1e-5).
+    Since the freestream inflow must not vary with position, heterogeneous inflow always
+    falls back to solving the full farm for every findex.
+    """
+
+    # Half width of the wake cone at the upstream turbine, in rotor diameters, and its
+    # growth per unit of downstream distance
+    cone_half_width_D = 2.5
+    cone_slope = 0.3
+
+    # Maximum number of solves the wake chains are grouped into for each move; chains
+    # in the same solve are padded to the same number of turbines
+    max_chain_groups = 4
+
+    def __init__(self, fmodel, layout_x, layout_y, use_value=False):
+        wind_data = fmodel.wind_data
+        if isinstance(wind_data, WindRoseWRG):
+            raise ValueError(
+                "Incremental objective evaluation is not supported with WindRoseWRG since "
+                "the frequencies depend on the layout."
+            )
+
+        # Weights that convert the farm power at each findex into the objective
+        n_findex = fmodel.n_findex
+        if wind_data is None:
+            self.weights = np.full(n_findex, 1.0 / n_findex)
+        else:
+            self.weights = wind_data.unpack_freq()
+            if use_value:
+                self.weights = self.weights * wind_data.unpack_value()
+        self.weights = self.weights * 8760
+
+        self.fmodel_dict = fmodel.core.as_dict()
+        self.fmodel = FlorisModel(self.fmodel_dict)
+        self.wind_directions = fmodel.wind_directions
+        self.wind_speeds = fmodel.wind_speeds
+        self.turbulence_intensities = fmodel.turbulence_intensities
+        self.D = fmodel.core.farm.rotor_diameters.max()
+        self.cone_half_width = self.cone_half_width_D * self.D
+
+        # Solving a subset of the turbines is only possible when the turbines are
+        # interchangeable and the inflow is the same everywhere
+        turbine_type = fmodel.core.farm.turbine_type
+        self.solve_full_farm = (
+            fmodel.core.flow_field.heterogeneous_inflow_config is not None
+            or not all(t == turbine_type[0] for t in turbine_type)
+        )
+
+        # The wakes only depend on the wind direction
+        self._unique_wd, self._wd_index = np.unique(self.wind_directions, return_inverse=True)
+        theta = wind_delta(self._unique_wd)
+        self._cos = cosd(theta)[:, None, None]
+        self._sin = sind(theta)[:, None, None]
+
+        self.layout_x = np.array(layout_x, dtype=float)
+        self.layout_y = np.array(layout_y, dtype=float)
+        self.fmodel.set(layout_x=self.layout_x, layout_y=self.layout_y)
+        self.fmodel.run()
+        self.turbine_powers = self.fmodel.get_turbine_powers()
+        self.objective = self._objective(self.turbine_powers)
+        self._pending = None
+
+    def _objective(self, turbine_powers):
+        return np.nansum(self.weights * np.sum(turbine_powers, axis=1))
+
+    def _wakes(self, x, y):
+        # wakes[w, i, j] is True where turbine i wakes turbine j at unique wind direction w.
+        # Turbines that are nearly side by side are considered to wake each other.
+        dx = x[None, :] - x[:, None]
+        dy = y[None, :] - y[:, None]
+        downstream = dx * self._cos - dy * self._sin
+        lateral = np.abs(dx * self._sin + dy * self._cos)
+        wakes = (
+            (downstream > -self.cone_half_width)
+            & (lateral < self.cone_half_width + self.cone_slope * np.maximum(downstream, 0.0))
+        )
+        wakes[:, np.arange(len(x)), np.arange(len(x))] = False
+        return wakes
+
+    def _wake_chains(self, tr, x, y):
+        """
+        For each unique wind direction, find the turbines whose powers can change when
+        turbine tr is moved to (x, y) and the turbines needed to solve for them.
+        """
+        n_turbines = len(self.layout_x)
+
+        # The old location of the moved turbine is included as an extra turbine that
+        # only wakes others, so that turbines that were in its wake are also updated
+        nodes_x = np.append(self.layout_x, self.layout_x[tr])
+        nodes_y = np.append(self.layout_y, self.layout_y[tr])
+        nodes_x[tr] = x
+        nodes_y[tr] = y
+        wakes = self._wakes(nodes_x, nodes_y)
+        waked_at_old_location = wakes[:, :, n_turbines].any(axis=1)
+        wakes[:, :, n_turbines] = False
+
+        # Turbines downstream of either location of the moved turbine
+        changed = np.zeros(wakes.shape[:2], dtype=bool)
+        changed[:, [tr, n_turbines]] = True
+        while True:
+            changed_next = changed | np.any(changed[:, :, None] & wakes, axis=1)
+            if (changed_next == changed).all():
+                break
+            changed = changed_next
+        changed = changed[:, :n_turbines]
+
+        # Turbines upstream of any of the changed turbines in the new layout
+        wakes = wakes[:, :n_turbines, :n_turbines]
+        needed = changed.copy()
+        while True:
+            needed_next = needed | np.any(wakes & needed[:, None, :], axis=2)
+            if (needed_next == needed).all():
+                break
+            needed = needed_next
+
+        # Nothing changes where the moved turbine is isolated at both locations
+        affected = (changed.sum(axis=1) > 1) | (needed.sum(axis=1) > 1) | waked_at_old_location
+
+        return affected, changed, needed
+
+    def _solve_subsets(self, layout_x, layout_y, findex, needed):
+        """
+        Solve for the powers of a different subset of the turbines at each findex. The
+        subsets are padded to the same size with turbines placed far to the side of the
+        farm, outside of all wakes.
+        """
+        n_needed = needed.sum(axis=1)
+        n_solve = n_needed.max()
+
+        # Padding turbines are spaced along the line perpendicular to the wind
+        # direction at each findex
+        center_x = (layout_x.min() + layout_x.max()) / 2
+        center_y = (layout_y.min() + layout_y.max()) / 2
+        radius = np.hypot(layout_x - center_x, layout_y - center_y).max()
+        pad_distance = (
+            (2 + 2 * self.cone_slope) * radius
+            + (self.cone_half_width + self.D) * (2 + np.arange(n_solve))
+        )
+        theta = wind_delta(self.wind_directions[findex])
+        sub_x = center_x + sind(theta)[:, None] * pad_distance[None, :]
+        sub_y = center_y + cosd(theta)[:, None] * pad_distance[None, :]
+
+        # Fill each row with the needed turbines, in order
+        turbine_index = np.where(needed, np.arange(needed.shape[1]), needed.shape[1])
+        turbine_index = np.sort(turbine_index, axis=1)[:, :n_solve]
+        is_turbine = np.arange(n_solve)[None, :] < n_needed[:, None]
+        sub_x[is_turbine] = layout_x[turbine_index[is_turbine]]
+        sub_y[is_turbine] = layout_y[turbine_index[is_turbine]]
+
+        fmodel_dict = copy.deepcopy(self.fmodel_dict)
+        fmodel_dict["farm"]["layout_x"] = sub_x[0]
+        fmodel_dict["farm"]["layout_y"] = sub_y[0]
+        fmodel_dict["farm"]["turbine_type"] = fmodel_dict["farm"]["turbine_type"][:1]
+        fmodel_dict["flow_field"]["wind_directions"] = self.wind_directions[findex]
+        fmodel_dict["flow_field"]["wind_speeds"] = self.wind_speeds[findex]
+        fmodel_dict["flow_field"]["turbulence_intensities"] = self.turbulence_intensities[findex]
+        fmodel_sub = FlorisModel(fmodel_dict)
+        fmodel_sub.core.set_findex_layouts(sub_x, sub_y)
+        fmodel_sub.run()
+
+        return fmodel_sub.get_turbine_powers(), turbine_index, is_turbine
+
+    def evaluate_move(self, tr, x, y):
+        """
+        Compute the objective of the current layout with turbine tr moved to (x, y).
+        The move is held as pending until accept_move() is called.
+        """
+        layout_x = self.layout_x.copy()
+        layout_y = self.layout_y.copy()
+        layout_x[tr] = x
+        layout_y[tr] = y
+        turbine_powers = self.turbine_powers.copy()
+
+        if self.solve_full_farm:
+            self.fmodel.set(layout_x=layout_x, layout_y=layout_y)
+            self.fmodel.run()
+            turbine_powers = self.fmodel.get_turbine_powers()
+            self._pending = (layout_x, layout_y, turbine_powers)
+            return self._objective(turbine_powers)
+
+        affected, changed, needed = self._wake_chains(tr, x, y)
+
+        # Group the wind directions by the number of turbines to solve
+        wd_affected = np.flatnonzero(affected)
+        wd_affected = wd_affected[np.argsort(needed[wd_affected].sum(axis=1))]
+        n_groups = min(self.max_chain_groups, len(wd_affected))
+        for wd_group in np.array_split(wd_affected, n_groups) if n_groups > 0 else []:
+            findex = np.flatnonzero(np.isin(self._wd_index, wd_group))
+            wd_index = self._wd_index[findex]
+            powers, turbine_index, is_turbine = self._solve_subsets(
+                layout_x,
+                layout_y,
+                findex,
+                needed[wd_index],
+            )
+
+            # Only the powers of the changed turbines are updated
+            findex_grid = np.broadcast_to(findex[:, None], is_turbine.shape)
+            update = is_turbine & np.take_along_axis(
+                changed[wd_index],
+                np.minimum(turbine_index, len(layout_x) - 1),
+                axis=1
+            )
+            turbine_powers[findex_grid[update], turbine_index[update]] = powers[update]
+
+        self._pending = (layout_x, layout_y, turbine_powers)
+        return self._objective(turbine_powers)
+
+    def accept_move(self):
+        """Make the last evaluated move the current layout."""
+        self.layout_x, self.layout_y, self.turbine_powers = self._pending
+        self.objective = self._objective(self.turbine_powers)
+        self._pending = None
+
+
 def _gen_dist_based_init(
     N, # Number of turbins to place
     step_size, #m, courseness of search grid
@@ -85,35 +322,42 @@ def _gen_dist_based_init(
     # Choose the initial point randomly
     init_x = float(np.random.randint(int(min_x),int(max_x)))
     init_y = float(np.random.randint(int(min_y),int(max_y)))
-    while not (poly_outer.contains(Point([init_x,init_y]))):
+    while not test_point_in_bounds(init_x, init_y, poly_outer):
         init_x = float(np.random.randint(int(min_x),int(max_x)))
         init_y = float(np.random.randint(int(min_y),int(max_y)))
 
     # Intialize the layout arrays
     layout_x = np.array([init_x])
     layout_y = np.array([init_y])
-    layout = np.array([layout_x, layout_y]).T
+
+    # Candidate points on the search grid that are within the boundary
+    grid_x, grid_y = np.meshgrid(
+        np.arange(min_x, max_x, step_size),
+        np.arange(min_y, max_y, step_size),
+        indexing="ij",
+    )
+    grid_x = grid_x.flatten()
+    grid_y = grid_y.flatten()
+    in_bounds = shapely.contains_xy(poly_outer, grid_x, grid_y)
+    grid_x = grid_x[in_bounds]
+    grid_y = grid_y[in_bounds]
+
+    # Distance from each candidate point to the nearest placed turbine
+    min_dist = np.hypot(grid_x - init_x, grid_y - init_y)
 
     # Now add the remaining points
     for i in range(1,N):
 
         print("Placing turbine {0} of {1}.".format(i, N))
         # Add a new turbine being as far as possible from current
-        max_dist = 0.
-        for x in np.arange(min_x, max_x,step_size):
-            for y in np.arange(min_y, max_y,step_size):
-                if poly_outer.contains(Point([x,y])):
-                    test_dist = cdist([[x,y]],layout)
-                    min_dist = np.min(test_dist)
-                    if min_dist > max_dist:
-                        max_dist = min_dist
-                        save_x = x
-                        save_y = y
+        save_index = np.argmax(min_dist)
+        save_x = grid_x[save_index]
+        save_y = grid_y[save_index]
 
         # Add point to the layout
         layout_x = np.append(layout_x,[save_x])
         layout_y = np.append(layout_y,[save_y])
-        layout = np.array([layout_x, layout_y]).T
+        min_dist = np.minimum(min_dist, np.hypot(grid_x - save_x, grid_y - save_y))
 
     # Return the layout
     return layout_x, layout_y
@@ -137,6 +381,8 @@ class LayoutOptimizationRandomSearch(LayoutOptimization):
         use_dist_based_init=True,
         random_seed=None,
         use_value=False,
+        use_incremental_objective=False,
+        n_candidates_per_step=1,
     ):
         """
         Optimize layout using genetic random search algorithm. Details of the algorithm can be found
@@ -166,10 +412,17 @@ class LayoutOptimizationRandomSearch(LayoutOptimization):
                 seconds to run the optimization for. Defaults to 600.
             interface (str): Parallel computing interface to leverage. Recommended is 'concurrent'
                 or 'multiprocessing' for local (single-system) use, and 'mpi4py' for high
-                performance computing on multiple nodes. Defaults to 'multiprocessing'.
+                performance computing on multiple nodes. With 'mpi4py', the script is run on
+                every rank of MPI.COMM_WORLD (e.g. `mpiexec -n 4 python script.py`) and the
+                individuals are split between the ranks, which all receive the results of
+                each generation. Note that 'mpi4py' no longer uses
+                mpi4py.futures.MPIPoolExecutor, so scripts previously launched with
+                `python -m mpi4py.futures` must now be launched directly with mpiexec.
+                Defaults to 'multiprocessing'.
             max_workers (int): Number of parallel workers, typically equal to the number of cores
                 you have on your system or HPC.  Defaults to None, which will use all
-                available cores.
+                available cores. With 'mpi4py', the number of workers is the number of
+                MPI ranks.
             grid_step_size (float): The coarseness of the grid used to generate the initial layout.
                 Defaults to 100.
             relegation_number (int): The number of the lowest performing individuals to be replaced
@@ -184,11 +437,28 @@ class LayoutOptimizationRandomSearch(LayoutOptimization):
                 is to maximize annual value production using the value array in the
                 FLORIS model's WindData object. If False, the optimization
                 objective is to maximize AEP. Defaults to False.
+            use_incremental_objective (bool, optional): If True, each move of a single
+                turbine is evaluated by solving only the wind conditions in which that
+                turbine interacts with the others through wakes, reusing the cached turbine
+                powers for the remaining conditions. This allows many more moves per
+                iteration at the cost of a very small approximation. The layout of each
+                individual is evaluated in full at the end of every iteration, so the
+                reported objectives are exact. Not available with enable_geometric_yaw or
+                a WindRoseWRG. Defaults to False.
+            n_candidates_per_step (int, optional): The number of candidate moves each
+                individual proposes at every step. All candidates are moves of a single
+                turbine away from the current layout, drawn using distance_pmf, and are
+                evaluated together in one vectorized FLORIS calculation; the best of them
+                is accepted if it improves the objective. If 1, moves are proposed and
+                evaluated one at a time. Cannot be combined with
+                use_incremental_objective. Defaults to 1.
         """
         # The parallel computing interface to use
         if interface == "mpi4py":
-            import mpi4py.futures as mp
-            self._PoolExecutor = mp.MPIPoolExecutor
+            from mpi4py import MPI
+            self._comm = MPI.COMM_WORLD
+            self._PoolExecutor = None
+            max_workers = self._comm.Get_size()
         elif interface == "multiprocessing":
             import multiprocessing as mp
             self._PoolExecutor = mp.Pool
@@ -200,9 +470,9 @@ class LayoutOptimizationRandomSearch(LayoutOptimization):
                     "Parallelization not possible with interface=None. "
                     +"Reducing n_individuals to 1 and ignoring max_workers."
                 )
-                self._PoolExecutor = None
                 max_workers = None
                 n_individuals = 1
+            self._PoolExecutor = None
 
         # elif interface == "concurrent":
         #     from concurrent.futures import ProcessPoolExecutor
@@ -227,6 +497,25 @@ class LayoutOptimizationRandomSearch(LayoutOptimization):
             raise ValueError("relegation_number must be less than n_individuals / 2.")
         self.relegation_number = relegation_number
 
+        # Incremental evaluation assumes the yaw angles and frequencies are independent
+        # of the layout
+        if use_incremental_objective and (
+            enable_geometric_yaw or isinstance(fmodel.wind_data, WindRoseWRG)
+        ):
+            raise ValueError(
+                "use_incremental_objective cannot be used with enable_geometric_yaw "
+                "or a WindRoseWRG."
+            )
+        self.use_incremental_objective = use_incremental_objective
+
+        if n_candidates_per_step < 1:
+            raise ValueError("n_candidates_per_step must be at least 1.")
+        if n_candidates_per_step > 1 and use_incremental_objective:
+            raise ValueError(
+                "n_candidates_per_step cannot be used with use_incremental_objective."
+            )
+        self.n_candidates_per_step = n_candidates_per_step
+
         # Store the rotor diameter and number of turbines
         self.D = fmodel.core.farm.rotor_diameters.max()
         if not all(fmodel.core.farm.rotor_diameters == self.D):
@@ -261,8 +550,10 @@ class LayoutOptimizationRandomSearch(LayoutOptimization):
         # Process and save the step distribution
         self._process_dist_pmf(distance_pmf)
 
-        # Store the Core dictionary
-        self.fmodel_dict = self.fmodel.core.as_dict()
+        # Store the inputs to rebuild the FlorisModel in the worker processes
+        self.fmodel_snapshot, (self.fmodel_set_kwargs,) = self.fmodel._get_worker_inputs(
+            [np.arange(self.fmodel.n_findex)]
+        )
 
         # Save the grid step size
         self.grid_step_size = grid_step_size
@@ -460,14 +751,7 @@ class LayoutOptimizationRandomSearch(LayoutOptimization):
             for i in range(self.n_individuals)
         ]
 
-        if self._PoolExecutor: # Parallelized
-            with self._PoolExecutor(self.max_workers) as p:
-                # This code is not currently necessary, but leaving in case implement
-                # concurrent later, based on parallel_computing_interface.py
-                if (self.interface == "mpi4py") or (self.interface == "multiprocessing"):
-                        out = p.starmap(_gen_dist_based_init, multiargs)
-        else: # Parallelization not activated
-            out = [_gen_dist_based_init(*multiargs[0])]
+        out = self._parallel_starmap(_gen_dist_based_init, multiargs)
 
         # Unpack out into the candidate layouts
         for i in range(self.n_individuals):
@@ -530,25 +814,23 @@ class LayoutOptimizationRandomSearch(LayoutOptimization):
                 self.objective_candidate[i],
                 self.x_candidate[i, :],
                 self.y_candidate[i, :],
-                self.fmodel_dict,
-                self.fmodel.wind_data,
+                self.fmodel_snapshot,
+                self.fmodel_set_kwargs,
                 self.min_dist,
                 self._boundary_polygon,
                 self.distance_pmf,
                 self.enable_geometric_yaw,
                 multi_random_seeds[i],
                 self.use_value,
-                self.debug
+                self.debug,
+                self.use_incremental_objective,
+                self.n_candidates_per_step,
             )
                 for i in range(self.n_individuals)
         ]
 
         # Run the single individual optimization in parallel
-        if self._PoolExecutor: # Parallelized
-            with self._PoolExecutor(self.max_workers) as p:
-                out = p.starmap(_single_individual_opt, multiargs)
-        else: # Parallelization not activated
-            out = [_single_individual_opt(*multiargs[0])]
+        out = self._parallel_starmap(_single_individual_opt, multiargs)
 
         # Unpack the results
         for i in range(self.n_individuals):
@@ -562,6 +844,29 @@ class LayoutOptimizationRandomSearch(LayoutOptimization):
         # Evaluate the individuals for this step
         self._evaluate_opt_step()
 
+    def _parallel_starmap(self, function, multiargs):
+        """
+        Evaluate function for the arguments of each individual using the parallel
+        computing interface.
+        """
+        if self.interface == "mpi4py": # Distributed across the MPI ranks
+            return mpi_starmap(function, multiargs, self._comm)
+        elif self._PoolExecutor: # Parallelized
+            with self._PoolExecutor(self.max_workers) as p:
+                return p.starmap(function, multiargs)
+        else: # Parallelization not activated
+            return [function(*multiargs[0])]
+
+    def _continue_optimization(self):
+        """
+        Check whether there is time left to run another generation.
+        """
+        continue_optimization = timerpc() < self._opt_stop_time
+        if self.interface == "mpi4py":
+            # All ranks must run the same number of generations, so follow rank 0
+            continue_optimization = self._comm.bcast(continue_optimization, root=0)
+        return continue_optimization
+
     def _finalize_optimization(self):
         """
         Package and print final results.
@@ -609,7 +914,7 @@ class LayoutOptimizationRandomSearch(LayoutOptimization):
         self._initialize_optimization()
 
         # Run generations until the overall stop time
-        while timerpc() < self._opt_stop_time:
+        while self._continue_optimization():
             self._run_optimization_generation()
 
         self._finalize_optimization()
@@ -639,15 +944,17 @@ def _single_individual_opt(
     initial_objective,
     layout_x,
     layout_y,
-    fmodel_dict,
-    wind_data,
+    fmodel_snapshot,
+    set_kwargs,
     min_dist,
     poly_outer,
     dist_pmf,
     enable_geometric_yaw,
     s,
     use_value,
-    debug
+    debug,
+    use_incremental_objective=False,
+    n_candidates=1,
 ):
     # Set random seed
     np.random.seed(s)
@@ -659,7 +966,7 @@ def _single_individual_opt(
     num_objective_calls = 0
 
     # Get the fmodel
-    fmodel_ = _load_local_floris_object(fmodel_dict, wind_data)
+    fmodel_ = _load_local_floris_object(fmodel_snapshot, set_kwargs)
 
     # Initialize local variables
     num_turbines = len(layout_x)
@@ -676,6 +983,12 @@ def _single_individual_opt(
     else: # yaw_angles will always be none
         yaw_angles = None
 
+    # Establish the incremental objective evaluator, if desired
+    if use_incremental_objective:
+        incremental_objective = _IncrementalObjective(fmodel_, layout_x, layout_y, use_value)
+        initial_layout_x = layout_x.copy()
+        initial_layout_y = layout_y.copy()
+
     # We have a beta feature to maintain momentum, i.e., if a move improves
     # the objective, we try to keep moving in that direction. This is currently
     # disabled.
@@ -695,6 +1008,23 @@ def _single_individual_opt(
         elif debug:
             dd += 1
 
+        if n_candidates > 1:
+            current_objective, num_candidates = _batched_candidate_step(
+                current_objective,
+                layout_x,
+                layout_y,
+                fmodel_,
+                min_dist,
+                poly_outer,
+                dist_pmf,
+                n_candidates,
+                stop_time,
+                yaw_opt if enable_geometric_yaw else None,
+                use_value,
+            )
+            num_objective_calls += num_candidates
+            continue
+
         if not use_momentum:
             get_new_point = True
 
@@ -739,11 +1069,16 @@ def _single_individual_opt(
             yaw_angles = np.vstack(df_opt['yaw_angles_opt'])
 
         num_objective_calls += 1
-        test_objective = _get_objective(layout_x, layout_y, fmodel_, yaw_angles, use_value)
+        if use_incremental_objective:
+            test_objective = incremental_objective.evaluate_move(tr, test_x, test_y)
+        else:
+            test_objective = _get_objective(layout_x, layout_y, fmodel_, yaw_angles, use_value)
 
         if test_objective > current_objective:
             # Accept the change
             current_objective = test_objective
+            if use_incremental_objective:
+                incremental_objective.accept_move()
 
             # If not a random point this cycle and it did improve things
             # try not getting a new point
@@ -756,5 +1091,98 @@ def _single_individual_opt(
             layout_y[tr] = original_y
             get_new_point = True
 
+    # The incremental objective is approximate and its error grows with every accepted
+    # move, so the final layout is evaluated in full. It is only kept if it improves on
+    # the initial layout.
+    if use_incremental_objective and current_objective != initial_objective:
+        current_objective = get_objectives_for_layouts(
+            fmodel_,
+            layout_x,
+            layout_y,
+            use_value=use_value,
+        )[0]
+        if current_objective <= initial_objective:
+            current_objective = initial_objective
+            layout_x[:] = initial_layout_x
+            layout_y[:] = initial_layout_y
+
     # Return the best result from this individual
     return current_objective, layout_x, layout_y, num_objective_calls
+
+def _batched_candidate_step(
+    current_objective,
+    layout_x,
+    layout_y,
+    fmodel,
+    min_dist,
+    poly_outer,
+    dist_pmf,
+    n_candidates,
+    stop_time,
+    yaw_opt,
+    use_value,
+):
+    """
+    Propose n_candidates moves of single turbines away from the current layout, evaluate
+    them together and accept the best one if it improves the objective. layout_x and
+    layout_y are updated in place. Returns the new objective and the number of
+    candidates evaluated.
+
+    At most 100 moves are tried for each candidate, so that the step ends without a time
+    limit, as in debug mode, when the layout has few or no valid moves.
+    """
+    num_turbines = len(layout_x)
+    candidates_x = []
+    candidates_y = []
+    max_attempts = 100 * n_candidates
+    attempts = 0
+    while len(candidates_x) < n_candidates and timerpc() < stop_time:
+        if attempts >= max_attempts:
+            break
+        attempts += 1
+
+        # Randomly select a turbine, direction and distance to move
+        tr = np.random.randint(0,num_turbines)
+        rand_dir = np.random.uniform(low=0.0, high=2*np.pi)
+        rand_dist = np.random.choice(dist_pmf["d"], p=dist_pmf["p"])
+
+        test_x = layout_x[tr] + np.cos(rand_dir) * rand_dist
+        test_y = layout_y[tr] + np.sin(rand_dir) * rand_dist
+        if not test_point_in_bounds(test_x, test_y, poly_outer):
+            continue
+
+        candidate_x = layout_x.copy()
+        candidate_y = layout_y.copy()
+        candidate_x[tr] = test_x
+        candidate_y[tr] = test_y
+        if not test_min_dist(candidate_x, candidate_y, min_dist):
+            continue
+
+        candidates_x.append(candidate_x)
+        candidates_y.append(candidate_y)
+
+    if len(candidates_x) == 0:
+        return current_objective, 0
+    candidates_x = np.array(candidates_x)
+    candidates_y = np.array(candidates_y)
+
+    if yaw_opt is not None: # Select appropriate yaw angles for each candidate
+        yaw_angles = get_geoyaw_angles_for_layouts(yaw_opt, candidates_x, candidates_y)
+    else:
+        yaw_angles = None
+
+    test_objectives = get_objectives_for_layouts(
+        fmodel,
+        candidates_x,
+        candidates_y,
+        yaw_angles=yaw_angles,
+        use_value=use_value,
+    )
+
+    best = np.argmax(test_objectives)
+    if test_objectives[best] > current_objective:
+        current_objective = test_objectives[best]
+        layout_x[:] = candidates_x[best]
+        layout_y[:] = candidates_y[best]
+
+    return current_objective, len(candidates_x)
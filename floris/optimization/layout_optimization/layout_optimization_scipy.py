@@ -2,10 +2,13 @@
 import matplotlib.pyplot as plt
 import numpy as np
 from scipy.optimize import minimize
-from scipy.spatial.distance import cdist
-from shapely.geometry import Point
 
-from .layout_optimization_base import LayoutOptimization, list_depth
+from .layout_optimization_base import (
+    distance_from_boundaries,
+    LayoutOptimization,
+    list_depth,
+    space_constraint,
+)
 
 
 class LayoutOptimizationScipy(LayoutOptimization):
@@ -24,6 +27,7 @@ class LayoutOptimizationScipy(LayoutOptimization):
         optOptions=None,
         enable_geometric_yaw=False,
         use_value=False,
+        batch_gradient=True,
     ):
         """
         Args:
@@ -45,6 +49,11 @@ class LayoutOptimizationScipy(LayoutOptimization):
                 is to maximize annual value production using the value array in the
                 FLORIS model's WindData object. If False, the optimization
                 objective is to maximize AEP. Defaults to False.
+            batch_gradient (bool, optional): If True, the finite-difference
+                gradient of the objective is computed by solving all of the
+                perturbed layouts together in a single vectorized FLORIS
+                calculation rather than letting Scipy evaluate the objective
+                once per design variable. Defaults to True.
         """
         if list_depth(boundaries) > 1 and hasattr(boundaries[0][0], "__len__"):
             raise NotImplementedError(
@@ -86,6 +95,8 @@ class LayoutOptimizationScipy(LayoutOptimization):
         else:
             self.optOptions = default_optOptions
 
+        self.batch_gradient = batch_gradient
+
         self._generate_constraints()
 
 
@@ -100,6 +111,7 @@ class LayoutOptimizationScipy(LayoutOptimization):
             self._obj_func,
             self.x0,
             method=self.solver,
+            jac=self._obj_jac if self.batch_gradient else None,
             bounds=self.bnds,
             constraints=self.cons,
             options=self.optOptions,
@@ -131,6 +143,30 @@ class LayoutOptimizationScipy(LayoutOptimization):
             self._aep_record.append(aep)
             return aep
 
+    def _obj_jac(self, locs):
+        # Forward-difference gradient of _obj_func, matching the steps Scipy takes
+        # by default, with the base and all perturbed layouts solved together
+        locs = np.array(locs, dtype=float)
+        step = np.full(len(locs), self.optOptions["eps"])
+
+        # Step backward for variables where a forward step would leave the bounds
+        upper_bounds = np.array([b[1] for b in self.bnds], dtype=float)
+        step[locs + step > upper_bounds] *= -1
+        dx = (locs + step) - locs
+
+        locs_perturbed = np.vstack([locs, locs + np.diag(dx)])
+        layout_x = self._unnorm(locs_perturbed[:, 0 : self.nturbs], self.xmin, self.xmax)
+        layout_y = self._unnorm(
+            locs_perturbed[:, self.nturbs : 2 * self.nturbs],
+            self.ymin,
+            self.ymax
+        )
+        yaw_angles = self._get_geoyaw_angles_for_layouts(layout_x, layout_y)
+        objectives = self._get_objectives_for_layouts(layout_x, layout_y, yaw_angles)
+        self._num_aep_calls += len(objectives)
+
+        f = -1 * objectives / self.initial_AEP_or_AVP
+        return (f[1:] - f[0]) / dx
 
     def _change_coordinates(self, locs):
         # Parse the layout coordinates
@@ -148,10 +184,12 @@ class LayoutOptimizationScipy(LayoutOptimization):
         tmp1 = {
             "type": "ineq",
             "fun": lambda x, *args: self._space_constraint(x),
+            "jac": lambda x, *args: self._space_constraint_jac(x),
         }
         tmp2 = {
             "type": "ineq",
             "fun": lambda x: self._distance_from_boundaries(x),
+            "jac": lambda x: self._distance_from_boundaries_jac(x),
         }
 
         self.cons = [tmp1, tmp2]
@@ -159,54 +197,43 @@ class LayoutOptimizationScipy(LayoutOptimization):
     def _set_opt_bounds(self):
         self.bnds = [(0.0, 1.0) for _ in range(2 * self.nturbs)]
 
-    def _space_constraint(self, x_in, rho=500):
-        x = [
-            self._unnorm(valx, self.xmin, self.xmax)
-            for valx in x_in[0 : self.nturbs]
-        ]
-        y =  [
-            self._unnorm(valy, self.ymin, self.ymax)
-            for valy in x_in[self.nturbs : 2 * self.nturbs]
-        ]
+    def _unnorm_locs(self, x_in):
+        x = self._unnorm(x_in[0 : self.nturbs], self.xmin, self.xmax)
+        y = self._unnorm(x_in[self.nturbs : 2 * self.nturbs], self.ymin, self.ymax)
+        return x, y
 
-        # Calculate distances between turbines
-        locs = np.vstack((x, y)).T
-        distances = cdist(locs, locs)
-        arange = np.arange(distances.shape[0])
-        distances[arange, arange] = 1e10
-        dist = np.min(distances, axis=0)
+    def _space_constraint(self, x_in, rho=500):
+        x, y = self._unnorm_locs(x_in)
+        KS_constraint, _ = space_constraint(x, y, self.min_dist, rho=rho)
 
-        g = 1 - np.array(dist) / self.min_dist
+        return -1*KS_constraint
 
-        # Following code copied from OpenMDAO KSComp().
-        # Constraint is satisfied when KS_constraint <= 0
-        g_max = np.max(np.atleast_2d(g), axis=-1)[:, np.newaxis]
-        g_diff = g - g_max
-        exponents = np.exp(rho * g_diff)
-        summation = np.sum(exponents, axis=-1)[:, np.newaxis]
-        KS_constraint = g_max + 1.0 / rho * np.log(summation)
+    def _space_constraint_jac(self, x_in, rho=500):
+        x, y = self._unnorm_locs(x_in)
+        _, _, grad_x, grad_y = space_constraint(
+            x, y, self.min_dist, rho=rho, return_gradient=True
+        )
 
-        return -1*KS_constraint[0][0]
+        return -1*np.concatenate(
+            (grad_x * (self.xmax - self.xmin), grad_y * (self.ymax - self.ymin))
+        )
 
     def _distance_from_boundaries(self, x_in):
-        x = [
-            self._unnorm(valx, self.xmin, self.xmax)
-            for valx in x_in[0 : self.nturbs]
-        ]
-        y =  [
-            self._unnorm(valy, self.ymin, self.ymax)
-            for valy in x_in[self.nturbs : 2 * self.nturbs]
-        ]
-        boundary_con = np.zeros(self.nturbs)
-        for i in range(self.nturbs):
-            loc = Point(x[i], y[i])
-            boundary_con[i] = loc.distance(self._boundary_line)
-            if self._boundary_polygon.contains(loc) is True:
-                boundary_con[i] *= 1.0
-            else:
-                boundary_con[i] *= -1.0
-
-        return boundary_con
+        x, y = self._unnorm_locs(x_in)
+        return distance_from_boundaries(x, y, self._boundary_polygon)
+
+    def _distance_from_boundaries_jac(self, x_in):
+        # Each turbine's distance depends only on its own coordinates
+        x, y = self._unnorm_locs(x_in)
+        _, grad_x, grad_y = distance_from_boundaries(
+            x, y, self._boundary_polygon, return_gradient=True
+        )
+        arange = np.arange(self.nturbs)
+        jac = np.zeros((self.nturbs, 2 * self.nturbs))
+        jac[arange, arange] = grad_x * (self.xmax - self.xmin)
+        jac[arange, self.nturbs + arange] = grad_y * (self.ymax - self.ymin)
+
+        return jac
 
     def _get_initial_and_final_locs(self):
         x_initial = [
@@ -1,13 +1,25 @@
 from __future__ import annotations
 
-import copy
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from pathlib import Path
-from time import perf_counter as timerpc
 
 import numpy as np
 
-from floris.core import State
+from floris.core import (
+    Profiler,
+    profiling,
+    State,
+    TurbineCubatureGrid,
+    TurbineGrid,
+)
+from floris.core.profiler import profiled_phase
 from floris.floris_model import FlorisModel
+from floris.utilities import mpi_starmap
+
+
+# Flow field outputs of each split that are combined into the flow field of the ParFlorisModel
+FLOW_FIELD_OUTPUTS = ("u", "v", "w", "turbulence_intensity_field")
 
 
 class ParFlorisModel(FlorisModel):
@@ -37,9 +49,18 @@ class ParFlorisModel(FlorisModel):
                 - **wake**: See `floris.simulation.wake.WakeManager` for more details.
                 - **logging**: See `floris.simulation.core.Core` for more details.
             interface: The parallelization interface to use. Options are "multiprocessing",
-               "pathos", and "concurrent", with possible future support for "mpi4py"
+               "pathos", "concurrent", "mpi4py", and "threads". With "mpi4py", the script is
+               run on every rank of MPI.COMM_WORLD (e.g. `mpiexec -n 4 python script.py`); each
+               call to run() must then be made on all ranks. The model on rank 0 is broadcast
+               to the other ranks, which split the wind conditions between them and all
+               receive the combined results. With "threads", the wind
+               conditions are solved in slabs by a pool of threads in this process, which share
+               the model's arrays and write the results in place, so that nothing is copied or
+               pickled. The threads run concurrently while NumPy releases the GIL, or fully on a
+               free-threaded build of Python.
             max_workers: The maximum number of workers to use. Defaults to -1, which then
-               takes the number of CPUs available.
+               takes the number of CPUs available. With "mpi4py", the number of workers is
+               the number of MPI ranks.
             n_wind_condition_splits: The number of wind conditions to split the simulation over.
                Defaults to the same as max_workers.
             return_turbine_powers_only: Whether to return only the turbine powers.
@@ -79,10 +100,14 @@ class ParFlorisModel(FlorisModel):
                 from multiprocessing import cpu_count
                 max_workers = cpu_count()
             self._PoolExecutor = ProcessPoolExecutor
-        elif interface in ["mpi4py"]:
-            raise NotImplementedError(
-                f"Parallelization interface {interface} not yet supported."
-            )
+        elif interface == "mpi4py":
+            from mpi4py import MPI
+            self._comm = MPI.COMM_WORLD
+            max_workers = self._comm.Get_size()
+        elif interface == "threads":
+            if max_workers == -1:
+                from multiprocessing import cpu_count
+                max_workers = cpu_count()
         elif interface is None:
             self.logger.warning(
                 "No parallelization interface specified. Running in serial mode."
@@ -94,7 +119,7 @@ class ParFlorisModel(FlorisModel):
         else:
             raise ValueError(
                 f"Invalid parallelization interface {interface}. "
-                "Options are 'multiprocessing', 'pathos', or 'concurrent'."
+                "Options are 'multiprocessing', 'pathos', 'concurrent', 'mpi4py', or 'threads'."
             )
 
         self._interface = interface
@@ -106,9 +131,57 @@ class ParFlorisModel(FlorisModel):
         self.return_turbine_powers_only = return_turbine_powers_only
         self.print_timings = print_timings
 
-    def run(self) -> None:
+    def run(self, profile: bool = False) -> Profiler | None:
         """
         Run the FLORIS model in parallel.
+
+        Args:
+            profile (bool, optional): Record the time spent in the parallel preprocessing,
+                loop execution and postprocessing, and in the phases of the calculations
+                made in this process, with a :py:class:`~floris.core.profiler.Profiler`.
+                print_timings uses the same profiler. Defaults to False.
+
+        Returns:
+            Profiler | None: The profiler, if profile is True.
+        """
+        if not (profile or self.print_timings):
+            self._run_parallel(None)
+            return None
+
+        with profiling() as profiler:
+            self._run_parallel(profiler)
+
+        if self.print_timings:
+            print("===============================================================================")
+            if self.interface is None:
+                print(
+                    "Total time spent for serial calculation (interface=None): "
+                    f"{profiler.total_time:.3f} s"
+                )
+            else:
+                print(
+                    "Total time spent for parallel calculation "
+                    f"({self.max_workers} workers): {profiler.total_time:.3f} s"
+                )
+                print(
+                    "  Time spent in parallel preprocessing: "
+                    f"{profiler.phases['preprocessing'].time:.3f} s"
+                )
+                print(
+                    "  Time spent in parallel loop execution: "
+                    f"{profiler.phases['loop_execution'].time:.3f} s."
+                )
+                print(
+                    "  Time spent in parallel postprocessing: "
+                    f"{profiler.phases['postprocessing'].time:.3f} s"
+                )
+
+        return profiler if profile else None
+
+    def _run_parallel(self, profiler: Profiler | None) -> None:
+        """
+        Run the FLORIS model with the parallelization interface, timing the preprocessing,
+        loop execution and postprocessing with the profiler, if any.
         """
 
         if self.return_turbine_powers_only:
@@ -120,84 +193,132 @@ class ParFlorisModel(FlorisModel):
             # the splits, and return them somehow.
             self._stored_turbine_powers = None # Temporary
         if self.interface is None:
-            t0 = timerpc()
             super().run()
-            t1 = timerpc()
-        elif self.interface == "multiprocessing":
-            t0 = timerpc()
-            self.core.initialize_domain()
-            parallel_run_inputs = self._preprocessing()
-            t1 = timerpc()
-            if self.return_turbine_powers_only:
-                with self._PoolExecutor(self.max_workers) as p:
-                    self._turbine_powers_split = p.starmap(
-                        _parallel_run_powers_only,
-                        parallel_run_inputs
-                    )
-            else:
-                with self._PoolExecutor(self.max_workers) as p:
-                    self._fmodels_split = p.starmap(_parallel_run, parallel_run_inputs)
-            t2 = timerpc()
-            self._postprocessing()
-            self.core.farm.finalize(self.core.grid.unsorted_indices)
-            self.core.state = State.USED
-            t3 = timerpc()
-        elif self.interface == "pathos":
-            t0 = timerpc()
+            return
+        if self.interface == "threads":
+            self._run_threads(profiler)
+            return
+
+        with profiled_phase(profiler, "preprocessing"):
             self.core.initialize_domain()
-            parallel_run_inputs = self._preprocessing()
-            t1 = timerpc()
-            if self.return_turbine_powers_only:
-                self._turbine_powers_split = self.pathos_pool.map(
-                    _parallel_run_powers_only_map,
-                    parallel_run_inputs
-                )
+            if self.interface == "mpi4py":
+                parallel_run_inputs = self._mpi_preprocessing()
             else:
-                self._fmodels_split = self.pathos_pool.map(
-                    _parallel_run_map,
-                    parallel_run_inputs
-                )
-            t2 = timerpc()
-            self._postprocessing()
-            self.core.farm.finalize(self.core.grid.unsorted_indices)
-            self.core.state = State.USED
-            t3 = timerpc()
-        elif self.interface == "concurrent":
-            t0 = timerpc()
-            self.core.initialize_domain()
-            parallel_run_inputs = self._preprocessing()
-            t1 = timerpc()
-            if self.return_turbine_powers_only:
-                with self._PoolExecutor(self.max_workers) as p:
-                    self._turbine_powers_split = p.map(
+                parallel_run_inputs = self._preprocessing()
+
+        with profiled_phase(profiler, "loop_execution"):
+            if self.interface == "multiprocessing":
+                if self.return_turbine_powers_only:
+                    with self._PoolExecutor(self.max_workers) as p:
+                        self._turbine_powers_split = p.starmap(
+                            _parallel_run_powers_only,
+                            parallel_run_inputs
+                        )
+                else:
+                    with self._PoolExecutor(self.max_workers) as p:
+                        self._fmodels_split = p.starmap(_parallel_run, parallel_run_inputs)
+            elif self.interface == "pathos":
+                if self.return_turbine_powers_only:
+                    self._turbine_powers_split = self.pathos_pool.map(
                         _parallel_run_powers_only_map,
                         parallel_run_inputs
                     )
-                    self._turbine_powers_split = list(self._turbine_powers_split)
-            else:
-                with self._PoolExecutor(self.max_workers) as p:
-                    self._fmodels_split = p.map(
+                else:
+                    self._fmodels_split = self.pathos_pool.map(
                         _parallel_run_map,
                         parallel_run_inputs
                     )
-                    self._fmodels_split = list(self._fmodels_split)
-            t2 = timerpc()
+            elif self.interface == "concurrent":
+                if self.return_turbine_powers_only:
+                    with self._PoolExecutor(self.max_workers) as p:
+                        self._turbine_powers_split = p.map(
+                            _parallel_run_powers_only_map,
+                            parallel_run_inputs
+                        )
+                        self._turbine_powers_split = list(self._turbine_powers_split)
+                else:
+                    with self._PoolExecutor(self.max_workers) as p:
+                        self._fmodels_split = p.map(
+                            _parallel_run_map,
+                            parallel_run_inputs
+                        )
+                        self._fmodels_split = list(self._fmodels_split)
+            elif self.interface == "mpi4py":
+                snapshot, fmodel, findex_splits = parallel_run_inputs
+                outputs_split = mpi_starmap(
+                    partial(_mpi_run_split, snapshot, fmodel, self.return_turbine_powers_only),
+                    findex_splits,
+                    self._comm
+                )
+                if self.return_turbine_powers_only:
+                    self._turbine_powers_split = outputs_split
+                else:
+                    self._flow_fields_split = outputs_split
+
+        with profiled_phase(profiler, "postprocessing"):
             self._postprocessing()
             self.core.farm.finalize(self.core.grid.unsorted_indices)
             self.core.state = State.USED
-            t3 = timerpc()
-        if self.print_timings:
-            print("===============================================================================")
-            if self.interface is None:
-                print(f"Total time spent for serial calculation (interface=None): {t1 - t0:.3f} s")
+
+    def _run_threads(self, profiler: Profiler | None) -> None:
+        """
+        Run the FLORIS model with the "threads" interface. The findices are split into slabs of
+        consecutive findices, and each thread solves a slab through views of the farm, flow
+        field and grid of this model. The threads write the solutions into arrays preallocated
+        for all findices, which are then finalized together as in a serial run.
+        """
+        with profiled_phase(profiler, "preprocessing"):
+            self.core.initialize_domain()
+            solver = self.core.select_solver()
+
+            # The flow field of other grids is solved from the turbine grid across all
+            # findices, so only the turbine grids are split
+            n_findex = self.core.flow_field.n_findex
+            if isinstance(self.core.grid, (TurbineGrid, TurbineCubatureGrid)):
+                n_wind_condition_splits = min(self.n_wind_condition_splits, n_findex)
             else:
-                print(
-                    "Total time spent for parallel calculation "
-                    f"({self.max_workers} workers): {t3-t0:.3f} s"
+                n_wind_condition_splits = 1
+            findex_slabs = [
+                slice(findices[0], findices[-1] + 1)
+                for findices in np.array_split(np.arange(n_findex), n_wind_condition_splits)
+            ]
+
+            shape = self.core.flow_field.u_initial_sorted.shape
+            outputs = {
+                "u_sorted": np.empty(shape),
+                "v_sorted": np.empty(shape),
+                "w_sorted": np.empty(shape),
+                "turbulence_intensity_field_sorted": np.empty(shape),
+            }
+
+            # The solvers that average the turbulence intensity at each turbine replace this
+            # attribute, whose shape depends on the solver, so it is gathered from each slab
+            ti_avg_initial = self.core.flow_field.turbulence_intensity_field_sorted_avg
+            ti_avg_slabs = [None] * len(findex_slabs)
+
+        def solve_slab(i: int, findices: slice) -> None:
+            farm, flow_field, grid = self.core.findex_slab(findices)
+            solver(farm, flow_field, grid, self.core.wake)
+            for name, output in outputs.items():
+                output[findices] = getattr(flow_field, name)
+            if flow_field.turbulence_intensity_field_sorted_avg is not ti_avg_initial:
+                ti_avg_slabs[i] = flow_field.turbulence_intensity_field_sorted_avg
+
+        with profiled_phase(profiler, "loop_execution"):
+            with ThreadPoolExecutor(self.max_workers) as executor:
+                # Consume the results so that any errors in the threads are raised here
+                list(executor.map(solve_slab, range(len(findex_slabs)), findex_slabs))
+
+        with profiled_phase(profiler, "postprocessing"):
+            for name, output in outputs.items():
+                setattr(self.core.flow_field, name, output)
+            if all(ti_avg is not None for ti_avg in ti_avg_slabs):
+                self.core.flow_field.turbulence_intensity_field_sorted_avg = np.concatenate(
+                    ti_avg_slabs
                 )
-                print(f"  Time spent in parallel preprocessing: {t1-t0:.3f} s")
-                print(f"  Time spent in parallel loop execution: {t2-t1:.3f} s.")
-                print(f"  Time spent in parallel postprocessing: {t3-t2:.3f} s")
+            self.core.finalize()
+            if self.return_turbine_powers_only:
+                self._stored_turbine_powers = super()._get_turbine_powers()
 
     def _preprocessing(self):
         """
@@ -210,37 +331,40 @@ class ParFlorisModel(FlorisModel):
             [n_wind_condition_splits, self.core.flow_field.n_findex]
         )
 
-        # Prepare the input arguments for parallel execution
-        fmodel_dict = self.core.as_dict()
+        # Prepare the input arguments for parallel execution. All workers receive the same
+        # snapshot, which they set to the wind conditions and control setpoints of their split.
         wind_condition_id_splits = np.array_split(
             np.arange(self.core.flow_field.n_findex),
             n_wind_condition_splits,
         )
-        multiargs = []
-        for wc_id_split in wind_condition_id_splits:
-            # for ws_id_split in wind_speed_id_splits:
-            fmodel_dict_split = copy.deepcopy(fmodel_dict)
-            wind_directions = self.core.flow_field.wind_directions[wc_id_split]
-            wind_speeds = self.core.flow_field.wind_speeds[wc_id_split]
-            turbulence_intensities = self.core.flow_field.turbulence_intensities[wc_id_split]
-
-            # Extract and format all control setpoints as a dict that can be unpacked later
-            control_setpoints_subset = {
-                "yaw_angles": self.core.farm.yaw_angles[wc_id_split, :],
-                "power_setpoints": self.core.farm.power_setpoints[wc_id_split, :],
-                "awc_modes": self.core.farm.awc_modes[wc_id_split, :],
-                "awc_amplitudes": self.core.farm.awc_amplitudes[wc_id_split, :],
-                "awc_frequencies": self.core.farm.awc_frequencies[wc_id_split, :],
-            }
-            fmodel_dict_split["flow_field"]["wind_directions"] = wind_directions
-            fmodel_dict_split["flow_field"]["wind_speeds"] = wind_speeds
-            fmodel_dict_split["flow_field"]["turbulence_intensities"] = turbulence_intensities
-
-            # Prepare lightweight data to pass along
-            multiargs.append((fmodel_dict_split, control_setpoints_subset))
+        snapshot, set_kwargs = self._get_worker_inputs(wind_condition_id_splits)
+        multiargs = [(snapshot, set_kwargs_split) for set_kwargs_split in set_kwargs]
 
         return multiargs
 
+    def _mpi_preprocessing(self):
+        """
+        Prepare the model and the findex splits for the "mpi4py" interface. The state of the
+        model on rank 0 is broadcast to all ranks once, so that mpi_starmap only needs to
+        scatter the findices of each split, and gather the outputs of each split.
+        """
+        if self._comm.Get_rank() == 0:
+            n_findex = self.core.flow_field.n_findex
+            worker_inputs = self._get_worker_inputs([np.arange(n_findex)])
+            findex_splits = [
+                (findices,) for findices in np.array_split(
+                    np.arange(n_findex),
+                    min(self.n_wind_condition_splits, n_findex),
+                )
+            ]
+        else:
+            worker_inputs = None
+            findex_splits = None
+        snapshot, (set_kwargs,) = self._comm.bcast(worker_inputs, root=0)
+        fmodel = FlorisModel._from_worker_inputs(snapshot, set_kwargs)
+
+        return snapshot, fmodel, findex_splits
+
     def _postprocessing(self):
         # Append the remaining flow_fields
         # Could consider adding a merge method to the FlowField class
@@ -249,33 +373,15 @@ class ParFlorisModel(FlorisModel):
         if self.return_turbine_powers_only:
             self._stored_turbine_powers = np.vstack(self._turbine_powers_split)
         else:
-            # Ensure fields to set have correct dimensions
-            self.core.flow_field.u = self._fmodels_split[0].core.flow_field.u
-            self.core.flow_field.v = self._fmodels_split[0].core.flow_field.v
-            self.core.flow_field.w = self._fmodels_split[0].core.flow_field.w
-            self.core.flow_field.turbulence_intensity_field = \
-                self._fmodels_split[0].core.flow_field.turbulence_intensity_field
-
-            for fm in self._fmodels_split[1:]:
-                self.core.flow_field.u = np.append(
-                    self.core.flow_field.u,
-                    fm.core.flow_field.u,
-                    axis=0
-                )
-                self.core.flow_field.v = np.append(
-                    self.core.flow_field.v,
-                    fm.core.flow_field.v,
-                    axis=0
-                )
-                self.core.flow_field.w = np.append(
-                    self.core.flow_field.w,
-                    fm.core.flow_field.w,
-                    axis=0
-                )
-                self.core.flow_field.turbulence_intensity_field = np.append(
-                    self.core.flow_field.turbulence_intensity_field,
-                    fm.core.flow_field.turbulence_intensity_field,
-                    axis=0
+            if self.interface != "mpi4py":
+                self._flow_fields_split = [
+                    _get_flow_field_outputs(fm) for fm in self._fmodels_split
+                ]
+            for name in FLOW_FIELD_OUTPUTS:
+                setattr(
+                    self.core.flow_field,
+                    name,
+                    np.concatenate([ff[name] for ff in self._flow_fields_split], axis=0),
                 )
 
     def _get_turbine_powers(self):
@@ -327,32 +433,60 @@ class ParFlorisModel(FlorisModel):
             "The parallelization interface cannot be changed after instantiation."
         )
 
-def _parallel_run(fmodel_dict, set_kwargs) -> FlorisModel:
+def _parallel_run(snapshot, set_kwargs) -> FlorisModel:
     """
     Run the FLORIS model in parallel.
 
     Args:
-        fmodel: The FLORIS model to run.
-        set_kwargs: Additional keyword arguments to pass to fmodel.set().
+        snapshot: The snapshot of the FLORIS model to run.
+        set_kwargs: The keyword arguments to pass to fmodel.set() for this split.
     """
-    fmodel = FlorisModel(fmodel_dict)
-    fmodel.set(**set_kwargs)
+    fmodel = FlorisModel._from_worker_inputs(snapshot, set_kwargs)
     fmodel.run()
     return fmodel
 
-def _parallel_run_powers_only(fmodel_dict, set_kwargs) -> np.ndarray:
+def _parallel_run_powers_only(snapshot, set_kwargs) -> np.ndarray:
     """
     Run the FLORIS model in parallel, returning only the turbine powers.
 
     Args:
-        fmodel: The FLORIS model to run.
-        set_kwargs: Additional keyword arguments to pass to fmodel.set().
+        snapshot: The snapshot of the FLORIS model to run.
+        set_kwargs: The keyword arguments to pass to fmodel.set() for this split.
     """
-    fmodel = FlorisModel(fmodel_dict)
-    fmodel.set(**set_kwargs)
+    fmodel = FlorisModel._from_worker_inputs(snapshot, set_kwargs)
     fmodel.run()
     return fmodel.get_turbine_powers()
 
+def _mpi_run_split(snapshot, fmodel, return_turbine_powers_only, findices):
+    """
+    Run the FLORIS model for a split of the findices on an MPI rank, returning only the
+    outputs that are gathered from the ranks.
+
+    Args:
+        snapshot: The snapshot of the FLORIS model broadcast to all ranks.
+        fmodel: The FLORIS model built from the snapshot and the wind conditions and control
+            setpoints broadcast to all ranks.
+        return_turbine_powers_only: Whether to return only the turbine powers.
+        findices: The findices of this split.
+    """
+    fmodel_split = FlorisModel._from_worker_inputs(
+        snapshot,
+        {
+            **fmodel._get_findex_wind_conditions(findices),
+            **fmodel._get_findex_setpoints(findices),
+        },
+    )
+    fmodel_split.run()
+    if return_turbine_powers_only:
+        return fmodel_split.get_turbine_powers()
+    return _get_flow_field_outputs(fmodel_split)
+
+def _get_flow_field_outputs(fmodel) -> dict:
+    """
+    Get the flow field outputs of a solved split that are combined by _postprocessing().
+    """
+    return {name: getattr(fmodel.core.flow_field, name) for name in FLOW_FIELD_OUTPUTS}
+
 def _parallel_run_map(x):
     """
     Wrapper for unpacking inputs to _parallel_run() for use with map().
@@ -0,0 +1,239 @@
+
+from __future__ import annotations
+
+import json
+from importlib.metadata import version
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+from floris.logging_manager import LoggingManager
+from floris.type_dec import NDArrayFloat
+
+
+if TYPE_CHECKING:
+    from floris.floris_model import FlorisModel
+
+
+# Turbine outputs that can be stored, and how to get each from a FlorisModel that has been run
+TURBINE_OUTPUTS = {
+    "turbine_powers": lambda fmodel: fmodel._get_turbine_powers(),
+    "turbine_average_velocities": lambda fmodel: fmodel.turbine_average_velocities,
+    "turbine_TIs": lambda fmodel: fmodel.get_turbine_TIs(),
+    "turbine_thrust_coefficients": lambda fmodel: fmodel.get_turbine_thrust_coefficients(),
+}
+
+# Wind conditions, with one value per findex, and control setpoints, with one value per findex
+# and turbine, that are always stored with the outputs
+WIND_CONDITIONS = {
+    "wind_directions": lambda fmodel: fmodel.core.flow_field.wind_directions,
+    "wind_speeds": lambda fmodel: fmodel.core.flow_field.wind_speeds,
+    "turbulence_intensities": lambda fmodel: fmodel.core.flow_field.turbulence_intensities,
+}
+SETPOINTS = {
+    "yaw_angles": lambda fmodel: fmodel.core.farm.yaw_angles,
+    "power_setpoints": lambda fmodel: fmodel.core.farm.power_setpoints,
+}
+
+METADATA_FILE = "metadata.json"
+
+# Each column is a .npy file whose header is padded to a fixed size, so that its number of rows
+# can be rewritten in place as rows are appended. This keeps the data aligned and lets any NumPy
+# reader memory map the columns.
+_NPY_HEADER_SIZE = 128
+
+
+def _write_npy_header(f, dtype: np.dtype, shape: tuple) -> None:
+    header = repr({"descr": np.lib.format.dtype_to_descr(dtype), "fortran_order": False,
+                   "shape": shape})
+    preamble = np.lib.format.magic(1, 0)
+    header_len = _NPY_HEADER_SIZE - len(preamble) - 2
+    header = header.ljust(header_len - 1) + "\n"
+    if len(header) != header_len:
+        raise ValueError(f"The .npy header for the shape {shape} is too long.")
+    f.seek(0)
+    f.write(preamble)
+    f.write(np.uint16(header_len).tobytes())
+    f.write(header.encode("latin1"))
+
+
+class TurbineResultStore(LoggingManager):
+    """
+    TurbineResultStore writes the per-findex turbine outputs of FLORIS runs, such as
+    turbine powers, to a directory, with one column file per output. Rows are appended as
+    each run, or each chunk of findices of a run, finishes, so that results larger than memory
+    can be written incrementally, e.g. with
+    :py:meth:`~floris.floris_model.FlorisModel.run_to_store`. The wind directions, wind
+    speeds, turbulence intensities, yaw angles and power setpoints of each findex are stored
+    with the outputs, and the layout is kept in the metadata.
+
+    Each column is a standard .npy file with shape (n_findex, n_turbines), or (n_findex,)
+    for the wind conditions, so the columns can be read by any NumPy reader. Indexing the
+    store, e.g. ``store["turbine_powers"]``, memory maps the column read-only without copying
+    it into memory.
+
+    Args:
+        path (str | Path): The directory of the store.
+        mode (str, optional): "r" to read an existing store, "a" to append to a store,
+            creating it if it does not exist, or "w" to create a new store, replacing any
+            existing one. Defaults to "r".
+        outputs (list[str] | None, optional): The turbine outputs to store when creating a
+            store, from "turbine_powers", "turbine_average_velocities", "turbine_TIs" and
+            "turbine_thrust_coefficients". Defaults to None, which stores all of them.
+    """
+
+    def __init__(
+        self,
+        path: str | Path,
+        mode: str = "r",
+        outputs: list[str] | None = None,
+    ):
+        if mode not in ("r", "a", "w"):
+            raise ValueError(f"mode must be 'r', 'a' or 'w', not {mode!r}.")
+        self.path = Path(path)
+        self.mode = mode
+        metadata_path = self.path / METADATA_FILE
+
+        if mode == "w" or (mode == "a" and not metadata_path.exists()):
+            outputs = list(TURBINE_OUTPUTS) if outputs is None else list(outputs)
+            unknown_outputs = set(outputs) - set(TURBINE_OUTPUTS)
+            if unknown_outputs:
+                raise ValueError(
+                    f"Unknown outputs {sorted(unknown_outputs)}. Outputs must be one of "
+                    f"{list(TURBINE_OUTPUTS)}."
+                )
+            self.path.mkdir(parents=True, exist_ok=True)
+            for name in [*WIND_CONDITIONS, *SETPOINTS, *TURBINE_OUTPUTS]:
+                (self.path / f"{name}.npy").unlink(missing_ok=True)
+            self.metadata = {
+                "floris_version": version("floris"),
+                "outputs": outputs,
+                "n_findex": 0,
+                "n_turbines": None,
+                "layout_x": None,
+                "layout_y": None,
+            }
+            self._write_metadata()
+        else:
+            if not metadata_path.exists():
+                raise FileNotFoundError(f"No result store found at {self.path}.")
+            with open(metadata_path) as f:
+                self.metadata = json.load(f)
+            if outputs is not None and list(outputs) != self.metadata["outputs"]:
+                raise ValueError(
+                    f"The store at {self.path} holds the outputs {self.metadata['outputs']}, "
+                    f"not {list(outputs)}."
+                )
+
+    def _write_metadata(self) -> None:
+        # Replace the metadata atomically, since its number of rows marks the rows that are
+        # complete in every column
+        tmp_path = self.path / f"{METADATA_FILE}.tmp"
+        with open(tmp_path, "w") as f:
+            json.dump(self.metadata, f, indent=2)
+        tmp_path.replace(self.path / METADATA_FILE)
+
+    @property
+    def columns(self) -> list[str]:
+        """
+        The names of the stored columns: the wind conditions, setpoints and outputs.
+        """
+        return [*WIND_CONDITIONS, *SETPOINTS, *self.metadata["outputs"]]
+
+    @property
+    def n_findex(self) -> int:
+        """
+        The number of findices, or rows, stored.
+        """
+        return self.metadata["n_findex"]
+
+    @property
+    def n_turbines(self) -> int | None:
+        """
+        The number of turbines, or None if nothing has been stored yet.
+        """
+        return self.metadata["n_turbines"]
+
+    def append(self, fmodel: FlorisModel) -> None:
+        """
+        Append the outputs of each findex of a FlorisModel that has been run, together with
+        its wind conditions and setpoints.
+
+        Args:
+            fmodel (FlorisModel): The model, which must have been run and have the same
+                layout as the models already stored.
+        """
+        if self.mode == "r":
+            raise PermissionError("The result store was opened read-only.")
+
+        layout_x, layout_y = fmodel.layout_x, fmodel.layout_y
+        if self.n_turbines is not None and (
+            len(layout_x) != self.n_turbines
+            or not np.allclose(layout_x, self.metadata["layout_x"])
+            or not np.allclose(layout_y, self.metadata["layout_y"])
+        ):
+            raise ValueError("The layout of the model differs from the layout of the store.")
+
+        getters = {
+            **WIND_CONDITIONS,
+            **SETPOINTS,
+            **{name: TURBINE_OUTPUTS[name] for name in self.metadata["outputs"]},
+        }
+        # Get every column before writing any, so that a failure leaves the store unchanged
+        values = {
+            name: np.ascontiguousarray(getter(fmodel), dtype=float)
+            for name, getter in getters.items()
+        }
+        for name, value in values.items():
+            self._append_column(name, value)
+
+        if self.n_turbines is None:
+            self.metadata["n_turbines"] = len(layout_x)
+            self.metadata["layout_x"] = np.asarray(layout_x).tolist()
+            self.metadata["layout_y"] = np.asarray(layout_y).tolist()
+
+        self.metadata["n_findex"] += fmodel.n_findex
+        self._write_metadata()
+
+    def _append_column(self, name: str, value: NDArrayFloat) -> None:
+        column_path = self.path / f"{name}.npy"
+        if not column_path.exists():
+            with open(column_path, "wb") as f:
+                _write_npy_header(f, value.dtype, (0, *value.shape[1:]))
+
+        # Write from the last complete row, overwriting any rows of a failed append
+        row_bytes = value.itemsize * int(np.prod(value.shape[1:]))
+        with open(column_path, "r+b") as f:
+            f.seek(_NPY_HEADER_SIZE + self.n_findex * row_bytes)
+            f.write(value.tobytes())
+            f.truncate()
+            _write_npy_header(f, value.dtype, (self.n_findex + len(value), *value.shape[1:]))
+
+    def __getitem__(self, name: str) -> NDArrayFloat:
+        """
+        Memory map a column read-only.
+
+        Args:
+            name (str): The name of the column, e.g. "turbine_powers" or "wind_speeds".
+
+        Returns:
+            NDArrayFloat: The column, with one row per findex.
+        """
+        if name not in self.columns:
+            raise KeyError(f"{name!r} is not a column of the store. Columns: {self.columns}.")
+        column_path = self.path / f"{name}.npy"
+        if self.n_findex == 0:
+            row_shape = () if name in WIND_CONDITIONS else (self.n_turbines or 0,)
+            return np.zeros((0, *row_shape))
+        # Ignore any rows of an unfinished append
+        return np.load(column_path, mmap_mode="r")[:self.n_findex]
+
+    def __len__(self) -> int:
+        return self.n_findex
+
+    def __repr__(self) -> str:
+        return (
+            f"TurbineResultStore({str(self.path)!r}, n_findex={self.n_findex}, "
+            f"n_turbines={self.n_turbines}, outputs={self.metadata['outputs']})"
+        )
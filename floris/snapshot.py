@@ -0,0 +1,118 @@
+
+from __future__ import annotations
+
+import io
+import json
+import pickle
+import struct
+from importlib.metadata import version
+from pathlib import Path
+from typing import Any, BinaryIO
+
+import numpy as np
+
+
+# A snapshot is a binary file that starts with a fixed-size preamble, followed by a JSON header
+# that gives the location of each data segment. The first segment holds the pickled state and the
+# rest hold the data of its NumPy arrays, which are pickled out-of-band so that each can be memory
+# mapped in place. Segments are aligned so that the arrays are aligned in memory.
+SNAPSHOT_MAGIC = b"\x93FLORIS\x00"
+SNAPSHOT_FORMAT_VERSION = 1
+_PREAMBLE = struct.Struct("<8sIQ")  # Magic, format version and header size
+_ALIGNMENT = 64
+
+
+def _aligned(offset: int) -> int:
+    return -(-offset // _ALIGNMENT) * _ALIGNMENT
+
+
+def _write_snapshot(state: Any, f: BinaryIO) -> None:
+    buffers = []
+    pickled = pickle.dumps(state, protocol=5, buffer_callback=buffers.append)
+    segments = [memoryview(pickled), *[buffer.raw() for buffer in buffers]]
+
+    # Locate each segment relative to the end of the header
+    locations = []
+    offset = 0
+    for segment in segments:
+        locations.append([offset, segment.nbytes])
+        offset = _aligned(offset + segment.nbytes)
+    header = json.dumps({"floris_version": version("floris"), "segments": locations}).encode()
+    header = header.ljust(_aligned(_PREAMBLE.size + len(header)) - _PREAMBLE.size)
+
+    f.write(_PREAMBLE.pack(SNAPSHOT_MAGIC, SNAPSHOT_FORMAT_VERSION, len(header)))
+    f.write(header)
+    start = f.tell()
+    for (offset, _), segment in zip(locations, segments):
+        # Seeking past the end of the previous segment pads it with zeros
+        f.seek(start + offset)
+        f.write(segment)
+
+
+def write_snapshot(state: Any, output_file_path: str | Path | None = None) -> bytes | None:
+    """
+    Write a snapshot of a picklable state, such as a model.
+
+    Args:
+        state (Any): The state to save.
+        output_file_path (str | Path | None, optional): The file to write the snapshot to.
+            Defaults to None, which returns the snapshot instead.
+
+    Returns:
+        bytes | None: The snapshot, if output_file_path is None.
+    """
+    if output_file_path is None:
+        f = io.BytesIO()
+        _write_snapshot(state, f)
+        return f.getvalue()
+    with open(output_file_path, "wb") as f:
+        _write_snapshot(state, f)
+
+
+def read_snapshot(snapshot: str | Path | bytes | bytearray) -> Any:
+    """
+    Read the state saved in a snapshot. The arrays of a snapshot file are memory mapped
+    copy-on-write, so that they are read from the file as they are used and can be modified
+    without modifying the file. Since the state is unpickled, only snapshots from trusted
+    sources should be read.
+
+    Args:
+        snapshot (str | Path | bytes | bytearray): The snapshot file, or the snapshot itself.
+
+    Raises:
+        ValueError: If the snapshot is not a FLORIS snapshot, or was written with a different
+            version of FLORIS or a newer snapshot format.
+
+    Returns:
+        Any: The state.
+    """
+    if isinstance(snapshot, (bytes, bytearray)):
+        # Copy the snapshot so that its arrays are writable
+        data = np.frombuffer(bytearray(snapshot), dtype=np.uint8)
+    else:
+        data = np.memmap(snapshot, dtype=np.uint8, mode="c")
+
+    if len(data) < _PREAMBLE.size:
+        raise ValueError("The snapshot is not a FLORIS snapshot.")
+    magic, format_version, header_size = _PREAMBLE.unpack(data[:_PREAMBLE.size].tobytes())
+    if magic != SNAPSHOT_MAGIC:
+        raise ValueError("The snapshot is not a FLORIS snapshot.")
+    if format_version > SNAPSHOT_FORMAT_VERSION:
+        raise ValueError(
+            f"The snapshot format version {format_version} is newer than the latest format "
+            f"version supported, {SNAPSHOT_FORMAT_VERSION}."
+        )
+
+    start = _PREAMBLE.size + header_size
+    header = json.loads(data[_PREAMBLE.size:start].tobytes())
+    if header["floris_version"] != version("floris"):
+        raise ValueError(
+            f"The snapshot was written with FLORIS {header['floris_version']}, but FLORIS "
+            f"{version('floris')} is installed. Snapshots can only be read by the version that "
+            "wrote them, so rebuild the model from its input file instead."
+        )
+
+    segments = [
+        data[start + offset:start + offset + nbytes] for offset, nbytes in header["segments"]
+    ]
+    return pickle.loads(segments[0], buffers=segments[1:])
@@ -151,19 +151,26 @@ def convert_to_path(fn: str | Path) -> Path:
     if isinstance(fn, str):
         fn = Path(fn)
 
-    # Get the base path from where the analysis script was run to determine the relative
-    # path from which `fn` might be based. [1] is where a direct call to this function will be
-    # located (e.g., testing via pytest), and [-1] is where a direct call to the function via an
-    # analysis script will be located (e.g., running an example).
-    base_fn_script = Path(inspect.stack()[-1].filename).resolve().parent
-    base_fn_sys = Path(inspect.stack()[1].filename).resolve().parent
-
     if isinstance(fn, Path):
         absolute_fn = fn.resolve()
-        relative_fn_script = (base_fn_script / fn).resolve()
-        relative_fn_sys = (base_fn_sys / fn).resolve()
         if absolute_fn.exists():
             return absolute_fn
+
+        # Get the base path from where the analysis script was run to determine the relative
+        # path from which `fn` might be based. The calling frame is where a direct call to this
+        # function will be located (e.g., testing via pytest), and the outermost frame is where
+        # a direct call to the function via an analysis script will be located (e.g., running an
+        # example). The frames are walked directly since inspect.stack() reads the source of
+        # every frame, which dominates the cost of constructing a model.
+        caller_frame = inspect.currentframe().f_back
+        outer_frame = caller_frame
+        while outer_frame.f_back is not None:
+            outer_frame = outer_frame.f_back
+        base_fn_script = Path(outer_frame.f_code.co_filename).resolve().parent
+        base_fn_sys = Path(caller_frame.f_code.co_filename).resolve().parent
+
+        relative_fn_script = (base_fn_script / fn).resolve()
+        relative_fn_sys = (base_fn_sys / fn).resolve()
         if relative_fn_script.exists():
             return relative_fn_script
         if relative_fn_sys.exists():
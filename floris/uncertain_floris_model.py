@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import copy
 from pathlib import Path
 from typing import (
     Any,
@@ -237,12 +238,19 @@ class UncertainFlorisModel(LoggingManager):
         # Calling set_uncertain again to reset the expanded FlorisModel
         self._set_uncertain()
 
-    def run(self):
+    def run(self, profile: bool = False):
         """
         Run the simulation in the underlying FlorisModel object.
+
+        Args:
+            profile (bool, optional): Record the time spent in each phase of the solve. See
+                :py:meth:`~floris.floris_model.FlorisModel.run`. Defaults to False.
+
+        Returns:
+            Profiler | None: The profiler, if profile is True.
         """
 
-        self.fmodel_expanded.run()
+        return self.fmodel_expanded.run(profile=profile)
 
     def run_no_wake(self):
         """
@@ -956,7 +964,9 @@ class UncertainFlorisModel(LoggingManager):
         if isinstance(operation_model, str):
             if len(self.fmodel_unexpanded.core.farm.turbine_type) == 1:
                 # Set a single one here, then, and return
-                turbine_type = self.fmodel_unexpanded.core.farm.turbine_definitions[0]
+                turbine_type = copy.deepcopy(
+                    self.fmodel_unexpanded.core.farm.turbine_definitions[0]
+                )
                 turbine_type["operation_model"] = operation_model
                 self.set(
                     turbine_type=[turbine_type],
@@ -971,7 +981,10 @@ class UncertainFlorisModel(LoggingManager):
                 "The length of the operation_model list must be " "equal to the number of turbines."
             )
 
-        turbine_type_list = self.fmodel_unexpanded.core.farm.turbine_definitions
+        # Turbines of the same type share their definition, so each is copied to be modified
+        turbine_type_list = [
+            copy.deepcopy(td) for td in self.fmodel_unexpanded.core.farm.turbine_definitions
+        ]
 
         for tindex in range(self.fmodel_unexpanded.core.farm.n_turbines):
             turbine_type_list[tindex]["turbine_type"] = (
@@ -5,6 +5,7 @@ import os
 from math import ceil
 from typing import (
     Any,
+    Callable,
     Dict,
     List,
     Optional,
@@ -232,6 +233,8 @@ def rotate_coordinates_rel_west(
         wind_directions (NDArrayFloat): Series of wind directions to base the rotation.
         coordinates (NDArrayFloat): Series of coordinates to rotate with shape (N coordinates, 3)
             so that each element of the array coordinates[i] yields a three-component coordinate.
+            Alternatively, coordinates specific to each wind direction may be given with shape
+            (n_findex, N coordinates, 3).
         x_center_of_rotation (float, optional): The x-coordinate for the rotation center of the
             input coordinates. Defaults to None.
         y_center_of_rotation (float, optional): The y-coordinate for the rotational center of the
@@ -243,13 +246,19 @@ def rotate_coordinates_rel_west(
     wind_deviation_from_west = np.reshape(wind_deviation_from_west, (len(wind_directions), 1))
 
     # Construct the arrays storing the turbine locations
-    x_coordinates, y_coordinates, z_coordinates = coordinates.T
+    x_coordinates, y_coordinates, z_coordinates = np.moveaxis(coordinates, -1, 0)
 
-    # Find center of rotation - this is the center of box bounding all of the turbines
+    # Find center of rotation - this is the center of box bounding all of the turbines.
+    # When the coordinates are specific to each wind direction, so is the center.
+    bounds_kwargs = {"axis": -1, "keepdims": True} if coordinates.ndim == 3 else {}
     if x_center_of_rotation is None:
-        x_center_of_rotation = (np.min(x_coordinates) + np.max(x_coordinates)) / 2
+        x_center_of_rotation = (
+            np.min(x_coordinates, **bounds_kwargs) + np.max(x_coordinates, **bounds_kwargs)
+        ) / 2
     if y_center_of_rotation is None:
-        y_center_of_rotation = (np.min(y_coordinates) + np.max(y_coordinates)) / 2
+        y_center_of_rotation = (
+            np.min(y_coordinates, **bounds_kwargs) + np.max(y_coordinates, **bounds_kwargs)
+        ) / 2
 
     # Rotate turbine coordinates about the center
     x_coord_offset = x_coordinates - x_center_of_rotation
@@ -289,12 +298,17 @@ def reverse_rotate_coordinates_rel_west(
         x_center_of_rotation (float): The x-coordinate for the rotation center of the
             input coordinates.
         y_center_of_rotation (float): The y-coordinate for the rotational center of the
-            input coordinates.
+            input coordinates. May also be given for each wind direction with shape
+            (n_findex, 1).
     """
     # Calculate the difference in given wind direction from 270 / West
     # We are rotating in the other direction
     wind_deviation_from_west = -1.0 * wind_delta(wind_directions)
 
+    # Centers of rotation for each wind direction
+    x_centers_of_rotation = np.broadcast_to(x_center_of_rotation, (len(wind_directions), 1))
+    y_centers_of_rotation = np.broadcast_to(y_center_of_rotation, (len(wind_directions), 1))
+
     # Construct the arrays storing the turbine locations
     grid_x_reversed = np.zeros_like(grid_x)
     grid_y_reversed = np.zeros_like(grid_x)
@@ -303,19 +317,21 @@ def reverse_rotate_coordinates_rel_west(
         x_rot = grid_x[wii]
         y_rot = grid_y[wii]
         z_rot = grid_z[wii]
+        x_center = x_centers_of_rotation[wii]
+        y_center = y_centers_of_rotation[wii]
 
         # Rotate turbine coordinates about the center
-        x_rot_offset = x_rot - x_center_of_rotation
-        y_rot_offset = y_rot - y_center_of_rotation
+        x_rot_offset = x_rot - x_center
+        y_rot_offset = y_rot - y_center
         x = (
             x_rot_offset * cosd(angle_rotation)
             - y_rot_offset * sind(angle_rotation)
-            + x_center_of_rotation
+            + x_center
         )
         y = (
             x_rot_offset * sind(angle_rotation)
             + y_rot_offset * cosd(angle_rotation)
-            + y_center_of_rotation
+            + y_center
         )
         z = z_rot  # Nothing changed in this rotation
 
@@ -439,3 +455,37 @@ def print_nested_dict(dictionary: Dict[str, Any], indent: int = 0) -> None:
             print_nested_dict(value, indent + 4)
         else:
             print(" " * (indent + 4) + str(value))
+
+def mpi_starmap(
+    function: Callable,
+    multiargs: List[Tuple] | None,
+    comm: Any = None,
+) -> List[Any]:
+    """Evaluate a function for each set of arguments, with the work distributed across the
+    ranks of an MPI communicator. The argument sets on rank 0 are scattered across the ranks
+    in contiguous blocks, and the results are gathered on every rank in the original order.
+    This must be called collectively by all ranks of the communicator; the arguments on the
+    other ranks are ignored and may be None.
+
+    Args:
+        function (Callable): The function to evaluate.
+        multiargs (List[Tuple] | None): The positional arguments of each function call.
+        comm (mpi4py.MPI.Comm, optional): The communicator to distribute the work over.
+            Defaults to None, which uses MPI.COMM_WORLD.
+
+    Returns:
+        List[Any]: The result of each function call, on all ranks.
+    """
+    if comm is None:
+        from mpi4py import MPI
+        comm = MPI.COMM_WORLD
+
+    if comm.Get_rank() == 0:
+        blocks = np.array_split(np.arange(len(multiargs)), comm.Get_size())
+        multiargs_split = [[multiargs[i] for i in block] for block in blocks]
+    else:
+        multiargs_split = None
+    multiargs_local = comm.scatter(multiargs_split, root=0)
+
+    out_local = [function(*args) for args in multiargs_local]
+    return [out for out_block in comm.allgather(out_local) for out in out_block]
@@ -0,0 +1,96 @@
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+
+from floris.type_dec import NDArrayFloat
+
+
+VELOCITY_DEFICIT_PROFILE_COLUMNS = ["x", "y", "z", "x1/D", "x2/D", "x3/D", "velocity_deficit"]
+
+
+class VelocityDeficitProfiles:
+    """
+    A set of velocity deficit profiles sampled along parallel lines for several findices.
+    Each quantity is stored as an array with dimensions (n_findex, n_lines, resolution), and
+    pandas DataFrames are only built on request.
+
+    Args:
+        direction (str): Direction in which the profiles are sampled. Either `cross-stream`
+            or `vertical`.
+        arrays (dict[str, NDArrayFloat]): Arrays for each of the
+            VELOCITY_DEFICIT_PROFILE_COLUMNS with dimensions (n_findex, n_lines, resolution).
+    """
+
+    def __init__(self, direction: str, arrays: dict[str, NDArrayFloat]):
+        if direction not in ["cross-stream", "vertical"]:
+            raise ValueError("`direction` must be either `cross-stream` or `vertical`.")
+        missing_columns = set(VELOCITY_DEFICIT_PROFILE_COLUMNS) - set(arrays)
+        if missing_columns:
+            raise ValueError(f"Missing arrays for the columns {sorted(missing_columns)}.")
+
+        shape = np.shape(arrays["velocity_deficit"])
+        if len(shape) != 3:
+            raise ValueError(
+                "The arrays must have dimensions (n_findex, n_lines, resolution)."
+            )
+        self.direction = direction
+        self.arrays = {
+            name: np.broadcast_to(arrays[name], shape) for name in VELOCITY_DEFICIT_PROFILE_COLUMNS
+        }
+
+    @property
+    def n_findex(self) -> int:
+        return self.arrays["velocity_deficit"].shape[0]
+
+    @property
+    def n_lines(self) -> int:
+        return self.arrays["velocity_deficit"].shape[1]
+
+    @property
+    def resolution(self) -> int:
+        return self.arrays["velocity_deficit"].shape[2]
+
+    def get_values(self, name: str) -> NDArrayFloat:
+        """
+        Get the values of one of the VELOCITY_DEFICIT_PROFILE_COLUMNS.
+
+        Args:
+            name (str): Name of the column.
+
+        Returns:
+            NDArrayFloat: Values with dimensions (n_findex, n_lines, resolution).
+        """
+        return self.arrays[name]
+
+    def to_dataframes(self, findex: int = 0) -> list[pd.DataFrame]:
+        """
+        Build one pandas DataFrame per profile for a single findex, in the format returned by
+        :py:meth:`~floris.floris_model.FlorisModel.sample_velocity_deficit_profiles`.
+
+        Args:
+            findex (int, optional): The findex of the profiles. Defaults to 0.
+
+        Returns:
+            list[pd.DataFrame]: A DataFrame for each profile line.
+        """
+        return [
+            pd.DataFrame(
+                {name: self.arrays[name][findex, i] for name in VELOCITY_DEFICIT_PROFILE_COLUMNS}
+            )
+            for i in range(self.n_lines)
+        ]
+
+    def to_dataframe(self) -> pd.DataFrame:
+        """
+        Build a single tidy pandas DataFrame of all of the profiles, with one row per sample
+        point and `findex`, `line` and `sample` columns identifying the point.
+
+        Returns:
+            pd.DataFrame: The profiles.
+        """
+        findex, line, sample = np.indices(self.arrays["velocity_deficit"].shape)
+        data = {"findex": findex.flatten(), "line": line.flatten(), "sample": sample.flatten()}
+        for name in VELOCITY_DEFICIT_PROFILE_COLUMNS:
+            data[name] = self.arrays[name].flatten()
+        return pd.DataFrame(data)
@@ -6,8 +6,6 @@ from abc import abstractmethod
 from pathlib import Path
 from typing import List
 
-import matplotlib as mpl
-import matplotlib.pyplot as plt
 import numpy as np
 import pandas as pd
 from pandas.api.types import CategoricalDtype
@@ -740,6 +738,9 @@ class WindRose(WindDataBase):
             the plotted wind rose.
         """
 
+        import matplotlib as mpl
+        import matplotlib.pyplot as plt
+
         # Get a aggregated (downsampled) wind_rose
         wind_rose_aggregate = self.downsample(wd_step, ws_step, inplace=False)
         wd_bins = wind_rose_aggregate.wind_directions
@@ -858,6 +859,8 @@ class WindRose(WindDataBase):
 
         # Set up figure
         if ax is None:
+            import matplotlib.pyplot as plt
+
             _, ax = plt.subplots()
 
         ax.plot(self.ws_flat, self.ti_table_flat * 100, marker=marker, ls=ls, color=color)
@@ -962,6 +965,8 @@ class WindRose(WindDataBase):
 
         # Set up figure
         if ax is None:
+            import matplotlib.pyplot as plt
+
             _, ax = plt.subplots()
 
         ax.plot(self.ws_flat, self.value_table_flat, marker=marker, ls=ls, color=color)
@@ -1780,6 +1785,9 @@ class WindTIRose(WindDataBase):
             the plotted wind rose.
         """
 
+        import matplotlib as mpl
+        import matplotlib.pyplot as plt
+
         if wind_rose_var not in {"ws", "ti"}:
             raise ValueError(
                 'wind_rose_var must be either "ws" or "ti" for wind speed or turbulence intensity.'
@@ -1867,6 +1875,8 @@ class WindTIRose(WindDataBase):
 
         # Set up figure
         if ax is None:
+            import matplotlib.pyplot as plt
+
             _, ax = plt.subplots()
 
         # get mean TI for each wind speed by averaging along wind direction and
@@ -1976,6 +1986,8 @@ class WindTIRose(WindDataBase):
 
         # Set up figure
         if ax is None:
+            import matplotlib.pyplot as plt
+
             _, ax = plt.subplots()
 
         ax.plot(self.ws_flat, self.value_table_flat, marker=marker, ls=ls, color=color)
@@ -3233,6 +3245,8 @@ class WindRoseWRG(WindDataBase):
 
         # If axarr is not defined, create a new figure
         if axarr is None:
+            import matplotlib.pyplot as plt
+
             _, axarr = plt.subplots(1, len(self.wind_roses), subplot_kw={"polar": True})
 
         # Test that axarr is the correct length
@@ -1 +0,0 @@
-../tests/conftest.py
\ No newline at end of file
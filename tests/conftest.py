@@ -2,6 +2,11 @@
 from __future__ import annotations
 
 import copy
+import importlib.util
+import os
+import shutil
+import subprocess
+import sys
 
 import numpy as np
 import pytest
@@ -19,6 +24,29 @@ def turbines_to_array(turbine_list: list):
     return [[t.average_velocity, t.Ct, t.power, t.axial_induction] for t in turbine_list]
 
 
+def run_with_mpiexec(script_path, n_ranks: int = 4) -> subprocess.CompletedProcess:
+    """
+    Run a Python script on n_ranks MPI ranks with mpiexec, skipping the calling test
+    if mpi4py or mpiexec are not available.
+    """
+    if importlib.util.find_spec("mpi4py") is None or shutil.which("mpiexec") is None:
+        pytest.skip("mpi4py and mpiexec are required for MPI tests")
+
+    # Allow Open MPI to run as root and with more ranks than cores, as in CI containers
+    env = {
+        **os.environ,
+        "OMPI_ALLOW_RUN_AS_ROOT": "1",
+        "OMPI_ALLOW_RUN_AS_ROOT_CONFIRM": "1",
+        "OMPI_MCA_rmaps_base_oversubscribe": "1",
+    }
+    return subprocess.run(
+        ["mpiexec", "-n", str(n_ranks), sys.executable, str(script_path)],
+        capture_output=True,
+        text=True,
+        env=env,
+        timeout=300,
+    )
+
 def assert_results_arrays(test: np.array, baseline: np.array):
     if np.shape(test) != np.shape(baseline):
         raise ValueError("test and baseline results have mismatched shapes.")
@@ -1,6 +1,8 @@
 
+import copy
 from pathlib import Path
 
+import numpy as np
 import yaml
 
 from floris.core import (
@@ -45,3 +47,48 @@ def test_asdict(turbine_grid_fixture: TurbineGrid):
     dict2 = new_floris.as_dict()
 
     assert dict1 == dict2
+
+
+def test_turbine_grid_solution_cache():
+    core = Core.from_dict(DICT_INPUT)
+    core.initialize_domain()
+    core.steady_state_atmospheric_condition()
+    u = core.flow_field.u.copy()
+
+    # The turbine grid solution is reused while the inputs are unchanged, and solving it
+    # does not modify the farm or the flow field
+    turbine_grid_solution = core.solve_turbine_grid_for_viz()
+    assert core.solve_turbine_grid_for_viz() is turbine_grid_solution
+    assert np.array_equal(core.flow_field.u, u)
+    assert turbine_grid_solution[0].turbine_map is core.farm.turbine_map
+
+    # Changing the operation of the turbines requires a new solution
+    yaw_angles = core.farm.yaw_angles.copy()
+    yaw_angles[:, 0] = 20.0
+    core.farm.set_yaw_angles(yaw_angles)
+    assert core.solve_turbine_grid_for_viz() is not turbine_grid_solution
+
+
+def test_findex_slab():
+    input_dict = copy.deepcopy(DICT_INPUT)
+    input_dict["flow_field"]["wind_directions"] = [260.0, 270.0, 280.0, 290.0]
+    input_dict["flow_field"]["wind_speeds"] = [6.0, 8.0, 10.0, 12.0]
+    input_dict["flow_field"]["turbulence_intensities"] = [0.06] * 4
+    core = Core.from_dict(input_dict)
+    core.initialize_domain()
+    n_findex = core.flow_field.n_findex
+    findices = slice(1, 3)
+    farm, flow_field, grid = core.findex_slab(findices)
+
+    # The slabs are views of the arrays of the core, which is not modified
+    assert flow_field.n_findex == grid.n_findex == 2
+    assert np.shares_memory(flow_field.u_initial_sorted, core.flow_field.u_initial_sorted)
+    assert np.array_equal(grid.x_sorted, core.grid.x_sorted[findices])
+    assert np.array_equal(farm.yaw_angles_sorted, core.farm.yaw_angles_sorted[findices])
+    assert core.flow_field.n_findex == n_findex
+    assert farm.turbine_map is core.farm.turbine_map
+
+    # Solving a slab gives the same solution as solving all findices
+    core.select_solver()(farm, flow_field, grid, core.wake)
+    core.steady_state_atmospheric_condition()
+    assert np.allclose(flow_field.u_sorted, core.flow_field.u_sorted[findices])
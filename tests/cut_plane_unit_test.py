@@ -0,0 +1,92 @@
+import numpy as np
+import pandas as pd
+
+from floris.cut_plane import (
+    calculate_wind_speed,
+    change_resolution,
+    CutPlane,
+    interpolate_onto_array,
+    set_origin,
+)
+
+
+def make_cut_planes():
+    # A structured plane stored as arrays, and the same plane stored as a DataFrame
+    x1, x2 = np.meshgrid(np.linspace(-100.0, 100.0, 5), np.linspace(0.0, 150.0, 4))
+    x3 = np.full_like(x1, 90.0)
+    u = 8.0 - np.exp(-(x2 - 90.0)**2 / 2000.0) * np.exp(-x1**2 / 2000.0)
+    v = 0.1 * x1 / 100.0
+    w = 0.05 * x2 / 150.0
+    cut_plane_arrays = CutPlane.from_arrays(x1, x2, x3, u, v, w, "x")
+    df = pd.DataFrame({
+        "x1": x1.flatten(),
+        "x2": x2.flatten(),
+        "x3": x3.flatten(),
+        "u": u.flatten(),
+        "v": v.flatten(),
+        "w": w.flatten(),
+    })
+    cut_plane_df = CutPlane(df, 5, 4, "x")
+    return cut_plane_arrays, cut_plane_df
+
+
+def test_from_arrays():
+    cut_plane_arrays, cut_plane_df = make_cut_planes()
+
+    assert cut_plane_arrays.resolution == (5, 4)
+    for name in ["x1", "x2", "x3", "u", "v", "w"]:
+        assert np.array_equal(cut_plane_arrays.get_mesh(name), cut_plane_df.get_mesh(name))
+        assert np.array_equal(cut_plane_arrays.get_values(name), cut_plane_df.get_values(name))
+
+    # The DataFrame is built on access and matches the one given directly
+    pd.testing.assert_frame_equal(cut_plane_arrays.df, cut_plane_df.df)
+
+    # Once accessed, changes to the DataFrame are reflected in the arrays
+    cut_plane_arrays.df.u = 0.0
+    assert np.all(cut_plane_arrays.get_mesh("u") == 0.0)
+
+
+def test_cut_plane_utilities():
+    cut_plane_arrays, cut_plane_df = make_cut_planes()
+
+    # The utilities give the same results for both representations
+    difference_arrays = cut_plane_arrays - cut_plane_df
+    assert np.all(difference_arrays.get_values("u") == 0.0)
+
+    set_origin(cut_plane_arrays, 10.0, 20.0)
+    set_origin(cut_plane_df, 10.0, 20.0)
+    pd.testing.assert_frame_equal(cut_plane_arrays.df, cut_plane_df.df)
+
+    assert np.isclose(
+        calculate_wind_speed(cut_plane_arrays, -10.0, 70.0, 60.0),
+        calculate_wind_speed(cut_plane_df, -10.0, 70.0, 60.0),
+    )
+
+    cut_plane_arrays, cut_plane_df = make_cut_planes()
+    change_resolution(cut_plane_arrays, (7, 6))
+    change_resolution(cut_plane_df, (7, 6))
+    assert cut_plane_arrays.resolution == (7, 6)
+    assert cut_plane_arrays.get_mesh("u").shape == (6, 7)
+    assert np.allclose(cut_plane_arrays.get_values("u"), cut_plane_df.get_values("u"))
+
+
+def test_interpolate_onto_array():
+    cut_plane_arrays, cut_plane_df = make_cut_planes()
+
+    # On a rectilinear grid, the interpolation reproduces the data at the original points
+    # and is NaN outside of the data
+    x1_array = np.linspace(-100.0, 150.0, 6)
+    x2_array = np.linspace(0.0, 150.0, 4)
+    cut_plane_interp = interpolate_onto_array(cut_plane_arrays, x1_array, x2_array)
+    assert cut_plane_interp.resolution == (6, 4)
+    u_mesh = cut_plane_interp.get_mesh("u")
+    assert np.allclose(u_mesh[:, [0, 2, 4]], cut_plane_arrays.get_mesh("u")[:, [0, 2, 4]])
+    assert np.all(np.isnan(u_mesh[:, -1]))
+
+    # Scattered points are interpolated by triangulation
+    df = cut_plane_df.df.sample(frac=1.0, random_state=0).reset_index(drop=True)
+    cut_plane_scattered = CutPlane(df, 5, 4, "x")
+    cut_plane_interp = interpolate_onto_array(cut_plane_scattered, x1_array, x2_array)
+    u_mesh = cut_plane_interp.get_mesh("u")
+    assert np.allclose(u_mesh[:, [0, 2, 4]], cut_plane_arrays.get_mesh("u")[:, [0, 2, 4]])
+    assert np.all(np.isnan(u_mesh[:, -1]))
@@ -1,4 +1,6 @@
 
+import os
+import pickle
 from copy import deepcopy
 from pathlib import Path
 
@@ -6,6 +8,7 @@ import numpy as np
 import pytest
 
 from floris.core import Farm
+from floris.core.farm import ReadOnlyDict
 from floris.utilities import load_yaml
 from tests.conftest import (
     N_FINDEX,
@@ -221,3 +224,45 @@ def test_farm_external_library(sample_inputs_fixture: SampleInputs):
     farm_data["turbine_type"] = ["FAKE_TURBINE"] * N_TURBINES
     with pytest.raises(FileNotFoundError):
         Farm.from_dict(farm_data)
+
+
+def test_turbine_definition_sharing(tmp_path):
+    # Turbine library files are parsed once per process and reparsed when they are modified
+    source_file = Path(__file__).parent / "data" / "nrel_5MW_custom.yaml"
+    turbine_def = load_yaml(source_file)
+    turbine_file = tmp_path / "nrel_5MW_tmp.yaml"
+    turbine_file.write_text(source_file.read_text())
+
+    farm_data = deepcopy(SampleInputs().farm)
+    farm_data["turbine_library_path"] = tmp_path
+    farm_data["turbine_type"] = ["nrel_5MW_tmp"]
+    farm = Farm.from_dict(farm_data)
+    assert farm.turbine_definitions[0]["hub_height"] == turbine_def["hub_height"]
+
+    # All turbines of a type share one read-only definition, whose copies can be modified
+    assert all(td is farm.turbine_definitions[0] for td in farm.turbine_definitions)
+    with pytest.raises(TypeError):
+        farm.turbine_definitions[0]["hub_height"] = 200.0
+    with pytest.raises(TypeError):
+        farm.turbine_definitions[0]["power_thrust_table"]["ref_tilt"] = 0.0
+    turbine_def_copy = deepcopy(farm.turbine_definitions[0])
+    turbine_def_copy["power_thrust_table"]["ref_tilt"] = 0.0
+    assert farm.turbine_definitions[0]["power_thrust_table"]["ref_tilt"] != 0.0
+    turbine_def_pickled = pickle.loads(pickle.dumps(farm.turbine_definitions[0]))
+    assert isinstance(turbine_def_pickled, ReadOnlyDict)
+    assert turbine_def_pickled == farm.turbine_definitions[0]
+
+    # Turbine definition dicts are copied rather than shared with the caller
+    farm_data_dict = deepcopy(farm_data)
+    farm_data_dict["turbine_type"] = [deepcopy(turbine_def)]
+    farm = Farm.from_dict(farm_data_dict)
+    farm_data_dict["turbine_type"][0]["hub_height"] = 200.0
+    assert farm.turbine_definitions[0]["hub_height"] == turbine_def["hub_height"]
+
+    # Modifying the file invalidates the cached definition
+    turbine_file.write_text(
+        source_file.read_text().replace("hub_height: 90.0", "hub_height: 100.0")
+    )
+    os.utime(turbine_file, ns=(0, turbine_file.stat().st_mtime_ns + 10**9))
+    farm = Farm.from_dict(farm_data)
+    assert farm.turbine_definitions[0]["hub_height"] == 100.0
@@ -1,4 +1,5 @@
 import logging
+import pickle
 from pathlib import Path
 
 import numpy as np
@@ -10,6 +11,12 @@ from floris import (
     TimeSeries,
     WindRose,
 )
+from floris.core import (
+    Core,
+    get_active_profiler,
+    Profiler,
+    profiling,
+)
 from floris.core.turbine.operation_models import POWER_SETPOINT_DEFAULT, POWER_SETPOINT_DISABLED
 
 
@@ -224,6 +231,43 @@ def test_get_turbine_powers():
     assert turbine_powers.shape[1] == n_turbines
     assert turbine_powers[0, 0] == turbine_powers[1, 0]
 
+def test_get_turbine_powers_for_layouts():
+    # Powers of several layouts solved together should match solving each layout on its own
+
+    fmodel = FlorisModel(configuration=YAML_INPUT)
+    fmodel.set(
+        wind_speeds=np.array([8.0, 9.0, 10.0]),
+        wind_directions=np.array([270.0, 280.0, 300.0]),
+        turbulence_intensities=np.array([0.06, 0.06, 0.06]),
+        layout_x=np.array([0.0, 500.0, 1000.0]),
+        layout_y=np.array([0.0, 0.0, 0.0]),
+    )
+
+    rng = np.random.default_rng(0)
+    layout_x = rng.uniform(0.0, 1000.0, (5, 3))
+    layout_y = rng.uniform(0.0, 1000.0, (5, 3))
+    yaw_angles = rng.uniform(-20.0, 20.0, (5, 3, 3))
+
+    turbine_powers = fmodel.get_turbine_powers_for_layouts(
+        layout_x,
+        layout_y,
+        yaw_angles=yaw_angles,
+        n_layouts_per_solve=2,
+    )
+    assert turbine_powers.shape == (5, 3, 3)
+
+    for i in range(5):
+        fmodel_single = fmodel.copy()
+        fmodel_single.set(layout_x=layout_x[i], layout_y=layout_y[i], yaw_angles=yaw_angles[i])
+        fmodel_single.run()
+        np.testing.assert_allclose(turbine_powers[i], fmodel_single.get_turbine_powers())
+
+    # The model itself is unchanged
+    np.testing.assert_array_equal(fmodel.layout_x, [0.0, 500.0, 1000.0])
+
+    with pytest.raises(ValueError):
+        fmodel.get_turbine_powers_for_layouts(layout_x[:, :2], layout_y[:, :2])
+
 def test_get_farm_power():
     fmodel = FlorisModel(configuration=YAML_INPUT)
 
@@ -614,6 +658,189 @@ def test_calculate_planes(caplog):
         fmodel.calculate_cross_plane(500.0)
     assert caplog.text != "" # Checking not empty
 
+def test_calculate_multiple_planes():
+    fmodel = FlorisModel(configuration=YAML_INPUT)
+    fmodel.set(
+        layout_x=[0.0, 630.0],
+        layout_y=[0.0, 50.0],
+        wind_directions=[260.0, 270.0, 285.0],
+        wind_speeds=[8.0, 9.0, 10.0],
+        turbulence_intensities=[0.06, 0.06, 0.06],
+        yaw_angles=[[20.0, 0.0], [0.0, 0.0], [0.0, -10.0]],
+    )
+    heights = [70.0, 90.0]
+    plane_kwargs = {
+        "x_resolution": 10,
+        "y_resolution": 5,
+        "x_bounds": (-200.0, 1500.0),
+        "y_bounds": (-300.0, 300.0),
+    }
+
+    # The planes are generated for each findex, then for each height, and match the planes
+    # calculated one at a time
+    horizontal_planes = fmodel.calculate_horizontal_planes(
+        heights,
+        findices=[2, 0, 1],
+        n_findex_per_solve=2,
+        **plane_kwargs,
+    )
+    for findex in [2, 0, 1]:
+        for height in heights:
+            horizontal_plane = next(horizontal_planes)
+            horizontal_plane_ref = fmodel.calculate_horizontal_plane(
+                height,
+                findex_for_viz=findex,
+                **plane_kwargs,
+            )
+            assert np.allclose(horizontal_plane.df, horizontal_plane_ref.df)
+    with pytest.raises(StopIteration):
+        next(horizontal_planes)
+
+    cross_planes = list(fmodel.calculate_cross_planes(500.0, y_resolution=6, z_resolution=4))
+    assert len(cross_planes) == 3
+    y_planes = list(fmodel.calculate_y_planes([0.0, 50.0], x_resolution=6, z_resolution=4))
+    assert len(y_planes) == 6
+
+    # Unspecified bounds are shared by all of the findices
+    for cross_plane in cross_planes[1:]:
+        assert np.allclose(cross_plane.df[["x1", "x2"]], cross_planes[0].df[["x1", "x2"]])
+
+def test_calculate_tiled_planes(monkeypatch):
+    fmodel = FlorisModel(configuration=YAML_INPUT)
+    fmodel.set(
+        layout_x=[0.0, 630.0],
+        layout_y=[0.0, 50.0],
+        wind_directions=[270.0, 285.0],
+        wind_speeds=[8.0, 9.0],
+        turbulence_intensities=[0.06, 0.06],
+        yaw_angles=[[20.0, 0.0], [0.0, -10.0]],
+    )
+    plane_kwargs = {"x_resolution": 23, "y_resolution": 17}
+
+    # The tiles are assembled into the same planes as solving the planes at once
+    horizontal_planes = fmodel.calculate_horizontal_planes(90.0, **plane_kwargs)
+    tiled_planes = fmodel.calculate_horizontal_planes(90.0, tile_resolution=5, **plane_kwargs)
+    for horizontal_plane, tiled_plane in zip(horizontal_planes, tiled_planes):
+        assert tiled_plane.get_mesh("u").shape == (17, 23)
+        for name in ["x1", "x2", "x3", "u"]:
+            assert np.allclose(tiled_plane.get_mesh(name), horizontal_plane.get_mesh(name))
+
+    # Tiles upstream of the turbines are set to the inflow without solving the wakes
+    def solve_for_viz(*args, **kwargs):
+        raise AssertionError("The wakes should not be solved upstream of the turbines.")
+    monkeypatch.setattr(Core, "solve_for_viz", solve_for_viz)
+    upstream_plane = fmodel.calculate_horizontal_plane(
+        90.0,
+        x_bounds=(-1000.0, -500.0),
+        findex_for_viz=0,
+        tile_resolution=5,
+        **plane_kwargs,
+    )
+    assert np.allclose(upstream_plane.get_values("u"), 8.0)
+
+
+def test_calculate_planes_reuses_turbine_solve():
+    fmodel = FlorisModel(configuration=YAML_INPUT)
+    fmodel.set(layout_x=[0.0, 630.0], layout_y=[0.0, 0.0])
+    plane_kwargs = {"x_resolution": 10, "y_resolution": 5}
+
+    # Repeated requests for the same operating state reuse the turbine grid solution
+    fmodel.calculate_horizontal_plane(90.0, **plane_kwargs)
+    turbine_grid_solution = fmodel._findex_core[2]._turbine_grid_solution
+    fmodel.calculate_horizontal_plane(70.0, **plane_kwargs)
+    fmodel.sample_flow_at_points([500.0], [0.0], [90.0])
+    assert fmodel._findex_core[2]._turbine_grid_solution is turbine_grid_solution
+
+    # The kept Core is not pickled with the model
+    fmodel_pickled = pickle.loads(pickle.dumps(fmodel))
+    assert fmodel_pickled._findex_core is None
+    assert fmodel._findex_core is not None
+    fmodel_pickled.sample_flow_at_points([500.0], [0.0], [90.0])
+
+    # Changing the operation gives the same planes as a new FlorisModel
+    fmodel.set(yaw_angles=[[20.0, 0.0]])
+    horizontal_plane = fmodel.calculate_horizontal_plane(90.0, **plane_kwargs)
+    fmodel_new = FlorisModel(configuration=YAML_INPUT)
+    fmodel_new.set(layout_x=[0.0, 630.0], layout_y=[0.0, 0.0], yaw_angles=[[20.0, 0.0]])
+    horizontal_plane_new = fmodel_new.calculate_horizontal_plane(90.0, **plane_kwargs)
+    assert np.allclose(horizontal_plane.df, horizontal_plane_new.df)
+
+
+def test_sample_flow_at_points():
+    fmodel = FlorisModel(configuration=YAML_INPUT)
+    fmodel.set(
+        layout_x=[0.0, 630.0],
+        layout_y=[0.0, 50.0],
+        wind_directions=[260.0, 270.0, 285.0],
+        wind_speeds=[8.0, 9.0, 10.0],
+        turbulence_intensities=[0.06, 0.06, 0.06],
+        yaw_angles=[[20.0, 0.0], [0.0, 0.0], [0.0, -10.0]],
+    )
+    fmodel.run()
+    x = np.linspace(-100.0, 1500.0, 11)
+    y = np.linspace(-100.0, 150.0, 11)
+    z = np.linspace(50.0, 120.0, 11)
+
+    # Solving in chunks of findices and points matches solving all of the points together
+    u_points = fmodel.core.solve_for_points(x, y, z)
+    u_chunked = fmodel.sample_flow_at_points(x, y, z, n_findex_per_solve=2, n_points_per_solve=4)
+    assert np.allclose(u_chunked, u_points)
+
+    # The wind speeds can be stored in a given array
+    out = np.zeros((3, 11))
+    assert fmodel.sample_flow_at_points(x, y, z, out=out) is out
+    assert np.allclose(out, u_points)
+    with pytest.raises(ValueError):
+        fmodel.sample_flow_at_points(x, y, z, out=np.zeros((2, 11)))
+
+    # The cumulative curl model is supported and matches the values in a plane
+    fmodel.set_param(["wake", "model_strings", "velocity_model"], "cc")
+    y_plane = fmodel.calculate_y_plane(0.0, x_resolution=5, z_resolution=3, findex_for_viz=1)
+    df = y_plane.df
+    u_cc = fmodel.sample_flow_at_points(df.x1, df.x3, df.x2)
+    assert np.allclose(u_cc[1], df.u)
+
+
+def test_sample_batched_velocity_deficit_profiles():
+    fmodel = FlorisModel(configuration=YAML_INPUT)
+    fmodel.set(
+        layout_x=[0.0, 630.0],
+        layout_y=[0.0, 50.0],
+        wind_directions=[270.0, 280.0, 270.0],
+        wind_speeds=[8.0, 9.0, 10.0],
+        turbulence_intensities=[0.06, 0.06, 0.06],
+        yaw_angles=[[20.0, 0.0], [0.0, 0.0], [0.0, -10.0]],
+    )
+    profile_kwargs = {
+        "direction": "vertical",
+        "downstream_dists": [300.0, 900.0],
+        "resolution": 7,
+    }
+
+    # The profiles are indexed by (findex, line, sample) in the order of the findices
+    profiles = fmodel.sample_batched_velocity_deficit_profiles(findices=[2, 0, 1], **profile_kwargs)
+    assert profiles.get_values("velocity_deficit").shape == (3, 2, 7)
+    df = profiles.to_dataframe()
+    assert len(df) == 3 * 2 * 7
+    assert np.array_equal(df.velocity_deficit, profiles.get_values("velocity_deficit").flatten())
+
+    # Each findex matches the profiles sampled for its wind condition alone
+    yaw_angles = fmodel.core.farm.yaw_angles
+    for i, findex in enumerate([2, 0, 1]):
+        fmodel_single = FlorisModel(configuration=YAML_INPUT)
+        fmodel_single.set(
+            layout_x=[0.0, 630.0],
+            layout_y=[0.0, 50.0],
+            wind_directions=fmodel.wind_directions[findex:findex + 1],
+            wind_speeds=fmodel.wind_speeds[findex:findex + 1],
+            turbulence_intensities=[0.06],
+            yaw_angles=yaw_angles[findex:findex + 1],
+        )
+        profiles_single = fmodel_single.sample_velocity_deficit_profiles(**profile_kwargs)
+        for df_single, df_batched in zip(profiles_single, profiles.to_dataframes(i)):
+            assert np.allclose(df_single, df_batched)
+
+
 def test_get_turbine_powers_with_WindRose():
     fmodel = FlorisModel(configuration=YAML_INPUT)
 
@@ -854,3 +1081,74 @@ def test_merge_floris_models():
     fmodel_list = [fmodel1, "not a floris model"]
     with pytest.raises(TypeError):
         merged_fmodel = FlorisModel.merge_floris_models(fmodel_list)
+
+def test_run_profile():
+    fmodel = FlorisModel(configuration=YAML_INPUT)
+    fmodel.set(layout_x=[0, 1000], layout_y=[0, 0])
+
+    # Without profile, run returns nothing and no profiler is active
+    assert fmodel.run() is None
+    assert get_active_profiler() is None
+
+    profiler = fmodel.run(profile=True)
+    assert isinstance(profiler, Profiler)
+    assert get_active_profiler() is None
+    velocity_model = "sequential_solver/velocity_model (gauss)"
+    assert profiler.phases[velocity_model].calls == fmodel.n_turbines
+    assert profiler.phases[velocity_model].max_array_bytes > 0
+    assert profiler.phases["sequential_solver"].time >= profiler.phases[velocity_model].time
+    assert profiler.total_time > 0
+    assert list(profiler.to_dataframe().columns) == ["time", "calls", "max_array_bytes"]
+
+    # The results do not depend on profiling
+    powers = fmodel.get_turbine_powers()
+    fmodel.run()
+    np.testing.assert_allclose(fmodel.get_turbine_powers(), powers)
+
+    # All of the calculations within the profiling context are recorded
+    with profiling() as profiler:
+        fmodel.set(
+            wind_speeds=[8.0, 9.0],
+            wind_directions=[270.0, 280.0],
+            turbulence_intensities=[0.06, 0.06],
+        )
+        fmodel.run()
+    assert "construct_grid" in profiler.phases
+    assert "sequential_solver" in profiler.phases
+
+def test_snapshot(tmp_path):
+    fmodel = FlorisModel(configuration=YAML_INPUT)
+    fmodel.set(
+        layout_x=[0, 500, 1000],
+        layout_y=[0, 0, 0],
+        wind_speeds=[8.0, 9.0],
+        wind_directions=[270.0, 280.0],
+        turbulence_intensities=[0.06, 0.06],
+        yaw_angles=[[10.0, 0.0, 0.0], [0.0, 5.0, 0.0]],
+    )
+    fmodel.run()
+    powers = fmodel.get_turbine_powers()
+
+    # A snapshot file restores the model, including its results, with memory mapped arrays
+    snapshot_file = tmp_path / "model.floris"
+    fmodel.to_snapshot(snapshot_file)
+    fmodel_snapshot = FlorisModel.from_snapshot(snapshot_file)
+    np.testing.assert_allclose(fmodel_snapshot.get_turbine_powers(), powers)
+    np.testing.assert_allclose(fmodel_snapshot.core.farm.yaw_angles, fmodel.core.farm.yaw_angles)
+    assert not fmodel_snapshot.core.flow_field.u.flags.owndata
+
+    # The arrays can be modified without modifying the file, and the model can be run again
+    fmodel_snapshot.core.farm.yaw_angles[:] = 0.0
+    fmodel_snapshot.run()
+    assert not np.allclose(fmodel_snapshot.get_turbine_powers(), powers)
+    fmodel_snapshot = FlorisModel.from_snapshot(snapshot_file)
+    np.testing.assert_allclose(fmodel_snapshot.get_turbine_powers(), powers)
+
+    # A snapshot in memory
+    fmodel_snapshot = FlorisModel.from_snapshot(fmodel.to_snapshot())
+    fmodel_snapshot.run()
+    np.testing.assert_allclose(fmodel_snapshot.get_turbine_powers(), powers)
+
+    # Files that are not snapshots are rejected
+    with pytest.raises(ValueError):
+        FlorisModel.from_snapshot(YAML_INPUT)
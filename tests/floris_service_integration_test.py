@@ -0,0 +1,119 @@
+
+import asyncio
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+import floris.floris_service
+from floris import FlorisModel, FlorisService
+
+
+TEST_DATA = Path(__file__).resolve().parent / "data"
+YAML_INPUT = TEST_DATA / "input_full.yaml"
+
+WIND_DIRECTIONS = [270.0, 280.0, 290.0, 300.0]
+WIND_SPEEDS = [6.0, 8.0, 10.0, 12.0]
+
+
+def get_fmodel():
+    fmodel = FlorisModel(configuration=YAML_INPUT)
+    fmodel.set(layout_x=[0.0, 500.0, 1000.0], layout_y=[0.0, 0.0, 0.0])
+    return fmodel
+
+
+def get_expected_powers(yaw_angles):
+    fmodel = get_fmodel()
+    fmodel.set(
+        wind_directions=WIND_DIRECTIONS,
+        wind_speeds=WIND_SPEEDS,
+        turbulence_intensities=[0.06] * 4,
+        yaw_angles=yaw_angles,
+    )
+    fmodel.run()
+    return fmodel.get_turbine_powers()
+
+
+async def query_each_condition(service, yaw_angles):
+    return await asyncio.gather(
+        *[
+            service.get_turbine_powers(
+                wind_directions=[wd], wind_speeds=[ws], turbulence_intensities=0.06,
+                yaw_angles=yaw_angles[i:i+1],
+            )
+            for i, (wd, ws) in enumerate(zip(WIND_DIRECTIONS, WIND_SPEEDS))
+        ]
+    )
+
+
+@pytest.mark.parametrize("interface", ["threads", "processes"])
+def test_concurrent_queries(interface):
+    yaw_angles = np.zeros((4, 3))
+    yaw_angles[:, 0] = [0.0, 10.0, 20.0, 0.0]
+    expected_powers = get_expected_powers(yaw_angles)
+
+    async def main():
+        async with FlorisService(get_fmodel(), interface=interface, max_delay=0.05) as service:
+            turbine_powers = await query_each_condition(service, yaw_angles)
+            farm_power = await service.get_farm_power(
+                WIND_DIRECTIONS, WIND_SPEEDS, 0.06, yaw_angles
+            )
+        return turbine_powers, farm_power
+
+    turbine_powers, farm_power = asyncio.run(main())
+    np.testing.assert_allclose(np.vstack(turbine_powers), expected_powers)
+    np.testing.assert_allclose(farm_power, expected_powers.sum(axis=1))
+
+
+def test_batching(monkeypatch):
+    batch_sizes = []
+    run_batch = floris.floris_service._run_batch
+
+    def counted_run_batch(fmodel, set_kwargs):
+        batch_sizes.append(len(set_kwargs["wind_directions"]))
+        return run_batch(fmodel, set_kwargs)
+
+    monkeypatch.setattr(floris.floris_service, "_run_batch", counted_run_batch)
+    yaw_angles = np.zeros((4, 3))
+
+    async def main():
+        # Concurrent queries are solved together
+        service = FlorisService(get_fmodel(), max_delay=0.05)
+        await query_each_condition(service, yaw_angles)
+        assert batch_sizes == [4]
+
+        # Batches are limited in size
+        service.max_batch_findex = 2
+        await query_each_condition(service, yaw_angles)
+        assert batch_sizes == [4, 2, 2]
+        await service.close()
+
+        with pytest.raises(RuntimeError):
+            await service.get_farm_power([270.0], [8.0], [0.06])
+
+    asyncio.run(main())
+
+
+def test_errors(monkeypatch):
+    def failed_run_batch(fmodel, set_kwargs):
+        raise ValueError("Solve failed")
+
+    async def main():
+        async with FlorisService(get_fmodel()) as service:
+            # Queries with inconsistent conditions are rejected without affecting others
+            with pytest.raises(ValueError):
+                await service.get_farm_power([270.0, 280.0], [8.0, 9.0, 10.0], 0.06)
+
+            # Errors in the solve are raised by each query of the batch
+            monkeypatch.setattr(floris.floris_service, "_run_batch", failed_run_batch)
+            results = await asyncio.gather(
+                service.get_farm_power([270.0], [8.0], 0.06),
+                service.get_farm_power([280.0], [8.0], 0.06),
+                return_exceptions=True,
+            )
+            assert all(isinstance(result, ValueError) for result in results)
+
+    asyncio.run(main())
+
+    with pytest.raises(ValueError):
+        FlorisService(get_fmodel(), interface="mpi4py")
@@ -0,0 +1,127 @@
+from pathlib import Path
+
+import numpy as np
+
+import floris.flow_visualization as flowviz
+from floris import FlorisModel
+
+
+TEST_DATA = Path(__file__).resolve().parent / "data"
+YAML_INPUT = TEST_DATA / "input_full.yaml"
+
+
+def test_calculate_horizontal_plane_with_turbines(monkeypatch):
+    fmodel = FlorisModel(configuration=YAML_INPUT)
+    fmodel.set(
+        layout_x=[0.0, 630.0],
+        layout_y=[0.0, 50.0],
+        wind_directions=[270.0, 280.0],
+        wind_speeds=[8.0, 9.0],
+        turbulence_intensities=[0.06, 0.06],
+        yaw_angles=[[20.0, 0.0], [0.0, 0.0]],
+    )
+
+    # Solve the test turbine locations in several chunks
+    monkeypatch.setattr(flowviz, "PROBE_TURBINES_PER_SOLVE", 12)
+    horizontal_plane = flowviz.calculate_horizontal_plane_with_turbines(
+        fmodel,
+        x_resolution=4,
+        y_resolution=3,
+        x_bounds=(-200.0, 1500.0),
+        y_bounds=(-200.0, 200.0),
+        findex_for_viz=1,
+    )
+    df = horizontal_plane.df
+
+    # Compare to placing the test turbine at each location and running the farm
+    fmodel_test = FlorisModel(configuration=YAML_INPUT)
+    for x, y, u in zip(df.x1, df.x2, df.u):
+        fmodel_test.set(
+            layout_x=[0.0, 630.0, x],
+            layout_y=[0.0, 50.0, y],
+            wind_directions=[280.0],
+            wind_speeds=[9.0],
+            turbulence_intensities=[0.06],
+            turbine_type=["nrel_5MW"] * 3,
+        )
+        fmodel_test.run()
+        center_point = fmodel_test.core.flow_field.u.shape[2] // 2
+        assert np.isclose(u, fmodel_test.core.flow_field.u[0, -1, center_point, center_point])
+
+    # The test turbine locations sweep x fastest
+    assert np.allclose(df.x1[:4], np.linspace(-200.0, 1500.0, 4))
+    assert np.allclose(df.x2[:4], -200.0)
+
+
+def test_velocity_profiles_figure():
+    fmodel = FlorisModel(configuration=YAML_INPUT)
+    fmodel.set(
+        layout_x=[0.0],
+        layout_y=[0.0],
+        wind_directions=[270.0, 275.0],
+        wind_speeds=[8.0, 9.0],
+        turbulence_intensities=[0.06, 0.06],
+    )
+    D = fmodel.core.farm.rotor_diameters[0]
+    profiles = fmodel.sample_batched_velocity_deficit_profiles(
+        direction="cross-stream",
+        downstream_dists=D * np.array([3.0, 5.0]),
+        resolution=5,
+    )
+
+    # The batched profiles and the DataFrames of a findex are plotted on the same axes
+    profiles_fig = flowviz.VelocityProfilesFigure(downstream_dists_D=[3.0, 5.0])
+    profiles_fig.add_profiles(profiles)
+    assert all(len(ax.lines) == 2 for ax in profiles_fig.axs[0])
+    profiles_fig.add_profiles(profiles.to_dataframes(1))
+    assert all(len(ax.lines) == 3 for ax in profiles_fig.axs[0])
+    assert np.isclose(profiles_fig.deficit_max, np.max(profiles.get_values("velocity_deficit")))
+
+
+def test_calculate_planes_in_parallel(tmp_path):
+    fmodel = FlorisModel(configuration=YAML_INPUT)
+    fmodel.set(
+        layout_x=[0.0, 630.0],
+        layout_y=[0.0, 50.0],
+        wind_directions=[270.0, 280.0, 290.0],
+        wind_speeds=[8.0, 9.0, 10.0],
+        turbulence_intensities=[0.06, 0.06, 0.06],
+        yaw_angles=[[20.0, 0.0], [10.0, 0.0], [0.0, 0.0]],
+    )
+    expected_planes = list(
+        fmodel.calculate_horizontal_planes([90.0, 120.0], x_resolution=10, y_resolution=8)
+    )
+
+    # The planes are the same whether they are split across workers or not
+    for max_workers in [1, 2]:
+        planes = flowviz.calculate_planes_in_parallel(
+            fmodel,
+            "z",
+            [90.0, 120.0],
+            x1_resolution=10,
+            x2_resolution=8,
+            max_workers=max_workers,
+        )
+        assert len(planes) == len(expected_planes)
+        for plane, expected_plane in zip(planes, expected_planes):
+            for name in flowviz.PLANE_ARRAY_NAMES:
+                assert np.allclose(plane.get_mesh(name), expected_plane.get_mesh(name))
+
+    # The frames are rendered by the workers in the order of the planes
+    frames = flowviz.calculate_planes_in_parallel(
+        fmodel,
+        "x",
+        630.0 + 5 * 126.0,
+        x1_resolution=6,
+        x2_resolution=5,
+        findices=[0, 2],
+        max_workers=2,
+        frames_directory=tmp_path,
+        plot_kwargs={"min_speed": 4.0, "max_speed": 10.0},
+        return_planes=False,
+    )
+    assert frames is None
+    assert sorted(path.name for path in tmp_path.iterdir()) == [
+        "plane_00000.png",
+        "plane_00001.png",
+    ]
@@ -3,6 +3,11 @@ from pathlib import Path
 
 import numpy as np
 import pytest
+from shapely.geometry import (
+    MultiPolygon,
+    Point,
+    Polygon,
+)
 
 from floris import (
     FlorisModel,
@@ -10,18 +15,25 @@ from floris import (
     WindRose,
 )
 from floris.optimization.layout_optimization.layout_optimization_base import (
+    distance_from_boundaries,
+    get_objectives_for_layouts,
     LayoutOptimization,
+    space_constraint,
 )
 from floris.optimization.layout_optimization.layout_optimization_gridded import (
     LayoutOptimizationGridded,
 )
 from floris.optimization.layout_optimization.layout_optimization_random_search import (
+    _batched_candidate_step,
+    _get_objective,
+    _IncrementalObjective,
     LayoutOptimizationRandomSearch,
 )
 from floris.optimization.layout_optimization.layout_optimization_scipy import (
     LayoutOptimizationScipy,
 )
 from floris.wind_data import WindDataBase
+from tests.conftest import run_with_mpiexec
 
 
 TEST_DATA = Path(__file__).resolve().parent / "data"
@@ -76,6 +88,100 @@ def test_base_class(caplog):
     LayoutOptimization(fmodel, test_boundaries, 5)
     LayoutOptimization(fmodel=fmodel, boundaries=test_boundaries, min_dist=5)
 
+def test_distance_from_boundaries():
+    # Two separate regions, one of which has a hole
+    boundary_polygon = MultiPolygon([
+        Polygon(
+            [(0.0, 0.0), (0.0, 1000.0), (1000.0, 1000.0), (1000.0, 0.0)],
+            holes=[[(400.0, 400.0), (400.0, 600.0), (600.0, 600.0), (600.0, 400.0)]],
+        ),
+        Polygon([(1500.0, 0.0), (1500.0, 500.0), (2000.0, 0.0)]),
+    ])
+
+    rng = np.random.default_rng(0)
+    x = rng.uniform(-200.0, 2200.0, 50)
+    y = rng.uniform(-200.0, 1200.0, 50)
+
+    distance, grad_x, grad_y = distance_from_boundaries(
+        x, y, boundary_polygon, return_gradient=True
+    )
+
+    # Matches shapely, positive inside and negative outside
+    for i in range(len(x)):
+        point = Point(x[i], y[i])
+        expected = point.distance(boundary_polygon.boundary)
+        if not boundary_polygon.contains(point):
+            expected *= -1.0
+        assert np.isclose(distance[i], expected)
+
+    # Gradients match finite differences
+    h = 1e-4
+    fd_x = (distance_from_boundaries(x + h, y, boundary_polygon) - distance) / h
+    fd_y = (distance_from_boundaries(x, y + h, boundary_polygon) - distance) / h
+    np.testing.assert_allclose(grad_x, fd_x, atol=1e-3)
+    np.testing.assert_allclose(grad_y, fd_y, atol=1e-3)
+
+def test_space_constraint():
+    rng = np.random.default_rng(0)
+    x = rng.uniform(0.0, 1000.0, 30)
+    y = rng.uniform(0.0, 1000.0, 30)
+    min_dist = 200.0
+
+    KS_constraint, dist, grad_x, grad_y = space_constraint(
+        x, y, min_dist, return_gradient=True
+    )
+
+    # Nearest-neighbor distances match a brute force calculation
+    distances = np.hypot(x[:, None] - x[None, :], y[:, None] - y[None, :])
+    np.fill_diagonal(distances, np.inf)
+    np.testing.assert_allclose(dist, distances.min(axis=1))
+    assert KS_constraint >= np.max(1 - dist / min_dist)
+
+    # Gradients match central differences
+    h = 1e-5
+    for i in range(len(x)):
+        dx = np.zeros_like(x)
+        dx[i] = h
+        fd_x = (
+            space_constraint(x + dx, y, min_dist)[0] - space_constraint(x - dx, y, min_dist)[0]
+        ) / (2 * h)
+        fd_y = (
+            space_constraint(x, y + dx, min_dist)[0] - space_constraint(x, y - dx, min_dist)[0]
+        ) / (2 * h)
+        assert np.isclose(grad_x[i], fd_x, atol=1e-6)
+        assert np.isclose(grad_y[i], fd_y, atol=1e-6)
+
+def test_LayoutOptimizationScipy_batch_gradient():
+    fmodel = FlorisModel(configuration=YAML_INPUT)
+    fmodel.set(
+        layout_x=[0.0, 500.0, 1000.0],
+        layout_y=[0.0, 100.0, 900.0],
+        wind_data=WindRose(
+            wind_directions=np.array([270.0, 300.0]),
+            wind_speeds=np.array([8.0, 10.0]),
+            ti_table=0.06,
+        ),
+    )
+
+    layout_opt = LayoutOptimizationScipy(fmodel=fmodel, boundaries=test_boundaries)
+    layout_opt._num_aep_calls = 0
+    layout_opt._aep_record = []
+
+    # The batched gradient should match forward differences of the objective,
+    # including the backward steps taken for variables on their upper bound
+    locs = np.array(layout_opt.x0)
+    eps = layout_opt.optOptions["eps"]
+    f0 = layout_opt._obj_func(locs)
+    grad_serial = np.zeros(len(locs))
+    for i in range(len(locs)):
+        step = eps if locs[i] + eps <= 1.0 else -eps
+        locs_step = locs.copy()
+        locs_step[i] += step
+        grad_serial[i] = (layout_opt._obj_func(locs_step) - f0) / step
+
+    grad_batched = layout_opt._obj_jac(locs)
+    np.testing.assert_allclose(grad_batched, grad_serial, rtol=1e-6, atol=1e-9)
+
 def test_LayoutOptimizationRandomSearch():
     fmodel = FlorisModel(configuration=YAML_INPUT)
     fmodel.set(layout_x=[0, 500], layout_y=[0, 0])
@@ -92,6 +198,229 @@ def test_LayoutOptimizationRandomSearch():
     # Check that the optimization runs
     layout_opt.optimize()
 
+def test_LayoutOptimizationRandomSearch_incremental_objective():
+    fmodel = FlorisModel(configuration=YAML_INPUT)
+    layout_x = np.array([0.0, 600.0, 0.0, 600.0, 300.0])
+    layout_y = np.array([0.0, 0.0, 600.0, 600.0, 300.0])
+    fmodel.set(
+        layout_x=layout_x,
+        layout_y=layout_y,
+        wind_data=WindRose(
+            wind_directions=np.arange(0.0, 360.0, 30.0),
+            wind_speeds=np.array([8.0, 10.0]),
+            ti_table=0.06,
+        ),
+    )
+
+    incremental_objective = _IncrementalObjective(fmodel, layout_x, layout_y)
+    assert np.isclose(
+        incremental_objective.objective,
+        _get_objective(layout_x, layout_y, fmodel.copy())
+    )
+
+    # Moves evaluated incrementally closely match evaluating the full layout, whether or
+    # not the previous moves were accepted
+    rng = np.random.default_rng(0)
+    for i in range(6):
+        tr = rng.integers(len(layout_x))
+        test_x = incremental_objective.layout_x[tr] + rng.uniform(-300.0, 300.0)
+        test_y = incremental_objective.layout_y[tr] + rng.uniform(-300.0, 300.0)
+        test_objective = incremental_objective.evaluate_move(tr, test_x, test_y)
+
+        test_layout_x = incremental_objective.layout_x.copy()
+        test_layout_y = incremental_objective.layout_y.copy()
+        test_layout_x[tr] = test_x
+        test_layout_y[tr] = test_y
+        fmodel_test = fmodel.copy()
+        fmodel_test.set(wind_data=fmodel.wind_data)
+        assert np.isclose(
+            test_objective,
+            _get_objective(test_layout_x, test_layout_y, fmodel_test),
+            rtol=1e-4,
+        )
+        if i % 2 == 0:
+            incremental_objective.accept_move()
+
+    # Check that the optimization runs, and not with geometric yaw
+    layout_opt = LayoutOptimizationRandomSearch(
+        fmodel=fmodel,
+        boundaries=test_boundaries,
+        min_dist_D=2,
+        seconds_per_iteration=1,
+        total_optimization_seconds=1,
+        use_dist_based_init=False,
+        interface=None,
+        n_individuals=2,
+        relegation_number=0,
+        use_incremental_objective=True,
+        random_seed=0,
+    )
+    objective_final, x_opt, y_opt = layout_opt.optimize()
+    assert objective_final >= layout_opt.objective_initial
+
+    # The reported objective is that of the returned layout, without the approximation
+    # of the incremental evaluation
+    fmodel_test = FlorisModel(configuration=YAML_INPUT)
+    fmodel_test.set(layout_x=x_opt, layout_y=y_opt, wind_data=fmodel.wind_data)
+    fmodel_test.run()
+    assert np.isclose(objective_final, fmodel_test.get_farm_AEP(), rtol=1e-9, atol=0.0)
+
+    with pytest.raises(ValueError):
+        LayoutOptimizationRandomSearch(
+            fmodel=fmodel,
+            boundaries=test_boundaries,
+            min_dist_D=2,
+            use_dist_based_init=False,
+            interface=None,
+            n_individuals=2,
+            relegation_number=0,
+            enable_geometric_yaw=True,
+            use_incremental_objective=True,
+        )
+
+def test_batched_candidate_step_without_valid_moves():
+    # Every move of the turbines in a narrow strip leaves the strip or brings them closer
+    # than the minimum distance, so the step ends without a time limit and keeps the layout
+    layout_x = np.array([0.0, 600.0])
+    layout_y = np.array([0.0, 0.0])
+    objective, num_candidates = _batched_candidate_step(
+        1.0,
+        layout_x,
+        layout_y,
+        None,
+        600.0,
+        Polygon([(-1.0, -1.0), (601.0, -1.0), (601.0, 1.0), (-1.0, 1.0)]),
+        {"d": np.array([100.0]), "p": np.array([1.0])},
+        4,
+        np.inf,
+        None,
+        False,
+    )
+    assert objective == 1.0
+    assert num_candidates == 0
+    np.testing.assert_array_equal(layout_x, [0.0, 600.0])
+    np.testing.assert_array_equal(layout_y, [0.0, 0.0])
+
+
+def test_LayoutOptimizationRandomSearch_batched_candidates():
+    fmodel = FlorisModel(configuration=YAML_INPUT)
+    fmodel.set(
+        layout_x=[0.0, 600.0, 0.0, 600.0],
+        layout_y=[0.0, 0.0, 600.0, 600.0],
+        wind_data=WindRose(
+            wind_directions=np.arange(0.0, 360.0, 45.0),
+            wind_speeds=np.array([8.0, 10.0]),
+            ti_table=0.06,
+        ),
+    )
+
+    # Candidates evaluated together match evaluating them one at a time
+    rng = np.random.default_rng(0)
+    layout_x = rng.uniform(0.0, 1000.0, (3, 4))
+    layout_y = rng.uniform(0.0, 1000.0, (3, 4))
+    objectives = get_objectives_for_layouts(fmodel, layout_x, layout_y)
+    for x, y, objective in zip(layout_x, layout_y, objectives):
+        fmodel_test = fmodel.copy()
+        fmodel_test.set(wind_data=fmodel.wind_data)
+        assert np.isclose(objective, _get_objective(x, y, fmodel_test))
+
+    layout_opt = LayoutOptimizationRandomSearch(
+        fmodel=fmodel,
+        boundaries=test_boundaries,
+        min_dist_D=2,
+        seconds_per_iteration=1,
+        total_optimization_seconds=1,
+        use_dist_based_init=False,
+        interface=None,
+        n_individuals=2,
+        relegation_number=0,
+        n_candidates_per_step=4,
+    )
+    layout_opt.optimize()
+    assert layout_opt.objective_final >= layout_opt.objective_initial
+    assert layout_opt.num_objective_calls_log[0][0] > 0
+
+    # The final objective is that of the final layout
+    fmodel_test = fmodel.copy()
+    fmodel_test.set(wind_data=fmodel.wind_data)
+    assert np.isclose(
+        layout_opt.objective_final,
+        _get_objective(layout_opt.x_opt, layout_opt.y_opt, fmodel_test),
+    )
+
+    with pytest.raises(ValueError):
+        LayoutOptimizationRandomSearch(
+            fmodel=fmodel,
+            boundaries=test_boundaries,
+            use_dist_based_init=False,
+            interface=None,
+            n_individuals=2,
+            relegation_number=0,
+            use_incremental_objective=True,
+            n_candidates_per_step=4,
+        )
+
+MPI_RANDOM_SEARCH_SCRIPT = """
+import numpy as np
+from mpi4py import MPI
+
+from floris import FlorisModel, WindRose
+from floris.optimization.layout_optimization.layout_optimization_random_search import (
+    _get_objective,
+    LayoutOptimizationRandomSearch,
+)
+
+fmodel = FlorisModel("{configuration}")
+fmodel.set(
+    layout_x=[0.0, 600.0, 0.0, 600.0],
+    layout_y=[0.0, 0.0, 600.0, 600.0],
+    wind_data=WindRose(
+        wind_directions=np.arange(0.0, 360.0, 90.0),
+        wind_speeds=np.array([8.0]),
+        ti_table=0.06,
+    ),
+)
+layout_opt = LayoutOptimizationRandomSearch(
+    fmodel=fmodel,
+    boundaries={boundaries},
+    min_dist_D=2,
+    n_individuals=6,
+    seconds_per_iteration=1,
+    total_optimization_seconds=2,
+    interface="mpi4py",
+    random_seed=0,
+)
+layout_opt.optimize()
+
+# All ranks finish with the same result, which is a valid improvement
+comm = MPI.COMM_WORLD
+objectives = comm.allgather(layout_opt.objective_final)
+layouts = comm.allgather((layout_opt.x_opt, layout_opt.y_opt))
+assert np.allclose(objectives, objectives[0])
+assert all(np.allclose(layout, layouts[0]) for layout in layouts)
+assert layout_opt.objective_final >= layout_opt.objective_initial
+fmodel_test = fmodel.copy()
+fmodel_test.set(wind_data=fmodel.wind_data)
+assert np.isclose(
+    layout_opt.objective_final,
+    _get_objective(layout_opt.x_opt, layout_opt.y_opt, fmodel_test),
+)
+print("rank", comm.Get_rank(), "passed")
+"""
+
+def test_LayoutOptimizationRandomSearch_mpi4py(tmp_path):
+    script_path = tmp_path / "mpi_random_search_script.py"
+    script_path.write_text(
+        MPI_RANDOM_SEARCH_SCRIPT.format(
+            configuration=YAML_INPUT.as_posix(),
+            boundaries=test_boundaries,
+        )
+    )
+
+    result = run_with_mpiexec(script_path, n_ranks=4)
+    assert result.returncode == 0, result.stderr
+    assert result.stdout.count("passed") == 4
+
 def test_LayoutOptimizationGridded_initialization(caplog):
     fmodel = FlorisModel(configuration=YAML_INPUT)
     fmodel.set(layout_x=[0, 500], layout_y=[0, 0])
@@ -156,6 +485,40 @@ def test_LayoutOptimizationGridded_basic():
 
     assert n_turbs_opt >= n_turbs_subopt
 
+def test_LayoutOptimizationGridded_nonconvex():
+    fmodel = FlorisModel(configuration=YAML_INPUT)
+
+    # L-shaped boundary
+    boundaries_L = [
+        (0.0, 0.0),
+        (2000.0, 0.0),
+        (2000.0, 500.0),
+        (500.0, 500.0),
+        (500.0, 2000.0),
+        (0.0, 2000.0),
+        (0.0, 0.0),
+    ]
+
+    layout_opt = LayoutOptimizationGridded(
+        fmodel=fmodel,
+        boundaries=boundaries_L,
+        min_dist=240.0,
+        rotation_step=15,
+        rotation_range=(0, 90),
+        translation_step=40,
+        hexagonal_packing=True,
+    )
+    n_turbs_opt, x_opt, y_opt = layout_opt.optimize()
+
+    # All of the returned turbines are in bounds
+    polygon = Polygon(boundaries_L)
+    assert n_turbs_opt == len(x_opt)
+    assert all(polygon.contains(Point(x, y)) for x, y in zip(x_opt, y_opt))
+
+    # The best layout is at least as good as the unrotated, untranslated grid
+    n_turbs_unmoved = sum(polygon.contains(Point(x, y)) for x, y in layout_opt.xy_grid)
+    assert n_turbs_opt >= n_turbs_unmoved
+
 def test_LayoutOptimizationGridded_diagonal():
     fmodel = FlorisModel(configuration=YAML_INPUT)
 
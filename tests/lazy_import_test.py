@@ -0,0 +1,45 @@
+
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+
+YAML_INPUT = Path(__file__).resolve().parent / "data" / "input_full.yaml"
+
+# Modules that are only needed by the plotting, parallel and heterogeneous inflow subsystems
+# and the numba solver backend
+LAZY_MODULES = ["matplotlib", "shapely", "pathos", "mpi4py", "numba"]
+
+
+def run_python(code: str) -> subprocess.CompletedProcess:
+    return subprocess.run(
+        [sys.executable, "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+
+def test_lazy_imports():
+    # Running a FlorisModel does not need the lazily imported subsystems
+    result = run_python(
+        "import sys\n"
+        "import floris\n"
+        f"fmodel = floris.FlorisModel({str(YAML_INPUT)!r})\n"
+        "fmodel.run()\n"
+        f"print([m for m in {LAZY_MODULES} if m in sys.modules])\n"
+        "print(floris.WindRose.__module__, floris.visualize_cut_plane.__module__)\n"
+    )
+    lazy_imported, lazy_attributes = result.stdout.splitlines()
+    assert lazy_imported == "[]"
+    assert lazy_attributes == "floris.wind_data floris.flow_visualization"
+
+
+def test_unknown_attribute():
+    import floris
+
+    with pytest.raises(AttributeError):
+        floris.NotAFlorisModel
+    assert {"FlorisModel", "ParFlorisModel", "TimeSeries"} <= set(dir(floris))
@@ -0,0 +1,100 @@
+
+import copy
+import logging
+
+import numpy as np
+import pytest
+
+from floris import FlorisModel
+
+
+N_FINDEX = 12
+
+# Velocity, deflection and turbulence models, and whether to enable the GCH corrections
+MODELS = [
+    ("gauss", "gauss", "crespo_hernandez", True),
+    ("gauss", "gauss", "crespo_hernandez", False),
+    ("jensen", "jimenez", "crespo_hernandez", False),
+    ("empirical_gauss", "empirical_gauss", "wake_induced_mixing", False),
+]
+
+
+def get_fmodel(core_dict, backend):
+    core_dict = copy.deepcopy(core_dict)
+    core_dict["solver"]["backend"] = backend
+    fmodel = FlorisModel(configuration=core_dict)
+
+    # Three rows of three turbines with the first row yawed, across directions that move the
+    # wakes over the downstream rows
+    layout_x, layout_y = np.meshgrid(np.arange(3) * 630.0, np.arange(3) * 500.0)
+    yaw_angles = np.zeros((N_FINDEX, 9))
+    yaw_angles[:, 0::3] = np.linspace(-20.0, 20.0, N_FINDEX)[:, None]
+    fmodel.set(
+        layout_x=layout_x.flatten(),
+        layout_y=layout_y.flatten(),
+        wind_directions=np.linspace(255.0, 285.0, N_FINDEX),
+        wind_speeds=np.linspace(6.0, 12.0, N_FINDEX),
+        turbulence_intensities=np.full(N_FINDEX, 0.06),
+        yaw_angles=yaw_angles,
+    )
+    return fmodel
+
+
+@pytest.mark.parametrize("velocity_model,deflection_model,turbulence_model,gch", MODELS)
+def test_numba_backend(
+    sample_inputs_fixture, velocity_model, deflection_model, turbulence_model, gch
+):
+    pytest.importorskip("numba")
+    wake = sample_inputs_fixture.core["wake"]
+    wake["model_strings"]["velocity_model"] = velocity_model
+    wake["model_strings"]["deflection_model"] = deflection_model
+    wake["model_strings"]["turbulence_model"] = turbulence_model
+    wake["enable_secondary_steering"] = gch
+    wake["enable_transverse_velocities"] = gch
+    wake["enable_yaw_added_recovery"] = gch or velocity_model == "empirical_gauss"
+
+    fmodel_numpy = get_fmodel(sample_inputs_fixture.core, "numpy")
+    fmodel_numba = get_fmodel(sample_inputs_fixture.core, "numba")
+    fmodel_numpy.run()
+    fmodel_numba.run()
+
+    flow_field_numpy = fmodel_numpy.core.flow_field
+    flow_field_numba = fmodel_numba.core.flow_field
+    np.testing.assert_allclose(flow_field_numba.u, flow_field_numpy.u)
+    np.testing.assert_allclose(flow_field_numba.v, flow_field_numpy.v, atol=1e-12)
+    np.testing.assert_allclose(flow_field_numba.w, flow_field_numpy.w, atol=1e-12)
+    np.testing.assert_allclose(
+        flow_field_numba.turbulence_intensity_field,
+        flow_field_numpy.turbulence_intensity_field,
+    )
+    np.testing.assert_allclose(
+        fmodel_numba.get_turbine_powers(), fmodel_numpy.get_turbine_powers()
+    )
+
+
+def test_numba_backend_fallback(sample_inputs_fixture, caplog):
+    pytest.importorskip("numba")
+    sample_inputs_fixture.core["wake"]["model_strings"]["velocity_model"] = "cc"
+    fmodel_numpy = get_fmodel(sample_inputs_fixture.core, "numpy")
+    fmodel_numba = get_fmodel(sample_inputs_fixture.core, "numba")
+    fmodel_numpy.run()
+
+    # Unsupported models are solved by the NumPy solver, with a warning
+    with caplog.at_level(logging.WARNING):
+        fmodel_numba.run()
+    assert "cc velocity model" in caplog.text
+    np.testing.assert_array_equal(
+        fmodel_numba.get_turbine_powers(), fmodel_numpy.get_turbine_powers()
+    )
+
+    # The fallback is only warned once for each Core
+    caplog.clear()
+    with caplog.at_level(logging.WARNING):
+        fmodel_numba.run()
+    assert "cc velocity model" not in caplog.text
+
+
+def test_invalid_backend(sample_inputs_fixture):
+    sample_inputs_fixture.core["solver"]["backend"] = "cuda"
+    with pytest.raises(ValueError):
+        FlorisModel(configuration=sample_inputs_fixture.core)
@@ -1,6 +1,7 @@
 
 import copy
 import logging
+from pathlib import Path
 
 import numpy as np
 import pytest
@@ -11,6 +12,7 @@ from floris import (
     WindRose,
 )
 from floris.par_floris_model import ParFlorisModel
+from tests.conftest import run_with_mpiexec
 
 
 DEBUG = False
@@ -135,6 +137,96 @@ def test_concurrent_interface(sample_inputs_fixture):
 
     assert np.allclose(f_turb_powers, pf_turb_powers)
 
+def test_threads_interface(sample_inputs_fixture):
+    """
+    With interface="threads", the ParFlorisModel should return the same powers and flow field
+    as the FlorisModel.
+    """
+    sample_inputs_fixture.core["wake"]["model_strings"]["velocity_model"] = VELOCITY_MODEL
+    sample_inputs_fixture.core["wake"]["model_strings"]["deflection_model"] = DEFLECTION_MODEL
+
+    fmodel = FlorisModel(sample_inputs_fixture.core)
+    pfmodel = ParFlorisModel(
+        sample_inputs_fixture.core,
+        interface="threads",
+        n_wind_condition_splits=2,
+    )
+
+    fmodel.run()
+    pfmodel.run()
+
+    f_turb_powers = fmodel.get_turbine_powers()
+    pf_turb_powers = pfmodel.get_turbine_powers()
+
+    assert np.allclose(f_turb_powers, pf_turb_powers)
+    assert np.allclose(fmodel.core.flow_field.u, pfmodel.core.flow_field.u)
+    assert np.allclose(
+        fmodel.core.flow_field.turbulence_intensity_field,
+        pfmodel.core.flow_field.turbulence_intensity_field,
+    )
+    np.testing.assert_array_equal(
+        fmodel.core.flow_field.turbulence_intensity_field_sorted_avg,
+        pfmodel.core.flow_field.turbulence_intensity_field_sorted_avg,
+    )
+
+    # Run in powers_only mode
+    pfmodel = ParFlorisModel(
+        sample_inputs_fixture.core,
+        interface="threads",
+        n_wind_condition_splits=2,
+        return_turbine_powers_only=True
+    )
+
+    pfmodel.run()
+    pf_turb_powers = pfmodel.get_turbine_powers()
+
+    assert np.allclose(f_turb_powers, pf_turb_powers)
+
+MPI_SCRIPT = """
+import numpy as np
+from mpi4py import MPI
+
+from floris import FlorisModel
+from floris.par_floris_model import ParFlorisModel
+
+fmodel = FlorisModel("{configuration}")
+fmodel.set(
+    layout_x=[0.0, 500.0, 1000.0],
+    layout_y=[0.0, 0.0, 0.0],
+    wind_directions=np.linspace(250.0, 290.0, 10),
+    wind_speeds=np.full(10, 8.0),
+    turbulence_intensities=np.full(10, 0.06),
+    yaw_angles=np.tile([[20.0, 10.0, 0.0]], (10, 1)),
+)
+fmodel.run()
+
+for return_turbine_powers_only in [False, True]:
+    pfmodel = ParFlorisModel(
+        fmodel,
+        interface="mpi4py",
+        return_turbine_powers_only=return_turbine_powers_only,
+    )
+    assert pfmodel.max_workers == MPI.COMM_WORLD.Get_size()
+    pfmodel.run()
+    assert np.allclose(fmodel.get_turbine_powers(), pfmodel.get_turbine_powers())
+    if not return_turbine_powers_only:
+        assert np.allclose(fmodel.core.flow_field.u, pfmodel.core.flow_field.u)
+
+print("rank", MPI.COMM_WORLD.Get_rank(), "passed")
+"""
+
+def test_mpi4py_interface(tmp_path):
+    """
+    With interface="mpi4py", every rank should receive the same powers as the FlorisModel.
+    """
+    configuration = Path(__file__).resolve().parent / "data" / "input_full.yaml"
+    script_path = tmp_path / "mpi_script.py"
+    script_path.write_text(MPI_SCRIPT.format(configuration=configuration.as_posix()))
+
+    result = run_with_mpiexec(script_path, n_ranks=4)
+    assert result.returncode == 0, result.stderr
+    assert result.stdout.count("passed") == 4
+
 def test_return_turbine_powers_only(sample_inputs_fixture):
     """
     With return_turbine_powers_only=True, the ParFlorisModel should return only the
@@ -286,3 +378,52 @@ def test_control_setpoints(sample_inputs_fixture):
 
     assert powers_fmodel.shape == powers_pfmodel.shape
     assert np.allclose(powers_fmodel, powers_pfmodel)
+
+@pytest.mark.parametrize("interface", ["multiprocessing", "threads"])
+def test_run_profile(sample_inputs_fixture, capsys, interface):
+    """
+    The parallel preprocessing, loop execution and postprocessing are recorded when profiling,
+    and print_timings reports them.
+    """
+    pfmodel = ParFlorisModel(
+        sample_inputs_fixture.core,
+        interface=interface,
+        n_wind_condition_splits=2,
+        print_timings=True,
+    )
+
+    profiler = pfmodel.run(profile=True)
+    for phase in ["preprocessing", "loop_execution", "postprocessing"]:
+        assert profiler.phases[phase].calls == 1
+    assert "preprocessing/initialize_velocity_field" in profiler.phases
+    assert "Time spent in parallel loop execution" in capsys.readouterr().out
+
+    assert pfmodel.run() is None
+
+@pytest.mark.parametrize("interface", ["multiprocessing", "threads"])
+def test_heterogeneous_inflow_splits(sample_inputs_fixture, interface):
+    """
+    Each split gets the heterogeneous inflow speed multipliers of its own wind conditions.
+    """
+    fmodel = FlorisModel(sample_inputs_fixture.core)
+    fmodel.set(
+        wind_directions=[270.0] * 4,
+        wind_speeds=[8.0] * 4,
+        turbulence_intensities=[0.06] * 4,
+        heterogeneous_inflow_config={
+            "x": [-1000.0, -1000.0, 3000.0, 3000.0],
+            "y": [-1000.0, 1000.0, -1000.0, 1000.0],
+            "speed_multipliers": [
+                [1.0, 1.0, 1.0, 1.0],
+                [1.0, 1.2, 1.0, 1.2],
+                [1.0, 0.8, 1.0, 0.8],
+                [1.1, 1.1, 1.1, 1.1],
+            ],
+        },
+    )
+    pfmodel = ParFlorisModel(fmodel, interface=interface, n_wind_condition_splits=2)
+
+    fmodel.run()
+    pfmodel.run()
+
+    assert np.allclose(fmodel.get_turbine_powers(), pfmodel.get_turbine_powers())
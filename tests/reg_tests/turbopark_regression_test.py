@@ -1,6 +1,11 @@
 
+from pathlib import Path
+
 import numpy as np
+import pytest
 
+import floris.core.wake_velocity.turbopark
+from floris import FlorisModel
 from floris.core import (
     average_velocity,
     axial_induction,
@@ -18,6 +23,9 @@ from tests.conftest import (
 
 
 DEBUG = False
+LOOKUP_TABLE = (
+    Path(floris.core.wake_velocity.turbopark.__file__).parent / "turbopark_lookup_table.mat"
+)
 VELOCITY_MODEL = "turbopark"
 DEFLECTION_MODEL = "gauss"
 COMBINATION_MODEL = "fls"
@@ -448,3 +456,61 @@ def test_full_flow_solver(sample_inputs_fixture):
     print(velocities)
     assert_results_arrays(velocities, full_flow_baseline)
 '''
+
+
+@pytest.mark.skipif(not LOOKUP_TABLE.exists(), reason="The TurbOPark lookup table is missing.")
+def test_points_and_planes_at_rotor(sample_inputs_fixture):
+    """
+    The flow at points and in planes evaluates the same wakes as the turbine grid, at points
+    rather than over the rotor of a downstream turbine. Without shear, averaging the flow at
+    points over the rotor of a turbine fully inside or outside of a single wake recovers its
+    rotor-averaged velocity on a turbine grid with a single point.
+    """
+    sample_inputs_fixture.core["wake"]["model_strings"]["velocity_model"] = VELOCITY_MODEL
+    sample_inputs_fixture.core["wake"]["model_strings"]["deflection_model"] = DEFLECTION_MODEL
+    sample_inputs_fixture.core["flow_field"]["wind_shear"] = 0.0
+    sample_inputs_fixture.core["solver"]["turbine_grid_points"] = 1
+    fmodel = FlorisModel(sample_inputs_fixture.core)
+    D = fmodel.core.farm.rotor_diameters[0]
+    hub_height = fmodel.core.farm.hub_heights[0]
+
+    # Points over the rotor disc, with the weights of a polar quadrature
+    r, theta = np.meshgrid(
+        (np.arange(40) + 0.5) / 40 * D / 2,
+        (np.arange(64) + 0.5) / 64 * 2 * np.pi,
+        indexing="ij",
+    )
+    weights = (r / r.sum()).flatten()
+
+    for lateral_offset in [0.0, 0.25 * D, 1.5 * D]:
+        fmodel.set(
+            layout_x=[0.0, 5 * D],
+            layout_y=[0.0, lateral_offset],
+            wind_directions=[270.0, 270.0, 270.0],
+            wind_speeds=[6.0, 8.0, 11.0],
+            turbulence_intensities=[0.06, 0.06, 0.06],
+        )
+        fmodel.run()
+        rotor_velocities = fmodel.turbine_average_velocities[:, 1]
+
+        u_points = fmodel.sample_flow_at_points(
+            np.full(r.size, 5 * D),
+            lateral_offset + (r * np.cos(theta)).flatten(),
+            hub_height + (r * np.sin(theta)).flatten(),
+        )
+        assert not np.isnan(u_points).any()
+        np.testing.assert_allclose(u_points @ weights, rotor_velocities, rtol=5e-3)
+
+        cross_plane = fmodel.calculate_cross_plane(
+            5 * D,
+            y_resolution=60,
+            z_resolution=60,
+            y_bounds=(lateral_offset - D / 2, lateral_offset + D / 2),
+            z_bounds=(hub_height - D / 2, hub_height + D / 2),
+            findex_for_viz=1,
+        )
+        df = cross_plane.df
+        in_rotor = np.hypot(df.x1.values - lateral_offset, df.x2.values - hub_height) < D / 2
+        np.testing.assert_allclose(
+            df.u.values[in_rotor].mean(), rotor_velocities[1], rtol=5e-3
+        )
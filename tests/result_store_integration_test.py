@@ -0,0 +1,120 @@
+
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from floris import (
+    FlorisModel,
+    TimeSeries,
+    TurbineResultStore,
+)
+
+
+TEST_DATA = Path(__file__).resolve().parent / "data"
+YAML_INPUT = TEST_DATA / "input_full.yaml"
+
+N_FINDEX = 25
+
+
+def get_fmodel():
+    fmodel = FlorisModel(configuration=YAML_INPUT)
+    time_series = TimeSeries(
+        wind_directions=np.linspace(250.0, 290.0, N_FINDEX),
+        wind_speeds=np.linspace(6.0, 12.0, N_FINDEX),
+        turbulence_intensities=0.06,
+    )
+    yaw_angles = np.zeros((N_FINDEX, 3))
+    yaw_angles[:, 0] = np.linspace(0.0, 20.0, N_FINDEX)
+    fmodel.set(
+        layout_x=[0.0, 500.0, 1000.0],
+        layout_y=[0.0, 0.0, 0.0],
+        wind_data=time_series,
+        yaw_angles=yaw_angles,
+    )
+    return fmodel
+
+
+def test_run_to_store(tmp_path):
+    fmodel = get_fmodel()
+
+    # Chunks that do not divide the findices evenly are stored in findex order
+    store = fmodel.run_to_store(tmp_path / "results", n_findex_per_chunk=7)
+    fmodel.run()
+
+    assert len(store) == N_FINDEX
+    assert store.n_turbines == 3
+    np.testing.assert_allclose(store["turbine_powers"], fmodel.get_turbine_powers())
+    np.testing.assert_allclose(
+        store["turbine_average_velocities"], fmodel.turbine_average_velocities
+    )
+    np.testing.assert_allclose(store["turbine_TIs"], fmodel.get_turbine_TIs())
+    np.testing.assert_allclose(
+        store["turbine_thrust_coefficients"], fmodel.get_turbine_thrust_coefficients()
+    )
+    np.testing.assert_allclose(store["wind_speeds"], fmodel.wind_speeds)
+    np.testing.assert_allclose(store["yaw_angles"], fmodel.core.farm.yaw_angles)
+
+    # Reopening the store memory maps the columns, which are standard .npy files
+    store = TurbineResultStore(tmp_path / "results")
+    powers = store["turbine_powers"]
+    assert isinstance(powers, np.memmap)
+    assert not powers.flags.writeable
+    np.testing.assert_allclose(
+        np.load(tmp_path / "results" / "turbine_powers.npy"), fmodel.get_turbine_powers()
+    )
+    np.testing.assert_allclose(store.metadata["layout_x"], fmodel.layout_x)
+    with pytest.raises(PermissionError):
+        store.append(fmodel)
+
+
+def test_run_to_store_after_flow_field(tmp_path):
+    # The Core kept for the flow field calculations is not reused to run the findices
+    fmodel = get_fmodel()
+    fmodel.run()
+    fmodel.calculate_horizontal_plane(90.0, x_resolution=20, y_resolution=10, findex_for_viz=0)
+    core = fmodel._findex_core[2]
+
+    store = fmodel.run_to_store(tmp_path / "results", n_findex_per_chunk=1)
+    np.testing.assert_allclose(store["turbine_powers"], fmodel.get_turbine_powers())
+
+    # Running to a store does not use or replace the kept Core
+    fmodel.calculate_horizontal_plane(90.0, x_resolution=20, y_resolution=10, findex_for_viz=0)
+    assert fmodel._findex_core[2] is core
+
+
+def test_append(tmp_path):
+    fmodel = get_fmodel()
+    fmodel.run()
+
+    store = TurbineResultStore(tmp_path / "results", mode="a", outputs=["turbine_powers"])
+    assert store.columns[-1] == "turbine_powers"
+    assert store["turbine_powers"].shape == (0, 0)
+    store.append(fmodel)
+
+    # Reopening for appending continues the same columns
+    store = TurbineResultStore(tmp_path / "results", mode="a")
+    fmodel.run_to_store(store, n_findex_per_chunk=10)
+    assert len(store) == 2 * N_FINDEX
+    np.testing.assert_allclose(
+        store["turbine_powers"], np.vstack([fmodel.get_turbine_powers()] * 2)
+    )
+    with pytest.raises(KeyError):
+        store["turbine_TIs"]
+
+    # Outputs of a different layout are rejected
+    fmodel.set(layout_x=[0.0, 500.0], layout_y=[0.0, 0.0], yaw_angles=np.zeros((N_FINDEX, 2)))
+    fmodel.run()
+    with pytest.raises(ValueError):
+        store.append(fmodel)
+    assert len(TurbineResultStore(tmp_path / "results")) == 2 * N_FINDEX
+
+    # Creating a store replaces the existing one
+    store = TurbineResultStore(tmp_path / "results", mode="w")
+    assert len(store) == 0
+    assert not (tmp_path / "results" / "turbine_powers.npy").exists()
+
+    with pytest.raises(ValueError):
+        TurbineResultStore(tmp_path / "other", mode="w", outputs=["farm_power"])
+    with pytest.raises(FileNotFoundError):
+        TurbineResultStore(tmp_path / "other")
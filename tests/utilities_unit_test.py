@@ -226,6 +226,44 @@ def test_reverse_rotate_coordinates_rel_west():
     np.testing.assert_almost_equal(grid_z_reversed.squeeze(), coordinates[:,2].squeeze())
 
 
+def test_rotate_coordinates_rel_west_per_findex():
+    # Coordinates specific to each wind direction should rotate exactly as when each
+    # set of coordinates is rotated on its own, including the center of rotation
+    coordinates = np.array(list(zip(X_COORDS, Y_COORDS, Z_COORDS)))
+    coordinates_per_findex = np.stack([coordinates, 2.0 * coordinates + 100.0])
+    wind_directions = np.array([270.0, 300.0])
+
+    x_rotated, y_rotated, z_rotated, x_center, y_center = rotate_coordinates_rel_west(
+        wind_directions,
+        coordinates_per_findex
+    )
+    np.testing.assert_equal(np.shape(x_rotated), (2, len(X_COORDS)))
+    np.testing.assert_equal(np.shape(x_center), (2, 1))
+
+    for i in range(2):
+        x_i, y_i, z_i, x_center_i, y_center_i = rotate_coordinates_rel_west(
+            wind_directions[i:i+1],
+            coordinates_per_findex[i]
+        )
+        np.testing.assert_array_equal(x_rotated[i], x_i[0])
+        np.testing.assert_array_equal(y_rotated[i], y_i[0])
+        np.testing.assert_array_equal(z_rotated[i], z_i[0])
+        np.testing.assert_array_equal(x_center[i], x_center_i)
+        np.testing.assert_array_equal(y_center[i], y_center_i)
+
+    # The reverse rotation with centers for each wind direction recovers the coordinates
+    grid_x_reversed, grid_y_reversed, _ = reverse_rotate_coordinates_rel_west(
+        wind_directions,
+        x_rotated[:, :, None, None],
+        y_rotated[:, :, None, None],
+        z_rotated[:, :, None, None],
+        x_center,
+        y_center,
+    )
+    np.testing.assert_almost_equal(grid_x_reversed.squeeze(), coordinates_per_findex[:, :, 0])
+    np.testing.assert_almost_equal(grid_y_reversed.squeeze(), coordinates_per_findex[:, :, 1])
+
+
 def test_nested_get():
     example_dict = {
         'a': {